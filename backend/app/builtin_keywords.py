@@ -94,7 +94,7 @@ BUILTIN_KEYWORDS = [
         expected_status: 期望的 HTTP 状态码
         expected_json_contains: 期望 JSON 响应包含的键值对
         expected_text_contains: 期望响应文本包含的字符串
-        json_path_exists: 期望存在的 JSON 路径 (如: data.user.id)
+        json_path_exists: 期望存在的 JSON 路径 (如: data.items[0].id)
 
     Returns:
         True 如果所有断言通过
@@ -127,15 +127,12 @@ BUILTIN_KEYWORDS = [
         if expected_text_contains not in response.get("text", ""):
             errors.append(f"响应文本不包含: {expected_text_contains}")
 
-    # 断言 JSON 路径存在
+    # 断言 JSON 路径存在 (路径编译结果会被缓存)
     if json_path_exists:
-        keys = json_path_exists.split(".")
-        current = response.get("json") or {}
-        for key in keys:
-            if not isinstance(current, dict) or key not in current:
-                errors.append(f"JSON 路径不存在: {json_path_exists}")
-                break
-            current = current[key]
+        from app.utils.json_path import compile_path
+
+        if not compile_path(json_path_exists).exists(response.get("json") or {}):
+            errors.append(f"JSON 路径不存在: {json_path_exists}")
 
     if errors:
         raise AssertionError("; ".join(errors))
@@ -164,7 +161,7 @@ BUILTIN_KEYWORDS = [
 
     Args:
         response: HTTP 响应对象
-        json_path: JSON 路径 (如: data.user.id)
+        json_path: JSON 路径 (如: data.user.id, items[0].id, items[?(@.ok==true)].id)
         header_name: 响应头名称
         regex_pattern: 正则表达式 (从响应文本中提取)
 
@@ -174,44 +171,15 @@ BUILTIN_KEYWORDS = [
     Raises:
         ValueError: 如果无法提取值或参数冲突
     """
-    provided = sum([
-        json_path is not None,
-        header_name is not None,
-        regex_pattern is not None,
-    ])
-
-    if provided == 0:
-        raise ValueError("必须提供 json_path, header_name, 或 regex_path 之一")
-    if provided > 1:
-        raise ValueError("只能提供一个提取方式")
-
-    # 从 JSON 提取
-    if json_path:
-        keys = json_path.split(".")
-        current = response.get("json") or {}
-        for key in keys:
-            if not isinstance(current, dict) or key not in current:
-                raise ValueError(f"JSON 路径不存在: {json_path}")
-            current = current[key]
-        return current
-
-    # 从响应头提取
-    if header_name:
-        headers = response.get("headers") or {}
-        if header_name not in headers:
-            raise ValueError(f"响应头不存在: {header_name}")
-        return headers[header_name]
-
-    # 使用正则提取
-    if regex_pattern:
-        import re
-        text = response.get("text") or ""
-        match = re.search(regex_pattern, text)
-        if not match:
-            raise ValueError(f"正则表达式未匹配: {regex_pattern}")
-        return match.group(1) if match.groups() else match.group(0)
-
-    return None
+    # 路径与正则在进程内编译缓存, 支持数组下标、通配符和过滤器
+    from app.utils.json_path import extract
+
+    return extract(
+        response,
+        json_path=json_path,
+        header_name=header_name,
+        regex_pattern=regex_pattern,
+    )
 ''',
         "params": [
             {"name": "response", "description": "HTTP 响应对象"},
@@ -32,6 +32,37 @@ class Settings(BaseSettings):
     MINIO_SECURE: bool = False
     MINIO_BUCKET: str = "sisyphus"
 
+    # Execution payload storage
+    PAYLOAD_STORE_BACKEND: str = "minio"  # minio / local
+    PAYLOAD_STORE_DIR: str = "/tmp/sisyphus-payloads"
+    PAYLOAD_SPILL_THRESHOLD_BYTES: int = 64 * 1024
+    PAYLOAD_PREVIEW_CHARS: int = 2048
+
+    # User code sandbox (out-of-process execution of global param functions)
+    SANDBOX_ENABLED: bool = False
+    SANDBOX_WORKERS: int = 0  # 0 = CPU count
+    SANDBOX_CPU_SECONDS: int = 5
+    SANDBOX_MEMORY_MB: int = 512
+    SANDBOX_TIMEOUT_SECONDS: float = 10.0
+
+    # Load tests (background jobs in the API process)
+    LOAD_TEST_MAX_CONCURRENT_JOBS: int = 2
+
+    # Bulk import parsing (process pool for large batches)
+    IMPORT_PARSE_WORKERS: int = 0  # 0 = CPU count, 1 = no worker processes
+
+    # Dashboard
+    DASHBOARD_STATS_TTL_SECONDS: float = 30.0  # 0 = no caching
+
+    # Interface tree
+    INTERFACE_TREE_CACHE_TTL_SECONDS: float = 300.0  # 0 = no caching
+
+    # Search (in-process index for databases without pg_trgm)
+    SEARCH_INDEX_TTL_SECONDS: float = 300.0  # 0 = rebuild per query
+
+    # Pagination
+    PAGINATION_TOTAL_TTL_SECONDS: float = 30.0  # cursor page totals, 0 = no caching
+
     # CORS
     BACKEND_CORS_ORIGINS: list = [
         "http://localhost:3000",
@@ -20,6 +20,7 @@ from app.routers import (
     projects,
     reports,
     scenarios,
+    search,
     test_plans,
     upload,
 )
@@ -28,7 +29,11 @@ from app.services.db_connection_scheduler import (
     shutdown_db_connection_scheduler,
 )
 from app.services.global_param_service import GlobalParamService
+from app.services.load_test_service import cancel_load_test_jobs
 from app.services.report_scheduler import init_report_scheduler, shutdown_report_scheduler
+from app.utils.pagination import NEXT_CURSOR_HEADER
+from app.utils.parse_pool import shutdown_parse_pool
+from app.utils.sandbox_pool import get_sandbox_pool, shutdown_sandbox_pool
 
 
 @asynccontextmanager
@@ -64,10 +69,18 @@ async def lifespan(app: FastAPI):
     # Initialize database connection scheduler
     init_db_connection_scheduler(async_session_maker)
 
+    # Create the user code sandbox pool (if enabled)
+    sandbox_pool = get_sandbox_pool()
+    if sandbox_pool is not None:
+        sandbox_pool.start()
+
     yield
     # Shutdown: Close database connections and stop schedulers
     shutdown_report_scheduler()
     shutdown_db_connection_scheduler()
+    await cancel_load_test_jobs()
+    shutdown_sandbox_pool()
+    shutdown_parse_pool()
     await engine.dispose()
 
 
@@ -86,6 +99,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 # Include routers
@@ -101,6 +115,7 @@ app.include_router(global_params.router, prefix=settings.API_V1_STR)
 app.include_router(dashboard.router, prefix=settings.API_V1_STR)
 app.include_router(reports.router, prefix=settings.API_V1_STR)
 app.include_router(upload.router, prefix=settings.API_V1_STR)
+app.include_router(search.router, prefix=settings.API_V1_STR)
 
 
 @app.get("/")
@@ -0,0 +1,94 @@
+"""Migration script to add the execution_daily_stats rollup table.
+
+This script creates:
+- execution_daily_stats: per project and day totals of finished executions
+
+and fills it from existing finished executions. Later repairs go through
+scripts/backfill_execution_stats.py.
+"""
+
+import asyncio
+
+from sqlalchemy import text
+
+from app.database import engine
+
+
+async def upgrade():
+    """Create execution_daily_stats table."""
+    async with engine.begin() as conn:
+        await conn.execute(
+            text(
+                """
+                CREATE TABLE IF NOT EXISTS execution_daily_stats (
+                    id SERIAL PRIMARY KEY,
+                    project_id INTEGER NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+                    day DATE NOT NULL,
+                    executions INTEGER NOT NULL DEFAULT 0,
+                    passed_scenarios INTEGER NOT NULL DEFAULT 0,
+                    failed_scenarios INTEGER NOT NULL DEFAULT 0,
+                    skipped_scenarios INTEGER NOT NULL DEFAULT 0,
+                    duration_seconds DOUBLE PRECISION NOT NULL DEFAULT 0,
+                    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+                    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+                    CONSTRAINT uq_execution_daily_stat UNIQUE (project_id, day)
+                )
+            """
+            )
+        )
+
+        await conn.execute(
+            text(
+                """
+                CREATE INDEX IF NOT EXISTS ix_execution_daily_stats_day
+                ON execution_daily_stats (day)
+            """
+            )
+        )
+
+        # Backfill from history (only into an empty table, so reruns are safe)
+        result = await conn.execute(
+            text(
+                """
+                INSERT INTO execution_daily_stats (
+                    project_id, day, executions, passed_scenarios,
+                    failed_scenarios, skipped_scenarios, duration_seconds
+                )
+                SELECT
+                    tp.project_id,
+                    CAST(te.created_at AS DATE),
+                    COUNT(*),
+                    COALESCE(SUM(te.passed_scenarios), 0),
+                    COALESCE(SUM(te.failed_scenarios), 0),
+                    COALESCE(SUM(te.skipped_scenarios), 0),
+                    COALESCE(SUM(GREATEST(
+                        EXTRACT(EPOCH FROM (te.finished_at - te.started_at)), 0
+                    )), 0)
+                FROM test_executions te
+                JOIN test_plans tp ON tp.id = te.plan_id
+                WHERE te.status IN ('completed', 'failed', 'terminated')
+                  AND NOT EXISTS (SELECT 1 FROM execution_daily_stats)
+                GROUP BY tp.project_id, CAST(te.created_at AS DATE)
+            """
+            )
+        )
+
+    print("✅ Migration completed: Created execution_daily_stats table")
+    print(f"   Backfilled {result.rowcount} project-day rows")
+
+
+async def downgrade():
+    """Drop execution_daily_stats table."""
+    async with engine.begin() as conn:
+        await conn.execute(text("DROP TABLE IF EXISTS execution_daily_stats"))
+
+    print("⏪ Rollback completed: Dropped execution_daily_stats table")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == "downgrade":
+        asyncio.run(downgrade())
+    else:
+        asyncio.run(upgrade())
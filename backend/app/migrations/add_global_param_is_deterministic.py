@@ -0,0 +1,68 @@
+"""Migration script to add is_deterministic to global_params table.
+
+This script adds:
+- is_deterministic: BOOLEAN DEFAULT FALSE
+
+and marks the pure built-in string/time conversions as deterministic so the
+batch parse endpoint can evaluate them once per batch.
+
+Run this script after updating the GlobalParam model.
+"""
+
+import asyncio
+
+from sqlalchemy import text
+
+from app.database import engine
+
+
+async def upgrade():
+    """Add is_deterministic column to global_params table."""
+    async with engine.begin() as conn:
+        # Add is_deterministic column
+        await conn.execute(
+            text(
+                """
+                ALTER TABLE global_params
+                ADD COLUMN IF NOT EXISTS is_deterministic BOOLEAN NOT NULL DEFAULT FALSE
+            """
+            )
+        )
+
+        # Mark pure built-in functions
+        await conn.execute(
+            text(
+                """
+                UPDATE global_params
+                SET is_deterministic = TRUE
+                WHERE is_builtin
+                  AND method_name IN ('to_uppercase', 'to_lowercase', 'timestamp_to_date')
+            """
+            )
+        )
+
+    print("✅ Migration completed: Added is_deterministic to global_params table")
+
+
+async def downgrade():
+    """Remove is_deterministic column from global_params table."""
+    async with engine.begin() as conn:
+        await conn.execute(
+            text(
+                """
+                ALTER TABLE global_params
+                DROP COLUMN IF EXISTS is_deterministic
+            """
+            )
+        )
+
+    print("⏪ Rollback completed: Removed is_deterministic from global_params table")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == "downgrade":
+        asyncio.run(downgrade())
+    else:
+        asyncio.run(upgrade())
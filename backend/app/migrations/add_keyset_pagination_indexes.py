@@ -0,0 +1,48 @@
+"""Migration script to add indexes for keyset (cursor) pagination.
+
+This script creates:
+- ix_test_reports_created_at_id: report lists, newest first
+- ix_scenarios_created_at_id: scenario lists, newest first
+- ix_test_plans_created_at_id: test plan lists, newest first
+- ix_interfaces_project_sort: interface lists per project by sort order
+"""
+
+import asyncio
+
+from sqlalchemy import text
+
+from app.database import engine
+
+INDEXES = {
+    "ix_test_reports_created_at_id": "test_reports (created_at, id)",
+    "ix_scenarios_created_at_id": "scenarios (created_at, id)",
+    "ix_test_plans_created_at_id": "test_plans (created_at, id)",
+    "ix_interfaces_project_sort": "interfaces (project_id, sort_order, id)",
+}
+
+
+async def upgrade():
+    """Create keyset pagination indexes."""
+    async with engine.begin() as conn:
+        for name, target in INDEXES.items():
+            await conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {target}"))
+
+    print("✅ Migration completed: Created keyset pagination indexes")
+
+
+async def downgrade():
+    """Drop keyset pagination indexes."""
+    async with engine.begin() as conn:
+        for name in INDEXES:
+            await conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+
+    print("⏪ Rollback completed: Dropped keyset pagination indexes")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == "downgrade":
+        asyncio.run(downgrade())
+    else:
+        asyncio.run(upgrade())
@@ -0,0 +1,46 @@
+"""Migration script to add the interface tree version to projects.
+
+This script adds:
+- projects.interface_tree_version: bumped on every folder or interface
+  change, used to cache the interface tree and as its ETag
+"""
+
+import asyncio
+
+from sqlalchemy import text
+
+from app.database import engine
+
+
+async def upgrade():
+    """Add interface_tree_version column."""
+    async with engine.begin() as conn:
+        await conn.execute(
+            text(
+                """
+                ALTER TABLE projects
+                ADD COLUMN IF NOT EXISTS interface_tree_version INTEGER NOT NULL DEFAULT 0
+            """
+            )
+        )
+
+    print("✅ Migration completed: Added projects.interface_tree_version")
+
+
+async def downgrade():
+    """Drop interface_tree_version column."""
+    async with engine.begin() as conn:
+        await conn.execute(
+            text("ALTER TABLE projects DROP COLUMN IF EXISTS interface_tree_version")
+        )
+
+    print("⏪ Rollback completed: Dropped projects.interface_tree_version")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == "downgrade":
+        asyncio.run(downgrade())
+    else:
+        asyncio.run(upgrade())
@@ -0,0 +1,85 @@
+"""Migration script to add the report_stats rollup table.
+
+This script creates:
+- report_stats: running report totals per plan and status
+
+and fills it from existing test_reports, so statistics reads never have to
+build it. ReportService.rebuild_report_stats repairs it later if needed.
+"""
+
+import asyncio
+
+from sqlalchemy import text
+
+from app.database import engine
+
+
+async def upgrade():
+    """Create report_stats table."""
+    async with engine.begin() as conn:
+        await conn.execute(
+            text(
+                """
+                CREATE TABLE IF NOT EXISTS report_stats (
+                    id SERIAL PRIMARY KEY,
+                    plan_id INTEGER NOT NULL REFERENCES test_plans(id) ON DELETE CASCADE,
+                    status VARCHAR(20) NOT NULL,
+                    reports INTEGER NOT NULL DEFAULT 0,
+                    total_scenarios INTEGER NOT NULL DEFAULT 0,
+                    passed INTEGER NOT NULL DEFAULT 0,
+                    failed INTEGER NOT NULL DEFAULT 0,
+                    skipped INTEGER NOT NULL DEFAULT 0,
+                    duration_total DOUBLE PRECISION NOT NULL DEFAULT 0,
+                    duration_count INTEGER NOT NULL DEFAULT 0,
+                    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+                    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+                    CONSTRAINT uq_report_stat UNIQUE (plan_id, status)
+                )
+            """
+            )
+        )
+
+        # Backfill from history (only into an empty table, so reruns are safe)
+        result = await conn.execute(
+            text(
+                """
+                INSERT INTO report_stats (
+                    plan_id, status, reports, total_scenarios, passed, failed,
+                    skipped, duration_total, duration_count
+                )
+                SELECT
+                    plan_id,
+                    status,
+                    COUNT(*),
+                    COALESCE(SUM(total_scenarios), 0),
+                    COALESCE(SUM(passed), 0),
+                    COALESCE(SUM(failed), 0),
+                    COALESCE(SUM(skipped), 0),
+                    COALESCE(SUM(duration_seconds), 0),
+                    COUNT(duration_seconds)
+                FROM test_reports
+                WHERE NOT EXISTS (SELECT 1 FROM report_stats)
+                GROUP BY plan_id, status
+            """
+            )
+        )
+
+    print("✅ Migration completed: Created report_stats table")
+    print(f"   Backfilled {result.rowcount} plan/status rows")
+
+
+async def downgrade():
+    """Drop report_stats table."""
+    async with engine.begin() as conn:
+        await conn.execute(text("DROP TABLE IF EXISTS report_stats"))
+
+    print("⏪ Rollback completed: Dropped report_stats table")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == "downgrade":
+        asyncio.run(downgrade())
+    else:
+        asyncio.run(upgrade())
@@ -0,0 +1,85 @@
+"""Migration script to add the scenario_tags index table.
+
+This script creates:
+- scenario_tags: one row per (scenario, lowercased tag name)
+- ix_scenario_tags_tag_scenario: scenarios by tag
+
+and fills it from the existing scenarios.tags JSON. New writes are kept in
+step by the Scenario mapper events in app.models.scenario_tag.
+"""
+
+import asyncio
+
+from sqlalchemy import insert, select, text
+
+from app.database import engine
+from app.models.scenario import Scenario
+from app.models.scenario_tag import ScenarioTag
+from app.utils.tag_expression import normalize_tags
+
+# Scenarios read per backfill batch
+BATCH_SIZE = 1000
+
+
+async def upgrade():
+    """Create and backfill scenario_tags table."""
+    async with engine.begin() as conn:
+        await conn.execute(
+            text(
+                """
+                CREATE TABLE IF NOT EXISTS scenario_tags (
+                    scenario_id INTEGER NOT NULL REFERENCES scenarios(id) ON DELETE CASCADE,
+                    tag VARCHAR(100) NOT NULL,
+                    PRIMARY KEY (scenario_id, tag)
+                )
+            """
+            )
+        )
+        await conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_scenario_tags_tag_scenario "
+                "ON scenario_tags (tag, scenario_id)"
+            )
+        )
+
+        await conn.execute(text("DELETE FROM scenario_tags"))
+        last_id = 0
+        total = 0
+        while True:
+            result = await conn.execute(
+                select(Scenario.id, Scenario.tags)
+                .where(Scenario.id > last_id)
+                .order_by(Scenario.id)
+                .limit(BATCH_SIZE)
+            )
+            scenarios = result.all()
+            if not scenarios:
+                break
+            rows = [
+                {"scenario_id": scenario_id, "tag": tag}
+                for scenario_id, tags in scenarios
+                for tag in normalize_tags(tags)
+            ]
+            if rows:
+                await conn.execute(insert(ScenarioTag), rows)
+            total += len(rows)
+            last_id = scenarios[-1][0]
+
+    print(f"✅ Migration completed: Created scenario_tags table ({total} tags)")
+
+
+async def downgrade():
+    """Drop scenario_tags table."""
+    async with engine.begin() as conn:
+        await conn.execute(text("DROP TABLE IF EXISTS scenario_tags"))
+
+    print("⏪ Rollback completed: Dropped scenario_tags table")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == "downgrade":
+        asyncio.run(downgrade())
+    else:
+        asyncio.run(upgrade())
@@ -0,0 +1,71 @@
+"""Migration script to add search indexes (PostgreSQL only).
+
+This script enables pg_trgm and creates:
+- GIN trigram indexes for ILIKE '%q%' on interface names/paths, scenario
+  names/descriptions, keyword names/method names, project and test plan names
+- GIN tsvector expression indexes for word search on interfaces, scenarios
+  and keywords (same expressions as app.services.search_service)
+
+Other databases are skipped: the search service uses an in-process index there.
+"""
+
+import asyncio
+
+from sqlalchemy import text
+
+from app.database import engine
+
+TRIGRAM_INDEXES = {
+    "ix_interfaces_name_trgm": "interfaces USING gin (name gin_trgm_ops)",
+    "ix_interfaces_path_trgm": "interfaces USING gin (path gin_trgm_ops)",
+    "ix_scenarios_name_trgm": "scenarios USING gin (name gin_trgm_ops)",
+    "ix_scenarios_description_trgm": "scenarios USING gin (description gin_trgm_ops)",
+    "ix_keywords_name_trgm": "keywords USING gin (name gin_trgm_ops)",
+    "ix_keywords_method_name_trgm": "keywords USING gin (method_name gin_trgm_ops)",
+    "ix_projects_name_trgm": "projects USING gin (name gin_trgm_ops)",
+    "ix_test_plans_name_trgm": "test_plans USING gin (name gin_trgm_ops)",
+}
+
+TSVECTOR_INDEXES = {
+    "ix_interfaces_fts": "interfaces USING gin "
+    "(to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(path, '')))",
+    "ix_scenarios_fts": "scenarios USING gin "
+    "(to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(description, '')))",
+    "ix_keywords_fts": "keywords USING gin "
+    "(to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(method_name, '')))",
+}
+
+
+async def upgrade():
+    """Create search indexes."""
+    if engine.dialect.name != "postgresql":
+        print("⏭️  Skipped: search indexes need PostgreSQL (pg_trgm)")
+        return
+
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        for name, target in {**TRIGRAM_INDEXES, **TSVECTOR_INDEXES}.items():
+            await conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {target}"))
+
+    print("✅ Migration completed: Created search indexes")
+
+
+async def downgrade():
+    """Drop search indexes (the pg_trgm extension is kept)."""
+    if engine.dialect.name != "postgresql":
+        return
+
+    async with engine.begin() as conn:
+        for name in {**TRIGRAM_INDEXES, **TSVECTOR_INDEXES}:
+            await conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+
+    print("⏪ Rollback completed: Dropped search indexes")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == "downgrade":
+        asyncio.run(downgrade())
+    else:
+        asyncio.run(upgrade())
@@ -0,0 +1,52 @@
+"""Migration script to add seed to test_executions table.
+
+This script adds:
+- seed: BIGINT (nullable; executions created before this migration have none)
+
+Run this script after updating the TestExecution model.
+"""
+
+import asyncio
+
+from sqlalchemy import text
+
+from app.database import engine
+
+
+async def upgrade():
+    """Add seed column to test_executions table."""
+    async with engine.begin() as conn:
+        await conn.execute(
+            text(
+                """
+                ALTER TABLE test_executions
+                ADD COLUMN IF NOT EXISTS seed BIGINT
+            """
+            )
+        )
+
+    print("✅ Migration completed: Added seed to test_executions table")
+
+
+async def downgrade():
+    """Remove seed column from test_executions table."""
+    async with engine.begin() as conn:
+        await conn.execute(
+            text(
+                """
+                ALTER TABLE test_executions
+                DROP COLUMN IF EXISTS seed
+            """
+            )
+        )
+
+    print("⏪ Rollback completed: Removed seed from test_executions table")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == "downgrade":
+        asyncio.run(downgrade())
+    else:
+        asyncio.run(upgrade())
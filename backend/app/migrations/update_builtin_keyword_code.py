@@ -0,0 +1,40 @@
+"""Migration script to refresh the code of built-in keyword rows.
+
+The assert_response and extract_variable keywords now delegate JSON path
+handling to app.utils.json_path (indexes, wildcards and filters). Rows
+created before that still hold the old dotted-key code; this rewrites every
+built-in keyword row from app.builtin_keywords.
+
+The application refreshes these rows on startup too; run this script for
+deployments that execute scenarios before the API has restarted.
+"""
+
+import asyncio
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import engine
+from app.init_builtin import init_builtin_keywords
+
+
+async def upgrade():
+    """Rewrite built-in keyword rows from the current definitions."""
+    async with AsyncSession(engine) as db:
+        count = await init_builtin_keywords(db)
+        await db.commit()
+
+    print(f"✅ Migration completed: Refreshed code of {count} built-in keywords")
+
+
+async def downgrade():
+    """Nothing to undo: the previous release rewrites the rows on startup."""
+    print("⏪ Rollback completed: Built-in keywords are restored by the previous release")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == "downgrade":
+        asyncio.run(downgrade())
+    else:
+        asyncio.run(upgrade())
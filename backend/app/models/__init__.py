@@ -13,6 +13,7 @@ from .database_config import DatabaseConfig
 from .dataset import Dataset
 from .env_variable import EnvVariable
 from .environment import Environment
+from .execution_daily_stat import ExecutionDailyStat
 from .execution_scenario import ExecutionScenario
 from .execution_step import ExecutionStep
 from .global_param import GlobalParam
@@ -28,10 +29,12 @@ from .plan_scenario import PlanScenario
 
 # Project and related models
 from .project import Project
+from .report_stat import ReportStat
 
 # Scenario and test execution
 from .scenario import Scenario
 from .scenario_step import ScenarioStep
+from .scenario_tag import ScenarioTag
 from .test_execution import TestExecution
 from .test_plan import TestPlan
 from .test_report import TestReport
@@ -49,12 +52,15 @@ __all__ = [
     "GlobalVariable",
     "Scenario",
     "ScenarioStep",
+    "ScenarioTag",
     "Dataset",
     "TestPlan",
     "PlanScenario",
     "TestExecution",
     "ExecutionScenario",
     "ExecutionStep",
+    "ExecutionDailyStat",
     "TestReport",
+    "ReportStat",
     "GlobalParam",
 ]
@@ -22,8 +22,8 @@ class Dataset(Base, TimestampMixin):
         Integer, ForeignKey("scenarios.id", ondelete="CASCADE"), nullable=False, index=True
     )
     name: Mapped[str] = mapped_column(String(200), nullable=False)
-    headers: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False, default=dict)  # 表头 (变量名数组)
-    rows: Mapped[dict[str, Any]] = mapped_column(JSON, default=dict)  # 二维数据数组
+    headers: Mapped[list[str]] = mapped_column(JSON, nullable=False, default=list)  # 表头 (变量名数组)
+    rows: Mapped[list[list[Any]]] = mapped_column(JSON, default=list)  # 二维数据数组
 
     __table_args__ = ()
 
@@ -0,0 +1,39 @@
+"""Daily execution rollup model."""
+
+from datetime import date
+
+from sqlalchemy import Date, Float, ForeignKey, Integer, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+from app.models.base import TimestampMixin
+
+
+class ExecutionDailyStat(Base, TimestampMixin):
+    """Per project and day totals of finished test executions.
+
+    Maintained incrementally when an execution finishes (see
+    ExecutionStatsService) so dashboard trends read one row per project-day
+    instead of scanning test_executions.
+    """
+
+    __tablename__ = "execution_daily_stats"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    project_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False
+    )
+    day: Mapped[date] = mapped_column(Date, nullable=False, index=True)  # 执行创建日期
+    executions: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    passed_scenarios: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    failed_scenarios: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    skipped_scenarios: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    duration_seconds: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)  # 总耗时
+
+    __table_args__ = (UniqueConstraint("project_id", "day", name="uq_execution_daily_stat"),)
+
+    def __repr__(self) -> str:
+        return (
+            f"<ExecutionDailyStat(project_id={self.project_id}, day={self.day}, "
+            f"executions={self.executions})>"
+        )
@@ -26,6 +26,8 @@ class GlobalParam(Base, TimestampMixin):
     params_in: Mapped[dict[str, Any]] = mapped_column(JSON, default=dict)  # [{name, type, description}]
     params_out: Mapped[dict[str, Any]] = mapped_column(JSON, default=dict)  # [{type, description}]
     is_builtin: Mapped[bool] = mapped_column(nullable=False, default=False)
+    # 纯函数: 相同参数总是返回相同结果, 批量解析时可去重
+    is_deterministic: Mapped[bool] = mapped_column(nullable=False, default=False)
 
     __table_args__ = (UniqueConstraint("class_name", "method_name", name="uq_class_method"),)
 
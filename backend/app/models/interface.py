@@ -35,7 +35,10 @@ class Interface(Base, TimestampMixin):
     )  # json/form-data/raw
     sort_order: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
 
-    __table_args__ = (Index("ix_interfaces_project_folder", "project_id", "folder_id"),)
+    __table_args__ = (
+        Index("ix_interfaces_project_folder", "project_id", "folder_id"),
+        Index("ix_interfaces_project_sort", "project_id", "sort_order", "id"),  # 游标分页
+    )
 
     def __repr__(self) -> str:
         return (
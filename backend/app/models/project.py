@@ -19,6 +19,9 @@ class Project(Base, TimestampMixin):
     creator_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
+    interface_tree_version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )  # 接口树版本: 目录或接口变更时递增, 用于树缓存和 ETag
 
     # Relationships
     creator = relationship("User", lazy="joined")
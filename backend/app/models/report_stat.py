@@ -0,0 +1,38 @@
+"""Report statistics rollup model."""
+
+from sqlalchemy import Float, ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+from app.models.base import TimestampMixin
+
+
+class ReportStat(Base, TimestampMixin):
+    """Running totals of test reports per plan and status.
+
+    Kept in step with test_reports by ReportService (create, delete and
+    cleanup), so report statistics read a handful of rows instead of
+    aggregating the whole reports table.
+    """
+
+    __tablename__ = "report_stats"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    plan_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("test_plans.id", ondelete="CASCADE"), nullable=False
+    )
+    status: Mapped[str] = mapped_column(String(20), nullable=False)
+    reports: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_scenarios: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    passed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    failed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    skipped: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    duration_total: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    duration_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0
+    )  # 有耗时的报告数 (用于计算平均耗时)
+
+    __table_args__ = (UniqueConstraint("plan_id", "status", name="uq_report_stat"),)
+
+    def __repr__(self) -> str:
+        return f"<ReportStat(plan_id={self.plan_id}, status={self.status}, reports={self.reports})>"
@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from sqlalchemy import JSON, ForeignKey, Integer, String, Text
+from sqlalchemy import JSON, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -40,7 +40,9 @@ class Scenario(Base, TimestampMixin):
     # Relationships
     steps = relationship("ScenarioStep", back_populates="scenario", cascade="all, delete-orphan")
 
-    __table_args__ = ()
+    __table_args__ = (
+        Index("ix_scenarios_created_at_id", "created_at", "id"),  # 游标分页
+    )
 
     def __repr__(self) -> str:
         return f"<Scenario(id={self.id}, name={self.name}, priority={self.priority})>"
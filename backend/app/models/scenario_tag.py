@@ -0,0 +1,58 @@
+"""Scenario tag index model."""
+
+from sqlalchemy import ForeignKey, Index, Integer, String, delete, event, insert
+from sqlalchemy.orm import Mapped, attributes, mapped_column
+
+from app.database import Base
+from app.models.scenario import Scenario
+from app.utils.tag_expression import MAX_TAG_LENGTH, normalize_tags
+
+
+class ScenarioTag(Base):
+    """One tag of a scenario.
+
+    Normalized copy of the tag names in ``Scenario.tags`` so scenarios can be
+    filtered by tag expressions with indexed lookups. Rows are maintained by
+    the Scenario mapper events below, so every ORM write path (services,
+    imports) keeps them in step with the JSON column; code inserting
+    scenarios with Core statements must copy the rows itself.
+    """
+
+    __tablename__ = "scenario_tags"
+
+    scenario_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("scenarios.id", ondelete="CASCADE"), primary_key=True
+    )
+    tag: Mapped[str] = mapped_column(String(MAX_TAG_LENGTH), primary_key=True)  # 小写标签名
+
+    __table_args__ = (
+        Index("ix_scenario_tags_tag_scenario", "tag", "scenario_id"),  # 按标签查场景
+    )
+
+    def __repr__(self) -> str:
+        return f"<ScenarioTag(scenario_id={self.scenario_id}, tag={self.tag})>"
+
+
+def _write_tags(connection, scenario_id: int, tags) -> None:
+    """Replace the tag rows of a scenario."""
+    connection.execute(delete(ScenarioTag).where(ScenarioTag.scenario_id == scenario_id))
+    rows = [{"scenario_id": scenario_id, "tag": tag} for tag in normalize_tags(tags)]
+    if rows:
+        connection.execute(insert(ScenarioTag), rows)
+
+
+@event.listens_for(Scenario, "after_insert")
+def _scenario_inserted(mapper, connection, target: Scenario) -> None:
+    if target.tags:
+        _write_tags(connection, target.id, target.tags)
+
+
+@event.listens_for(Scenario, "after_update")
+def _scenario_updated(mapper, connection, target: Scenario) -> None:
+    if attributes.get_history(target, "tags").has_changes():
+        _write_tags(connection, target.id, target.tags)
+
+
+@event.listens_for(Scenario, "after_delete")
+def _scenario_deleted(mapper, connection, target: Scenario) -> None:
+    connection.execute(delete(ScenarioTag).where(ScenarioTag.scenario_id == target.id))
@@ -3,10 +3,11 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
+from app.utils.seeded_random import new_seed
 
 
 class TestExecution(Base):
@@ -35,6 +36,9 @@ class TestExecution(Base):
     passed_scenarios: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     failed_scenarios: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     skipped_scenarios: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    seed: Mapped[int | None] = mapped_column(
+        BigInteger, nullable=True, default=new_seed
+    )  # 随机种子 (派生各场景/数据行的随机数生成器, 用于复现)
     started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
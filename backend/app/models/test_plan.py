@@ -1,7 +1,7 @@
 """Test plan model."""
 
 
-from sqlalchemy import ForeignKey, Integer, String, Text
+from sqlalchemy import ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -30,7 +30,9 @@ class TestPlan(Base, TimestampMixin):
     project = relationship("Project", back_populates="test_plans")
     creator = relationship("User", back_populates="test_plans")
 
-    __table_args__ = ()
+    __table_args__ = (
+        Index("ix_test_plans_created_at_id", "created_at", "id"),  # 游标分页
+    )
 
     def __repr__(self) -> str:
         return f"<TestPlan(id={self.id}, name={self.name})>"
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, Float, ForeignKey, Integer, String
+from sqlalchemy import DateTime, Float, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -50,7 +50,9 @@ class TestReport(Base):
     )
     updated_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
-    __table_args__ = ()
+    __table_args__ = (
+        Index("ix_test_reports_created_at_id", "created_at", "id"),  # 游标分页
+    )
 
     def __repr__(self) -> str:
         return f"<TestReport(id={self.id}, status={self.status}, passed={self.passed}, failed={self.failed})>"
@@ -11,6 +11,7 @@ from app.routers import (
     projects,
     reports,
     scenarios,
+    search,
     test_plans,
     upload,
 )
@@ -26,6 +27,7 @@ __all__ = [
     "global_params",
     "reports",
     "scenarios",
+    "search",
     "test_plans",
     "upload",
 ]
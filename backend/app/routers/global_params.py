@@ -9,6 +9,9 @@ from app.database import get_db
 from app.middleware.auth import get_current_user
 from app.models.user import User
 from app.schemas.global_param import (
+    FunctionParseBatchItem,
+    FunctionParseBatchRequest,
+    FunctionParseBatchResponse,
     FunctionParseRequest,
     FunctionParseResponse,
     GlobalParamCreate,
@@ -325,3 +328,32 @@ async def parse_function_calls(
             success=False,
             error=str(e),
         )
+
+
+@router.post("/parse/batch", response_model=FunctionParseBatchResponse)
+async def parse_function_calls_batch(
+    request: FunctionParseBatchRequest,
+    current_user: User = Depends(get_current_user),
+    service: GlobalParamService = Depends(get_global_param_service),
+):
+    """Parse {{function()}} calls in many texts or structures at once.
+
+    Items share one executor and context; deterministic expressions are
+    evaluated once per batch.
+
+    Args:
+        request: Batch parse request containing items and context
+        current_user: Current authenticated user
+        service: Global parameter service
+
+    Returns:
+        Parsed items in request order
+    """
+    results, evaluated, deduplicated = await service.parse_batch(
+        request.items, request.context
+    )
+    return FunctionParseBatchResponse(
+        results=[FunctionParseBatchItem(**item) for item in results],
+        evaluated=evaluated,
+        deduplicated=deduplicated,
+    )
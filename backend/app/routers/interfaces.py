@@ -2,22 +2,40 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Form,
+    Header,
+    HTTPException,
+    Query,
+    Response,
+    UploadFile,
+    status,
+)
+from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
+from app.middleware.auth import get_current_user
+from app.models.user import User
 from app.schemas.interface import (
     CurlImportRequest,
+    ImportMode,
     InterfaceCreate,
     InterfaceFolderCreate,
     InterfaceFolderResponse,
     InterfaceFolderUpdate,
+    InterfaceImportResponse,
     InterfaceReorderRequest,
     InterfaceResponse,
     InterfaceTreeNode,
     InterfaceUpdate,
 )
+from app.services.interface_import_service import InterfaceImportService
 from app.services.interface_service import InterfaceService
+from app.utils.pagination import CURSOR_PAGE_RESPONSES, NEXT_CURSOR_HEADER
 
 router = APIRouter(prefix="/interfaces", tags=["interfaces"])
 
@@ -41,19 +59,59 @@ def get_interface_service(db: Annotated[AsyncSession, Depends(get_db)]) -> Inter
 @router.get("/tree", response_model=list[InterfaceTreeNode])
 async def get_interface_tree(
     project_id: int = Query(..., description="Project ID"),
+    parent_id: int | None = Query(None, description="Lazy mode: folder to expand (default: root)"),
+    depth: int | None = Query(None, ge=1, le=10, description="Lazy mode: levels to return"),
+    if_none_match: str | None = Header(None),
     service: InterfaceService = Depends(get_interface_service),
 ):
-    """Get full interface tree for a project.
+    """Get the interface tree for a project.
+
+    Without parent_id/depth the whole tree is returned. With either, only
+    depth levels below parent_id (or the root) are returned, folders on the
+    last level carrying child_count, so the sidebar can expand on demand.
+
+    The response carries an ETag that changes whenever a folder or interface
+    of the project changes; send it back in If-None-Match to get 304 Not
+    Modified while the tree is unchanged.
 
     Args:
         project_id: Project ID
+        parent_id: Folder to expand (lazy mode)
+        depth: Levels to return (lazy mode, default 1)
+        if_none_match: ETags the client already has
         service: Interface service
 
     Returns:
         List of tree nodes (folders and interfaces)
+
+    Raises:
+        HTTPException: If the project doesn't exist or parent_id is not a
+            folder of the project
     """
-    tree = await service.get_interface_tree(project_id)
-    return tree
+    lazy = parent_id is not None or depth is not None
+    version = await service.get_tree_version(project_id)
+    if version is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
+    etag = f'"tree-{project_id}-{version}"'
+    if lazy:
+        etag = f'"tree-{project_id}-{version}-{parent_id or 0}-{depth or 1}"'
+
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if if_none_match and (
+        if_none_match.strip() == "*"
+        or etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    ):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    if not lazy:
+        body = await service.get_interface_tree_json(project_id, version)
+        return Response(content=body, media_type="application/json", headers=headers)
+
+    try:
+        nodes = await service.get_interface_subtree(project_id, parent_id, depth or 1)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+    return JSONResponse(content=nodes, headers=headers)
 
 
 # ============== Folder Endpoints ==============
@@ -132,24 +190,47 @@ async def delete_folder(
 
 # ============== Interface Endpoints ==============
 
-@router.get("", response_model=list[InterfaceResponse])
+@router.get("", response_model=list[InterfaceResponse], responses=CURSOR_PAGE_RESPONSES)
 async def list_interfaces(
+    response: Response,
     project_id: int = Query(..., description="Project ID"),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=100, description="Maximum number of records"),
+    cursor: str | None = Query(
+        None, description="Cursor pagination: X-Next-Cursor of the previous page, empty for the first"
+    ),
     service: InterfaceService = Depends(get_interface_service),
 ):
     """List all interfaces for a project.
 
+    Passing cursor switches to keyset pagination: skip is ignored and the
+    next page's cursor is returned in the X-Next-Cursor header.
+
     Args:
+        response: Response (for the X-Next-Cursor header)
         project_id: Project ID
         skip: Number of records to skip
         limit: Maximum number of records
+        cursor: Cursor of the previous page ("" for the first page)
         service: Interface service
 
     Returns:
         List of interfaces
+
+    Raises:
+        HTTPException: If the cursor is invalid
     """
+    if cursor is not None:
+        try:
+            interfaces, next_cursor = await service.list_interfaces_page(
+                project_id, cursor or None, limit
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+        if next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = next_cursor
+        return interfaces
+
     interfaces, _ = await service.list_interfaces(project_id, skip, limit)
     return interfaces
 
@@ -295,3 +376,186 @@ async def import_from_curl(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         ) from e
+
+
+# ============== Bulk Import ==============
+
+@router.post(
+    "/import/curl/batch",
+    response_model=InterfaceImportResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def import_from_curl_batch(
+    file: Annotated[UploadFile, File(description="Text file of cURL commands")],
+    project_id: Annotated[int, Form()],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    folder_id: Annotated[int | None, Form()] = None,
+    mode: Annotated[ImportMode, Form()] = "skip",
+):
+    """Import interfaces from many cURL commands at once.
+
+    Args:
+        file: Uploaded file, one command per line (backslash continuations allowed)
+        project_id: Project ID
+        db: Database session
+        folder_id: Target folder ID (None: project root)
+        mode: What to do with existing (method, path): append, skip or upsert
+
+    Returns:
+        Import summary with per-line errors
+
+    Raises:
+        HTTPException: If the file or the target folder is invalid
+    """
+    try:
+        text = (await file.read()).decode("utf-8-sig")
+    except UnicodeDecodeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="cURL file must be UTF-8 text",
+        ) from e
+
+    service = InterfaceImportService(db)
+    try:
+        return await service.import_curl_batch(project_id, text, folder_id, mode)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+
+
+@router.post(
+    "/import/openapi",
+    response_model=InterfaceImportResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def import_from_openapi(
+    file: Annotated[UploadFile, File(description="OpenAPI 3 / Swagger 2 document (JSON or YAML)")],
+    project_id: Annotated[int, Form()],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    folder_id: Annotated[int | None, Form()] = None,
+    mode: Annotated[ImportMode, Form()] = "skip",
+):
+    """Import interfaces from an OpenAPI / Swagger document.
+
+    The upload is read incrementally and written with bulk statements, so
+    large specifications don't have to fit in memory.
+
+    Args:
+        file: Uploaded document
+        project_id: Project ID
+        db: Database session
+        folder_id: Target folder ID (None: project root)
+        mode: What to do with existing (method, path): append, skip or upsert
+
+    Returns:
+        Import summary
+
+    Raises:
+        HTTPException: If the document or the target folder is invalid
+    """
+    service = InterfaceImportService(db)
+    try:
+        return await service.import_openapi(project_id, file.file, folder_id, mode)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+
+
+@router.post(
+    "/import/postman",
+    response_model=InterfaceImportResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def import_from_postman(
+    file: Annotated[UploadFile, File(description="Postman collection (v2.0 / v2.1)")],
+    project_id: Annotated[int, Form()],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    folder_id: Annotated[int | None, Form()] = None,
+    mode: Annotated[ImportMode, Form()] = "skip",
+    scenario_name: Annotated[str | None, Form()] = None,
+    current_user: User = Depends(get_current_user),
+):
+    """Import interfaces, and optionally a scenario, from a Postman collection.
+
+    Args:
+        file: Uploaded collection
+        project_id: Project ID
+        db: Database session
+        folder_id: Target folder ID (None: project root)
+        mode: What to do with existing (method, path): append, skip or upsert
+        scenario_name: Also create a scenario replaying the requests in order
+        current_user: Current authenticated user (creator of the scenario)
+
+    Returns:
+        Import summary
+
+    Raises:
+        HTTPException: If the document or the target folder is invalid
+    """
+    service = InterfaceImportService(db)
+    try:
+        return await service.import_postman(
+            project_id,
+            file.file,
+            folder_id,
+            mode,
+            scenario_name=scenario_name or None,
+            creator_id=current_user.id,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+
+
+@router.post(
+    "/import/har",
+    response_model=InterfaceImportResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def import_from_har(
+    file: Annotated[UploadFile, File(description="HAR capture")],
+    project_id: Annotated[int, Form()],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    folder_id: Annotated[int | None, Form()] = None,
+    mode: Annotated[ImportMode, Form()] = "skip",
+    scenario_name: Annotated[str | None, Form()] = None,
+    current_user: User = Depends(get_current_user),
+):
+    """Import interfaces, and optionally a scenario, from a HAR capture.
+
+    Args:
+        file: Uploaded capture
+        project_id: Project ID
+        db: Database session
+        folder_id: Target folder ID (None: project root)
+        mode: What to do with existing (method, path): append, skip or upsert
+        scenario_name: Also create a scenario replaying the requests in order
+        current_user: Current authenticated user (creator of the scenario)
+
+    Returns:
+        Import summary
+
+    Raises:
+        HTTPException: If the document or the target folder is invalid
+    """
+    service = InterfaceImportService(db)
+    try:
+        return await service.import_har(
+            project_id,
+            file.file,
+            folder_id,
+            mode,
+            scenario_name=scenario_name or None,
+            creator_id=current_user.id,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
@@ -2,7 +2,8 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
@@ -10,10 +11,13 @@ from app.middleware.auth import get_current_user
 from app.models.user import User
 from app.schemas.project import (
     ProjectCreate,
+    ProjectImportResponse,
     ProjectListResponse,
     ProjectResponse,
     ProjectUpdate,
 )
+from app.services.clone_service import CloneService
+from app.services.project_bundle_service import ProjectBundleService
 from app.services.project_service import ProjectService
 
 router = APIRouter(prefix="/projects", tags=["Projects"])
@@ -212,3 +216,130 @@ async def delete_project(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found",
         )
+
+
+@router.post(
+    "/{project_id}/clone", response_model=ProjectResponse, status_code=status.HTTP_201_CREATED
+)
+async def clone_project(
+    project_id: int,
+    name: Annotated[
+        str | None, Query(min_length=1, max_length=200, description="副本名称, 默认原名称加 (copy)")
+    ] = None,
+    current_user: User = Depends(get_current_user),
+    project_service: ProjectService = Depends(get_project_service),
+):
+    """Clone a project with its interfaces, scenarios, plans and settings.
+
+    Args:
+        project_id: Project ID
+        name: Name of the clone
+        current_user: Current authenticated user
+        project_service: Project service
+
+    Returns:
+        Cloned project
+
+    Raises:
+        HTTPException: If project not found or the name already exists
+    """
+    project = await project_service.get_project_by_id(project_id)
+    if not project:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found",
+        )
+
+    try:
+        new_id = await CloneService(project_service.db).clone_project(
+            project_id, current_user.id, name
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+
+    project = await project_service.get_project_by_id(new_id)
+    assert project is not None  # Type guard: the clone was inserted above
+    return ProjectResponse(
+        id=project.id,
+        name=project.name,
+        description=project.description,
+        creator_name=project.creator.nickname,
+        created_at=project.created_at,
+        updated_at=project.updated_at,
+    )
+
+
+@router.get("/{project_id}/export")
+async def export_project(
+    project_id: int,
+    current_user: User = Depends(get_current_user),
+    project_service: ProjectService = Depends(get_project_service),
+):
+    """Export a project as a gzip-compressed NDJSON bundle.
+
+    The bundle is streamed; database passwords are not included.
+
+    Args:
+        project_id: Project ID
+        current_user: Current authenticated user
+        project_service: Project service
+
+    Returns:
+        Streaming .ndjson.gz download
+
+    Raises:
+        HTTPException: If project not found
+    """
+    project = await project_service.get_project_by_id(project_id)
+    if not project:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found",
+        )
+
+    return StreamingResponse(
+        ProjectBundleService(project_service.db).export_project(project_id),
+        media_type="application/gzip",
+        headers={
+            "Content-Disposition": f'attachment; filename="project-{project_id}.ndjson.gz"'
+        },
+    )
+
+
+@router.post(
+    "/import", response_model=ProjectImportResponse, status_code=status.HTTP_201_CREATED
+)
+async def import_project(
+    file: Annotated[UploadFile, File(description="项目导出包 (.ndjson.gz)")],
+    name: Annotated[
+        str | None, Query(min_length=1, max_length=200, description="新项目名称, 默认使用导出包中的名称")
+    ] = None,
+    current_user: User = Depends(get_current_user),
+    project_service: ProjectService = Depends(get_project_service),
+):
+    """Import a project bundle as a new project.
+
+    Args:
+        file: Bundle from the export endpoint
+        name: Name of the new project
+        current_user: Current authenticated user
+        project_service: Project service
+
+    Returns:
+        Import summary
+
+    Raises:
+        HTTPException: If the bundle is invalid or the name already exists
+    """
+    try:
+        return await ProjectBundleService(project_service.db).import_project(
+            file.file, current_user.id, name
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
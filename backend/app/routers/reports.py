@@ -16,33 +16,68 @@ from app.schemas.report import (
 )
 from app.services.report_export_service import ReportExportService
 from app.services.report_service import ReportService
+from app.utils.pagination import CURSOR_PAGE_RESPONSES, NEXT_CURSOR_HEADER
 
 router = APIRouter(prefix="/reports", tags=["reports"])
 
 
-@router.get("", response_model=ReportListResponse)
+@router.get("", response_model=ReportListResponse, responses=CURSOR_PAGE_RESPONSES)
 async def get_reports(
+    response: Response,
     project_id: int | None = Query(None, description="Filter by project ID"),
     plan_id: int | None = Query(None, description="Filter by plan ID"),
     status_filter: str | None = Query(None, alias="status", description="Filter by status"),
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: str | None = Query(
+        None, description="Cursor pagination: X-Next-Cursor of the previous page, empty for the first"
+    ),
+    with_total: bool = Query(True, description="Include the (cached) total in cursor mode"),
     session: AsyncSession = Depends(get_db),
 ) -> ReportListResponse:
     """Get paginated list of test reports.
 
+    Passing cursor switches to keyset pagination: page is ignored and the
+    next page's cursor is returned in the X-Next-Cursor header.
+
     Args:
+        response: Response (for the X-Next-Cursor header)
         project_id: Filter by project ID (not yet implemented, ignored)
         plan_id: Filter by plan ID
         status_filter: Filter by status
         page: Page number (1-indexed)
         limit: Items per page
+        cursor: Cursor of the previous page ("" for the first page)
+        with_total: Include the total count in cursor mode
         session: Database session
 
     Returns:
         Paginated list of reports
+
+    Raises:
+        HTTPException: If the cursor is invalid
     """
     service = ReportService(session)
+    if cursor is not None:
+        try:
+            reports, next_cursor, total = await service.get_reports_page(
+                plan_id=plan_id,
+                status=status_filter,
+                cursor=cursor or None,
+                limit=limit,
+                with_total=with_total,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+        if next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = next_cursor
+        return ReportListResponse(
+            reports=[ReportResponse.model_validate(report) for report in reports],
+            total=total,
+            page=page,
+            limit=limit,
+        )
+
     reports, total = await service.get_reports(
         plan_id=plan_id,
         status=status_filter,
@@ -60,18 +95,22 @@ async def get_reports(
 
 @router.get("/statistics", response_model=ReportStatistics)
 async def get_report_statistics(
+    plan_id: int | None = Query(None, description="Filter by plan ID"),
+    status_filter: str | None = Query(None, alias="status", description="Filter by status"),
     session: AsyncSession = Depends(get_db),
 ) -> ReportStatistics:
     """Get report statistics.
 
     Args:
+        plan_id: Filter by plan ID
+        status_filter: Filter by status
         session: Database session
 
     Returns:
         Report statistics
     """
     service = ReportService(session)
-    stats = await service.get_report_statistics()
+    stats = await service.get_report_statistics(plan_id=plan_id, status=status_filter)
 
     return ReportStatistics(**stats)
 
@@ -191,6 +230,40 @@ async def export_report(
     )
 
 
+@router.get("/{report_id}/steps/{step_id}/payload")
+async def get_step_payload(
+    report_id: int,
+    step_id: int,
+    kind: str = Query("response", pattern="^(request|response)$", description="request/response"),
+    session: AsyncSession = Depends(get_db),
+) -> dict | None:
+    """Get the full request or response payload of an execution step.
+
+    Large payloads are stored outside the database; this endpoint fetches and
+    decompresses them on demand.
+
+    Args:
+        report_id: Report ID
+        step_id: Execution step ID
+        kind: Payload kind (request/response)
+        session: Database session
+
+    Returns:
+        Full payload
+
+    Raises:
+        HTTPException: If report or step not found, or payload cannot be read
+    """
+    service = ReportService(session)
+    try:
+        return await service.get_step_payload(report_id, step_id, kind)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+
+
 @router.delete("/{report_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_report(
     report_id: int,
@@ -2,12 +2,15 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Response, UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
+from app.schemas.load_test import LoadTestJobResponse, LoadTestRequest
 from app.schemas.scenario import (
     CSVUploadResponse,
+    DatasetGenerateRequest,
+    DatasetGenerateResponse,
     DatasetResponse,
     ScenarioCreate,
     ScenarioListResponse,
@@ -17,7 +20,14 @@ from app.schemas.scenario import (
     ScenarioUpdate,
     StepReorderRequest,
 )
+from app.services.clone_service import CloneService
+from app.services.load_test_service import (
+    LoadTestService,
+    get_load_test_job,
+    start_load_test_job,
+)
 from app.services.scenario_service import ScenarioService
+from app.utils.pagination import CURSOR_PAGE_RESPONSES, NEXT_CURSOR_HEADER
 
 router = APIRouter(prefix="/scenarios", tags=["scenarios"])
 
@@ -36,6 +46,34 @@ def get_scenario_service(
     return ScenarioService(session)
 
 
+def get_load_test_service(
+    session: Annotated[AsyncSession, Depends(get_db)]
+) -> LoadTestService:
+    """Get load test service instance.
+
+    Args:
+        session: Database session
+
+    Returns:
+        LoadTestService instance
+    """
+    return LoadTestService(session)
+
+
+def get_clone_service(
+    session: Annotated[AsyncSession, Depends(get_db)]
+) -> CloneService:
+    """Get clone service instance.
+
+    Args:
+        session: Database session
+
+    Returns:
+        CloneService instance
+    """
+    return CloneService(session)
+
+
 @router.post("", response_model=ScenarioResponse, status_code=201)
 async def create_scenario(
     scenario_data: ScenarioCreate,
@@ -69,29 +107,61 @@ async def create_scenario(
     return ScenarioResponse.model_validate(result)
 
 
-@router.get("", response_model=list[ScenarioListResponse])
+@router.get("", response_model=list[ScenarioListResponse], responses=CURSOR_PAGE_RESPONSES)
 async def list_scenarios(
+    response: Response,
     service: Annotated[ScenarioService, Depends(get_scenario_service)],
     project_id: Annotated[int | None, Query(gt=0)] = None,
     limit: Annotated[int, Query(gt=0, le=100)] = 100,
     offset: Annotated[int, Query(ge=0)] = 0,
+    cursor: Annotated[str | None, Query(description="游标分页: 上一页的 X-Next-Cursor, 首页传空")] = None,
+    tags: Annotated[
+        str | None, Query(max_length=500, description="标签表达式, 如 smoke AND NOT slow")
+    ] = None,
 ):
     """List scenarios with optional filtering.
 
+    Passing cursor switches to keyset pagination: offset is ignored and the
+    next page's cursor is returned in the X-Next-Cursor header.
+
     Args:
+        response: Response (for the X-Next-Cursor header)
         project_id: Optional project ID filter
         limit: Maximum number of results (default: 100)
         offset: Number of results to skip (default: 0)
+        cursor: Cursor of the previous page ("" for the first page)
+        tags: Tag expression (AND / OR / NOT, parentheses)
         service: Scenario service
 
     Returns:
         List of scenarios
+
+    Raises:
+        HTTPException: If the cursor or tag expression is invalid
     """
-    scenarios, _ = await service.list_scenarios(
-        project_id=project_id,
-        limit=limit,
-        offset=offset,
-    )
+    if cursor is not None:
+        try:
+            scenarios, next_cursor = await service.list_scenarios_page(
+                project_id=project_id,
+                cursor=cursor or None,
+                limit=limit,
+                tag_expression=tags,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+        if next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = next_cursor
+        return [ScenarioListResponse(**s) for s in scenarios]
+
+    try:
+        scenarios, _ = await service.list_scenarios(
+            project_id=project_id,
+            limit=limit,
+            offset=offset,
+            tag_expression=tags,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
     return [ScenarioListResponse(**s) for s in scenarios]
 
@@ -181,6 +251,38 @@ async def delete_scenario(
     return {"message": "Scenario deleted successfully"}
 
 
+@router.post("/{scenario_id}/clone", response_model=ScenarioResponse, status_code=201)
+async def clone_scenario(
+    scenario_id: int,
+    service: Annotated[ScenarioService, Depends(get_scenario_service)],
+    clone_service: Annotated[CloneService, Depends(get_clone_service)],
+    name: Annotated[
+        str | None, Query(min_length=1, max_length=200, description="副本名称, 默认原名称加 (copy)")
+    ] = None,
+):
+    """Clone a scenario with its steps, datasets, variables and tags.
+
+    Args:
+        scenario_id: Scenario ID
+        service: Scenario service
+        clone_service: Clone service
+        name: Name of the clone
+
+    Returns:
+        Cloned scenario
+
+    Raises:
+        HTTPException: If scenario not found
+    """
+    try:
+        new_id = await clone_service.clone_scenario(scenario_id, name)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+
+    scenario = await service.get_scenario_by_id(new_id)
+    return ScenarioResponse.model_validate(scenario)
+
+
 @router.post("/{scenario_id}/steps", response_model=ScenarioStepResponse, status_code=201)
 async def add_step(
     scenario_id: int,
@@ -378,6 +480,55 @@ async def upload_dataset(
     )
 
 
+@router.post(
+    "/{scenario_id}/dataset/generate", response_model=DatasetGenerateResponse, status_code=201
+)
+async def generate_dataset(
+    scenario_id: int,
+    generate_in: DatasetGenerateRequest,
+    service: Annotated[ScenarioService, Depends(get_scenario_service)],
+):
+    """Generate scenario dataset from global-param function templates.
+
+    Args:
+        scenario_id: Scenario ID
+        generate_in: Row count and column templates
+        service: Scenario service
+
+    Returns:
+        Generated dataset summary with a preview of the first rows
+
+    Raises:
+        HTTPException: If scenario not found or a column expression fails
+    """
+    try:
+        result = await service.generate_dataset(
+            scenario_id=scenario_id,
+            name=generate_in.name,
+            columns=generate_in.columns,
+            rows=generate_in.rows,
+            seed=generate_in.seed,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    if not result:
+        raise HTTPException(status_code=404, detail="Scenario not found")
+
+    dataset, generator = result
+    return DatasetGenerateResponse(
+        id=dataset.id,
+        scenario_id=dataset.scenario_id,
+        name=dataset.name,
+        headers=dataset.headers,
+        rows_count=len(dataset.rows),
+        preview=dataset.rows[:10],
+        vectorized=generator.vectorized + generator.constant,
+        per_row=generator.per_row,
+        seed=generator.seed,
+    )
+
+
 @router.get("/{scenario_id}/dataset", response_model=DatasetResponse)
 async def get_dataset(
     scenario_id: int,
@@ -400,3 +551,66 @@ async def get_dataset(
         raise HTTPException(status_code=404, detail="Dataset not found")
 
     return DatasetResponse.model_validate(dataset)
+
+
+@router.post(
+    "/{scenario_id}/load-test", response_model=LoadTestJobResponse, status_code=202
+)
+async def run_load_test(
+    scenario_id: int,
+    load_in: LoadTestRequest,
+    service: Annotated[LoadTestService, Depends(get_load_test_service)],
+):
+    """Start a load test as concurrent virtual users or at a target arrival rate.
+
+    The scenario is loaded and validated in this request; the run itself
+    happens in the background (runs may last up to an hour). Poll
+    GET /scenarios/{scenario_id}/load-test/{job_id} for the result.
+
+    Args:
+        scenario_id: Scenario ID
+        load_in: Load test configuration
+        service: Load test service
+
+    Returns:
+        Running job
+
+    Raises:
+        HTTPException: If scenario not found or cannot be run, or too many
+            load tests are running
+    """
+    try:
+        prepared = await service.prepare_load_test(scenario_id, load_in)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    if not prepared:
+        raise HTTPException(status_code=404, detail="Scenario not found")
+
+    try:
+        job_id = start_load_test_job(service, prepared)
+    except RuntimeError as e:
+        raise HTTPException(status_code=429, detail=str(e)) from e
+    return LoadTestJobResponse(job_id=job_id, scenario_id=scenario_id, status="running")
+
+
+@router.get("/{scenario_id}/load-test/{job_id}", response_model=LoadTestJobResponse)
+async def get_load_test(scenario_id: int, job_id: str):
+    """Get the state of a load test job.
+
+    Args:
+        scenario_id: Scenario ID
+        job_id: Job ID returned when the load test was started
+
+    Returns:
+        Job status, with latency percentiles, throughput and error rates
+        once completed
+
+    Raises:
+        HTTPException: If the job is unknown or expired
+    """
+    job = get_load_test_job(job_id)
+    if job is None or job["scenario_id"] != scenario_id:
+        raise HTTPException(status_code=404, detail="Load test job not found")
+
+    return LoadTestJobResponse.model_validate(job)
@@ -0,0 +1,49 @@
+"""Search router."""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_db
+from app.schemas.search import SearchResponse, SearchType
+from app.services.search_service import SEARCH_TARGETS, SearchService
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+
+@router.get("", response_model=SearchResponse)
+async def search(
+    db: Annotated[AsyncSession, Depends(get_db)],
+    q: Annotated[str, Query(min_length=1, max_length=200, description="Search text")],
+    project_id: Annotated[int | None, Query(description="Limit to one project")] = None,
+    types: Annotated[
+        list[SearchType] | None, Query(description="Types to search (default: all)")
+    ] = None,
+    limit: Annotated[int, Query(ge=1, le=100, description="Maximum hits per type")] = 20,
+):
+    """Search interfaces, scenarios and keywords by substring or words.
+
+    Matches interface names and paths, scenario names and descriptions, and
+    keyword names and method names.
+
+    Args:
+        db: Database session
+        q: Search text
+        project_id: Only interfaces and scenarios of this project
+        types: Types to search
+        limit: Maximum hits per type
+
+    Returns:
+        Hits, best first
+    """
+    try:
+        items = await SearchService(db).search(
+            q, project_id=project_id, types=types or tuple(SEARCH_TARGETS), limit=limit
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+    return {"items": items}
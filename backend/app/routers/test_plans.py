@@ -2,13 +2,15 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.middleware.auth import get_current_user
 from app.models.user import User
 from app.schemas.test_plan import (
+    PlanCompileResponse,
+    PlanValidationIssue,
     ScenarioInPlan,
     TestPlanCreate,
     TestPlanDetailResponse,
@@ -16,7 +18,10 @@ from app.schemas.test_plan import (
     TestPlanResponse,
     TestPlanUpdate,
 )
+from app.services.clone_service import CloneService
+from app.services.plan_compiler import PlanCompiler
 from app.services.test_plan_service import TestPlanService
+from app.utils.pagination import CURSOR_PAGE_RESPONSES, NEXT_CURSOR_HEADER
 
 router = APIRouter(prefix="/test-plans", tags=["Test Plans"])
 
@@ -35,32 +40,58 @@ async def get_test_plan_service(
     return TestPlanService(db)
 
 
-@router.get("", response_model=TestPlanListResponse)
+@router.get("", response_model=TestPlanListResponse, responses=CURSOR_PAGE_RESPONSES)
 async def list_test_plans(
+    response: Response,
     page: Annotated[int, Query(ge=1, description="页码")] = 1,
     pageSize: Annotated[int, Query(ge=1, le=100, description="每页条数")] = 10,  # noqa: N803
     name: Annotated[str | None, Query(description="计划名称(模糊搜索)")] = None,
     project_id: Annotated[int | None, Query(description="项目 ID")] = None,
+    cursor: Annotated[str | None, Query(description="游标分页: 上一页的 X-Next-Cursor, 首页传空")] = None,
+    with_total: Annotated[bool, Query(description="游标分页时是否返回总条数 (缓存)")] = True,
     current_user: User = Depends(get_current_user),
     test_plan_service: TestPlanService = Depends(get_test_plan_service),
 ):
     """List test plans with pagination and search.
 
+    Passing cursor switches to keyset pagination: page is ignored and the
+    next page's cursor is returned in the X-Next-Cursor header.
+
     Args:
+        response: Response (for the X-Next-Cursor header)
         page: Page number (1-indexed)
         pageSize: Number of items per page
         name: Filter by plan name (partial match)
         project_id: Filter by project ID
+        cursor: Cursor of the previous page ("" for the first page)
+        with_total: Include the total count in cursor mode
         current_user: Current authenticated user
         test_plan_service: Test plan service
 
     Returns:
         Paginated list of test plans
+
+    Raises:
+        HTTPException: If the cursor is invalid
     """
-    skip = (page - 1) * pageSize
-    test_plans, total = await test_plan_service.list_test_plans(
-        skip=skip, limit=pageSize, name=name, project_id=project_id
-    )
+    if cursor is not None:
+        try:
+            test_plans, next_cursor, total = await test_plan_service.list_test_plans_page(
+                cursor=cursor or None,
+                limit=pageSize,
+                name=name,
+                project_id=project_id,
+                with_total=with_total,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+        if next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    else:
+        skip = (page - 1) * pageSize
+        test_plans, total = await test_plan_service.list_test_plans(
+            skip=skip, limit=pageSize, name=name, project_id=project_id
+        )
 
     # Convert to response models
     items = [
@@ -233,6 +264,62 @@ async def delete_test_plan(
         )
 
 
+@router.post(
+    "/{plan_id}/clone", response_model=TestPlanResponse, status_code=status.HTTP_201_CREATED
+)
+async def clone_test_plan(
+    plan_id: int,
+    name: Annotated[
+        str | None, Query(min_length=1, max_length=200, description="副本名称, 默认原名称加 (copy)")
+    ] = None,
+    current_user: User = Depends(get_current_user),
+    test_plan_service: TestPlanService = Depends(get_test_plan_service),
+):
+    """Clone a test plan with its scenario list.
+
+    Args:
+        plan_id: Test plan ID
+        name: Name of the clone
+        current_user: Current authenticated user
+        test_plan_service: Test plan service
+
+    Returns:
+        Cloned test plan
+
+    Raises:
+        HTTPException: If test plan not found or the name already exists
+    """
+    test_plan = await test_plan_service.get_test_plan_by_id(plan_id)
+    if not test_plan:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Test plan not found",
+        )
+
+    try:
+        new_id = await CloneService(test_plan_service.db).clone_test_plan(
+            plan_id, current_user.id, name
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+
+    test_plan = await test_plan_service.get_test_plan_by_id(new_id)
+    assert test_plan is not None  # Type guard: the clone was inserted above
+    return TestPlanResponse(
+        id=test_plan.id,
+        name=test_plan.name,
+        description=test_plan.description,
+        project_id=test_plan.project_id,
+        project_name=test_plan.project.name,
+        creator_name=test_plan.creator.nickname,
+        created_at=test_plan.created_at,
+        updated_at=test_plan.updated_at,
+    )
+
+
 @router.post("/{plan_id}/scenarios", status_code=status.HTTP_201_CREATED)
 async def add_scenario_to_plan(
     plan_id: int,
@@ -280,6 +367,46 @@ async def add_scenario_to_plan(
         ) from e
 
 
+@router.post("/{plan_id}/scenarios/by-tags", status_code=status.HTTP_201_CREATED)
+async def add_scenarios_by_tags(
+    plan_id: int,
+    expression: Annotated[
+        str, Query(min_length=1, max_length=500, description="标签表达式, 如 smoke AND NOT slow")
+    ],
+    current_user: User = Depends(get_current_user),
+    test_plan_service: TestPlanService = Depends(get_test_plan_service),
+):
+    """Add all project scenarios matching a tag expression to a test plan.
+
+    Args:
+        plan_id: Test plan ID
+        expression: Tag expression (AND / OR / NOT, parentheses)
+        current_user: Current authenticated user
+        test_plan_service: Test plan service
+
+    Returns:
+        Number of scenarios added
+
+    Raises:
+        HTTPException: If test plan not found or the expression is invalid
+    """
+    test_plan = await test_plan_service.get_test_plan_by_id(plan_id)
+    if not test_plan:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Test plan not found",
+        )
+
+    try:
+        added = await test_plan_service.add_scenarios_by_tags(plan_id, expression)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+    return {"added": added}
+
+
 @router.put("/{plan_id}/scenarios/reorder")
 async def reorder_scenarios(
     plan_id: int,
@@ -345,3 +472,43 @@ async def remove_scenario_from_plan(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Scenario not found in this test plan",
         )
+
+
+@router.post("/{plan_id}/compile", response_model=PlanCompileResponse)
+async def compile_test_plan(
+    plan_id: int,
+    environment_id: Annotated[int | None, Query(gt=0, description="执行环境 ID")] = None,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Resolve and validate a whole test plan without running it.
+
+    Args:
+        plan_id: Test plan ID
+        environment_id: Environment to validate against
+        current_user: Current authenticated user
+        db: Database session
+
+    Returns:
+        Validation report with errors and warnings
+
+    Raises:
+        HTTPException: If test plan not found
+    """
+    result = await PlanCompiler(db).compile(plan_id, environment_id)
+    if result is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Test plan not found",
+        )
+
+    compiled, report = result
+    return PlanCompileResponse(
+        plan_id=plan_id,
+        valid=report.is_valid,
+        environment_id=compiled.environment_id if compiled else environment_id,
+        scenario_count=len(compiled.scenarios) if compiled else 0,
+        step_count=compiled.step_count if compiled else 0,
+        errors=[PlanValidationIssue.model_validate(issue) for issue in report.errors],
+        warnings=[PlanValidationIssue.model_validate(issue) for issue in report.warnings],
+    )
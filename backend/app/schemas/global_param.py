@@ -30,6 +30,9 @@ class GlobalParamBase(BaseModel):
     params_out: list[dict[str, Any]] = Field(
         default=[], description="输出参数列表 [{type, description}]"
     )
+    is_deterministic: bool = Field(
+        default=False, description="是否为纯函数 (相同参数返回相同结果, 批量解析时去重)"
+    )
 
 
 class GlobalParamCreate(GlobalParamBase):
@@ -47,6 +50,7 @@ class GlobalParamUpdate(BaseModel):
     code: str | None = Field(None, min_length=1)
     params_in: list[dict[str, Any]] | None = None
     params_out: list[dict[str, Any]] | None = None
+    is_deterministic: bool | None = None
 
 
 class GlobalParamResponse(GlobalParamBase):
@@ -81,6 +85,32 @@ class FunctionParseRequest(BaseModel):
     context: dict[str, Any] = Field(default={}, description="执行上下文变量")
 
 
+class FunctionParseBatchRequest(BaseModel):
+    """Batch function parse request schema."""
+
+    items: list[Any] = Field(
+        ..., min_length=1, max_length=500, description="待解析的文本或结构 (dict/list 递归解析)"
+    )
+    context: dict[str, Any] = Field(default={}, description="共享的执行上下文变量")
+
+
+class FunctionParseBatchItem(BaseModel):
+    """Single batch parse result."""
+
+    parsed: Any = Field(description="解析后的文本或结构")
+    functions_called: list[str] = Field(description="调用的函数列表")
+    success: bool
+    error: str | None = None
+
+
+class FunctionParseBatchResponse(BaseModel):
+    """Batch function parse response schema."""
+
+    results: list[FunctionParseBatchItem]
+    evaluated: int = Field(description="实际执行的表达式次数")
+    deduplicated: int = Field(description="因纯函数去重而复用结果的次数")
+
+
 class FunctionParseResponse(BaseModel):
     """Function parse response schema."""
 
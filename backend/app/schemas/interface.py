@@ -1,6 +1,6 @@
 """Interface schemas for request/response validation."""
 
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -99,6 +99,9 @@ class InterfaceTreeNode(BaseModel):
     parent_id: int | None = None
     sort_order: int
     children: list["InterfaceTreeNode"] = Field(default_factory=list)
+    child_count: int | None = Field(
+        None, description="Number of direct children (lazy subtree loading only)"
+    )
 
 
 # Enable forward reference
@@ -115,6 +118,7 @@ class InterfaceReorderRequest(BaseModel):
         min_length=1,
         description="List of {id, sort_order} updates"
     )
+    project_id: int = Field(..., description="Project whose items are reordered")
 
 
 class CurlImportRequest(BaseModel):
@@ -123,3 +127,20 @@ class CurlImportRequest(BaseModel):
     curl: str = Field(..., description="cURL command string")
     project_id: int = Field(..., description="Project ID")
     folder_id: int | None = Field(None, description="Target folder ID")
+
+
+# ============== Bulk Import ==============
+
+# What an import does with interfaces whose (method, path) already exists
+ImportMode = Literal["append", "skip", "upsert"]
+
+
+class InterfaceImportResponse(BaseModel):
+    """Schema for bulk import results."""
+
+    created: int = Field(..., description="Interfaces created")
+    updated: int = Field(..., description="Existing interfaces updated (upsert mode)")
+    skipped: int = Field(..., description="Items skipped as duplicates or invalid")
+    folders_created: int = Field(..., description="Folders created")
+    errors: list[str] = Field(default_factory=list, description="Per-item errors")
+    scenario_id: int | None = Field(None, description="Scenario created from the requests")
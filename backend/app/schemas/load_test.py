@@ -0,0 +1,73 @@
+"""Load test schemas for request/response validation."""
+
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+
+class LoadTestRequest(BaseModel):
+    """Schema for starting a scenario load test."""
+
+    environment_id: int | None = Field(None, gt=0, description="环境ID (默认使用场景环境)")
+    virtual_users: int = Field(1, ge=1, le=1000, description="并发虚拟用户数 (到达率模式下为最大并发)")
+    target_rps: float | None = Field(
+        None, gt=0, le=10000, description="目标到达率 (每秒迭代数), 为空时使用固定虚拟用户模式"
+    )
+    duration_seconds: float = Field(10, gt=0, le=3600, description="持续时间 (秒)")
+    think_time_ms: int = Field(0, ge=0, le=60000, description="迭代间思考时间 (毫秒)")
+    request_timeout_seconds: float = Field(30, gt=0, le=300, description="单个请求超时时间 (秒)")
+    seed: int | None = Field(
+        None, ge=0, lt=2**63, description="随机种子 (为空时自动生成, 相同种子可复现随机函数结果)"
+    )
+
+
+class LatencyStats(BaseModel):
+    """Latency percentiles in milliseconds."""
+
+    count: int = Field(0, description="样本数")
+    min_ms: float | None = None
+    max_ms: float | None = None
+    mean_ms: float | None = None
+    p50_ms: float | None = None
+    p95_ms: float | None = None
+    p99_ms: float | None = None
+
+
+class LoadTestStepStats(LatencyStats):
+    """Per-step load test statistics."""
+
+    step_id: int
+    description: str
+    errors: int = Field(0, description="失败次数")
+    error_rate: float = Field(0.0, description="失败率 (百分比)")
+
+
+class LoadTestResponse(BaseModel):
+    """Schema for load test results."""
+
+    scenario_id: int
+    mode: str = Field(..., description="virtual_users / arrival_rate")
+    virtual_users: int
+    target_rps: float | None = None
+    duration_seconds: float = Field(..., description="实际持续时间 (秒)")
+    iterations: int = Field(..., description="完成的迭代数")
+    failed_iterations: int
+    dropped_iterations: int = Field(0, description="到达率模式下因并发上限未启动的迭代数")
+    throughput_rps: float = Field(..., description="每秒完成的迭代数")
+    error_rate: float = Field(..., description="迭代失败率 (百分比)")
+    latency: LatencyStats = Field(..., description="整次迭代耗时")
+    steps: list[LoadTestStepStats] = Field(default_factory=list)
+    errors: dict[str, int] = Field(default_factory=dict, description="错误信息计数 (最多 20 条)")
+    shared_cache_hits: int = Field(0, description="共享步骤复用次数")
+    shared_cache_misses: int = Field(0, description="共享步骤实际执行次数")
+    seed: int = Field(..., description="本次运行使用的随机种子")
+
+
+class LoadTestJobResponse(BaseModel):
+    """Schema for a background load test job."""
+
+    job_id: str
+    scenario_id: int
+    status: Literal["running", "completed", "failed", "cancelled"] = Field(..., description="任务状态")
+    result: LoadTestResponse | None = Field(default=None, description="压测结果 (完成后返回)")
+    error: str | None = Field(default=None, description="失败原因")
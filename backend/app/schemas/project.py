@@ -43,3 +43,11 @@ class ProjectListResponse(BaseModel):
     total: int
     page: int
     pageSize: int  # noqa: N815
+
+
+class ProjectImportResponse(BaseModel):
+    """Project bundle import summary."""
+
+    project_id: int = Field(..., description="新项目 ID")
+    counts: dict[str, int] = Field(..., description="各类数据导入条数")
+    errors: list[str] = Field(default_factory=list, description="跳过的行及原因")
@@ -62,7 +62,7 @@ class ReportListResponse(BaseModel):
     """Schema for report list response."""
 
     reports: list[ReportResponse]
-    total: int
+    total: int | None = Field(default=None, description="Total count (None when not requested)")
     page: int
     limit: int
 
@@ -133,6 +133,35 @@ class DatasetResponse(DatasetBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class DatasetGenerateRequest(BaseModel):
+    """Schema for generating a dataset from global-param functions."""
+
+    name: str = Field(default="generated", min_length=1, max_length=200, description="数据集名称")
+    rows: int = Field(..., ge=1, le=100_000, description="生成的数据行数")
+    columns: dict[str, str] = Field(
+        ...,
+        min_length=1,
+        description="列名 -> 模板 (如 user_{{random_string(8)}}, 可使用 row_index)",
+    )
+    seed: int | None = Field(
+        default=None, ge=0, lt=2**63, description="随机种子 (为空时自动生成, 相同种子生成相同数据)"
+    )
+
+
+class DatasetGenerateResponse(BaseModel):
+    """Schema for dataset generation response."""
+
+    id: int
+    scenario_id: int
+    name: str
+    headers: list[str]
+    rows_count: int = Field(..., description="生成的数据行数")
+    preview: list[list[str]] = Field(default=[], description="前几行数据预览")
+    vectorized: int = Field(default=0, description="批量生成的表达式数")
+    per_row: int = Field(default=0, description="逐行求值的表达式数")
+    seed: int = Field(..., description="本次生成使用的随机种子")
+
+
 class CSVUploadResponse(BaseModel):
     """Schema for CSV upload response."""
 
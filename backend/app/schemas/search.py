@@ -0,0 +1,24 @@
+"""Search schemas."""
+
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+SearchType = Literal["interface", "scenario", "keyword"]
+
+
+class SearchHit(BaseModel):
+    """Single search result."""
+
+    type: SearchType = Field(..., description="Result type")
+    id: int = Field(..., description="ID of the interface, scenario or keyword")
+    project_id: int | None = Field(None, description="Project ID (None for keywords)")
+    name: str = Field(..., description="Name")
+    detail: str | None = Field(None, description="Method and path, description or method name")
+    score: float = Field(..., description="Trigram similarity to the query (0-1)")
+
+
+class SearchResponse(BaseModel):
+    """Search response."""
+
+    items: list[SearchHit]
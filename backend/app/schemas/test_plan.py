@@ -42,7 +42,7 @@ class TestPlanListResponse(BaseModel):
     """Paginated test plan list response."""
 
     items: list[TestPlanResponse]
-    total: int
+    total: int | None = Field(default=None, description="总条数 (未请求时为空)")
     page: int
     pageSize: int  # noqa: N815
 
@@ -62,3 +62,27 @@ class TestPlanDetailResponse(TestPlanResponse):
     """Test plan detail response with scenarios."""
 
     scenarios: list[ScenarioInPlan] = []
+
+
+class PlanValidationIssue(BaseModel):
+    """Plan compilation issue schema."""
+
+    severity: str = Field(..., description="error / warning")
+    code: str = Field(..., description="问题类型")
+    message: str
+    scenario_id: int | None = None
+    step_id: int | None = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class PlanCompileResponse(BaseModel):
+    """Plan compilation (pre-flight validation) response schema."""
+
+    plan_id: int
+    valid: bool = Field(..., description="是否可以执行")
+    environment_id: int | None = None
+    scenario_count: int = 0
+    step_count: int = 0
+    errors: list[PlanValidationIssue] = []
+    warnings: list[PlanValidationIssue] = []
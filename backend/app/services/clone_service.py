@@ -0,0 +1,282 @@
+"""Clone service: deep copies of scenarios, test plans and projects."""
+
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.database_config import DatabaseConfig
+from app.models.dataset import Dataset
+from app.models.env_variable import EnvVariable
+from app.models.environment import Environment
+from app.models.global_variable import GlobalVariable
+from app.models.interface import Interface
+from app.models.interface_folder import InterfaceFolder
+from app.models.plan_scenario import PlanScenario
+from app.models.project import Project
+from app.models.scenario import Scenario
+from app.models.scenario_step import ScenarioStep
+from app.models.scenario_tag import ScenarioTag
+from app.models.test_plan import TestPlan
+from app.services.dashboard_service import invalidate_core_stats
+from app.utils.set_copy import allocate_ids, copy_row, copy_rows, remap
+
+# Suffix of default clone names
+_COPY_SUFFIX = " (copy)"
+
+
+def _copy_name(name: str, max_length: int = 200) -> str:
+    """Default name of a clone."""
+    return name[: max_length - len(_COPY_SUFFIX)] + _COPY_SUFFIX
+
+
+def folder_levels(folders: list[tuple[int, int | None]]) -> list[list[int]]:
+    """Group folder ids by depth, roots first.
+
+    Folders whose parent is outside the list count as roots.
+    """
+    parents = dict(folders)
+    depths: dict[int, int] = {}
+    for folder_id, _ in folders:
+        chain = []
+        current: int | None = folder_id
+        while current in parents and current not in depths and current not in chain:
+            chain.append(current)
+            current = parents[current]
+        depth = depths.get(current, -1) if current is not None else -1
+        for node in reversed(chain):
+            depth += 1
+            depths[node] = depth
+    levels: list[list[int]] = [[] for _ in range(max(depths.values(), default=-1) + 1)]
+    for folder_id, depth in depths.items():
+        levels[depth].append(folder_id)
+    return levels
+
+
+class CloneService:
+    """Deep copies with set-based INSERT ... SELECT statements.
+
+    Rows are never loaded into ORM objects: each table is copied by one
+    statement per batch of remapped ids (see app.utils.set_copy), parents
+    before children, all in the caller's transaction. Execution history and
+    reports are not copied.
+    """
+
+    def __init__(self, db: AsyncSession):
+        """Initialize clone service.
+
+        Args:
+            db: Database session
+        """
+        self.db = db
+
+    async def _copy_scenario_children(self, scenario_map: dict[int, int]) -> None:
+        """Copy steps, datasets and tag rows of scenarios."""
+        # Core inserts bypass the Scenario mapper events, so tag rows are
+        # copied along with the scenarios
+        for model in (ScenarioStep, Dataset, ScenarioTag):
+            await copy_rows(self.db, model, [], key="scenario_id", mapping=scenario_map)
+
+    async def clone_scenario(self, scenario_id: int, name: str | None = None) -> int:
+        """Clone a scenario with its steps, datasets, variables and tags.
+
+        Args:
+            scenario_id: Scenario ID
+            name: Name of the clone (default: original name + " (copy)")
+
+        Returns:
+            ID of the clone
+
+        Raises:
+            ValueError: If scenario not found
+        """
+        result = await self.db.execute(select(Scenario.name).where(Scenario.id == scenario_id))
+        original = result.scalar_one_or_none()
+        if original is None:
+            raise ValueError("Scenario not found")
+
+        new_id = await copy_row(
+            self.db, Scenario, scenario_id, {"name": name or _copy_name(original)}
+        )
+        await self._copy_scenario_children({scenario_id: new_id})
+        invalidate_core_stats()
+        return new_id
+
+    async def clone_test_plan(
+        self, plan_id: int, creator_id: int, name: str | None = None
+    ) -> int:
+        """Clone a test plan with its scenario list.
+
+        The clone lives in the same project and references the same
+        scenarios.
+
+        Args:
+            plan_id: Test plan ID
+            creator_id: ID of user creating the clone
+            name: Name of the clone (default: original name + " (copy)")
+
+        Returns:
+            ID of the clone
+
+        Raises:
+            ValueError: If test plan not found or the name already exists
+        """
+        result = await self.db.execute(
+            select(TestPlan.name, TestPlan.project_id).where(TestPlan.id == plan_id)
+        )
+        original = result.one_or_none()
+        if original is None:
+            raise ValueError("Test plan not found")
+
+        name = name or _copy_name(original.name)
+        existing = await self.db.execute(
+            select(TestPlan.id).where(
+                TestPlan.project_id == original.project_id, TestPlan.name == name
+            )
+        )
+        if existing.first():
+            raise ValueError("Test plan with this name already exists in this project")
+
+        new_id = await copy_row(
+            self.db, TestPlan, plan_id, {"name": name, "creator_id": creator_id}
+        )
+        await copy_rows(
+            self.db, PlanScenario, [PlanScenario.plan_id == plan_id], {"plan_id": new_id}
+        )
+        invalidate_core_stats(creator_id)
+        return new_id
+
+    async def clone_project(
+        self, project_id: int, creator_id: int, name: str | None = None
+    ) -> int:
+        """Clone a project with everything it owns.
+
+        Copies database configs (connection status reset), global variables,
+        environments and their variables, the interface folder tree and
+        interfaces, scenarios with steps, datasets and tags, and test plans
+        with their scenario lists. References between copied rows point to
+        the copies.
+
+        Args:
+            project_id: Project ID
+            creator_id: ID of user creating the clone
+            name: Name of the clone (default: original name + " (copy)")
+
+        Returns:
+            ID of the clone
+
+        Raises:
+            ValueError: If project not found or the name already exists
+        """
+        result = await self.db.execute(select(Project.name).where(Project.id == project_id))
+        original = result.scalar_one_or_none()
+        if original is None:
+            raise ValueError("Project not found")
+
+        name = name or _copy_name(original)
+        existing = await self.db.execute(
+            select(Project.id).where(Project.creator_id == creator_id, Project.name == name)
+        )
+        if existing.first():
+            raise ValueError("Project with this name already exists")
+
+        new_id = await copy_row(
+            self.db,
+            Project,
+            project_id,
+            {"name": name, "creator_id": creator_id, "interface_tree_version": 0},
+        )
+        values = {"project_id": new_id}
+
+        await copy_rows(
+            self.db,
+            DatabaseConfig,
+            [DatabaseConfig.project_id == project_id],
+            {**values, "is_connected": False, "last_check_at": None, "last_error": None},
+        )
+        await copy_rows(
+            self.db, GlobalVariable, [GlobalVariable.project_id == project_id], values
+        )
+
+        environment_map = await self._copy_owned(Environment, project_id, values)
+        await copy_rows(self.db, EnvVariable, [], key="environment_id", mapping=environment_map)
+
+        folder_map = await self._copy_folders(project_id, new_id)
+        await copy_rows(
+            self.db,
+            Interface,
+            [Interface.project_id == project_id],
+            values,
+            key="folder_id",
+            mapping=folder_map,
+        )
+        await copy_rows(
+            self.db,
+            Interface,
+            [Interface.project_id == project_id, Interface.folder_id.is_(None)],
+            values,
+        )
+
+        scenario_map = await self._copy_owned(
+            Scenario,
+            project_id,
+            {**values, "environment_id": remap(Scenario.environment_id, environment_map)},
+        )
+        await self._copy_scenario_children(scenario_map)
+
+        plan_map = await self._copy_owned(TestPlan, project_id, values)
+        await copy_rows(
+            self.db,
+            PlanScenario,
+            [PlanScenario.plan_id.in_(list(plan_map))],
+            {"plan_id": remap(PlanScenario.plan_id, plan_map)},
+            key="scenario_id",
+            mapping=scenario_map,
+        )
+
+        invalidate_core_stats(creator_id)
+        return new_id
+
+    async def _copy_owned(
+        self, model: Any, project_id: int, values: dict[str, Any]
+    ) -> dict[int, int]:
+        """Copy the rows of a project-owned table, returning the id mapping."""
+        result = await self.db.execute(select(model.id).where(model.project_id == project_id))
+        id_map = await allocate_ids(self.db, model, list(result.scalars()))
+        await copy_rows(
+            self.db, model, [model.project_id == project_id], values, key="id", mapping=id_map
+        )
+        return id_map
+
+    async def _copy_folders(self, project_id: int, new_project_id: int) -> dict[int, int]:
+        """Copy a project's folder tree level by level, returning the id mapping.
+
+        Parents are inserted before their children, so the parent_id foreign
+        key holds after every statement.
+        """
+        result = await self.db.execute(
+            select(InterfaceFolder.id, InterfaceFolder.parent_id).where(
+                InterfaceFolder.project_id == project_id
+            )
+        )
+        folders: list[tuple[int, int | None]] = [
+            (folder_id, parent_id) for folder_id, parent_id in result.all()
+        ]
+        folder_map = await allocate_ids(self.db, InterfaceFolder, [row[0] for row in folders])
+
+        parent_map: dict[int, int] = {}
+        for level in folder_levels(folders):
+            level_map = {old: folder_map[old] for old in level}
+            await copy_rows(
+                self.db,
+                InterfaceFolder,
+                [InterfaceFolder.project_id == project_id],
+                {
+                    "project_id": new_project_id,
+                    "parent_id": remap(InterfaceFolder.parent_id, parent_map),
+                },
+                key="id",
+                mapping=level_map,
+            )
+            parent_map = level_map
+        return folder_map
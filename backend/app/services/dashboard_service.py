@@ -5,10 +5,11 @@ from datetime import datetime, timedelta
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
+from app.models.execution_daily_stat import ExecutionDailyStat
 from app.models.interface import Interface
 from app.models.project import Project
 from app.models.scenario import Scenario
-from app.models.test_execution import TestExecution
 from app.models.test_plan import TestPlan
 from app.schemas.dashboard import (
     CoreStatsResponse,
@@ -16,6 +17,23 @@ from app.schemas.dashboard import (
     TrendDataPoint,
     TrendResponse,
 )
+from app.utils.ttl_cache import TTLCache
+
+# Core stats per user id; shared by all requests in this process
+_core_stats_cache = TTLCache(ttl=settings.DASHBOARD_STATS_TTL_SECONDS)
+
+
+def invalidate_core_stats(user_id: int | None = None) -> None:
+    """Drop cached dashboard core stats.
+
+    Args:
+        user_id: Project creator whose stats changed (None: all users, for
+            changes where the owner isn't at hand)
+    """
+    if user_id is None:
+        _core_stats_cache.clear()
+    else:
+        _core_stats_cache.invalidate(user_id)
 
 
 class DashboardService:
@@ -25,6 +43,10 @@ class DashboardService:
         """
         Get core statistics for dashboard.
 
+        All four counts come from one query (scalar subqueries) and are cached
+        per user for DASHBOARD_STATS_TTL_SECONDS. Project, interface, scenario
+        and test plan create/delete invalidate the cache.
+
         Args:
             session: Database session
             user_id: Current user ID
@@ -32,45 +54,38 @@ class DashboardService:
         Returns:
             CoreStatsResponse with counts
         """
-        # Count projects
-        projects_result = await session.execute(
-            select(func.count(Project.id)).where(Project.creator_id == user_id)
-        )
-        total_projects = projects_result.scalar() or 0
+        found, stats = _core_stats_cache.get(user_id)
+        if found:
+            return stats.model_copy()
 
-        # Count interfaces (through projects)
-        interfaces_result = await session.execute(
-            select(func.count(Interface.id))
-            .select_from(Project)
-            .join(Interface, Project.id == Interface.project_id)
-            .where(Project.creator_id == user_id)
-        )
-        total_interfaces = interfaces_result.scalar() or 0
-
-        # Count scenarios (through projects)
-        scenarios_result = await session.execute(
-            select(func.count(Scenario.id))
-            .select_from(Project)
-            .join(Scenario, Project.id == Scenario.project_id)
-            .where(Project.creator_id == user_id)
-        )
-        total_scenarios = scenarios_result.scalar() or 0
-
-        # Count test plans (through projects)
-        plans_result = await session.execute(
-            select(func.count(TestPlan.id))
-            .select_from(Project)
-            .join(TestPlan, Project.id == TestPlan.project_id)
-            .where(Project.creator_id == user_id)
+        owned = Project.creator_id == user_id
+        result = await session.execute(
+            select(
+                select(func.count(Project.id)).where(owned).scalar_subquery(),
+                select(func.count(Interface.id))
+                .join(Project, Project.id == Interface.project_id)
+                .where(owned)
+                .scalar_subquery(),
+                select(func.count(Scenario.id))
+                .join(Project, Project.id == Scenario.project_id)
+                .where(owned)
+                .scalar_subquery(),
+                select(func.count(TestPlan.id))
+                .join(Project, Project.id == TestPlan.project_id)
+                .where(owned)
+                .scalar_subquery(),
+            )
         )
-        total_plans = plans_result.scalar() or 0
+        total_projects, total_interfaces, total_scenarios, total_plans = result.one()
 
-        return CoreStatsResponse(
-            total_projects=total_projects,
-            total_interfaces=total_interfaces,
-            total_scenarios=total_scenarios,
-            total_plans=total_plans,
+        stats = CoreStatsResponse(
+            total_projects=total_projects or 0,
+            total_interfaces=total_interfaces or 0,
+            total_scenarios=total_scenarios or 0,
+            total_plans=total_plans or 0,
         )
+        _core_stats_cache.set(user_id, stats)
+        return stats.model_copy()
 
     async def get_execution_trend(
         self, session: AsyncSession, user_id: int, days: int = 30
@@ -86,21 +101,19 @@ class DashboardService:
         Returns:
             TrendResponse with daily execution counts
         """
-        start_date = datetime.now() - timedelta(days=days)
+        start_date = (datetime.now() - timedelta(days=days)).date()
 
-        # Query executions by date for user's projects
+        # Read the daily rollup: one row per project and day
         result = await session.execute(
             select(
-                func.date(TestExecution.created_at).label("date"),
-                func.count(TestExecution.id).label("execution_count"),
+                ExecutionDailyStat.day.label("date"),
+                func.sum(ExecutionDailyStat.executions).label("execution_count"),
             )
-            .select_from(TestExecution)
-            .join(TestPlan, TestExecution.plan_id == TestPlan.id)
-            .join(Project, TestPlan.project_id == Project.id)
+            .join(Project, ExecutionDailyStat.project_id == Project.id)
             .where(Project.creator_id == user_id)
-            .where(TestExecution.created_at >= start_date)
-            .group_by(func.date(TestExecution.created_at))
-            .order_by(func.date(TestExecution.created_at))
+            .where(ExecutionDailyStat.day >= start_date)
+            .group_by(ExecutionDailyStat.day)
+            .order_by(ExecutionDailyStat.day)
         )
 
         trend = [
@@ -135,12 +148,10 @@ class DashboardService:
                 coverage_percentage=0.0,
             )
 
-        # Count projects with at least one execution
+        # Count projects with at least one execution (from the daily rollup)
         tested_result = await session.execute(
-            select(func.count(Project.id.distinct()))
-            .select_from(Project)
-            .join(TestPlan, Project.id == TestPlan.project_id)
-            .join(TestExecution, TestPlan.id == TestExecution.plan_id)
+            select(func.count(ExecutionDailyStat.project_id.distinct()))
+            .join(Project, ExecutionDailyStat.project_id == Project.id)
             .where(Project.creator_id == user_id)
         )
         tested_projects = tested_result.scalar() or 0
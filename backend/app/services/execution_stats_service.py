@@ -0,0 +1,140 @@
+"""Execution rollup service: daily per-project execution totals."""
+
+from collections import defaultdict
+from datetime import date, datetime, time
+from typing import Any
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.execution_daily_stat import ExecutionDailyStat
+from app.models.test_execution import TestExecution
+from app.models.test_plan import TestPlan
+from app.utils.db_upsert import increment_counters
+
+# Execution statuses that count towards the rollup
+FINISHED_STATUSES = ("completed", "failed", "terminated")
+
+# Rows per INSERT when rebuilding
+_INSERT_BATCH = 500
+
+_COUNTERS = (
+    "executions",
+    "passed_scenarios",
+    "failed_scenarios",
+    "skipped_scenarios",
+    "duration_seconds",
+)
+
+
+def _duration(started_at: datetime | None, finished_at: datetime | None) -> float:
+    """Execution duration in seconds (0 if it never started or finished)."""
+    if started_at and finished_at:
+        return max((finished_at - started_at).total_seconds(), 0.0)
+    return 0.0
+
+
+class ExecutionStatsService:
+    """Maintains the ExecutionDailyStat rollup.
+
+    Each finished execution adds its counts to the row for its project and
+    creation day, so trend and coverage queries read O(days) rows rather
+    than every execution ever run.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize execution stats service.
+
+        Args:
+            session: SQLAlchemy async session
+        """
+        self.session = session
+
+    async def record_execution(self, execution: TestExecution) -> None:
+        """Add a finished execution to the rollup.
+
+        Does not commit; call it in the same transaction that marks the
+        execution finished (e.g. report creation).
+
+        Args:
+            execution: Finished test execution
+        """
+        if execution.status not in FINISHED_STATUSES:
+            return
+
+        project_id = await self.session.scalar(
+            select(TestPlan.project_id).where(TestPlan.id == execution.plan_id)
+        )
+        if project_id is None:
+            return
+
+        await increment_counters(
+            self.session,
+            ExecutionDailyStat,
+            {
+                "project_id": project_id,
+                "day": (execution.created_at or datetime.now()).date(),
+            },
+            {
+                "executions": 1,
+                "passed_scenarios": execution.passed_scenarios,
+                "failed_scenarios": execution.failed_scenarios,
+                "skipped_scenarios": execution.skipped_scenarios,
+                "duration_seconds": _duration(execution.started_at, execution.finished_at),
+            },
+        )
+
+    async def rebuild(self, since: date | None = None) -> int:
+        """Recompute the rollup from test_executions (backfill).
+
+        Executions are streamed and aggregated in memory per project-day, so
+        memory use is proportional to the number of rollup rows.
+
+        Args:
+            since: First day to rebuild (None: all history)
+
+        Returns:
+            Number of rollup rows written
+        """
+        query = (
+            select(
+                TestPlan.project_id,
+                TestExecution.created_at,
+                TestExecution.started_at,
+                TestExecution.finished_at,
+                TestExecution.passed_scenarios,
+                TestExecution.failed_scenarios,
+                TestExecution.skipped_scenarios,
+            )
+            .join(TestPlan, TestPlan.id == TestExecution.plan_id)
+            .where(TestExecution.status.in_(FINISHED_STATUSES))
+            .execution_options(yield_per=1000)
+        )
+        if since is not None:
+            query = query.where(TestExecution.created_at >= datetime.combine(since, time.min))
+
+        totals: dict[tuple[int, date], list[Any]] = defaultdict(lambda: [0, 0, 0, 0, 0.0])
+        result = await self.session.stream(query)
+        async for row in result:
+            entry = totals[(row.project_id, row.created_at.date())]
+            entry[0] += 1
+            entry[1] += row.passed_scenarios
+            entry[2] += row.failed_scenarios
+            entry[3] += row.skipped_scenarios
+            entry[4] += _duration(row.started_at, row.finished_at)
+
+        clear = delete(ExecutionDailyStat)
+        if since is not None:
+            clear = clear.where(ExecutionDailyStat.day >= since)
+        await self.session.execute(clear)
+
+        rows = [
+            {"project_id": project_id, "day": day, **dict(zip(_COUNTERS, values, strict=True))}
+            for (project_id, day), values in totals.items()
+        ]
+        for start in range(0, len(rows), _INSERT_BATCH):
+            await self.session.execute(
+                insert(ExecutionDailyStat), rows[start : start + _INSERT_BATCH]
+            )
+        await self.session.commit()
+        return len(rows)
@@ -1,5 +1,9 @@
 """Global parameter service for business logic."""
 
+import re
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any
+
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -8,8 +12,24 @@ from app.schemas.global_param import GlobalParamCreate, GlobalParamUpdate
 from app.utils.function_executor import (
     BUILTIN_FUNCTIONS,
     BUILTIN_PARAMS_DATA,
+    DETERMINISTIC_BUILTIN_FUNCTIONS,
     FunctionExecutor,
+    expression_calls,
 )
+from app.utils.sandbox_pool import get_sandbox_pool
+
+_PLACEHOLDER = re.compile(r"\{\{(.+?)\}\}")
+
+
+def _map_strings(value: Any, func: Callable[[str], str]) -> Any:
+    """Apply func to every string inside a (nested) value."""
+    if isinstance(value, str):
+        return func(value)
+    if isinstance(value, dict):
+        return {key: _map_strings(item, func) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_map_strings(item, func) for item in value]
+    return value
 
 
 class GlobalParamService:
@@ -113,6 +133,7 @@ class GlobalParamService:
             params_in=param_in.params_in,  # type: ignore[arg-type]
             params_out=param_in.params_out,  # type: ignore[arg-type]
             is_builtin=False,  # User-created params are never builtin
+            is_deterministic=param_in.is_deterministic,
         )
         self.db.add(param)
         await self.db.flush()
@@ -232,6 +253,9 @@ class GlobalParamService:
         # Add user-defined functions
         for param in params:
             func_name = param.method_name
+            if param.is_builtin and func_name in BUILTIN_FUNCTIONS:
+                # Stored copy of a built-in; keep the in-process implementation
+                continue
             try:
                 # Execute the code to get the function
                 exec_globals = {}
@@ -256,9 +280,181 @@ class GlobalParamService:
         Returns:
             Tuple of (parsed_text, functions_called, success, error_message)
         """
+        pool = get_sandbox_pool()
+        if pool is not None:
+            # Run user code out of process so it can't block the event loop
+            try:
+                return await pool.parse_text(await self.get_function_sources(), text, context)
+            except ValueError as e:
+                return text, [], False, str(e)
+
         executor = await self.get_function_executor()
         return executor.parse_text(text, context)
 
+    async def parse_batch(
+        self, items: list[Any], context: dict[str, Any]
+    ) -> tuple[list[dict[str, Any]], int, int]:
+        """Parse {{}} placeholders in many texts/structures at once.
+
+        All items share one executor and context. Expressions that only call
+        deterministic functions (``GlobalParam.is_deterministic`` or pure
+        built-ins) are evaluated once per batch; others (e.g.
+        ``random_string()``) are evaluated for every occurrence.
+
+        Args:
+            items: Strings, or dicts/lists containing strings (parsed recursively)
+            context: Execution context variables
+
+        Returns:
+            Tuple of (per-item results, evaluations performed, evaluations reused)
+        """
+        pure_functions = await self.get_deterministic_functions()
+
+        # Pass 1: assign every placeholder occurrence an evaluation slot
+        expressions: list[str] = []
+        pure_slots: dict[str, int] = {}
+        item_slots: list[list[int]] = []
+        reused = 0
+
+        for item in items:
+            slots: list[int] = []
+
+            def collect(text: str, slots: list[int] = slots) -> str:
+                nonlocal reused
+                for match in _PLACEHOLDER.finditer(text):
+                    expr = match.group(1).strip()
+                    calls = expression_calls(expr)
+                    is_pure = calls is not None and calls <= pure_functions
+                    if is_pure and expr in pure_slots:
+                        slots.append(pure_slots[expr])
+                        reused += 1
+                        continue
+                    slots.append(len(expressions))
+                    if is_pure:
+                        pure_slots[expr] = len(expressions)
+                    expressions.append(expr)
+                return text
+
+            _map_strings(item, collect)
+            item_slots.append(slots)
+
+        # Evaluate all expressions in one go
+        outcomes = await self.evaluate_many([(expr, context) for expr in expressions])
+
+        # Pass 2: substitute results in the same traversal order
+        results = []
+        for item, slots in zip(items, item_slots, strict=True):
+            slot_iter = iter(slots)
+            called: list[str] = []
+            errors: list[str] = []
+
+            def substitute(
+                text: str,
+                slot_iter=slot_iter,
+                called: list[str] = called,
+                errors: list[str] = errors,
+            ) -> str:
+                def replace(match: re.Match[str]) -> str:
+                    index = next(slot_iter)
+                    expr = expressions[index]
+                    if expr not in called:
+                        called.append(expr)
+                    ok, value = outcomes[index]
+                    if not ok:
+                        errors.append(value)
+                        return match.group(0)
+                    return str(value)
+
+                return _PLACEHOLDER.sub(replace, text)
+
+            parsed = _map_strings(item, substitute)
+            results.append(
+                {
+                    "parsed": parsed,
+                    "functions_called": called,
+                    "success": not errors,
+                    "error": errors[0] if errors else None,
+                }
+            )
+
+        return results, len(expressions), reused
+
+    async def get_deterministic_functions(self) -> frozenset[str]:
+        """Get names of functions whose result depends only on their arguments.
+
+        A built-in shadowed by a user function loses its purity; user
+        functions marked is_deterministic keep theirs.
+
+        Returns:
+            Pure built-ins not shadowed by user functions, plus functions
+            marked is_deterministic
+        """
+        result = await self.db.execute(
+            select(
+                GlobalParam.method_name, GlobalParam.is_builtin, GlobalParam.is_deterministic
+            ).where(
+                (GlobalParam.is_builtin.is_(False)) | (GlobalParam.is_deterministic.is_(True))
+            )
+        )
+        custom: set[str] = set()
+        marked: set[str] = set()
+        for name, is_builtin, is_deterministic in result.all():
+            if not is_builtin:
+                custom.add(name)
+            if is_deterministic:
+                marked.add(name)
+        pure = FunctionExecutor.PURE_BUILTINS | DETERMINISTIC_BUILTIN_FUNCTIONS
+        return (pure - custom) | marked
+
+    async def evaluate_many(
+        self, requests: Sequence[tuple[str, Mapping[str, Any]]]
+    ) -> list[tuple[bool, Any]]:
+        """Evaluate expressions with one executor (or one sandbox round trip).
+
+        Args:
+            requests: (expression, context) pairs
+
+        Returns:
+            (ok, value) per request; value is the error message when not ok
+        """
+        if not requests:
+            return []
+
+        pool = get_sandbox_pool()
+        if pool is not None:
+            try:
+                return await pool.run_batch(
+                    await self.get_function_sources(),
+                    [("eval", expr, context) for expr, context in requests],
+                )
+            except ValueError as e:
+                return [(False, str(e))] * len(requests)
+
+        executor = await self.get_function_executor()
+        outcomes: list[tuple[bool, Any]] = []
+        for expr, context in requests:
+            try:
+                outcomes.append((True, executor.execute_function(expr, dict(context))))
+            except Exception as e:
+                outcomes.append((False, str(e)))
+        return outcomes
+
+    async def get_function_sources(self) -> dict[str, str]:
+        """Get the source code of all user-defined functions.
+
+        Returns:
+            Dictionary mapping method names to source code
+        """
+        result = await self.db.execute(
+            select(GlobalParam.method_name, GlobalParam.code, GlobalParam.is_builtin)
+        )
+        # Workers already have the built-in implementations
+        return {
+            name: code
+            for name, code, is_builtin in result.all()
+            if not (is_builtin and name in BUILTIN_FUNCTIONS)
+        }
+
     async def initialize_builtin_params(self) -> int:
         """Initialize built-in global parameters.
 
@@ -289,6 +485,7 @@ class GlobalParamService:
                 params_in=param_data["params_in"],  # type: ignore[arg-type]
                 params_out=param_data["params_out"],  # type: ignore[arg-type]
                 is_builtin=param_data["is_builtin"],
+                is_deterministic=param_data.get("is_deterministic", False),
             )
             self.db.add(param)
             created_count += 1
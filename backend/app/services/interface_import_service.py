@@ -0,0 +1,486 @@
+"""Bulk interface import service."""
+
+import asyncio
+import hashlib
+import json
+from collections.abc import Iterable, Iterator
+from typing import IO, Any
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.interface import Interface
+from app.models.interface_folder import InterfaceFolder
+from app.models.keyword import Keyword
+from app.models.scenario import Scenario
+from app.models.scenario_step import ScenarioStep
+from app.services.dashboard_service import invalidate_core_stats
+from app.services.interface_service import InterfaceService
+from app.utils.import_parsers import (
+    HTTP_METHODS,
+    parse_curl_chunk,
+    parse_har,
+    parse_openapi,
+    parse_postman,
+    postman_variables,
+    split_curl_commands,
+)
+from app.utils.json_stream import JsonSource
+from app.utils.parse_pool import iterate_in_thread, parse_in_pool
+
+# Interfaces written per bulk statement
+_BATCH = 500
+
+# Import modes for interfaces whose (method, path) already exists
+IMPORT_MODES = ("append", "skip", "upsert")
+
+# Errors kept in the import result
+_MAX_ERRORS = 100
+
+
+def _normalize(item: dict[str, Any]) -> dict[str, Any]:
+    """Validate a parsed item and coerce it to Interface column values.
+
+    Raises:
+        ValueError: If the item can't be stored as an interface
+    """
+    method = str(item.get("method") or "").upper()
+    if method.lower() not in HTTP_METHODS:
+        raise ValueError(f"unsupported method {method or '(none)'}")
+    path = str(item.get("path") or "/")
+    if len(path) > 500:
+        raise ValueError("path longer than 500 characters")
+
+    body, body_type = item.get("body"), item.get("body_type") or "json"
+    if body is None:
+        body = {}
+    elif not isinstance(body, dict):
+        # Interface bodies are objects; keep arrays and scalars as raw text
+        body, body_type = {"raw": json.dumps(body, ensure_ascii=False)}, "raw"
+
+    folder = item.get("folder")
+    return {
+        "name": (str(item.get("name") or "").strip() or f"{method} {path}")[:200],
+        "method": method,
+        "path": path,
+        "folder": str(folder)[:255] if folder else None,
+        "headers": item.get("headers") or {},
+        "params": item.get("params") or {},
+        "body": body,
+        "body_type": body_type if body_type in ("json", "form-data", "raw") else "raw",
+    }
+
+
+def _fingerprint(item: dict[str, Any]) -> bytes:
+    """Digest identifying identical requests."""
+    key = [
+        item.get("method"),
+        item.get("url") or item.get("path"),
+        item.get("headers"),
+        item.get("params"),
+        item.get("body"),
+    ]
+    data = json.dumps(key, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _step_params(item: dict[str, Any]) -> dict[str, Any]:
+    """http_request keyword params replaying a recorded request."""
+    params: dict[str, Any] = {"url": item.get("url") or item["path"], "method": item["method"]}
+    if item.get("headers"):
+        params["headers"] = item["headers"]
+    if item.get("params") and "?" not in params["url"]:
+        params["params"] = item["params"]
+    body, body_type = item.get("body"), item.get("body_type")
+    if body and body_type == "raw" and isinstance(body, dict):
+        params["data"] = body.get("raw")
+    elif body and body_type == "form-data":
+        params["data"] = body
+    elif body:
+        params["json"] = body
+    return params
+
+
+class InterfaceImportService:
+    """Imports many interfaces at once with bulk statements.
+
+    Parsed items are written in batches of _BATCH rows: folders are created
+    with one INSERT per batch, new interfaces with one INSERT and, in upsert
+    mode, existing ones updated with one executemany UPDATE. Nothing is
+    committed, so a whole import is a single transaction.
+    """
+
+    def __init__(self, db: AsyncSession):
+        """Initialize interface import service.
+
+        Args:
+            db: Database session
+        """
+        self.db = db
+
+    async def import_openapi(
+        self,
+        project_id: int,
+        fp: IO[bytes],
+        folder_id: int | None = None,
+        mode: str = "skip",
+    ) -> dict[str, Any]:
+        """Import an OpenAPI 3 / Swagger 2 document (JSON or YAML).
+
+        Args:
+            project_id: Project ID
+            fp: Seekable binary file with the document
+            folder_id: Folder to import into (None: project root)
+            mode: What to do with existing (method, path): "append", "skip"
+                or "upsert"
+
+        Returns:
+            Import summary (created, updated, skipped, folders_created, errors)
+
+        Raises:
+            ValueError: If the document or the target folder is invalid
+        """
+        return await self.import_interfaces(
+            project_id, parse_openapi(JsonSource(fp)), folder_id, mode
+        )
+
+    async def import_curl_batch(
+        self,
+        project_id: int,
+        text: str,
+        folder_id: int | None = None,
+        mode: str = "skip",
+    ) -> dict[str, Any]:
+        """Import a file of cURL commands.
+
+        Commands are parsed in the import parse pool; lines that fail to parse
+        are reported by line number and the rest are written in bulk.
+
+        Args:
+            project_id: Project ID
+            text: cURL commands, one per line (backslash continuations allowed)
+            folder_id: Folder to import into (None: project root)
+            mode: What to do with existing (method, path)
+
+        Returns:
+            Import summary
+
+        Raises:
+            ValueError: If the mode or target folder is invalid
+        """
+        commands = split_curl_commands(text)
+        results = await parse_in_pool(parse_curl_chunk, [command for _, command in commands])
+
+        items: list[dict[str, Any]] = []
+        errors: list[str] = []
+        for (line, _), (ok, value) in zip(commands, results, strict=True):
+            if ok:
+                items.append({**value, "line": line})
+            elif len(errors) < _MAX_ERRORS:
+                errors.append(f"line {line}: {value}")
+
+        summary = await self.import_interfaces(project_id, items, folder_id, mode)
+        summary["skipped"] += len(commands) - len(items)
+        summary["errors"] = (errors + summary["errors"])[:_MAX_ERRORS]
+        return summary
+
+    async def import_postman(
+        self,
+        project_id: int,
+        fp: IO[bytes],
+        folder_id: int | None = None,
+        mode: str = "skip",
+        scenario_name: str | None = None,
+        *,
+        creator_id: int,
+    ) -> dict[str, Any]:
+        """Import a Postman collection.
+
+        Collection variables become the scenario variables, so
+        ``{{baseUrl}}``-style URLs keep working in the scenario steps.
+
+        Args:
+            project_id: Project ID
+            fp: Seekable binary file with the collection
+            folder_id: Folder to import into (None: project root)
+            mode: What to do with existing (method, path)
+            scenario_name: Also create a scenario with one step per request
+            creator_id: Creator of the scenario
+
+        Returns:
+            Import summary, with scenario_id if a scenario was created
+
+        Raises:
+            ValueError: If the document or the target folder is invalid
+        """
+        source = JsonSource(fp)
+        items = parse_postman(source)
+        # A separate pass over the file, so also kept off the event loop
+        variables = await asyncio.to_thread(postman_variables, source) if scenario_name else {}
+        return await self._import_recorded(
+            project_id, items, folder_id, mode, scenario_name, creator_id, variables
+        )
+
+    async def import_har(
+        self,
+        project_id: int,
+        fp: IO[bytes],
+        folder_id: int | None = None,
+        mode: str = "skip",
+        scenario_name: str | None = None,
+        *,
+        creator_id: int,
+    ) -> dict[str, Any]:
+        """Import a HAR capture.
+
+        Args:
+            project_id: Project ID
+            fp: Seekable binary file with the capture
+            folder_id: Folder to import into (None: project root)
+            mode: What to do with existing (method, path)
+            scenario_name: Also create a scenario with one step per request
+            creator_id: Creator of the scenario
+
+        Returns:
+            Import summary, with scenario_id if a scenario was created
+
+        Raises:
+            ValueError: If the document or the target folder is invalid
+        """
+        return await self._import_recorded(
+            project_id, parse_har(JsonSource(fp)), folder_id, mode, scenario_name, creator_id
+        )
+
+    async def _import_recorded(
+        self,
+        project_id: int,
+        items: Iterable[dict[str, Any]],
+        folder_id: int | None,
+        mode: str,
+        scenario_name: str | None,
+        creator_id: int,
+        variables: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Import recorded requests, dropping identical repeats.
+
+        With scenario_name, the distinct requests also become the ordered
+        http_request steps of a new scenario, written with bulk INSERTs after
+        the interfaces.
+        """
+        keyword_id = None
+        if scenario_name:
+            keyword_id = await self.db.scalar(
+                select(Keyword.id).where(Keyword.method_name == "http_request")
+            )
+            if keyword_id is None:
+                raise ValueError("Keyword http_request not found")
+
+        seen: set[bytes] = set()
+        steps: list[dict[str, Any]] = []
+        duplicates = 0
+
+        def unique() -> Iterator[dict[str, Any]]:
+            nonlocal duplicates
+            for item in items:
+                digest = _fingerprint(item)
+                if digest in seen:
+                    duplicates += 1
+                    continue
+                seen.add(digest)
+                if keyword_id is not None and str(item.get("method")).lower() in HTTP_METHODS:
+                    steps.append(
+                        {
+                            "sort_order": len(steps),
+                            "description": (item.get("name") or item["path"])[:500],
+                            "keyword_id": keyword_id,
+                            "params": _step_params(item),
+                        }
+                    )
+                yield item
+
+        summary = await self.import_interfaces(project_id, unique(), folder_id, mode)
+        summary["skipped"] += duplicates
+
+        if scenario_name:
+            scenario = Scenario(
+                project_id=project_id,
+                name=scenario_name[:200],
+                creator_id=creator_id,
+                variables=variables or {},
+            )
+            self.db.add(scenario)
+            await self.db.flush()
+            for start in range(0, len(steps), _BATCH):
+                chunk = steps[start : start + _BATCH]
+                await self.db.execute(
+                    insert(ScenarioStep), [{"scenario_id": scenario.id, **step} for step in chunk]
+                )
+            summary["scenario_id"] = scenario.id
+            invalidate_core_stats()
+        return summary
+
+    async def import_interfaces(
+        self,
+        project_id: int,
+        items: Iterable[dict[str, Any]],
+        folder_id: int | None = None,
+        mode: str = "skip",
+    ) -> dict[str, Any]:
+        """Write parsed interfaces in bulk.
+
+        Items are keyed on (method, path) within the project, including
+        earlier items of the same import. Each item's ``folder`` name maps to
+        a folder under folder_id, created on first use. Items are pulled in a
+        worker thread, so lazy parsers reading an upload don't block the
+        event loop.
+
+        Args:
+            project_id: Project ID
+            items: Interface dicts (see app.utils.import_parsers)
+            folder_id: Folder to import into (None: project root)
+            mode: What to do with existing (method, path): "append" (insert
+                anyway), "skip" or "upsert" (update the existing interface)
+
+        Returns:
+            Import summary (created, updated, skipped, folders_created, errors)
+
+        Raises:
+            ValueError: If the mode or target folder is invalid
+        """
+        if mode not in IMPORT_MODES:
+            raise ValueError(f"Invalid import mode: {mode}")
+        if folder_id is not None:
+            parent = await self.db.scalar(
+                select(InterfaceFolder.id).where(
+                    InterfaceFolder.id == folder_id, InterfaceFolder.project_id == project_id
+                )
+            )
+            if parent is None:
+                raise ValueError(f"Folder {folder_id} not found")
+
+        # Existing interfaces by (method, path), one query up front
+        existing: dict[tuple[str, str], int] = {}
+        if mode != "append":
+            result = await self.db.execute(
+                select(Interface.method, Interface.path, Interface.id).where(
+                    Interface.project_id == project_id
+                )
+            )
+            existing = {(method, path): id_ for method, path, id_ in result.all()}
+
+        # Folders directly under the target, by name
+        parent_filter = (
+            InterfaceFolder.parent_id.is_(None)
+            if folder_id is None
+            else InterfaceFolder.parent_id == folder_id
+        )
+        result = await self.db.execute(
+            select(InterfaceFolder.name, InterfaceFolder.id).where(
+                InterfaceFolder.project_id == project_id, parent_filter
+            )
+        )
+        folders: dict[str, int] = dict(result.all())
+
+        summary: dict[str, Any] = {
+            "created": 0,
+            "updated": 0,
+            "skipped": 0,
+            "folders_created": 0,
+            "errors": [],
+        }
+        batch: list[dict[str, Any]] = []
+        index = 0
+        async for item in iterate_in_thread(items, _BATCH):
+            index += 1
+            try:
+                batch.append(_normalize(item))
+            except ValueError as e:
+                summary["skipped"] += 1
+                if len(summary["errors"]) < _MAX_ERRORS:
+                    label = f"line {item['line']}" if "line" in item else f"#{index}"
+                    summary["errors"].append(f"{label} {item.get('name') or ''}: {e}")
+                continue
+            if len(batch) >= _BATCH:
+                await self._write_batch(project_id, folder_id, batch, mode, existing, folders, summary)
+                batch = []
+        if batch:
+            await self._write_batch(project_id, folder_id, batch, mode, existing, folders, summary)
+
+        if summary["created"] or summary["updated"] or summary["folders_created"]:
+            await InterfaceService(self.db).bump_tree_version(project_id)
+            invalidate_core_stats()
+        return summary
+
+    async def _write_batch(
+        self,
+        project_id: int,
+        folder_id: int | None,
+        batch: list[dict[str, Any]],
+        mode: str,
+        existing: dict[tuple[str, str], int],
+        folders: dict[str, int],
+        summary: dict[str, Any],
+    ) -> None:
+        """Write one batch: new folders, then inserts, then updates."""
+        new_folders = list(
+            dict.fromkeys(
+                item["folder"]
+                for item in batch
+                if item["folder"] is not None and item["folder"] not in folders
+            )
+        )
+        if new_folders:
+            result = await self.db.execute(
+                insert(InterfaceFolder).returning(InterfaceFolder.name, InterfaceFolder.id),
+                [
+                    {"project_id": project_id, "parent_id": folder_id, "name": name}
+                    for name in new_folders
+                ],
+            )
+            folders.update(dict(result.all()))
+            summary["folders_created"] += len(new_folders)
+
+        inserts: dict[tuple[str, str], dict[str, Any]] = {}
+        appended: list[dict[str, Any]] = []
+        updates: dict[int, dict[str, Any]] = {}
+        for item in batch:
+            key = (item["method"], item["path"])
+            values = {
+                "project_id": project_id,
+                "method": item["method"],
+                "path": item["path"],
+                "name": item["name"],
+                "folder_id": folders[item["folder"]] if item["folder"] else folder_id,
+                "headers": item["headers"],
+                "params": item["params"],
+                "body": item["body"],
+                "body_type": item["body_type"],
+            }
+            if mode == "append":
+                appended.append(values)
+            elif key in existing:
+                if mode == "upsert":
+                    updates[existing[key]] = {"id": existing[key], **values}
+                else:
+                    summary["skipped"] += 1
+            elif key in inserts:
+                # Repeated within this batch: last one wins (upsert) or first (skip)
+                if mode == "upsert":
+                    inserts[key].update(values)
+                else:
+                    summary["skipped"] += 1
+            else:
+                inserts[key] = values
+
+        rows = appended or list(inserts.values())
+        if rows:
+            result = await self.db.execute(
+                insert(Interface).returning(Interface.method, Interface.path, Interface.id), rows
+            )
+            if mode != "append":
+                existing.update({(method, path): id_ for method, path, id_ in result.all()})
+            summary["created"] += len(rows)
+        if updates:
+            await self.db.execute(update(Interface), list(updates.values()))
+            summary["updated"] += len(updates)
+
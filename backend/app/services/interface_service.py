@@ -1,13 +1,15 @@
 """Interface service for business logic."""
 
-import shlex
+import json
 from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.models.interface import Interface
 from app.models.interface_folder import InterfaceFolder
+from app.models.project import Project
 from app.schemas.interface import (
     CurlImportRequest,
     InterfaceCreate,
@@ -17,6 +19,27 @@ from app.schemas.interface import (
     InterfaceTreeNode,
     InterfaceUpdate,
 )
+from app.services.dashboard_service import invalidate_core_stats
+from app.utils.bulk_reorder import bulk_reorder
+from app.utils.import_parsers import parse_curl
+from app.utils.pagination import keyset_page, next_cursor
+from app.utils.ttl_cache import TTLCache
+
+# Cursor pagination key for interface lists
+_INTERFACE_SORT_KEY = (Interface.sort_order, Interface.id)
+
+# Serialized trees keyed by (project_id, interface_tree_version)
+_tree_cache = TTLCache(ttl=settings.INTERFACE_TREE_CACHE_TTL_SECONDS, maxsize=256)
+
+
+def clear_interface_tree_cache() -> None:
+    """Drop all cached interface trees."""
+    _tree_cache.clear()
+
+
+def _tree_json(nodes: list[dict[str, Any]]) -> bytes:
+    """Serialize tree nodes as a JSON response body."""
+    return json.dumps(nodes, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
 
 
 class InterfaceService:
@@ -41,66 +64,286 @@ class InterfaceService:
         Returns:
             List of tree nodes (folders and interfaces)
         """
+        return [InterfaceTreeNode.model_validate(node) for node in await self._build_tree(project_id)]
+
+    async def get_interface_tree_json(self, project_id: int, version: int) -> bytes:
+        """Get the interface tree as JSON.
+
+        The serialized tree is cached per project and tree version, so
+        repeated sidebar loads skip both the queries and the serialization
+        until a folder or interface of the project changes.
+
+        Args:
+            project_id: Project ID
+            version: Current tree version (from get_tree_version)
+
+        Returns:
+            JSON body
+        """
+        found, body = _tree_cache.get((project_id, version))
+        if not found:
+            body = _tree_json(await self._build_tree(project_id))
+            _tree_cache.set((project_id, version), body)
+        return body
+
+    async def get_interface_subtree(
+        self, project_id: int, parent_id: int | None = None, depth: int = 1
+    ) -> list[dict[str, Any]]:
+        """Get the children of one folder, for on-demand sidebar expansion.
+
+        Each level is loaded with one query per table on the
+        (project_id, parent_id) and (project_id, folder_id) indexes, so cost
+        follows the visible nodes rather than the project size. Folders on
+        the last level come with child_count but no children.
+
+        Args:
+            project_id: Project ID
+            parent_id: Folder to expand (None: project root)
+            depth: Number of levels to return
+
+        Returns:
+            Tree nodes (same shape as get_interface_tree)
+
+        Raises:
+            ValueError: If the folder doesn't exist in the project
+        """
+        if parent_id is not None:
+            folder_id = await self.db.scalar(
+                select(InterfaceFolder.id).where(
+                    InterfaceFolder.id == parent_id, InterfaceFolder.project_id == project_id
+                )
+            )
+            if folder_id is None:
+                raise ValueError(f"Folder {parent_id} not found")
+
+        roots: list[dict[str, Any]] = []
+        # Children list of every loaded folder, by folder id
+        slots: dict[int | None, list[dict[str, Any]]] = {parent_id: roots}
+        folder_nodes: dict[int, dict[str, Any]] = {}
+        frontier: list[int | None] = [parent_id]
+        # Folders loaded by the last query, not expanded yet
+        last_level: list[int] = []
+        for _ in range(depth):
+            folders, interfaces = await self._tree_level(project_id, frontier)
+            for interface in interfaces:
+                slots[interface.folder_id].append(
+                    {
+                        "id": interface.id,
+                        "name": interface.name,
+                        "type": "interface",
+                        "method": interface.method,
+                        "path": interface.path,
+                        "folder_id": interface.folder_id,
+                        "parent_id": interface.folder_id,
+                        "sort_order": interface.sort_order,
+                        "children": [],
+                        "child_count": 0,
+                    }
+                )
+
+            last_level = []
+            for folder in folders:
+                node = {
+                    "id": folder.id,
+                    "name": folder.name,
+                    "type": "folder",
+                    "method": None,
+                    "path": None,
+                    "folder_id": None,
+                    "parent_id": folder.parent_id,
+                    "sort_order": folder.sort_order,
+                    "children": [],
+                    "child_count": 0,
+                }
+                slots[folder.parent_id].append(node)
+                slots[folder.id] = node["children"]
+                folder_nodes[folder.id] = node
+                last_level.append(folder.id)
+            if not last_level:
+                break
+            frontier = list(last_level)
+
+        # Folders on the last level are not expanded, so count their children
+        counts = await self._child_counts(project_id, last_level) if last_level else {}
+        unexpanded = set(last_level)
+        for folder_id, node in folder_nodes.items():
+            if folder_id in unexpanded:
+                node["child_count"] = counts.get(folder_id, 0)
+            else:
+                node["child_count"] = len(node["children"])
+
+        return roots
+
+    async def _tree_level(self, project_id: int, parent_ids: list[int | None]) -> tuple[list, list]:
+        """Load the folders and interfaces directly under some folders.
+
+        Args:
+            project_id: Project ID
+            parent_ids: Folder IDs, or [None] for the project root
+
+        Returns:
+            Tuple of (folder rows, interface rows)
+        """
+        if parent_ids == [None]:
+            in_folder = InterfaceFolder.parent_id.is_(None)
+            in_interface_folder = Interface.folder_id.is_(None)
+        else:
+            in_folder = InterfaceFolder.parent_id.in_(parent_ids)
+            in_interface_folder = Interface.folder_id.in_(parent_ids)
+
+        folder_result = await self.db.execute(
+            select(
+                InterfaceFolder.id,
+                InterfaceFolder.name,
+                InterfaceFolder.parent_id,
+                InterfaceFolder.sort_order,
+            )
+            .where(InterfaceFolder.project_id == project_id, in_folder)
+            .order_by(InterfaceFolder.sort_order, InterfaceFolder.id)
+        )
+        interface_result = await self.db.execute(
+            select(
+                Interface.id,
+                Interface.name,
+                Interface.method,
+                Interface.path,
+                Interface.folder_id,
+                Interface.sort_order,
+            )
+            .where(Interface.project_id == project_id, in_interface_folder)
+            .order_by(Interface.sort_order, Interface.id)
+        )
+        return list(folder_result.all()), list(interface_result.all())
+
+    async def _child_counts(self, project_id: int, folder_ids: list[int]) -> dict[int, int]:
+        """Count direct subfolders and interfaces per folder.
+
+        Args:
+            project_id: Project ID
+            folder_ids: Folder IDs
+
+        Returns:
+            Child count by folder ID (folders without children omitted)
+        """
+        counts: dict[int, int] = {}
+        for parent, column, table_project in (
+            (InterfaceFolder.parent_id, InterfaceFolder.id, InterfaceFolder.project_id),
+            (Interface.folder_id, Interface.id, Interface.project_id),
+        ):
+            result = await self.db.execute(
+                select(parent, func.count(column))
+                .where(table_project == project_id, parent.in_(folder_ids))
+                .group_by(parent)
+            )
+            for folder_id, count in result.all():
+                # parent IN (...) never matches NULL
+                if folder_id is not None:
+                    counts[folder_id] = counts.get(folder_id, 0) + count
+        return counts
+
+    async def get_tree_version(self, project_id: int) -> int | None:
+        """Get the interface tree version of a project.
+
+        Args:
+            project_id: Project ID
+
+        Returns:
+            Version number, or None if the project doesn't exist
+        """
+        return await self.db.scalar(
+            select(Project.interface_tree_version).where(Project.id == project_id)
+        )
+
+    async def bump_tree_version(self, *project_ids: int) -> None:
+        """Mark the interface trees of projects as changed.
+
+        Args:
+            project_ids: Projects whose folders or interfaces changed
+        """
+        await self.db.execute(
+            update(Project)
+            .where(Project.id.in_(set(project_ids)))
+            .values(
+                interface_tree_version=Project.interface_tree_version + 1,
+                # Tree edits are not project edits
+                updated_at=Project.updated_at,
+            )
+        )
+
+    async def _build_tree(self, project_id: int) -> list[dict[str, Any]]:
+        """Build the tree from the columns it shows (no request bodies)."""
         # Get all folders
         folder_result = await self.db.execute(
-            select(InterfaceFolder)
+            select(
+                InterfaceFolder.id,
+                InterfaceFolder.name,
+                InterfaceFolder.parent_id,
+                InterfaceFolder.sort_order,
+            )
             .where(InterfaceFolder.project_id == project_id)
             .order_by(InterfaceFolder.sort_order, InterfaceFolder.id)
         )
-        folders = folder_result.scalars().all()
+        folders = folder_result.all()
 
         # Get all interfaces
         interface_result = await self.db.execute(
-            select(Interface)
+            select(
+                Interface.id,
+                Interface.name,
+                Interface.method,
+                Interface.path,
+                Interface.folder_id,
+                Interface.sort_order,
+            )
             .where(Interface.project_id == project_id)
             .order_by(Interface.sort_order, Interface.id)
         )
-        interfaces = interface_result.scalars().all()
+        interfaces = interface_result.all()
 
         # Build tree structure
-        folder_map: dict[int, InterfaceTreeNode] = {}
-        root_nodes: list[InterfaceTreeNode] = []
+        folder_map: dict[int, dict[str, Any]] = {}
+        root_nodes: list[dict[str, Any]] = []
 
         # First pass: create folder nodes
         for folder in folders:
-            node = InterfaceTreeNode(
-                id=folder.id,
-                name=folder.name,
-                type="folder",
-                folder_id=None,
-                parent_id=folder.parent_id,
-                sort_order=folder.sort_order,
-                children=[],
-            )
-            folder_map[folder.id] = node
+            folder_map[folder.id] = {
+                "id": folder.id,
+                "name": folder.name,
+                "type": "folder",
+                "method": None,
+                "path": None,
+                "folder_id": None,
+                "parent_id": folder.parent_id,
+                "sort_order": folder.sort_order,
+                "children": [],
+            }
 
         # Second pass: create interface nodes
         for interface in interfaces:
-            node = InterfaceTreeNode(
-                id=interface.id,
-                name=interface.name,
-                type="interface",
-                method=interface.method,
-                path=interface.path,
-                folder_id=interface.folder_id,
-                parent_id=interface.folder_id,
-                sort_order=interface.sort_order,
-                children=[],
-            )
+            node = {
+                "id": interface.id,
+                "name": interface.name,
+                "type": "interface",
+                "method": interface.method,
+                "path": interface.path,
+                "folder_id": interface.folder_id,
+                "parent_id": interface.folder_id,
+                "sort_order": interface.sort_order,
+                "children": [],
+            }
             # Add interface to parent folder or root
             if interface.folder_id and interface.folder_id in folder_map:
-                folder_map[interface.folder_id].children.append(node)
+                folder_map[interface.folder_id]["children"].append(node)
             else:
                 root_nodes.append(node)
 
         # Third pass: build folder hierarchy
         for folder in folders:
-            if folder.id in folder_map:
-                node = folder_map[folder.id]
-                if folder.parent_id and folder.parent_id in folder_map:
-                    folder_map[folder.parent_id].children.append(node)
-                else:
-                    root_nodes.append(node)
+            node = folder_map[folder.id]
+            if folder.parent_id and folder.parent_id in folder_map:
+                folder_map[folder.parent_id]["children"].append(node)
+            else:
+                root_nodes.append(node)
 
         return root_nodes
 
@@ -137,6 +380,7 @@ class InterfaceService:
         self.db.add(folder)
         await self.db.flush()
         await self.db.refresh(folder)
+        await self.bump_tree_version(folder.project_id)
         return folder
 
     async def update_folder(
@@ -161,6 +405,7 @@ class InterfaceService:
 
         await self.db.flush()
         await self.db.refresh(folder)
+        await self.bump_tree_version(folder.project_id)
         return folder
 
     async def delete_folder(self, folder_id: int) -> bool:
@@ -179,6 +424,8 @@ class InterfaceService:
         # Delete folder (cascade will handle children)
         await self.db.delete(folder)
         await self.db.flush()
+        await self.bump_tree_version(folder.project_id)
+        invalidate_core_stats()
         return True
 
     # ============== Interface CRUD ==============
@@ -208,6 +455,29 @@ class InterfaceService:
 
         return list(interfaces), total
 
+    async def list_interfaces_page(
+        self, project_id: int, cursor: str | None = None, limit: int = 100
+    ) -> tuple[list[Interface], str | None]:
+        """List one page of a project's interfaces by cursor.
+
+        Pages are keyed on (sort_order, id), matching list_interfaces order,
+        so every page costs the same regardless of depth.
+
+        Args:
+            project_id: Project ID
+            cursor: Cursor of the previous page (None: first page)
+            limit: Maximum number of records to return
+
+        Returns:
+            Tuple of (interfaces list, next cursor or None on the last page)
+
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        query = select(Interface).where(Interface.project_id == project_id)
+        result = await self.db.execute(keyset_page(query, _INTERFACE_SORT_KEY, cursor, limit))
+        return next_cursor(list(result.scalars().all()), _INTERFACE_SORT_KEY, limit)
+
     async def get_interface_by_id(self, interface_id: int) -> Interface | None:
         """Get interface by ID.
 
@@ -245,6 +515,8 @@ class InterfaceService:
         self.db.add(interface)
         await self.db.flush()
         await self.db.refresh(interface)
+        await self.bump_tree_version(interface.project_id)
+        invalidate_core_stats()
         return interface
 
     async def update_interface(
@@ -269,6 +541,7 @@ class InterfaceService:
 
         await self.db.flush()
         await self.db.refresh(interface)
+        await self.bump_tree_version(interface.project_id)
         return interface
 
     async def delete_interface(self, interface_id: int) -> bool:
@@ -286,6 +559,8 @@ class InterfaceService:
 
         await self.db.delete(interface)
         await self.db.flush()
+        await self.bump_tree_version(interface.project_id)
+        invalidate_core_stats()
         return True
 
     # ============== Batch Operations ==============
@@ -293,36 +568,42 @@ class InterfaceService:
     async def batch_reorder(self, reorder_in: InterfaceReorderRequest) -> dict[str, Any]:
         """Batch reorder interfaces and folders.
 
+        IDs are matched against interfaces first and the rest against
+        folders, with one UPDATE per table. Items outside the request's
+        project are left untouched.
+
         Args:
-            reorder_in: Reorder request with list of {id, sort_order}
+            reorder_in: Reorder request with project_id and list of {id, sort_order}
 
         Returns:
             Summary of reorder operation
         """
-        updated_count = 0
-
-        for update in reorder_in.updates:
-            item_id = update.get("id")
-            sort_order = update.get("sort_order", 0)
-
-            if not item_id:
-                continue
+        positions = {
+            item["id"]: item.get("sort_order", 0) for item in reorder_in.updates if item.get("id")
+        }
+        # Try interfaces first
+        rows = await bulk_reorder(
+            self.db,
+            Interface,
+            positions,
+            where=[Interface.project_id == reorder_in.project_id],
+            returning=(Interface.id, Interface.project_id),
+        )
 
-            # Try interface first
-            interface = await self.get_interface_by_id(item_id)
-            if interface:
-                interface.sort_order = sort_order
-                updated_count += 1
-                continue
+        # Then folders, for the IDs that are not interfaces
+        matched = {item_id for item_id, _ in rows}
+        remaining = {item_id: pos for item_id, pos in positions.items() if item_id not in matched}
+        rows += await bulk_reorder(
+            self.db,
+            InterfaceFolder,
+            remaining,
+            where=[InterfaceFolder.project_id == reorder_in.project_id],
+            returning=(InterfaceFolder.id, InterfaceFolder.project_id),
+        )
 
-            # Try folder
-            folder = await self.get_folder_by_id(item_id)
-            if folder:
-                folder.sort_order = sort_order
-                updated_count += 1
-
-        await self.db.flush()
-        return {"updated_count": updated_count}
+        if rows:
+            await self.bump_tree_version(*(project_id for _, project_id in rows))
+        return {"updated_count": len(rows)}
 
     # ============== cURL Import ==============
 
@@ -338,7 +619,7 @@ class InterfaceService:
         Raises:
             ValueError: If cURL command is invalid
         """
-        parsed = self._parse_curl(curl_in.curl)
+        parsed = parse_curl(curl_in.curl)
 
         interface = Interface(
             project_id=curl_in.project_id,
@@ -354,127 +635,6 @@ class InterfaceService:
         self.db.add(interface)
         await self.db.flush()
         await self.db.refresh(interface)
+        await self.bump_tree_version(interface.project_id)
+        invalidate_core_stats()
         return interface
-
-    def _parse_curl(self, curl_command: str) -> dict[str, Any]:
-        """Parse cURL command into interface components.
-
-        Args:
-            curl_command: cURL command string
-
-        Returns:
-            Parsed components (method, path, headers, body, etc.)
-
-        Raises:
-            ValueError: If cURL command is invalid
-        """
-        result: dict[str, Any] = {
-            "method": "GET",
-            "path": "/",
-            "headers": {},
-            "params": {},
-            "body": {},
-            "body_type": "json",
-        }
-
-        # Remove 'curl' prefix and split
-        parts = shlex.split(curl_command)
-        if not parts or parts[0] != "curl":
-            raise ValueError("Invalid cURL command: must start with 'curl'")
-
-        i = 1
-        while i < len(parts):
-            part = parts[i]
-
-            if part.startswith("-X") or part.startswith("--request"):
-                # HTTP method
-                if part == "-X" or part == "--request":
-                    i += 1
-                    if i < len(parts):
-                        result["method"] = parts[i].upper()
-                else:
-                    result["method"] = part[2:].upper()
-
-            elif part.startswith("-H") or part.startswith("--header"):
-                # Header
-                if part == "-H" or part == "--header":
-                    i += 1
-                    if i < len(parts):
-                        header = parts[i]
-                    else:
-                        i += 1
-                        continue
-                else:
-                    header = part[2:] if len(part) > 2 else parts[i + 1]
-                    i += 1
-
-                if ": " in header:
-                    key, value = header.split(": ", 1)
-                    result["headers"][key] = value
-                elif ":" in header:
-                    key, value = header.split(":", 1)
-                    result["headers"][key] = value
-
-            elif part.startswith("-d") or part.startswith("--data") or part.startswith("--data-raw"):
-                # Request body
-                if part in ["-d", "--data", "--data-raw", "--data-urlencode"]:
-                    i += 1
-                    if i < len(parts):
-                        body_str = parts[i]
-                    else:
-                        i += 1
-                        continue
-                else:
-                    body_str = parts[i + 1] if len(part) <= 3 else parts[i]
-                    i += 1
-
-                # Try to parse as JSON
-                try:
-                    import json
-
-                    result["body"] = json.loads(body_str)
-                    result["body_type"] = "json"
-                except json.JSONDecodeError:
-                    # Not JSON, treat as raw
-                    result["body"] = {"raw": body_str}
-                    result["body_type"] = "raw"
-
-                # Set method to POST if not explicitly set
-                if result["method"] == "GET":
-                    result["method"] = "POST"
-
-            elif part.startswith("--data-binary"):
-                # Binary data
-                i += 1
-                if i < len(parts):
-                    result["body"] = {"binary": parts[i]}
-                    result["body_type"] = "raw"
-                if result["method"] == "GET":
-                    result["method"] = "POST"
-
-            elif part.startswith("-G") or part.startswith("--get"):
-                # Force GET
-                result["method"] = "GET"
-
-            elif not part.startswith("-") and "://" in part:
-                # URL
-                url = part
-                # Extract path and query params
-                from urllib.parse import parse_qs, urlparse
-
-                parsed_url = urlparse(url)
-                result["path"] = parsed_url.path or "/"
-
-                # Parse query parameters
-                if parsed_url.query:
-                    params = parse_qs(parsed_url.query, keep_blank_values=True)
-                    # Convert list values to single values
-                    result["params"] = {k: v[0] if len(v) == 1 else v for k, v in params.items()}
-
-            i += 1
-
-        # Generate default name from URL
-        if "name" not in result:
-            result["name"] = f"{result['method']} {result['path']}"
-
-        return result
@@ -0,0 +1,460 @@
+"""Load test service for running scenarios as concurrent virtual users."""
+
+import asyncio
+import time
+import uuid
+from collections import Counter
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.config import settings
+from app.models.env_variable import EnvVariable
+from app.models.environment import Environment
+from app.models.global_variable import GlobalVariable
+from app.models.keyword import Keyword
+from app.models.scenario import Scenario
+from app.schemas.load_test import (
+    LatencyStats,
+    LoadTestRequest,
+    LoadTestResponse,
+    LoadTestStepStats,
+)
+from app.services.global_param_service import GlobalParamService
+from app.services.scenario_runner import (
+    RunnableStep,
+    ScenarioRunner,
+    StepResult,
+    load_keyword_functions,
+)
+from app.utils.function_executor import FunctionExecutor
+from app.utils.latency_histogram import LatencyHistogram
+from app.utils.seeded_random import new_seed, seeded_scope
+from app.utils.shared_cache import SharedVariableCache
+from app.utils.ttl_cache import TTLCache
+from app.utils.variable_context import VariableContext, flatten_layers
+
+# Maximum number of distinct error messages reported
+MAX_REPORTED_ERRORS = 20
+
+# Seconds a finished job's result stays available for polling
+_JOB_RESULT_TTL_SECONDS = 3600
+
+# Running jobs by ID: (scenario_id, task)
+_running_jobs: dict[str, tuple[int, asyncio.Task]] = {}
+
+# Finished job states by ID
+_finished_jobs = TTLCache(ttl=_JOB_RESULT_TTL_SECONDS, maxsize=256)
+
+
+@dataclass
+class PreparedLoadTest:
+    """Everything a load test run needs, loaded up front from the database."""
+
+    scenario_id: int
+    load_in: LoadTestRequest
+    steps: list[RunnableStep]
+    keyword_functions: dict[str, Callable[..., Any]]
+    executor: FunctionExecutor
+    base_url: str
+    base_context: Mapping[str, Any]
+    seed: int
+
+
+class _LoadTestRecorder:
+    """Aggregates iteration results into latency histograms."""
+
+    def __init__(self, steps: list[RunnableStep]):
+        self.steps = steps
+        self.iteration_latency = LatencyHistogram()
+        self.step_latency = {step.id: LatencyHistogram() for step in steps}
+        self.step_errors: Counter[int] = Counter()
+        self.error_messages: Counter[str] = Counter()
+        self.iterations = 0
+        self.failed_iterations = 0
+        self.dropped_iterations = 0
+
+    def record(self, results: list[StepResult], elapsed_ms: float) -> None:
+        """Record one finished iteration."""
+        failed = False
+        for result in results:
+            self.step_latency[result.step_id].record(result.elapsed_ms)
+            if result.status != "passed":
+                failed = True
+                self.step_errors[result.step_id] += 1
+                self.error_messages[result.error_message or "Unknown error"] += 1
+
+        self.iterations += 1
+        if failed:
+            self.failed_iterations += 1
+        self.iteration_latency.record(elapsed_ms)
+
+
+class LoadTestService:
+    """Service for scenario load testing.
+
+    Runs a scenario repeatedly either as N closed-loop virtual users or at a
+    target arrival rate, keeping only latency histograms and counters in
+    memory instead of writing ExecutionStep rows.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        """Initialize load test service.
+
+        Args:
+            session: Database session
+            transport: Optional HTTP transport (used by tests)
+        """
+        self.session = session
+        self.transport = transport
+
+    async def run_load_test(
+        self, scenario_id: int, load_in: LoadTestRequest
+    ) -> LoadTestResponse | None:
+        """Run a load test against a scenario.
+
+        Args:
+            scenario_id: Scenario ID
+            load_in: Load test configuration
+
+        Returns:
+            Aggregated load test results, or None if scenario not found
+
+        Raises:
+            ValueError: If the scenario has no steps or uses unavailable keywords
+        """
+        prepared = await self.prepare_load_test(scenario_id, load_in)
+        if prepared is None:
+            return None
+        return await self.execute_load_test(prepared)
+
+    async def prepare_load_test(
+        self, scenario_id: int, load_in: LoadTestRequest
+    ) -> PreparedLoadTest | None:
+        """Load everything a load test needs from the database.
+
+        Args:
+            scenario_id: Scenario ID
+            load_in: Load test configuration
+
+        Returns:
+            Prepared run for execute_load_test, or None if scenario not found
+
+        Raises:
+            ValueError: If the scenario has no steps or uses unavailable keywords
+        """
+        result = await self.session.execute(
+            select(Scenario)
+            .options(selectinload(Scenario.steps))
+            .where(Scenario.id == scenario_id)
+        )
+        scenario = result.scalar_one_or_none()
+        if not scenario:
+            return None
+
+        if not scenario.steps:
+            raise ValueError("Scenario has no steps")
+
+        steps, keywords = await self._load_steps(scenario)
+        keyword_functions = load_keyword_functions(keywords)
+        executor = await GlobalParamService(self.session).get_function_executor()
+
+        result = await self.session.execute(
+            select(GlobalVariable.name, GlobalVariable.value).where(
+                GlobalVariable.project_id == scenario.project_id
+            )
+        )
+        global_vars = dict(result.all())
+
+        base_url = ""
+        env_vars: dict[str, Any] = {}
+        environment_id = load_in.environment_id or scenario.environment_id
+        if environment_id:
+            environment = await self.session.get(Environment, environment_id)
+            if not environment:
+                raise ValueError(f"Environment {environment_id} not found")
+            base_url = environment.base_url
+            result = await self.session.execute(
+                select(EnvVariable.name, EnvVariable.value).where(
+                    EnvVariable.environment_id == environment_id
+                )
+            )
+            env_vars = dict(result.all())
+
+        return PreparedLoadTest(
+            scenario_id=scenario_id,
+            load_in=load_in,
+            steps=steps,
+            keyword_functions=keyword_functions,
+            executor=executor,
+            base_url=base_url,
+            # Built once and shared read-only by every iteration
+            base_context=flatten_layers(global_vars, env_vars, scenario.variables),
+            # Each iteration gets its own RNG derived from this seed (see _run_iteration)
+            seed=load_in.seed if load_in.seed is not None else new_seed(),
+        )
+
+    async def execute_load_test(self, prepared: PreparedLoadTest) -> LoadTestResponse:
+        """Run a prepared load test.
+
+        Does not use the database session, so it can outlive the request
+        that prepared it.
+
+        Args:
+            prepared: Result of prepare_load_test
+
+        Returns:
+            Aggregated load test results
+        """
+        load_in = prepared.load_in
+        recorder = _LoadTestRecorder(prepared.steps)
+        async with httpx.AsyncClient(
+            base_url=prepared.base_url,
+            timeout=load_in.request_timeout_seconds,
+            limits=httpx.Limits(
+                max_connections=load_in.virtual_users,
+                max_keepalive_connections=load_in.virtual_users,
+            ),
+            transport=self.transport,
+        ) as client:
+            # One shared cache per run: shared steps (e.g. login) run once for all users
+            shared_cache = SharedVariableCache()
+            runner = ScenarioRunner(
+                prepared.steps, prepared.keyword_functions, prepared.executor, client, shared_cache
+            )
+            started = time.perf_counter()
+            if load_in.target_rps:
+                await self._run_arrival_rate(
+                    runner, prepared.base_context, recorder, load_in, prepared.seed
+                )
+            else:
+                await self._run_virtual_users(
+                    runner, prepared.base_context, recorder, load_in, prepared.seed
+                )
+            elapsed = time.perf_counter() - started
+
+        return self._build_response(prepared, recorder, elapsed, shared_cache)
+
+    async def _load_steps(self, scenario: Scenario) -> tuple[list[RunnableStep], list[Keyword]]:
+        """Resolve scenario steps and their keywords in one query."""
+        ordered = sorted(scenario.steps, key=lambda s: (s.sort_order, s.id))
+        keyword_ids = {step.keyword_id for step in ordered}
+        result = await self.session.execute(select(Keyword).where(Keyword.id.in_(keyword_ids)))
+        keywords = {keyword.id: keyword for keyword in result.scalars().all()}
+
+        steps = []
+        for step in ordered:
+            keyword = keywords.get(step.keyword_id)
+            if keyword is None:
+                raise ValueError(f"Keyword {step.keyword_id} not found (step {step.id})")
+            if not keyword.is_enabled:
+                raise ValueError(f"Keyword {keyword.method_name} is disabled (step {step.id})")
+            steps.append(RunnableStep.from_model(step, keyword))
+        return steps, list(keywords.values())
+
+    async def _run_iteration(
+        self,
+        runner: ScenarioRunner,
+        base_context: Mapping[str, Any],
+        recorder: _LoadTestRecorder,
+        seed: int,
+        *scope: object,
+    ) -> None:
+        """Run one scenario iteration with a fresh context and its own RNG."""
+        started = time.perf_counter()
+        with seeded_scope(seed, *scope):
+            results = await runner.run(VariableContext(base_context))
+        recorder.record(results, (time.perf_counter() - started) * 1000)
+
+    async def _run_virtual_users(
+        self,
+        runner: ScenarioRunner,
+        base_context: Mapping[str, Any],
+        recorder: _LoadTestRecorder,
+        load_in: LoadTestRequest,
+        seed: int,
+    ) -> None:
+        """Closed model: each virtual user loops until the deadline."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + load_in.duration_seconds
+
+        async def virtual_user(user: int) -> None:
+            iteration = 0
+            while loop.time() < deadline:
+                await self._run_iteration(
+                    runner, base_context, recorder, seed, "user", user, iteration
+                )
+                iteration += 1
+                # Always yield so CPU-only scenarios don't starve other users
+                await asyncio.sleep(load_in.think_time_ms / 1000)
+
+        await asyncio.gather(*(virtual_user(user) for user in range(load_in.virtual_users)))
+
+    async def _run_arrival_rate(
+        self,
+        runner: ScenarioRunner,
+        base_context: Mapping[str, Any],
+        recorder: _LoadTestRecorder,
+        load_in: LoadTestRequest,
+        seed: int,
+    ) -> None:
+        """Open model: start iterations at a fixed rate, capped by virtual_users."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + load_in.duration_seconds
+        interval = 1 / (load_in.target_rps or 1)
+        slots = asyncio.Semaphore(load_in.virtual_users)
+        in_flight: set[asyncio.Task] = set()
+
+        async def run_one(arrival: int) -> None:
+            try:
+                await self._run_iteration(runner, base_context, recorder, seed, "arrival", arrival)
+            finally:
+                slots.release()
+
+        arrival = 0
+        next_start = loop.time()
+        while next_start < deadline:
+            delay = next_start - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            if slots.locked():
+                # All virtual users busy: the arrival is dropped, not queued
+                recorder.dropped_iterations += 1
+            else:
+                await slots.acquire()
+                task = asyncio.create_task(run_one(arrival))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+
+            arrival += 1
+            next_start += interval
+
+        if in_flight:
+            await asyncio.gather(*in_flight)
+
+    def _build_response(
+        self,
+        prepared: PreparedLoadTest,
+        recorder: _LoadTestRecorder,
+        elapsed: float,
+        shared_cache: SharedVariableCache,
+    ) -> LoadTestResponse:
+        """Build the load test response from recorded histograms."""
+        load_in = prepared.load_in
+        step_stats = []
+        for step in recorder.steps:
+            histogram = recorder.step_latency[step.id]
+            errors = recorder.step_errors[step.id]
+            step_stats.append(
+                LoadTestStepStats.model_validate(
+                    {
+                        **histogram.summary(),
+                        "step_id": step.id,
+                        "description": step.description,
+                        "errors": errors,
+                        "error_rate": (
+                            round(errors / histogram.count * 100, 2) if histogram.count else 0.0
+                        ),
+                    }
+                )
+            )
+
+        iterations = recorder.iterations
+        return LoadTestResponse(
+            scenario_id=prepared.scenario_id,
+            mode="arrival_rate" if load_in.target_rps else "virtual_users",
+            virtual_users=load_in.virtual_users,
+            target_rps=load_in.target_rps,
+            duration_seconds=round(elapsed, 3),
+            iterations=iterations,
+            failed_iterations=recorder.failed_iterations,
+            dropped_iterations=recorder.dropped_iterations,
+            throughput_rps=round(iterations / elapsed, 2) if elapsed > 0 else 0.0,
+            error_rate=(
+                round(recorder.failed_iterations / iterations * 100, 2) if iterations else 0.0
+            ),
+            latency=LatencyStats.model_validate(recorder.iteration_latency.summary()),
+            steps=step_stats,
+            errors=dict(recorder.error_messages.most_common(MAX_REPORTED_ERRORS)),
+            shared_cache_hits=shared_cache.hits,
+            shared_cache_misses=shared_cache.misses,
+            seed=prepared.seed,
+        )
+
+
+def start_load_test_job(service: LoadTestService, prepared: PreparedLoadTest) -> str:
+    """Run a prepared load test in the background.
+
+    Jobs live in this process: poll get_load_test_job on the same worker.
+    Results are kept for _JOB_RESULT_TTL_SECONDS after the run finishes.
+    At most LOAD_TEST_MAX_CONCURRENT_JOBS run at once.
+
+    Args:
+        service: Load test service (its session is not used by the run)
+        prepared: Result of prepare_load_test
+
+    Returns:
+        Job ID
+
+    Raises:
+        RuntimeError: If the maximum number of jobs is already running
+    """
+    if len(_running_jobs) >= settings.LOAD_TEST_MAX_CONCURRENT_JOBS:
+        raise RuntimeError(
+            f"Too many load tests running (max {settings.LOAD_TEST_MAX_CONCURRENT_JOBS})"
+        )
+    job_id = uuid.uuid4().hex
+
+    async def run() -> None:
+        state: dict[str, Any] = {"job_id": job_id, "scenario_id": prepared.scenario_id}
+        try:
+            result = await service.execute_load_test(prepared)
+            state.update(status="completed", result=result)
+        except asyncio.CancelledError:
+            state.update(status="cancelled")
+            raise
+        except Exception as e:
+            state.update(status="failed", error=str(e) or type(e).__name__)
+        finally:
+            _finished_jobs.set(job_id, state)
+            _running_jobs.pop(job_id, None)
+
+    _running_jobs[job_id] = (prepared.scenario_id, asyncio.create_task(run()))
+    return job_id
+
+
+def get_load_test_job(job_id: str) -> dict[str, Any] | None:
+    """Get the state of a load test job.
+
+    Args:
+        job_id: Job ID from start_load_test_job
+
+    Returns:
+        job_id, scenario_id, status (running / completed / failed /
+        cancelled) and the
+        result or error, or None if the job is unknown or expired
+    """
+    running = _running_jobs.get(job_id)
+    if running is not None:
+        return {"job_id": job_id, "scenario_id": running[0], "status": "running"}
+    found, state = _finished_jobs.get(job_id)
+    return state if found else None
+
+
+async def cancel_load_test_jobs() -> None:
+    """Cancel running load test jobs (application shutdown)."""
+    tasks = [task for _, task in _running_jobs.values()]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    _running_jobs.clear()
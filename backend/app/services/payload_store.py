@@ -0,0 +1,242 @@
+"""Payload store for spilling large execution step payloads to blob storage."""
+
+import gzip
+import json
+import uuid
+from pathlib import Path
+from typing import Any, Protocol
+
+from app.config import settings
+from app.models.execution_step import ExecutionStep
+from app.services.upload_service import UploadService
+
+# Marker key identifying a spilled payload stub
+SPILLED_KEY = "_spilled"
+
+PAYLOAD_KINDS = ("request", "response")
+
+
+class BlobStore(Protocol):
+    """Minimal key/value byte storage used by PayloadStore."""
+
+    async def put(self, key: str, data: bytes) -> None:
+        """Store bytes under a key."""
+        ...
+
+    async def get(self, key: str) -> bytes:
+        """Read bytes stored under a key."""
+        ...
+
+    async def delete(self, key: str) -> None:
+        """Delete bytes stored under a key."""
+        ...
+
+
+class LocalBlobStore:
+    """Blob store backed by a local directory."""
+
+    def __init__(self, root: str | Path):
+        """Initialize local blob store.
+
+        Args:
+            root: Root directory for stored blobs
+        """
+        self.root = Path(root)
+
+    def _path(self, key: str) -> Path:
+        """Resolve a key to a file path inside the root directory."""
+        path = (self.root / key).resolve()
+        if not path.is_relative_to(self.root.resolve()):
+            raise ValueError(f"Invalid payload reference: {key}")
+        return path
+
+    async def put(self, key: str, data: bytes) -> None:
+        """Store bytes under a key."""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+
+    async def get(self, key: str) -> bytes:
+        """Read bytes stored under a key."""
+        path = self._path(key)
+        if not path.exists():
+            raise ValueError(f"Payload not found: {key}")
+        return path.read_bytes()
+
+    async def delete(self, key: str) -> None:
+        """Delete bytes stored under a key."""
+        self._path(key).unlink(missing_ok=True)
+
+
+class MinioBlobStore:
+    """Blob store backed by MinIO through UploadService."""
+
+    def __init__(self, upload_service: UploadService | None = None):
+        """Initialize MinIO blob store.
+
+        Args:
+            upload_service: Upload service (created on first use if omitted)
+        """
+        self._upload_service = upload_service
+
+    @property
+    def upload_service(self) -> UploadService:
+        """Get the upload service, connecting lazily."""
+        if self._upload_service is None:
+            self._upload_service = UploadService()
+        return self._upload_service
+
+    async def put(self, key: str, data: bytes) -> None:
+        """Store bytes under a key."""
+        await self.upload_service.put_object(key, data, content_type="application/gzip")
+
+    async def get(self, key: str) -> bytes:
+        """Read bytes stored under a key."""
+        return await self.upload_service.get_object(key)
+
+    async def delete(self, key: str) -> None:
+        """Delete bytes stored under a key."""
+        await self.upload_service.delete_file(key)
+
+
+class PayloadStore:
+    """Moves oversized step payloads out of ExecutionStep JSON columns.
+
+    Payloads whose JSON encoding exceeds the threshold are gzip-compressed and
+    written to the blob store; the row keeps a small stub with the blob
+    reference, sizes and a truncated preview.
+    """
+
+    def __init__(
+        self,
+        blob_store: BlobStore,
+        threshold_bytes: int | None = None,
+        preview_chars: int | None = None,
+    ):
+        """Initialize payload store.
+
+        Args:
+            blob_store: Blob store holding spilled payloads
+            threshold_bytes: Spill payloads larger than this (default from settings)
+            preview_chars: Preview length kept inline (default from settings)
+        """
+        self.blob_store = blob_store
+        self.threshold_bytes = (
+            threshold_bytes
+            if threshold_bytes is not None
+            else settings.PAYLOAD_SPILL_THRESHOLD_BYTES
+        )
+        self.preview_chars = (
+            preview_chars if preview_chars is not None else settings.PAYLOAD_PREVIEW_CHARS
+        )
+
+    @staticmethod
+    def is_spilled(payload: Any) -> bool:
+        """Check whether a stored payload is a spill stub.
+
+        Args:
+            payload: Value of a request_data/response_data column
+
+        Returns:
+            True if the payload lives in the blob store
+        """
+        return isinstance(payload, dict) and payload.get(SPILLED_KEY) is True
+
+    async def spill(
+        self, payload: dict[str, Any] | None, prefix: str = "payloads"
+    ) -> dict[str, Any] | None:
+        """Spill a payload to the blob store if it is too large.
+
+        Args:
+            payload: Request or response payload
+            prefix: Object key prefix
+
+        Returns:
+            The payload unchanged if small enough, otherwise a spill stub
+        """
+        if payload is None or self.is_spilled(payload):
+            return payload
+
+        encoded = json.dumps(payload, ensure_ascii=False, default=str)
+        raw = encoded.encode("utf-8")
+        if len(raw) <= self.threshold_bytes:
+            return payload
+
+        compressed = gzip.compress(raw, compresslevel=6)
+        ref = f"{prefix}/{uuid.uuid4().hex}.json.gz"
+        await self.blob_store.put(ref, compressed)
+
+        return {
+            SPILLED_KEY: True,
+            "ref": ref,
+            "encoding": "gzip",
+            "size": len(raw),
+            "stored_size": len(compressed),
+            "preview": encoded[: self.preview_chars],
+        }
+
+    async def load(self, payload: dict[str, Any] | None) -> dict[str, Any] | None:
+        """Load the full payload, fetching spilled payloads from the blob store.
+
+        Args:
+            payload: Value of a request_data/response_data column
+
+        Returns:
+            Full payload
+
+        Raises:
+            ValueError: If the spilled payload cannot be read
+        """
+        if payload is None or not self.is_spilled(payload):
+            return payload
+
+        data = await self.blob_store.get(payload["ref"])
+        if payload.get("encoding") == "gzip":
+            data = gzip.decompress(data)
+        return json.loads(data.decode("utf-8"))
+
+    async def delete(self, payload: dict[str, Any] | None) -> None:
+        """Delete the blob behind a spilled payload (no-op for inline payloads).
+
+        Args:
+            payload: Value of a request_data/response_data column
+        """
+        if payload is not None and self.is_spilled(payload):
+            await self.blob_store.delete(payload["ref"])
+
+    async def spill_step(self, step: ExecutionStep) -> ExecutionStep:
+        """Spill a step's oversized request/response payloads in place.
+
+        Call before adding the step to the session. Nothing in this tree
+        writes ExecutionStep rows yet (load tests keep their results in
+        memory), so the execution step writer must call this when it lands.
+
+        Args:
+            step: Execution step
+
+        Returns:
+            The same step
+        """
+        prefix = f"payloads/{step.execution_scenario_id}"
+        step.request_data = await self.spill(step.request_data, prefix)
+        step.response_data = await self.spill(step.response_data, prefix)
+        return step
+
+
+_payload_store: PayloadStore | None = None
+
+
+def get_payload_store() -> PayloadStore:
+    """Get the process-wide payload store configured from settings.
+
+    Returns:
+        PayloadStore instance
+    """
+    global _payload_store
+    if _payload_store is None:
+        if settings.PAYLOAD_STORE_BACKEND == "local":
+            blob_store: BlobStore = LocalBlobStore(settings.PAYLOAD_STORE_DIR)
+        else:
+            blob_store = MinioBlobStore()
+        _payload_store = PayloadStore(blob_store)
+    return _payload_store
@@ -0,0 +1,572 @@
+"""Plan compiler: resolves and validates a test plan before it runs."""
+
+import ast
+import re
+from collections import defaultdict
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass, field
+from types import CodeType, MappingProxyType
+from typing import Any
+
+import httpx
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.database_config import DatabaseConfig
+from app.models.dataset import Dataset
+from app.models.env_variable import EnvVariable
+from app.models.environment import Environment
+from app.models.global_variable import GlobalVariable
+from app.models.keyword import Keyword
+from app.models.plan_scenario import PlanScenario
+from app.models.scenario import Scenario
+from app.models.scenario_step import ScenarioStep
+from app.models.test_plan import TestPlan
+from app.services.global_param_service import GlobalParamService
+from app.services.scenario_runner import (
+    RESERVED_STEP_PARAMS,
+    RunnableStep,
+    ScenarioRunner,
+    load_keyword_functions,
+)
+from app.utils.function_executor import FunctionExecutor, compile_expression
+from app.utils.shared_cache import SharedVariableCache
+from app.utils.variable_context import VariableContext, flatten_layers
+
+_PLACEHOLDER = re.compile(r"\{\{(.+?)\}\}", re.DOTALL)
+
+# Step params that name a database connection (DatabaseConfig.variable_name)
+DB_CONNECTION_PARAMS = ("db_connection",)
+
+@dataclass(frozen=True)
+class ValidationIssue:
+    """A problem found while compiling a plan."""
+
+    severity: str  # error/warning
+    code: str
+    message: str
+    scenario_id: int | None = None
+    step_id: int | None = None
+
+
+@dataclass
+class ValidationReport:
+    """All issues found while compiling a plan."""
+
+    issues: list[ValidationIssue] = field(default_factory=list)
+
+    def add(
+        self,
+        severity: str,
+        code: str,
+        message: str,
+        scenario_id: int | None = None,
+        step_id: int | None = None,
+    ) -> None:
+        """Record an issue."""
+        self.issues.append(ValidationIssue(severity, code, message, scenario_id, step_id))
+
+    @property
+    def errors(self) -> list[ValidationIssue]:
+        """Issues that prevent the plan from running."""
+        return [issue for issue in self.issues if issue.severity == "error"]
+
+    @property
+    def warnings(self) -> list[ValidationIssue]:
+        """Issues that do not prevent the plan from running."""
+        return [issue for issue in self.issues if issue.severity == "warning"]
+
+    @property
+    def is_valid(self) -> bool:
+        """Whether the plan compiled without errors."""
+        return not self.errors
+
+
+@dataclass(frozen=True)
+class CompiledScenario:
+    """A scenario with its steps and data resolved."""
+
+    id: int
+    name: str
+    steps: tuple[RunnableStep, ...]
+    variables: Mapping[str, Any]
+    dataset_rows: tuple[Mapping[str, Any], ...] = ()
+    pre_sql: str | None = None
+    post_sql: str | None = None
+
+
+@dataclass(frozen=True)
+class CompiledPlan:
+    """Immutable, fully resolved execution plan.
+
+    Everything a runner needs is loaded up front, so running the plan does no
+    database lookups.
+    """
+
+    plan_id: int
+    project_id: int
+    environment_id: int | None
+    base_url: str
+    variables: Mapping[str, Any]
+    database_configs: Mapping[str, int]
+    scenarios: tuple[CompiledScenario, ...]
+    keyword_functions: Mapping[str, Callable[..., Any]]
+    templates: Mapping[str, CodeType]
+    executor: FunctionExecutor
+
+    @property
+    def step_count(self) -> int:
+        """Total number of steps across all scenarios."""
+        return sum(len(scenario.steps) for scenario in self.scenarios)
+
+    def runner_for(
+        self,
+        scenario: CompiledScenario,
+        client: httpx.AsyncClient,
+        shared_cache: SharedVariableCache | None = None,
+    ) -> ScenarioRunner:
+        """Build a runner for one compiled scenario.
+
+        Args:
+            scenario: Scenario from this plan
+            client: HTTP client (base_url should be the plan base_url)
+            shared_cache: Execution-scoped cache for shared steps
+
+        Returns:
+            ScenarioRunner instance
+        """
+        return ScenarioRunner(
+            list(scenario.steps),
+            dict(self.keyword_functions),
+            self.executor,
+            client,
+            shared_cache,
+        )
+
+    def contexts_for(self, scenario: CompiledScenario) -> Iterator[VariableContext]:
+        """Yield the initial variable context for each run of a scenario.
+
+        Plan variables (the shared read-only base) are overridden by scenario
+        variables, which are overridden by dataset row values (one run per
+        row). Only the scenario/row layer is allocated per run.
+
+        Args:
+            scenario: Scenario from this plan
+
+        Yields:
+            Fresh variable context per run
+        """
+        if not scenario.dataset_rows:
+            yield VariableContext(self.variables, scenario.variables)
+            return
+        for row in scenario.dataset_rows:
+            yield VariableContext(self.variables, scenario.variables, row)
+
+
+def iter_placeholders(value: Any) -> Iterator[str]:
+    """Yield every {{}} expression inside a (nested) param value.
+
+    Args:
+        value: str, dict, list or scalar
+
+    Yields:
+        Stripped placeholder expressions
+    """
+    if isinstance(value, str):
+        for match in _PLACEHOLDER.finditer(value):
+            yield match.group(1).strip()
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from iter_placeholders(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from iter_placeholders(item)
+
+
+def _expression_names(tree: ast.AST) -> set[str]:
+    """Get free variable names read by an expression."""
+    bound = {
+        node.id
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store)
+    }
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Lambda):
+            bound.update(arg.arg for arg in node.args.args)
+    return {
+        node.id
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load)
+    } - bound
+
+
+def _is_unsafe(tree: ast.AST) -> bool:
+    """Check for private/dunder attribute access (sandbox escapes)."""
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Attribute) and node.attr.startswith("_"):
+            return True
+        if isinstance(node, ast.Name) and node.id.startswith("__"):
+            return True
+    return False
+
+
+def _dataset_rows(dataset: Dataset | None) -> tuple[Mapping[str, Any], ...]:
+    """Convert dataset rows into per-run variable mappings."""
+    if dataset is None or not dataset.rows:
+        return ()
+    headers = list(dataset.headers or [])
+    return tuple(
+        MappingProxyType(dict(zip(headers, row, strict=False))) for row in dataset.rows
+    )
+
+
+class PlanCompiler:
+    """Compiles a test plan into an immutable CompiledPlan.
+
+    Loads plan, scenarios, steps, keywords, variables, database configs and
+    datasets in a fixed number of bulk queries, pre-compiles keyword code and
+    {{}} templates, and reports every problem a run would otherwise only hit
+    when the failing step executes.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """Initialize plan compiler.
+
+        Args:
+            session: Database session
+        """
+        self.session = session
+
+    async def compile(
+        self, plan_id: int, environment_id: int | None = None
+    ) -> tuple[CompiledPlan | None, ValidationReport] | None:
+        """Compile a test plan.
+
+        Args:
+            plan_id: Test plan ID
+            environment_id: Environment to run against (default: the single
+                environment shared by the plan's scenarios, if any)
+
+        Returns:
+            Tuple of (compiled plan or None if invalid, validation report),
+            or None if the plan is not found
+        """
+        plan = await self.session.get(TestPlan, plan_id)
+        if not plan:
+            return None
+
+        report = ValidationReport()
+
+        result = await self.session.execute(
+            select(Scenario)
+            .join(PlanScenario, PlanScenario.scenario_id == Scenario.id)
+            .where(PlanScenario.plan_id == plan_id)
+            .order_by(PlanScenario.sort_order, PlanScenario.id)
+        )
+        scenarios = list(result.scalars().all())
+        if not scenarios:
+            report.add("error", "empty_plan", "Test plan has no scenarios")
+        scenario_ids = [scenario.id for scenario in scenarios]
+
+        steps_by_scenario: dict[int, list[ScenarioStep]] = defaultdict(list)
+        datasets: dict[int, Dataset] = {}
+        keywords: dict[int, Keyword] = {}
+        if scenario_ids:
+            result = await self.session.execute(
+                select(ScenarioStep)
+                .where(ScenarioStep.scenario_id.in_(scenario_ids))
+                .order_by(ScenarioStep.sort_order, ScenarioStep.id)
+            )
+            for step in result.scalars().all():
+                steps_by_scenario[step.scenario_id].append(step)
+
+            keyword_ids = {step.keyword_id for steps in steps_by_scenario.values() for step in steps}
+            if keyword_ids:
+                result = await self.session.execute(
+                    select(Keyword).where(Keyword.id.in_(keyword_ids))
+                )
+                keywords = {keyword.id: keyword for keyword in result.scalars().all()}
+
+            result = await self.session.execute(
+                select(Dataset).where(Dataset.scenario_id.in_(scenario_ids))
+            )
+            datasets = {dataset.scenario_id: dataset for dataset in result.scalars().all()}
+
+        environment = await self._resolve_environment(scenarios, environment_id, report)
+
+        result = await self.session.execute(
+            select(GlobalVariable.name, GlobalVariable.value).where(
+                GlobalVariable.project_id == plan.project_id
+            )
+        )
+        global_vars = dict(result.all())
+        env_vars: dict[str, Any] = {}
+        if environment is not None:
+            result = await self.session.execute(
+                select(EnvVariable.name, EnvVariable.value).where(
+                    EnvVariable.environment_id == environment.id
+                )
+            )
+            env_vars = dict(result.all())
+        # Environment variables override project-wide globals
+        variables = flatten_layers(global_vars, env_vars)
+
+        result = await self.session.execute(
+            select(DatabaseConfig.variable_name, DatabaseConfig.id, DatabaseConfig.is_enabled).where(
+                DatabaseConfig.project_id == plan.project_id
+            )
+        )
+        db_configs = {row.variable_name: (row.id, row.is_enabled) for row in result.all()}
+
+        executor = await GlobalParamService(self.session).get_function_executor()
+        keyword_functions = load_keyword_functions(
+            [keyword for keyword in keywords.values() if keyword.is_enabled]
+        )
+
+        templates: dict[str, CodeType] = {}
+        compiled_scenarios = []
+        for scenario in scenarios:
+            compiled_scenarios.append(
+                self._compile_scenario(
+                    scenario,
+                    steps_by_scenario[scenario.id],
+                    keywords,
+                    keyword_functions,
+                    datasets.get(scenario.id),
+                    known_names=set(executor.functions) | set(variables) | set(db_configs),
+                    db_configs=db_configs,
+                    templates=templates,
+                    report=report,
+                )
+            )
+
+        if not report.is_valid:
+            return None, report
+
+        compiled = CompiledPlan(
+            plan_id=plan.id,
+            project_id=plan.project_id,
+            environment_id=environment.id if environment else None,
+            base_url=environment.base_url if environment else "",
+            variables=variables,
+            database_configs=MappingProxyType(
+                {name: config_id for name, (config_id, enabled) in db_configs.items() if enabled}
+            ),
+            scenarios=tuple(compiled_scenarios),
+            keyword_functions=MappingProxyType(keyword_functions),
+            templates=MappingProxyType(templates),
+            executor=executor,
+        )
+        return compiled, report
+
+    async def _resolve_environment(
+        self,
+        scenarios: list[Scenario],
+        environment_id: int | None,
+        report: ValidationReport,
+    ) -> Environment | None:
+        """Pick the environment the plan runs against."""
+        if environment_id is None:
+            scenario_envs = {s.environment_id for s in scenarios if s.environment_id}
+            if len(scenario_envs) > 1:
+                report.add(
+                    "error",
+                    "ambiguous_environment",
+                    "Scenarios use different environments; specify environment_id",
+                )
+                return None
+            environment_id = next(iter(scenario_envs), None)
+
+        if environment_id is None:
+            return None
+
+        environment = await self.session.get(Environment, environment_id)
+        if environment is None:
+            report.add("error", "missing_environment", f"Environment {environment_id} not found")
+        return environment
+
+    def _compile_scenario(
+        self,
+        scenario: Scenario,
+        steps: list[ScenarioStep],
+        keywords: dict[int, Keyword],
+        keyword_functions: dict[str, Callable[..., Any]],
+        dataset: Dataset | None,
+        known_names: set[str],
+        db_configs: dict[str, tuple[int, bool]],
+        templates: dict[str, CodeType],
+        report: ValidationReport,
+    ) -> CompiledScenario:
+        """Resolve and validate one scenario."""
+        if not steps:
+            report.add("warning", "empty_scenario", "Scenario has no steps", scenario.id)
+
+        scenario_vars = dict(scenario.variables or {})
+        rows = _dataset_rows(dataset)
+        # Names defined so far; grows as earlier steps save/extract values
+        defined = known_names | set(scenario_vars)
+        if dataset is not None:
+            defined.update(dataset.headers or [])
+
+        for sql in (scenario.pre_sql, scenario.post_sql):
+            self._check_templates(sql, defined, templates, report, scenario.id)
+        for value in scenario_vars.values():
+            self._check_templates(value, defined, templates, report, scenario.id)
+
+        runnable = []
+        for step in steps:
+            keyword = keywords.get(step.keyword_id)
+            if keyword is None:
+                report.add(
+                    "error",
+                    "missing_keyword",
+                    f"Keyword {step.keyword_id} not found",
+                    scenario.id,
+                    step.id,
+                )
+                continue
+            if not keyword.is_enabled:
+                report.add(
+                    "error",
+                    "disabled_keyword",
+                    f"Keyword {keyword.method_name} is disabled",
+                    scenario.id,
+                    step.id,
+                )
+                continue
+            if (
+                keyword.method_name != "http_request"
+                and keyword.method_name not in keyword_functions
+            ):
+                report.add(
+                    "error",
+                    "invalid_keyword",
+                    f"Keyword {keyword.method_name} code does not define a callable",
+                    scenario.id,
+                    step.id,
+                )
+
+            params = dict(step.params or {})
+            self._check_db_connections(params, db_configs, report, scenario.id, step.id)
+            for key, value in params.items():
+                if key not in RESERVED_STEP_PARAMS:
+                    self._check_templates(value, defined, templates, report, scenario.id, step.id)
+
+            # Values produced by this step are visible to the following steps
+            if keyword.method_name == "http_request":
+                defined.add("response")
+            if params.get("save_as"):
+                defined.add(params["save_as"])
+            if isinstance(params.get("extract"), dict):
+                defined.update(params["extract"])
+
+            runnable.append(
+                RunnableStep(
+                    id=step.id,
+                    sort_order=step.sort_order,
+                    description=step.description,
+                    method_name=keyword.method_name,
+                    params=MappingProxyType(params),
+                )
+            )
+
+        return CompiledScenario(
+            id=scenario.id,
+            name=scenario.name,
+            steps=tuple(runnable),
+            variables=MappingProxyType(scenario_vars),
+            dataset_rows=rows,
+            pre_sql=scenario.pre_sql,
+            post_sql=scenario.post_sql,
+        )
+
+    @staticmethod
+    def _check_templates(
+        value: Any,
+        defined: set[str],
+        templates: dict[str, CodeType],
+        report: ValidationReport,
+        scenario_id: int,
+        step_id: int | None = None,
+    ) -> None:
+        """Compile and validate every placeholder in a value."""
+        for expr in iter_placeholders(value):
+            try:
+                tree = ast.parse(expr, mode="eval")
+            except SyntaxError:
+                report.add(
+                    "error",
+                    "invalid_placeholder",
+                    f"Invalid expression: {{{{{expr}}}}}",
+                    scenario_id,
+                    step_id,
+                )
+                continue
+
+            if _is_unsafe(tree):
+                report.add(
+                    "error",
+                    "unsafe_placeholder",
+                    f"Unsafe expression: {{{{{expr}}}}}",
+                    scenario_id,
+                    step_id,
+                )
+                continue
+
+            for name in sorted(_expression_names(tree) - defined):
+                report.add(
+                    "error",
+                    "undefined_variable",
+                    f"Undefined variable '{name}' in {{{{{expr}}}}}",
+                    scenario_id,
+                    step_id,
+                )
+
+            code = compile_expression(expr)
+            if code is None:
+                report.add(
+                    "error",
+                    "unsafe_placeholder",
+                    f"Unsafe expression: {{{{{expr}}}}}",
+                    scenario_id,
+                    step_id,
+                )
+            else:
+                templates[expr] = code
+
+    @staticmethod
+    def _check_db_connections(
+        params: dict[str, Any],
+        db_configs: dict[str, tuple[int, bool]],
+        report: ValidationReport,
+        scenario_id: int,
+        step_id: int,
+    ) -> None:
+        """Validate database connections referenced by a step."""
+        for key in DB_CONNECTION_PARAMS:
+            value = params.get(key)
+            if not isinstance(value, str):
+                continue
+            name = value.strip()
+            match = _PLACEHOLDER.fullmatch(name)
+            if match:
+                name = match.group(1).strip()
+
+            config = db_configs.get(name)
+            if config is None:
+                report.add(
+                    "error",
+                    "missing_database",
+                    f"Database config '{name}' not found",
+                    scenario_id,
+                    step_id,
+                )
+            elif not config[1]:
+                report.add(
+                    "error",
+                    "disabled_database",
+                    f"Database config '{name}' is disabled",
+                    scenario_id,
+                    step_id,
+                )
+
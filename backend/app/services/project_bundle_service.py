@@ -0,0 +1,459 @@
+"""Project bundles: streaming export and import of a whole project.
+
+A bundle is gzip-compressed NDJSON: a header line, then one line per row in
+dependency order (parents before children), then a trailer with the row
+count::
+
+    {"type": "header", "format": "sisyphus-x-project", "version": 1, "project": {...}}
+    {"type": "environment", "id": 7, "name": "dev", "base_url": "..."}
+    {"type": "env_variable", "id": 31, "environment_id": 7, ...}
+    ...
+    {"type": "end", "rows": 12345}
+
+Ids are the exporting instance's and only serve to link rows inside the
+bundle; the importer assigns new ones. Database passwords and connection
+state are never exported.
+"""
+
+import gzip
+import io
+import json
+import zlib
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from typing import IO, Any
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.database_config import DatabaseConfig
+from app.models.dataset import Dataset
+from app.models.env_variable import EnvVariable
+from app.models.environment import Environment
+from app.models.global_variable import GlobalVariable
+from app.models.interface import Interface
+from app.models.interface_folder import InterfaceFolder
+from app.models.keyword import Keyword
+from app.models.plan_scenario import PlanScenario
+from app.models.project import Project
+from app.models.scenario import Scenario
+from app.models.scenario_step import ScenarioStep
+from app.models.scenario_tag import ScenarioTag
+from app.models.test_plan import TestPlan
+from app.services.clone_service import folder_levels
+from app.services.dashboard_service import invalidate_core_stats
+from app.utils.tag_expression import normalize_tags
+
+BUNDLE_FORMAT = "sisyphus-x-project"
+BUNDLE_VERSION = 1
+
+# Rows per export query and per import INSERT
+_BATCH = 500
+
+# Errors reported per import
+_MAX_ERRORS = 100
+
+# Columns never exported (the importer sets them)
+_IMPLICIT = ("id", "project_id", "created_at", "updated_at")
+
+
+@dataclass(frozen=True)
+class _Section:
+    """A table of the bundle."""
+
+    kind: str
+    model: Any
+    # Kind of the project-owned parent and the column referencing it, for
+    # tables not owned by the project directly
+    parent: str | None = None
+    parent_key: str | None = None
+    # Columns referencing earlier sections (column -> kind)
+    refs: dict[str, str] = field(default_factory=dict)
+    # Columns left out of the bundle
+    omit: tuple[str, ...] = ()
+
+
+# In dependency order
+BUNDLE_SECTIONS: tuple[_Section, ...] = (
+    _Section(
+        "database_config",
+        DatabaseConfig,
+        omit=("password", "is_connected", "last_check_at", "last_error"),
+    ),
+    _Section("global_variable", GlobalVariable),
+    _Section("environment", Environment),
+    _Section(
+        "env_variable",
+        EnvVariable,
+        parent="environment",
+        parent_key="environment_id",
+        refs={"environment_id": "environment"},
+    ),
+    _Section("folder", InterfaceFolder, refs={"parent_id": "folder"}),
+    _Section("interface", Interface, refs={"folder_id": "folder"}),
+    _Section(
+        "scenario", Scenario, refs={"environment_id": "environment"}, omit=("creator_id",)
+    ),
+    # keyword_id is exported as the keyword's method_name (ids differ per instance)
+    _Section(
+        "scenario_step",
+        ScenarioStep,
+        parent="scenario",
+        parent_key="scenario_id",
+        refs={"scenario_id": "scenario"},
+        omit=("keyword_id",),
+    ),
+    _Section(
+        "dataset",
+        Dataset,
+        parent="scenario",
+        parent_key="scenario_id",
+        refs={"scenario_id": "scenario"},
+    ),
+    _Section("test_plan", TestPlan, omit=("creator_id",)),
+    _Section(
+        "plan_scenario",
+        PlanScenario,
+        parent="test_plan",
+        parent_key="plan_id",
+        refs={"plan_id": "test_plan", "scenario_id": "scenario"},
+    ),
+)
+
+_SECTIONS_BY_KIND = {section.kind: section for section in BUNDLE_SECTIONS}
+
+# Kinds whose id mappings the importer keeps
+_REFERENCED = {kind for section in BUNDLE_SECTIONS for kind in section.refs.values()}
+
+
+def _line(record: dict[str, Any]) -> str:
+    """Encode one NDJSON line."""
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":"), default=str) + "\n"
+
+
+def _exported_columns(section: _Section) -> list[Any]:
+    """Columns of a section's rows in the bundle, id first."""
+    table = section.model.__table__
+    return [table.c.id] + [
+        column
+        for column in table.columns
+        if column.name not in _IMPLICIT and column.name not in section.omit
+    ]
+
+
+def _open_lines(fp: IO[bytes]) -> IO[str]:
+    """Open a bundle as text lines, gzip-compressed or not."""
+    magic = fp.read(2)
+    fp.seek(0)
+    if magic == b"\x1f\x8b":
+        return gzip.open(fp, "rt", encoding="utf-8")
+    return io.TextIOWrapper(fp, encoding="utf-8")
+
+
+class ProjectBundleService:
+    """Export a project to a bundle and import bundles as new projects.
+
+    Both directions stream: the exporter reads rows in keyset batches and
+    yields compressed chunks, the importer reads one line at a time and
+    writes bulk INSERTs of _BATCH rows. Memory is bounded by a batch plus
+    the old-to-new id mappings of referenced rows (environments, folders,
+    scenarios and plans). The import runs in the caller's transaction, so a
+    failed import leaves nothing behind.
+    """
+
+    def __init__(self, db: AsyncSession):
+        """Initialize project bundle service.
+
+        Args:
+            db: Database session
+        """
+        self.db = db
+
+    async def export_project(self, project_id: int) -> AsyncIterator[bytes]:
+        """Stream a project as a gzip-compressed bundle.
+
+        Args:
+            project_id: Project ID
+
+        Yields:
+            Chunks of the gzip file
+
+        Raises:
+            ValueError: If project not found
+        """
+        result = await self.db.execute(
+            select(Project.name, Project.description).where(Project.id == project_id)
+        )
+        project = result.one_or_none()
+        if project is None:
+            raise ValueError("Project not found")
+
+        # wbits=31: gzip container, readable by gzip.open and command-line tools
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+        header = {
+            "type": "header",
+            "format": BUNDLE_FORMAT,
+            "version": BUNDLE_VERSION,
+            "project": {"name": project.name, "description": project.description},
+        }
+        result = await self.db.execute(select(Keyword.id, Keyword.method_name))
+        keywords = dict(result.all())
+
+        chunk = compressor.compress(_line(header).encode())
+        if chunk:
+            yield chunk
+
+        rows = 0
+        for section in BUNDLE_SECTIONS:
+            names = [column.name for column in _exported_columns(section)]
+            async for batch in self._export_batches(section, project_id):
+                lines = []
+                for row in batch:
+                    record = {"type": section.kind, **dict(zip(names, row, strict=False))}
+                    if section.kind == "scenario_step":
+                        # Trailing column added by _export_batches
+                        record["keyword"] = keywords.get(row[-1])
+                    lines.append(_line(record))
+                rows += len(lines)
+                chunk = compressor.compress("".join(lines).encode())
+                if chunk:
+                    yield chunk
+
+        yield compressor.compress(_line({"type": "end", "rows": rows}).encode()) + compressor.flush()
+
+    async def _export_batches(
+        self, section: _Section, project_id: int
+    ) -> AsyncIterator[list[Any]]:
+        """Read a section's rows in batches, exported columns first."""
+        table = section.model.__table__
+        columns = _exported_columns(section)
+        if section.parent is None:
+            owned = table.c.project_id == project_id
+        else:
+            parent = _SECTIONS_BY_KIND[section.parent].model
+            owned = table.c[section.parent_key].in_(
+                select(parent.id).where(parent.project_id == project_id)
+            )
+        if section.kind == "scenario_step":
+            columns = [*columns, table.c.keyword_id]
+
+        if section.kind == "folder":
+            # Parents before children, so the importer can resolve parent_id
+            result = await self.db.execute(select(table.c.id, table.c.parent_id).where(owned))
+            for level in folder_levels([tuple(row) for row in result.all()]):
+                for start in range(0, len(level), _BATCH):
+                    result = await self.db.execute(
+                        select(*columns)
+                        .where(table.c.id.in_(level[start : start + _BATCH]))
+                        .order_by(table.c.id)
+                    )
+                    yield list(result.all())
+            return
+
+        last_id = 0
+        while True:
+            result = await self.db.execute(
+                select(*columns)
+                .where(owned, table.c.id > last_id)
+                .order_by(table.c.id)
+                .limit(_BATCH)
+            )
+            batch = list(result.all())
+            if not batch:
+                return
+            yield batch
+            last_id = batch[-1][0]
+
+    async def import_project(
+        self, fp: IO[bytes], creator_id: int, name: str | None = None
+    ) -> dict[str, Any]:
+        """Import a bundle as a new project.
+
+        Rows whose references can't be resolved (e.g. a step whose keyword
+        doesn't exist on this instance) are skipped and reported. Database
+        configs are imported disabled with an empty password, to be
+        re-entered.
+
+        Args:
+            fp: Bundle file (gzip-compressed or plain NDJSON)
+            creator_id: ID of user importing the project
+            name: Name of the new project (default: the exported name)
+
+        Returns:
+            Summary: project_id, rows imported per kind and errors
+
+        Raises:
+            ValueError: If the file is not a complete bundle or the project
+                name already exists
+        """
+        try:
+            lines = _open_lines(fp)
+            importer = _Importer(self.db, creator_id)
+            project_id = await importer.run(lines, name)
+        except (OSError, EOFError, UnicodeDecodeError) as e:
+            raise ValueError(f"Invalid bundle: {e}") from e
+
+        invalidate_core_stats(creator_id)
+        return {"project_id": project_id, "counts": importer.counts, "errors": importer.errors}
+
+
+class _Importer:
+    """State of one bundle import."""
+
+    def __init__(self, db: AsyncSession, creator_id: int):
+        self.db = db
+        self.creator_id = creator_id
+        self.project_id = 0
+        self.keywords: dict[str, int] = {}
+        self.id_maps: dict[str, dict[int, int]] = {kind: {} for kind in _REFERENCED}
+        self.counts: dict[str, int] = dict.fromkeys(_SECTIONS_BY_KIND, 0)
+        self.errors: list[str] = []
+        self.section: _Section | None = None
+        # (old id, row) pairs of the current section not yet written
+        self.pending: list[tuple[int | None, dict[str, Any]]] = []
+        self.pending_ids: set[int] = set()
+
+    def error(self, line: int, message: str) -> None:
+        if len(self.errors) < _MAX_ERRORS:
+            self.errors.append(f"line {line}: {message}")
+
+    async def run(self, lines: IO[str], name: str | None) -> int:
+        """Import all lines, returning the new project ID."""
+        records = self._records(lines)
+        header = next(records, None)
+        if header is None or header[1].get("format") != BUNDLE_FORMAT:
+            raise ValueError("Not a project bundle")
+        if header[1].get("version") != BUNDLE_VERSION:
+            raise ValueError(f"Unsupported bundle version: {header[1].get('version')}")
+        await self._create_project(header[1].get("project") or {}, name)
+
+        result = await self.db.execute(select(Keyword.method_name, Keyword.id))
+        self.keywords = dict(result.all())
+
+        for line, record in records:
+            kind = record.get("type")
+            if kind == "end":
+                await self._flush()
+                return self.project_id
+            section = _SECTIONS_BY_KIND.get(kind) if isinstance(kind, str) else None
+            if section is None:
+                self.error(line, f"unknown type {kind!r}")
+                continue
+            if section is not self.section:
+                await self._flush()
+                self.section = section
+            await self._add(section, line, record)
+        raise ValueError("Bundle is truncated (no end record)")
+
+    def _records(self, lines: IO[str]):
+        """Parse lines, skipping blank and reporting malformed ones."""
+        for line, text in enumerate(lines, start=1):
+            if not text.strip():
+                continue
+            try:
+                record = json.loads(text)
+            except ValueError:
+                self.error(line, "invalid JSON")
+                continue
+            if not isinstance(record, dict):
+                self.error(line, "not an object")
+                continue
+            yield line, record
+
+    async def _create_project(self, project: dict[str, Any], name: str | None) -> None:
+        name = name or project.get("name")
+        if not isinstance(name, str) or not name:
+            raise ValueError("Bundle header has no project name")
+        existing = await self.db.execute(
+            select(Project.id).where(Project.creator_id == self.creator_id, Project.name == name)
+        )
+        if existing.first():
+            raise ValueError("Project with this name already exists")
+        result = await self.db.execute(
+            insert(Project)
+            .values(name=name, description=project.get("description"), creator_id=self.creator_id)
+            .returning(Project.id)
+        )
+        self.project_id = result.scalar_one()
+
+    async def _add(self, section: _Section, line: int, record: dict[str, Any]) -> None:
+        """Build the row of a record and queue it."""
+        # A reference to a row of the pending batch (folder parents) needs
+        # its new id first
+        if any(
+            target == section.kind and record.get(column) in self.pending_ids
+            for column, target in section.refs.items()
+        ):
+            await self._flush()
+
+        row: dict[str, Any] = {}
+        for column in _exported_columns(section)[1:]:
+            value = record.get(column.name)
+            if column.name in section.refs and value is not None:
+                value = self.id_maps[section.refs[column.name]].get(value)
+                if value is None and not column.nullable:
+                    self.error(line, f"{column.name} {record[column.name]!r} not found in bundle")
+                    return
+            if column.name not in record:
+                if column.default is not None and column.default.is_scalar:
+                    value = column.default.arg
+                elif not column.nullable and column.name not in section.refs:
+                    self.error(line, f"missing {column.name}")
+                    return
+            if value is None and not column.nullable:
+                self.error(line, f"missing {column.name}")
+                return
+            row[column.name] = value
+
+        if section.parent is None:
+            row["project_id"] = self.project_id
+        if section.kind in ("scenario", "test_plan"):
+            row["creator_id"] = self.creator_id
+        elif section.kind == "database_config":
+            row.update(password="", is_enabled=False)
+        elif section.kind == "scenario_step":
+            keyword = record.get("keyword")
+            keyword_id = self.keywords.get(keyword) if isinstance(keyword, str) else None
+            if keyword_id is None:
+                self.error(line, f"keyword {keyword!r} not found")
+                return
+            row["keyword_id"] = keyword_id
+
+        old_id = record.get("id")
+        self.pending.append((old_id, row))
+        if isinstance(old_id, int):
+            self.pending_ids.add(old_id)
+        if len(self.pending) >= _BATCH:
+            await self._flush()
+
+    async def _flush(self) -> None:
+        """Write the pending rows of the current section."""
+        section = self.section
+        if not self.pending or section is None:
+            return
+        rows = [row for _, row in self.pending]
+        if section.kind in _REFERENCED:
+            result = await self.db.execute(
+                insert(section.model).returning(section.model.id, sort_by_parameter_order=True),
+                rows,
+            )
+            new_ids = list(result.scalars())
+            id_map = self.id_maps[section.kind]
+            for (old_id, _), new_id in zip(self.pending, new_ids, strict=True):
+                if isinstance(old_id, int):
+                    id_map[old_id] = new_id
+            if section.kind == "scenario":
+                # Core inserts bypass the Scenario mapper events
+                tags = [
+                    {"scenario_id": new_id, "tag": tag}
+                    for row, new_id in zip(rows, new_ids, strict=True)
+                    for tag in normalize_tags(row.get("tags"))
+                ]
+                if tags:
+                    await self.db.execute(insert(ScenarioTag), tags)
+        else:
+            await self.db.execute(insert(section.model), rows)
+
+        self.counts[section.kind] += len(rows)
+        self.pending = []
+        self.pending_ids = set()
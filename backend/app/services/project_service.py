@@ -8,6 +8,7 @@ from sqlalchemy.orm import selectinload
 from app.models.project import Project
 from app.models.user import User
 from app.schemas.project import ProjectCreate, ProjectUpdate
+from app.services.dashboard_service import invalidate_core_stats
 
 
 class ProjectService:
@@ -111,6 +112,7 @@ class ProjectService:
         self.db.add(project)
         await self.db.flush()
         await self.db.refresh(project)
+        invalidate_core_stats(creator_id)
 
         # Load creator relationship
         await self.db.refresh(project, ["creator"])
@@ -171,4 +173,5 @@ class ProjectService:
 
         await self.db.delete(project)
         await self.db.flush()
+        invalidate_core_stats(project.creator_id)
         return True
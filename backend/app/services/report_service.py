@@ -2,17 +2,29 @@
 
 import shutil
 import subprocess
+from collections import defaultdict
+from collections.abc import Iterable
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Any
 
 from fastapi import HTTPException, status
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, delete, func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 
 from app.models.execution_scenario import ExecutionScenario
 from app.models.execution_step import ExecutionStep
+from app.models.report_stat import ReportStat
 from app.models.test_execution import TestExecution
 from app.models.test_report import TestReport
+from app.services.execution_stats_service import ExecutionStatsService
+from app.services.payload_store import PAYLOAD_KINDS, PayloadStore, get_payload_store
+from app.utils.db_upsert import increment_counters
+from app.utils.pagination import cached_total, keyset_page, next_cursor
+
+# Cursor pagination key for report lists (newest first)
+_REPORT_SORT_KEY = (TestReport.created_at, TestReport.id)
 
 
 class ReportService:
@@ -82,6 +94,9 @@ class ReportService:
         )
 
         self.session.add(report)
+        await self._apply_report_stats([report], 1)
+        # The execution is finished: add it to the daily dashboard rollup
+        await ExecutionStatsService(self.session).record_execution(execution)
         await self.session.commit()
         await self.session.refresh(report)
 
@@ -146,11 +161,105 @@ class ReportService:
 
         return list(reports), total
 
-    async def delete_report(self, report_id: int) -> bool:
+    async def get_reports_page(
+        self,
+        plan_id: int | None = None,
+        status: str | None = None,
+        cursor: str | None = None,
+        limit: int = 20,
+        with_total: bool = True,
+    ) -> tuple[list[TestReport], str | None, int | None]:
+        """Get one page of reports by cursor, newest first.
+
+        Pages are keyed on (created_at, id), so every page costs the same
+        regardless of depth.
+
+        Args:
+            plan_id: Filter by plan ID
+            status: Filter by status
+            cursor: next_cursor of the previous page (None: first page)
+            limit: Items per page
+            with_total: Also return the (cached) total count
+
+        Returns:
+            Tuple of (reports list, next cursor or None, total count or None)
+
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        query = select(TestReport)
+        if plan_id is not None:
+            query = query.where(TestReport.plan_id == plan_id)
+        if status is not None:
+            query = query.where(TestReport.status == status)
+
+        total = None
+        if with_total:
+            total = await cached_total(self.session, query, ("reports", plan_id, status))
+
+        result = await self.session.execute(
+            keyset_page(query, _REPORT_SORT_KEY, cursor, limit, descending=True)
+        )
+        reports, next_page = next_cursor(list(result.scalars().all()), _REPORT_SORT_KEY, limit)
+        return reports, next_page, total
+
+    async def _spilled_payloads(self, execution_ids: list[str]) -> list[dict[str, Any]]:
+        """Find the spilled step payloads of executions.
+
+        Args:
+            execution_ids: Execution IDs of the reports being deleted
+
+        Returns:
+            Spill stubs of their request/response payloads
+        """
+        if not execution_ids:
+            return []
+
+        query = (
+            select(ExecutionStep.request_data, ExecutionStep.response_data)
+            .join(ExecutionScenario, ExecutionStep.execution_scenario_id == ExecutionScenario.id)
+            .where(ExecutionScenario.execution_id.in_(execution_ids))
+        )
+        payloads: list[dict[str, Any]] = []
+        result = await self.session.stream(query)
+        async for row in result:
+            payloads.extend(payload for payload in row if PayloadStore.is_spilled(payload))
+        return payloads
+
+    @staticmethod
+    async def _delete_payloads(
+        payloads: list[dict[str, Any]], payload_store: PayloadStore | None = None
+    ) -> None:
+        """Delete the blobs behind spill stubs.
+
+        Call after the report deletion is committed, so a rollback never
+        leaves reports pointing at deleted objects. The step rows are left in
+        place; only the blob store objects go.
+
+        Args:
+            payloads: Spill stubs from _spilled_payloads
+            payload_store: Payload store (default: process-wide store)
+        """
+        if not payloads:
+            return
+        store = payload_store or get_payload_store()
+        for payload in payloads:
+            try:
+                await store.delete(payload)
+            except Exception as e:
+                # Log error but don't fail deletion
+                print(f"Error deleting spilled payload: {e}")
+
+    async def delete_report(
+        self, report_id: int, payload_store: PayloadStore | None = None
+    ) -> bool:
         """Delete a report.
 
+        Allure files and spilled step payloads of the report are deleted too.
+
         Args:
             report_id: Report ID
+            payload_store: Payload store (default: process-wide store)
 
         Returns:
             True if deleted
@@ -169,16 +278,22 @@ class ReportService:
                 # Log error but don't fail deletion
                 print(f"Error deleting allure report: {e}")
 
+        payloads = await self._spilled_payloads([report.execution_id])
+        await self._apply_report_stats([report], -1)
         await self.session.delete(report)
         await self.session.commit()
+        await self._delete_payloads(payloads, payload_store)
 
         return True
 
-    async def cleanup_old_reports(self, days: int = 30) -> int:
+    async def cleanup_old_reports(
+        self, days: int = 30, payload_store: PayloadStore | None = None
+    ) -> int:
         """Delete reports older than specified days.
 
         Args:
             days: Number of days to retain reports
+            payload_store: Payload store (default: process-wide store)
 
         Returns:
             Number of deleted reports
@@ -189,6 +304,7 @@ class ReportService:
         query = select(TestReport).where(TestReport.created_at < cutoff)
         result = await self.session.execute(query)
         old_reports = result.scalars().all()
+        payloads = await self._spilled_payloads([report.execution_id for report in old_reports])
 
         # Delete reports and their Allure files
         deleted_count = 0
@@ -206,7 +322,9 @@ class ReportService:
             await self.session.delete(report)
             deleted_count += 1
 
+        await self._apply_report_stats(old_reports, -1)
         await self.session.commit()
+        await self._delete_payloads(payloads, payload_store)
         return deleted_count
 
     async def get_allure_report_url(self, report_id: int) -> tuple[str, datetime | None]:
@@ -278,35 +396,43 @@ class ReportService:
                 print(f"Error generating Allure report: {e}")
                 raise
 
-    async def get_report_statistics(self) -> dict:
+    async def get_report_statistics(
+        self, plan_id: int | None = None, status: str | None = None
+    ) -> dict:
         """Get report statistics.
 
+        Reads the per plan/status rollup (ReportStat), so the cost does not
+        grow with the number of reports.
+
+        Args:
+            plan_id: Only count reports of this plan
+            status: Only count reports with this status
+
         Returns:
             Dictionary with statistics
         """
-        # Get total reports
-        total_reports_result = await self.session.execute(
-            select(func.count()).select_from(TestReport)
+        query = select(
+            func.sum(ReportStat.reports).label("total_reports"),
+            func.sum(ReportStat.total_scenarios).label("total_scenarios"),
+            func.sum(ReportStat.passed).label("total_passed"),
+            func.sum(ReportStat.failed).label("total_failed"),
+            func.sum(ReportStat.skipped).label("total_skipped"),
+            func.sum(ReportStat.duration_total).label("duration_total"),
+            func.sum(ReportStat.duration_count).label("duration_count"),
         )
-        total_reports = total_reports_result.scalar_one()
-
-        # Get sums
-        stats_result = await self.session.execute(
-            select(
-                func.sum(TestReport.total_scenarios).label("total_scenarios"),
-                func.sum(TestReport.passed).label("total_passed"),
-                func.sum(TestReport.failed).label("total_failed"),
-                func.sum(TestReport.skipped).label("total_skipped"),
-                func.avg(TestReport.duration_seconds).label("avg_duration"),
-            )
-        )
-        stats = stats_result.one()
+        if plan_id is not None:
+            query = query.where(ReportStat.plan_id == plan_id)
+        if status is not None:
+            query = query.where(ReportStat.status == status)
+        stats = (await self.session.execute(query)).one()
 
         total_scenarios = stats.total_scenarios or 0
         total_passed = stats.total_passed or 0
         total_failed = stats.total_failed or 0
         total_skipped = stats.total_skipped or 0
-        avg_duration = stats.avg_duration
+        avg_duration = (
+            stats.duration_total / stats.duration_count if stats.duration_count else None
+        )
 
         # Calculate pass rate
         pass_rate = 0.0
@@ -314,7 +440,7 @@ class ReportService:
             pass_rate = (total_passed / total_scenarios) * 100
 
         return {
-            "total_reports": total_reports,
+            "total_reports": stats.total_reports or 0,
             "total_scenarios": total_scenarios,
             "total_passed": total_passed,
             "total_failed": total_failed,
@@ -323,6 +449,70 @@ class ReportService:
             "average_duration": avg_duration,
         }
 
+    async def rebuild_report_stats(self) -> None:
+        """Recompute the ReportStat rollup from test_reports (does not commit).
+
+        The add_report_stats migration backfills the table; use this to
+        repair it.
+        """
+        await self.session.execute(delete(ReportStat))
+        await self.session.execute(
+            insert(ReportStat).from_select(
+                [
+                    "plan_id",
+                    "status",
+                    "reports",
+                    "total_scenarios",
+                    "passed",
+                    "failed",
+                    "skipped",
+                    "duration_total",
+                    "duration_count",
+                ],
+                select(
+                    TestReport.plan_id,
+                    TestReport.status,
+                    func.count(),
+                    func.sum(TestReport.total_scenarios),
+                    func.sum(TestReport.passed),
+                    func.sum(TestReport.failed),
+                    func.sum(TestReport.skipped),
+                    func.coalesce(func.sum(TestReport.duration_seconds), 0.0),
+                    func.count(TestReport.duration_seconds),
+                ).group_by(TestReport.plan_id, TestReport.status),
+            )
+        )
+
+    async def _apply_report_stats(self, reports: Iterable[TestReport], sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) reports from the ReportStat rollup."""
+        deltas: dict[tuple[int, str], dict[str, Any]] = {}
+        for report in reports:
+            delta = deltas.setdefault(
+                (report.plan_id, report.status),
+                {
+                    "reports": 0,
+                    "total_scenarios": 0,
+                    "passed": 0,
+                    "failed": 0,
+                    "skipped": 0,
+                    "duration_total": 0.0,
+                    "duration_count": 0,
+                },
+            )
+            delta["reports"] += sign
+            delta["total_scenarios"] += sign * report.total_scenarios
+            delta["passed"] += sign * report.passed
+            delta["failed"] += sign * report.failed
+            delta["skipped"] += sign * report.skipped
+            if report.duration_seconds is not None:
+                delta["duration_total"] += sign * report.duration_seconds
+                delta["duration_count"] += sign
+
+        for (plan_id, report_status), counters in deltas.items():
+            await increment_counters(
+                self.session, ReportStat, {"plan_id": plan_id, "status": report_status}, counters
+            )
+
     async def get_report_details(self, report_id: int) -> dict:
         """Get detailed report information including execution steps.
 
@@ -340,20 +530,30 @@ class ReportService:
             )
 
         # Get execution scenarios
-        scenarios_query = select(ExecutionScenario).where(
-            ExecutionScenario.execution_id == report.execution_id
+        scenarios_query = (
+            select(ExecutionScenario)
+            .where(ExecutionScenario.execution_id == report.execution_id)
+            .order_by(ExecutionScenario.id)
         )
         scenarios_result = await self.session.execute(scenarios_query)
         scenarios = scenarios_result.scalars().all()
 
-        # Get execution steps for each scenario
-        scenario_details = []
-        for scenario in scenarios:
-            steps_query = select(ExecutionStep).where(
-                ExecutionStep.execution_scenario_id == scenario.id
+        # Load all steps in one query, skipping the (possibly large) payload columns
+        steps_by_scenario: dict[int, list[ExecutionStep]] = defaultdict(list)
+        if scenarios:
+            steps_query = (
+                select(ExecutionStep)
+                .options(defer(ExecutionStep.request_data), defer(ExecutionStep.response_data))
+                .where(ExecutionStep.execution_scenario_id.in_([s.id for s in scenarios]))
+                .order_by(ExecutionStep.sort_order, ExecutionStep.id)
             )
             steps_result = await self.session.execute(steps_query)
-            steps = steps_result.scalars().all()
+            for step in steps_result.scalars().all():
+                steps_by_scenario[step.execution_scenario_id].append(step)
+
+        scenario_details = []
+        for scenario in scenarios:
+            steps = steps_by_scenario[scenario.id]
 
             # Calculate elapsed time from started_at and finished_at
             elapsed_ms = None
@@ -369,6 +569,7 @@ class ReportService:
                     "error_message": scenario.error_message,
                     "steps": [
                         {
+                            "id": step.id,
                             "step_id": step.step_id,
                             "sort_order": step.sort_order,
                             "status": step.status,
@@ -384,3 +585,60 @@ class ReportService:
             "report": report,
             "scenarios": scenario_details,
         }
+
+    async def get_step_payload(
+        self,
+        report_id: int,
+        execution_step_id: int,
+        kind: str = "response",
+        payload_store: PayloadStore | None = None,
+    ) -> dict[str, Any] | None:
+        """Get the full request or response payload of an execution step.
+
+        Spilled payloads are fetched from the blob store and decompressed.
+
+        Args:
+            report_id: Report ID
+            execution_step_id: Execution step ID
+            kind: "request" or "response"
+            payload_store: Payload store (default: process-wide store)
+
+        Returns:
+            Full payload, or None if the step recorded none
+
+        Raises:
+            HTTPException: If the report or step is not found
+            ValueError: If kind is invalid or the spilled payload cannot be read
+        """
+        if kind not in PAYLOAD_KINDS:
+            raise ValueError(f"Invalid payload kind: {kind}")
+
+        report = await self.get_report_by_id(report_id)
+        if not report:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Report {report_id} not found",
+            )
+
+        column = ExecutionStep.request_data if kind == "request" else ExecutionStep.response_data
+        result = await self.session.execute(
+            select(column)
+            .join(ExecutionScenario, ExecutionStep.execution_scenario_id == ExecutionScenario.id)
+            .where(
+                ExecutionStep.id == execution_step_id,
+                ExecutionScenario.execution_id == report.execution_id,
+            )
+        )
+        row = result.one_or_none()
+        if row is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Step {execution_step_id} not found in report {report_id}",
+            )
+
+        payload = row[0]
+        if not PayloadStore.is_spilled(payload):
+            return payload
+
+        store = payload_store or get_payload_store()
+        return await store.load(payload)
@@ -0,0 +1,287 @@
+"""Scenario runner for executing scenario steps in-process."""
+
+import asyncio
+import inspect
+import json
+import re
+import time
+from collections.abc import Callable, Mapping, MutableMapping
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+from app.models.keyword import Keyword
+from app.models.scenario_step import ScenarioStep
+from app.utils.function_executor import FunctionExecutor
+from app.utils.json_path import extract_many
+from app.utils.shared_cache import SharedVariableCache
+
+# Step params consumed by the runner instead of being passed to the keyword
+RESERVED_STEP_PARAMS = frozenset({"save_as", "shared", "shared_ttl", "extract"})
+
+_FULL_PLACEHOLDER = re.compile(r"^\{\{(.+?)\}\}$", re.DOTALL)
+
+
+@dataclass(frozen=True)
+class RunnableStep:
+    """Scenario step detached from the ORM session, ready to run."""
+
+    id: int
+    sort_order: int
+    description: str
+    method_name: str
+    params: Mapping[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_model(cls, step: ScenarioStep, keyword: Keyword) -> "RunnableStep":
+        """Build a runnable step from ORM rows.
+
+        Args:
+            step: Scenario step
+            keyword: Keyword used by the step
+
+        Returns:
+            RunnableStep instance
+        """
+        return cls(
+            id=step.id,
+            sort_order=step.sort_order,
+            description=step.description,
+            method_name=keyword.method_name,
+            params=dict(step.params or {}),
+        )
+
+
+@dataclass
+class StepResult:
+    """Outcome of a single step run."""
+
+    step_id: int
+    status: str  # passed/failed
+    elapsed_ms: float
+    value: Any = None
+    error_message: str | None = None
+
+
+def load_keyword_functions(keywords: list[Keyword]) -> dict[str, Callable[..., Any]]:
+    """Compile keyword code into callables.
+
+    Args:
+        keywords: Keywords to compile
+
+    Returns:
+        Dictionary mapping method names to callables (invalid code is skipped)
+    """
+    functions: dict[str, Callable[..., Any]] = {}
+    for keyword in keywords:
+        try:
+            exec_globals: dict[str, Any] = {}
+            exec(keyword.code, exec_globals)
+            func = exec_globals.get(keyword.method_name)
+            if callable(func):
+                functions[keyword.method_name] = func
+        except Exception:
+            # Skip invalid keywords; steps using them fail at run time
+            pass
+    return functions
+
+
+class ScenarioRunner:
+    """Runs scenario steps sequentially against a shared variable context.
+
+    ``http_request`` steps are sent through an async httpx client; every other
+    keyword is called with its rendered params in a worker thread. The last HTTP response is kept
+    in the context as ``response`` and passed to keywords that accept it.
+
+    Steps with a ``shared`` param run at most once per shared cache (i.e. per
+    execution): ``shared: true`` keys the result by keyword and rendered
+    params, a string value is used as the key itself. ``shared_ttl`` sets how
+    many seconds the result stays valid. Concurrent scenarios reaching the same
+    shared step wait for the first one and reuse its result, so e.g. a login
+    request is sent once instead of once per scenario.
+
+    An ``extract`` param maps variable names to JSON paths (or extraction rule
+    dicts) evaluated in one pass over the latest response after the step runs.
+    """
+
+    def __init__(
+        self,
+        steps: list[RunnableStep],
+        keyword_functions: dict[str, Callable[..., Any]],
+        executor: FunctionExecutor,
+        client: httpx.AsyncClient,
+        shared_cache: SharedVariableCache | None = None,
+    ):
+        """Initialize scenario runner.
+
+        Args:
+            steps: Steps to run, in execution order
+            keyword_functions: Compiled keyword callables by method name
+            executor: Function executor used to render {{}} placeholders
+            client: HTTP client (its base_url is the environment base URL)
+            shared_cache: Execution-scoped cache for ``shared`` steps
+                (default: a new cache private to this runner)
+        """
+        self.steps = steps
+        self.keyword_functions = keyword_functions
+        self.executor = executor
+        self.client = client
+        self.shared_cache = shared_cache if shared_cache is not None else SharedVariableCache()
+
+    async def run(self, context: MutableMapping[str, Any]) -> list[StepResult]:
+        """Run all steps, stopping at the first failure.
+
+        Args:
+            context: Variable context (updated in place with saved values)
+
+        Returns:
+            Results of the steps that ran
+        """
+        results: list[StepResult] = []
+        for step in self.steps:
+            result = await self.run_step(step, context)
+            results.append(result)
+            if result.status != "passed":
+                break
+        return results
+
+    async def run_step(self, step: RunnableStep, context: MutableMapping[str, Any]) -> StepResult:
+        """Run a single step.
+
+        Args:
+            step: Step to run
+            context: Variable context
+
+        Returns:
+            Step result
+        """
+        started = time.perf_counter()
+        try:
+            value = await self._execute(step, context)
+        except Exception as e:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            return StepResult(
+                step_id=step.id,
+                status="failed",
+                elapsed_ms=elapsed_ms,
+                error_message=str(e) or type(e).__name__,
+            )
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        save_as = step.params.get("save_as")
+        if save_as:
+            context[save_as] = value
+        return StepResult(step_id=step.id, status="passed", elapsed_ms=elapsed_ms, value=value)
+
+    async def _execute(self, step: RunnableStep, context: MutableMapping[str, Any]) -> Any:
+        """Execute the keyword behind a step."""
+        params = {
+            key: self.render(value, context)
+            for key, value in step.params.items()
+            if key not in RESERVED_STEP_PARAMS
+        }
+
+        shared = step.params.get("shared")
+        if not shared:
+            value = await self._invoke(step, params, context)
+        else:
+            key = self._shared_key(step, shared, params)
+            ttl = step.params.get("shared_ttl")
+            value = await self.shared_cache.get_or_compute(
+                key,
+                lambda: self._invoke(step, params, context),
+                ttl=float(ttl) if ttl is not None else None,
+            )
+            if step.method_name == "http_request":
+                context["response"] = value
+
+        rules = step.params.get("extract")
+        if rules:
+            if "response" not in context:
+                raise ValueError("No HTTP response to extract variables from")
+            context.update(extract_many(context["response"], self.render(rules, context)))
+        return value
+
+    @staticmethod
+    def _shared_key(step: RunnableStep, shared: Any, params: dict[str, Any]) -> str:
+        """Build the shared cache key for a step."""
+        if isinstance(shared, str):
+            return shared
+        encoded = json.dumps(params, sort_keys=True, ensure_ascii=False, default=str)
+        return f"{step.method_name}:{encoded}"
+
+    async def _invoke(
+        self, step: RunnableStep, params: dict[str, Any], context: MutableMapping[str, Any]
+    ) -> Any:
+        """Call the keyword with rendered params."""
+        if step.method_name == "http_request":
+            response = await self._send_request(params)
+            context["response"] = response
+            return response
+
+        func = self.keyword_functions.get(step.method_name)
+        if func is None:
+            raise ValueError(f"Keyword not available: {step.method_name}")
+
+        if "response" not in params and "response" in context:
+            if "response" in inspect.signature(func).parameters:
+                params = {**params, "response": context["response"]}
+
+        # User code may block (sleeps, sync I/O): keep it off the event loop.
+        # The thread inherits contextvars, so seeded random scopes still apply.
+        return await asyncio.to_thread(func, **params)
+
+    async def _send_request(self, params: dict[str, Any]) -> dict[str, Any]:
+        """Send an HTTP request described by http_request params."""
+        response = await self.client.request(
+            method=str(params.get("method", "GET")).upper(),
+            url=params["url"],
+            headers=params.get("headers") or None,
+            params=params.get("params") or None,
+            json=params.get("json"),
+            data=params.get("data"),
+        )
+
+        result: dict[str, Any] = {
+            "status_code": response.status_code,
+            "headers": dict(response.headers),
+            "text": response.text,
+            "json": None,
+        }
+        if response.headers.get("content-type", "").startswith("application/json"):
+            try:
+                result["json"] = response.json()
+            except ValueError:
+                result["json"] = None
+        return result
+
+    def render(self, value: Any, context: MutableMapping[str, Any]) -> Any:
+        """Render {{}} placeholders in a param value.
+
+        A string that is exactly one placeholder keeps the native type of the
+        evaluated expression; other strings get text substitution.
+
+        Args:
+            value: Param value (str, dict, list or scalar)
+            context: Variable context
+
+        Returns:
+            Rendered value
+
+        Raises:
+            ValueError: If a whole-value placeholder cannot be evaluated
+        """
+        if isinstance(value, str):
+            if "{{" not in value:
+                return value
+            match = _FULL_PLACEHOLDER.match(value.strip())
+            if match and "{{" not in match.group(1):
+                return self.executor.execute_function(match.group(1).strip(), context)
+            parsed_text, _, _, _ = self.executor.parse_text(value, context)
+            return parsed_text
+        if isinstance(value, dict):
+            return {k: self.render(v, context) for k, v in value.items()}
+        if isinstance(value, list):
+            return [self.render(v, context) for v in value]
+        return value
@@ -3,12 +3,43 @@
 import csv
 from io import StringIO
 
-from sqlalchemy import func, select
+from sqlalchemy import ColumnElement, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.dataset import Dataset
+from app.models.global_param import GlobalParam
 from app.models.scenario import Scenario
 from app.models.scenario_step import ScenarioStep
+from app.models.scenario_tag import ScenarioTag
+from app.services.dashboard_service import invalidate_core_stats
+from app.services.global_param_service import GlobalParamService
+from app.utils.bulk_generator import BATCH_FUNCTIONS, BulkGenerator
+from app.utils.bulk_reorder import bulk_reorder
+from app.utils.pagination import encode_cursor, keyset_order, keyset_page
+from app.utils.tag_expression import compile_tag_expression
+
+# Cursor pagination key for scenario lists (newest first)
+_SCENARIO_SORT_KEY = (Scenario.created_at, Scenario.id)
+
+
+def _has_tag(tag: str) -> ColumnElement[bool]:
+    """Scenario has a tag (uses ix_scenario_tags_tag_scenario)."""
+    return Scenario.id.in_(select(ScenarioTag.scenario_id).where(ScenarioTag.tag == tag))
+
+
+def scenario_tag_filter(expression: str) -> ColumnElement[bool]:
+    """SQL condition selecting scenarios matching a tag expression.
+
+    Args:
+        expression: Tag expression, e.g. ``smoke AND NOT slow``
+
+    Returns:
+        Condition on Scenario
+
+    Raises:
+        ValueError: If the expression is malformed
+    """
+    return compile_tag_expression(expression, _has_tag)
 
 
 class ScenarioService:
@@ -84,6 +115,7 @@ class ScenarioService:
 
         await self.session.commit()
         await self.session.refresh(scenario)
+        invalidate_core_stats()
 
         return scenario
 
@@ -110,6 +142,7 @@ class ScenarioService:
         project_id: int | None = None,
         limit: int = 100,
         offset: int = 0,
+        tag_expression: str | None = None,
     ) -> tuple[list[dict], int]:
         """List scenarios with optional filtering.
 
@@ -117,9 +150,13 @@ class ScenarioService:
             project_id: Optional project ID filter
             limit: Maximum number of results
             offset: Number of results to skip
+            tag_expression: Optional tag filter, e.g. ``smoke AND NOT slow``
 
         Returns:
             Tuple of (scenarios list, total count)
+
+        Raises:
+            ValueError: If the tag expression is malformed
         """
         # Build query
         query = select(Scenario)
@@ -128,6 +165,10 @@ class ScenarioService:
         if project_id:
             query = query.where(Scenario.project_id == project_id)
             count_query = count_query.where(Scenario.project_id == project_id)
+        if tag_expression:
+            condition = scenario_tag_filter(tag_expression)
+            query = query.where(condition)
+            count_query = count_query.where(condition)
 
         # Get total count
         total_result = await self.session.execute(count_query)
@@ -165,6 +206,69 @@ class ScenarioService:
 
         return scenarios, total
 
+    async def list_scenarios_page(
+        self,
+        project_id: int | None = None,
+        cursor: str | None = None,
+        limit: int = 100,
+        tag_expression: str | None = None,
+    ) -> tuple[list[dict], str | None]:
+        """List one page of scenarios by cursor, newest first.
+
+        Pages are keyed on (created_at, id), so every page costs the same
+        regardless of depth.
+
+        Args:
+            project_id: Optional project ID filter
+            cursor: Cursor of the previous page (None: first page)
+            limit: Maximum number of results
+            tag_expression: Optional tag filter, e.g. ``smoke AND NOT slow``
+
+        Returns:
+            Tuple of (scenarios list, next cursor or None on the last page)
+
+        Raises:
+            ValueError: If the cursor or tag expression is invalid
+        """
+        query = select(Scenario.id)
+        if project_id:
+            query = query.where(Scenario.project_id == project_id)
+        if tag_expression:
+            query = query.where(scenario_tag_filter(tag_expression))
+        query = keyset_page(query, _SCENARIO_SORT_KEY, cursor, limit, descending=True)
+
+        # Count steps for the page only
+        page = query.subquery()
+        result = await self.session.execute(
+            select(Scenario, func.count(ScenarioStep.id).label("step_count"))
+            .join(page, page.c.id == Scenario.id)
+            .outerjoin(ScenarioStep, Scenario.id == ScenarioStep.scenario_id)
+            .group_by(Scenario.id)
+            .order_by(*keyset_order(_SCENARIO_SORT_KEY, descending=True))
+        )
+        rows = result.all()
+
+        next_page = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1][0]
+            next_page = encode_cursor([last.created_at, last.id])
+
+        scenarios = [
+            {
+                "id": scenario.id,
+                "name": scenario.name,
+                "description": scenario.description,
+                "priority": scenario.priority,
+                "tags": scenario.tags,
+                "created_at": scenario.created_at,
+                "updated_at": scenario.updated_at,
+                "step_count": step_count or 0,
+            }
+            for scenario, step_count in rows
+        ]
+        return scenarios, next_page
+
     async def update_scenario(
         self,
         scenario_id: int,
@@ -234,6 +338,7 @@ class ScenarioService:
 
         await self.session.delete(scenario)
         await self.session.commit()
+        invalidate_core_stats()
 
         return True
 
@@ -285,15 +390,17 @@ class ScenarioService:
         Returns:
             True if successful, False if scenario not found
         """
-        scenario = await self.get_scenario_by_id(scenario_id)
-        if not scenario:
+        exists = await self.session.scalar(select(Scenario.id).where(Scenario.id == scenario_id))
+        if exists is None:
             return False
 
-        # Update sort_order for each step
-        for idx, step_id in enumerate(step_ids):
-            step = await self.session.get(ScenarioStep, step_id)
-            if step and step.scenario_id == scenario_id:
-                step.sort_order = idx
+        # One UPDATE; steps of other scenarios are ignored
+        await bulk_reorder(
+            self.session,
+            ScenarioStep,
+            {step_id: idx for idx, step_id in enumerate(step_ids)},
+            where=[ScenarioStep.scenario_id == scenario_id],
+        )
 
         await self.session.commit()
         return True
@@ -397,6 +504,73 @@ class ScenarioService:
 
         return dataset
 
+    async def generate_dataset(
+        self,
+        scenario_id: int,
+        name: str,
+        columns: dict[str, str],
+        rows: int,
+        seed: int | None = None,
+    ) -> tuple[Dataset, BulkGenerator] | None:
+        """Generate a dataset from global-param function templates.
+
+        Built-in random functions are generated in batches rather than one
+        eval per cell. An existing scenario dataset is replaced.
+
+        Args:
+            scenario_id: Scenario ID
+            name: Dataset name
+            columns: Header name to column template
+            rows: Number of rows
+            seed: Random seed (default: a fresh one, recorded on the generator)
+
+        Returns:
+            Tuple of (dataset, generator stats) if scenario exists, None otherwise
+
+        Raises:
+            ValueError: If a column expression fails
+        """
+        scenario = await self.get_scenario_by_id(scenario_id)
+        if not scenario:
+            return None
+
+        params = GlobalParamService(self.session)
+        # User functions shadowing a built-in must not use the batched version
+        result = await self.session.execute(
+            select(GlobalParam.method_name).where(GlobalParam.is_builtin.is_(False))
+        )
+        custom = set(result.scalars().all())
+        generator = BulkGenerator(
+            params.evaluate_many,
+            deterministic=await params.get_deterministic_functions(),
+            batch_functions={
+                func_name: func
+                for func_name, func in BATCH_FUNCTIONS.items()
+                if func_name not in custom
+            },
+            seed=seed,
+        )
+        headers, data_rows = await generator.generate(columns, rows)
+
+        dataset = await self.get_dataset_by_scenario(scenario_id)
+        if dataset:
+            dataset.name = name
+            dataset.headers = headers
+            dataset.rows = data_rows
+        else:
+            dataset = Dataset(
+                scenario_id=scenario_id,
+                name=name,
+                headers=headers,
+                rows=data_rows,
+            )
+            self.session.add(dataset)
+
+        await self.session.commit()
+        await self.session.refresh(dataset)
+
+        return dataset, generator
+
     async def get_dataset_by_scenario(self, scenario_id: int) -> Dataset | None:
         """Get dataset for scenario.
 
@@ -0,0 +1,234 @@
+"""Search service across interfaces, scenarios and keywords."""
+
+from collections.abc import Hashable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event, func, literal_column, null, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from app.config import settings
+from app.models.interface import Interface
+from app.models.keyword import Keyword
+from app.models.project import Project
+from app.models.scenario import Scenario
+from app.utils.trigram_index import TrigramIndex
+from app.utils.ttl_cache import TTLCache
+
+
+@dataclass(frozen=True)
+class _Target:
+    """A searchable table."""
+
+    model: Any
+    # Columns with pg_trgm indexes (see migrations/add_search_indexes.py)
+    fields: tuple[InstrumentedAttribute, ...]
+    # Columns joined into the hit detail
+    detail: tuple[InstrumentedAttribute, ...]
+    # Expression of the tsvector index, verbatim so the planner can use it
+    tsvector: str
+    project_scoped: bool = True
+
+
+SEARCH_TARGETS: dict[str, _Target] = {
+    "interface": _Target(
+        Interface,
+        fields=(Interface.name, Interface.path),
+        detail=(Interface.method, Interface.path),
+        tsvector="to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(path, ''))",
+    ),
+    "scenario": _Target(
+        Scenario,
+        fields=(Scenario.name, Scenario.description),
+        detail=(Scenario.description,),
+        tsvector="to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(description, ''))",
+    ),
+    "keyword": _Target(
+        Keyword,
+        fields=(Keyword.name, Keyword.method_name),
+        detail=(Keyword.method_name,),
+        tsvector="to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(method_name, ''))",
+        project_scoped=False,
+    ),
+}
+
+# Characters of a hit detail (scenario descriptions can be long)
+_DETAIL_CHARS = 200
+
+# In-process indexes by (type, project_id), for databases without pg_trgm
+_index_cache = TTLCache(ttl=settings.SEARCH_INDEX_TTL_SECONDS, maxsize=64)
+
+# ORM writes per type; part of the index signature
+_generations: dict[str, int] = dict.fromkeys(SEARCH_TARGETS, 0)
+
+
+def clear_search_index() -> None:
+    """Drop all in-process search indexes."""
+    _index_cache.clear()
+
+
+def _listen_for_writes(kind: str, model: Any) -> None:
+    """Count ORM inserts, updates and deletes of a searchable model."""
+
+    def bump(mapper, connection, target) -> None:
+        _generations[kind] += 1
+
+    for name in ("after_insert", "after_update", "after_delete"):
+        event.listen(model, name, bump)
+
+
+for _kind, _target in SEARCH_TARGETS.items():
+    _listen_for_writes(_kind, _target.model)
+
+
+def _escape_like(value: str) -> str:
+    """Escape LIKE wildcards in user input."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _detail(values: tuple[Any, ...]) -> str | None:
+    """Join detail column values into a short string."""
+    text = " ".join(str(value) for value in values if value)
+    return text[:_DETAIL_CHARS] or None
+
+
+class SearchService:
+    """Substring and word search over interfaces, scenarios and keywords.
+
+    On PostgreSQL every query is answered by pg_trgm GIN indexes (ILIKE
+    '%q%') and tsvector expression indexes (all words, in any order), ranked
+    by trigram similarity. Other databases use an in-process TrigramIndex per
+    type and project, rebuilt when its signature (ORM write count, row count,
+    max id and, for interfaces, the tree versions) changes.
+    """
+
+    def __init__(self, db: AsyncSession):
+        """Initialize search service.
+
+        Args:
+            db: Database session
+        """
+        self.db = db
+
+    async def search(
+        self,
+        query: str,
+        project_id: int | None = None,
+        types: Sequence[str] = tuple(SEARCH_TARGETS),
+        limit: int = 20,
+    ) -> list[dict[str, Any]]:
+        """Search by substring or words.
+
+        Args:
+            query: Search text
+            project_id: Only interfaces and scenarios of this project
+                (keywords are global)
+            types: Types to search ("interface", "scenario", "keyword")
+            limit: Maximum hits per type
+
+        Returns:
+            Hits (type, id, project_id, name, detail, score), best first
+
+        Raises:
+            ValueError: If a type is unknown
+        """
+        unknown = set(types) - set(SEARCH_TARGETS)
+        if unknown:
+            raise ValueError(f"Unknown search type: {', '.join(sorted(unknown))}")
+        query = query.strip()
+        if not query:
+            return []
+
+        postgres = self.db.get_bind().dialect.name == "postgresql"
+        hits: list[dict[str, Any]] = []
+        for kind in dict.fromkeys(types):
+            target = SEARCH_TARGETS[kind]
+            if postgres:
+                hits += await self._search_sql(kind, target, query, project_id, limit)
+            else:
+                hits += await self._search_index(kind, target, query, project_id, limit)
+        hits.sort(key=lambda hit: -hit["score"])
+        return hits
+
+    def _columns(self, target: _Target) -> list[Any]:
+        """Projected columns of a hit."""
+        project = target.model.project_id if target.project_scoped else null()
+        return [target.model.id, project.label("project_id"), target.model.name, *target.detail]
+
+    def _filters(self, target: _Target, project_id: int | None) -> list[Any]:
+        """Project filter of a target, if any."""
+        if project_id is not None and target.project_scoped:
+            return [target.model.project_id == project_id]
+        return []
+
+    def _hit(self, kind: str, row: Any, score: float) -> dict[str, Any]:
+        """Build a hit from a projected row."""
+        return {
+            "type": kind,
+            "id": row[0],
+            "project_id": row[1],
+            "name": row[2],
+            "detail": _detail(tuple(row[3:])),
+            "score": round(float(score), 4),
+        }
+
+    async def _search_sql(
+        self, kind: str, target: _Target, query: str, project_id: int | None, limit: int
+    ) -> list[dict[str, Any]]:
+        """Search one type with pg_trgm and tsvector indexes."""
+        pattern = f"%{_escape_like(query)}%"
+        score = func.greatest(*(func.similarity(field, query) for field in target.fields))
+        matches = or_(
+            *(field.ilike(pattern, escape="\\") for field in target.fields),
+            literal_column(target.tsvector).op("@@")(
+                func.plainto_tsquery(literal_column("'simple'"), query)
+            ),
+        )
+        result = await self.db.execute(
+            select(*self._columns(target), score.label("score"))
+            .where(matches, *self._filters(target, project_id))
+            .order_by(score.desc(), target.model.id)
+            .limit(limit)
+        )
+        return [self._hit(kind, row[:-1], row[-1]) for row in result.all()]
+
+    async def _search_index(
+        self, kind: str, target: _Target, query: str, project_id: int | None, limit: int
+    ) -> list[dict[str, Any]]:
+        """Search one type with the in-process index."""
+        rows, index = await self._index(kind, target, project_id)
+        return [self._hit(kind, rows[key], score) for key, score in index.search(query, limit)]
+
+    async def _index(
+        self, kind: str, target: _Target, project_id: int | None
+    ) -> tuple[dict[Hashable, Any], TrigramIndex]:
+        """Get the in-process index of a type, rebuilding it if stale."""
+        if not target.project_scoped:
+            project_id = None
+        filters = self._filters(target, project_id)
+
+        signature_columns = [func.count(target.model.id), func.max(target.model.id)]
+        if kind == "interface":
+            # Every interface write path bumps the tree version
+            versions = select(func.coalesce(func.sum(Project.interface_tree_version), 0))
+            if project_id is not None:
+                versions = versions.where(Project.id == project_id)
+            signature_columns.append(versions.scalar_subquery())
+        result = await self.db.execute(select(*signature_columns).where(*filters))
+        signature = (_generations[kind], *result.one())
+
+        key = (kind, project_id)
+        found, cached = _index_cache.get(key)
+        if found and cached[0] == signature:
+            return cached[1], cached[2]
+
+        result = await self.db.execute(select(*self._columns(target), *target.fields).where(*filters))
+        rows: dict[Hashable, Any] = {}
+        index = TrigramIndex()
+        width = 3 + len(target.detail)
+        for row in result.all():
+            rows[row[0]] = tuple(row[:width])
+            index.add(row[0], *row[width:])
+        _index_cache.set(key, (signature, rows, index))
+        return rows, index
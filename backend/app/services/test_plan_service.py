@@ -1,7 +1,8 @@
 """Test plan service for business logic."""
 
+from typing import Any, cast
 
-from sqlalchemy import func, select
+from sqlalchemy import CursorResult, func, insert, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -9,6 +10,13 @@ from app.models.plan_scenario import PlanScenario
 from app.models.scenario import Scenario
 from app.models.test_plan import TestPlan
 from app.schemas.test_plan import TestPlanCreate, TestPlanUpdate
+from app.services.dashboard_service import invalidate_core_stats
+from app.services.scenario_service import scenario_tag_filter
+from app.utils.bulk_reorder import bulk_reorder
+from app.utils.pagination import cached_total, keyset_page, next_cursor
+
+# Cursor pagination key for test plan lists (newest first)
+_PLAN_SORT_KEY = (TestPlan.created_at, TestPlan.id)
 
 
 class TestPlanService:
@@ -67,6 +75,50 @@ class TestPlanService:
 
         return list(test_plans), total
 
+    async def list_test_plans_page(
+        self,
+        cursor: str | None = None,
+        limit: int = 100,
+        name: str | None = None,
+        project_id: int | None = None,
+        with_total: bool = True,
+    ) -> tuple[list[TestPlan], str | None, int | None]:
+        """List one page of test plans by cursor, newest first.
+
+        Pages are keyed on (created_at, id), so every page costs the same
+        regardless of depth.
+
+        Args:
+            cursor: Cursor of the previous page (None: first page)
+            limit: Maximum number of records to return
+            name: Filter by plan name (partial match)
+            project_id: Filter by project ID
+            with_total: Also return the (cached) total count
+
+        Returns:
+            Tuple of (test plans list, next cursor or None, total count or None)
+
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        query = select(TestPlan)
+        if name:
+            query = query.where(TestPlan.name.ilike(f"%{name}%"))
+        if project_id:
+            query = query.where(TestPlan.project_id == project_id)
+
+        total = None
+        if with_total:
+            total = await cached_total(self.db, query, ("test_plans", name, project_id))
+
+        query = keyset_page(query, _PLAN_SORT_KEY, cursor, limit, descending=True).options(
+            selectinload(TestPlan.creator),
+            selectinload(TestPlan.project),
+        )
+        result = await self.db.execute(query)
+        test_plans, next_page = next_cursor(list(result.scalars().all()), _PLAN_SORT_KEY, limit)
+        return test_plans, next_page, total
+
     async def get_test_plan_by_id(self, plan_id: int) -> TestPlan | None:
         """Get test plan by ID with scenarios.
 
@@ -154,6 +206,7 @@ class TestPlanService:
         )
         self.db.add(test_plan)
         await self.db.flush()
+        invalidate_core_stats()
 
         # Load relationships with eager loading
         result = await self.db.execute(
@@ -218,6 +271,7 @@ class TestPlanService:
 
         await self.db.delete(test_plan)
         await self.db.flush()
+        invalidate_core_stats()
         return True
 
     async def add_scenario_to_plan(
@@ -258,6 +312,56 @@ class TestPlanService:
 
         return plan_scenario
 
+    async def add_scenarios_by_tags(self, plan_id: int, tag_expression: str) -> int:
+        """Add every scenario of the plan's project matching a tag expression.
+
+        Matching scenarios not yet in the plan are appended after the current
+        last position, in creation order, with one INSERT ... SELECT driven by
+        the scenario tag index.
+
+        Args:
+            plan_id: Test plan ID
+            tag_expression: Tag expression, e.g. ``smoke AND NOT slow``
+
+        Returns:
+            Number of scenarios added
+
+        Raises:
+            ValueError: If the test plan doesn't exist or the expression is malformed
+        """
+        condition = scenario_tag_filter(tag_expression)
+        project_id = await self.db.scalar(
+            select(TestPlan.project_id).where(TestPlan.id == plan_id)
+        )
+        if project_id is None:
+            raise ValueError("Test plan not found")
+
+        next_order = await self.db.scalar(
+            select(func.coalesce(func.max(PlanScenario.sort_order) + 1, 0)).where(
+                PlanScenario.plan_id == plan_id
+            )
+        )
+        matching = select(
+            literal(plan_id),
+            Scenario.id,
+            literal(next_order) - 1 + func.row_number().over(order_by=Scenario.id),
+        ).where(
+            Scenario.project_id == project_id,
+            condition,
+            Scenario.id.not_in(
+                select(PlanScenario.scenario_id).where(PlanScenario.plan_id == plan_id)
+            ),
+        )
+        result = cast(
+            CursorResult[Any],
+            await self.db.execute(
+                insert(PlanScenario).from_select(
+                    ["plan_id", "scenario_id", "sort_order"], matching
+                )
+            ),
+        )
+        return result.rowcount
+
     async def reorder_scenarios(
         self, plan_id: int, scenario_orders: list[dict]
     ) -> list[PlanScenario]:
@@ -270,25 +374,20 @@ class TestPlanService:
         Returns:
             Updated PlanScenario instances
         """
-        plan_scenarios = []
-        for item in scenario_orders:
-            scenario_id = item.get("scenario_id")
-            sort_order = item.get("sort_order", 0)
-
-            result = await self.db.execute(
-                select(PlanScenario).where(
-                    PlanScenario.plan_id == plan_id,
-                    PlanScenario.scenario_id == scenario_id
-                )
-            )
-            plan_scenario = result.scalar_one_or_none()
-
-            if plan_scenario:
-                plan_scenario.sort_order = sort_order or 0
-                plan_scenarios.append(plan_scenario)
-
-        await self.db.flush()
-        return plan_scenarios
+        positions = {
+            item["scenario_id"]: item.get("sort_order") or 0
+            for item in scenario_orders
+            if item.get("scenario_id") is not None
+        }
+        rows = await bulk_reorder(
+            self.db,
+            PlanScenario,
+            positions,
+            key="scenario_id",
+            where=[PlanScenario.plan_id == plan_id],
+            returning=(PlanScenario,),
+        )
+        return [row[0] for row in rows]
 
     async def remove_scenario_from_plan(
         self, plan_id: int, scenario_id: int
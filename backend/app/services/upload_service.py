@@ -81,6 +81,60 @@ class UploadService:
         except S3Error as e:
             raise ValueError(f"Upload failed: {e}") from e
 
+    async def put_object(
+        self,
+        object_name: str,
+        data: bytes,
+        content_type: str = "application/octet-stream",
+    ) -> str:
+        """Store bytes under a fixed object name.
+
+        Args:
+            object_name: Object name in MinIO
+            data: Object bytes
+            content_type: MIME type of the object
+
+        Returns:
+            Object name
+
+        Raises:
+            ValueError: If the upload fails
+        """
+        try:
+            self.client.put_object(
+                bucket_name=self.bucket,
+                object_name=object_name,
+                data=BytesIO(data),
+                length=len(data),
+                content_type=content_type,
+            )
+            return object_name
+        except S3Error as e:
+            raise ValueError(f"Upload failed: {e}") from e
+
+    async def get_object(self, object_name: str) -> bytes:
+        """Read an object's bytes.
+
+        Args:
+            object_name: Object name in MinIO
+
+        Returns:
+            Object bytes
+
+        Raises:
+            ValueError: If the object cannot be read
+        """
+        response = None
+        try:
+            response = self.client.get_object(bucket_name=self.bucket, object_name=object_name)
+            return response.read()
+        except S3Error as e:
+            raise ValueError(f"Download failed: {e}") from e
+        finally:
+            if response is not None:
+                response.close()
+                response.release_conn()
+
     async def delete_file(self, object_name: str) -> bool:
         """Delete file from MinIO.
 
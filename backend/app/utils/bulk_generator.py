@@ -0,0 +1,248 @@
+"""Vectorized bulk value generation for datasets.
+
+Columns are ``{{}}`` templates such as ``user_{{random_string(8)}}``. Each
+placeholder is generated for all rows at once:
+
+* calls to built-ins with literal arguments (``random_string(8)``,
+  ``random_number(1, 10)``) use batched implementations (NumPy when it is
+  installed, otherwise one ``random.choices`` over the whole batch);
+* ``row_index`` yields 0..N-1;
+* expressions that only call deterministic functions are evaluated once and
+  repeated;
+* anything else (e.g. user functions) is evaluated per row in one batch.
+
+Each column draws from its own generator derived from the generator seed,
+so the same seed reproduces the same dataset.
+"""
+
+import ast
+import re
+import string
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from itertools import repeat
+from typing import Any
+
+from app.utils.function_executor import expression_calls
+from app.utils.seeded_random import current_rng, new_seed, seeded_scope
+
+try:
+    import numpy as np  # pyright: ignore[reportMissingImports]
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+ALPHANUMERIC = string.ascii_letters + string.digits
+ROW_INDEX = "row_index"
+
+_PLACEHOLDER = re.compile(r"\{\{(.+?)\}\}")
+
+# Evaluates (expression, context) pairs, returning (ok, value) per pair
+Evaluator = Callable[[Sequence[tuple[str, Mapping[str, Any]]]], Awaitable[list[tuple[bool, Any]]]]
+
+
+def batch_random_string(count: int, length: int = 10) -> list[str]:
+    """Generate count random alphanumeric strings.
+
+    Args:
+        count: Number of values
+        length: String length (default: 10)
+
+    Returns:
+        Random strings
+    """
+    if length <= 0:
+        return [""] * count
+
+    total = count * length
+    rng = current_rng()
+    if np is not None:
+        alphabet = np.frombuffer(ALPHANUMERIC.encode("ascii"), dtype=np.uint8)
+        indexes = np.random.default_rng(rng.getrandbits(64)).integers(0, len(alphabet), size=total)
+        blob = alphabet[indexes].tobytes().decode("ascii")
+    else:
+        blob = "".join(rng.choices(ALPHANUMERIC, k=total))
+    return [blob[i : i + length] for i in range(0, total, length)]
+
+
+def batch_random_number(count: int, min_val: int = 0, max_val: int = 100) -> list[int]:
+    """Generate count random integers in range.
+
+    Args:
+        count: Number of values
+        min_val: Minimum value (inclusive, default: 0)
+        max_val: Maximum value (inclusive, default: 100)
+
+    Returns:
+        Random integers
+    """
+    if min_val > max_val:
+        raise ValueError(f"empty range for random_number({min_val}, {max_val})")
+    rng = current_rng()
+    if np is not None:
+        generator = np.random.default_rng(rng.getrandbits(64))
+        return generator.integers(min_val, max_val + 1, size=count).tolist()
+    return rng.choices(range(min_val, max_val + 1), k=count)
+
+
+# Batched implementations of built-in functions
+BATCH_FUNCTIONS: dict[str, Callable[..., list[Any]]] = {
+    "random_string": batch_random_string,
+    "random_number": batch_random_number,
+}
+
+
+def _literal_call(expr: str) -> tuple[str, list[Any], dict[str, Any]] | None:
+    """Split ``name(literal, ...)`` into (name, args, kwargs), else None."""
+    try:
+        node = ast.parse(expr, mode="eval").body
+    except SyntaxError:
+        return None
+    if not isinstance(node, ast.Call) or not isinstance(node.func, ast.Name):
+        return None
+    try:
+        args = [ast.literal_eval(arg) for arg in node.args]
+        kwargs = {kw.arg: ast.literal_eval(kw.value) for kw in node.keywords if kw.arg}
+    except ValueError:
+        return None
+    if len(kwargs) != len(node.keywords):
+        return None
+    return node.func.id, args, kwargs
+
+
+def _free_names(expr: str) -> set[str]:
+    """Names an expression reads (excluding the functions it calls)."""
+    tree = ast.parse(expr, mode="eval")
+    called = {
+        node.func.id
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name)
+    }
+    return {
+        node.id for node in ast.walk(tree) if isinstance(node, ast.Name) and node.id not in called
+    }
+
+
+class BulkGenerator:
+    """Generates dataset columns from ``{{}}`` templates."""
+
+    def __init__(
+        self,
+        evaluate: Evaluator,
+        deterministic: frozenset[str] | set[str] = frozenset(),
+        batch_functions: Mapping[str, Callable[..., list[Any]]] | None = None,
+        seed: int | None = None,
+    ):
+        """Initialize bulk generator.
+
+        Args:
+            evaluate: Fallback evaluator for expressions that cannot be batched
+            deterministic: Function names whose result depends only on arguments
+            batch_functions: Batched implementations by function name
+                (default: BATCH_FUNCTIONS)
+            seed: Random seed (default: a fresh one, see ``seed`` attribute)
+        """
+        self.evaluate = evaluate
+        self.deterministic = deterministic
+        self.batch_functions = BATCH_FUNCTIONS if batch_functions is None else batch_functions
+        self.seed = seed if seed is not None else new_seed()
+        self.vectorized = 0
+        self.constant = 0
+        self.per_row = 0
+
+    async def generate_values(self, expr: str, count: int) -> list[Any]:
+        """Generate count values for one expression.
+
+        Args:
+            expr: Placeholder expression
+            count: Number of values
+
+        Returns:
+            Generated values
+
+        Raises:
+            ValueError: If the expression fails
+        """
+        if expr == ROW_INDEX:
+            self.vectorized += 1
+            return list(range(count))
+
+        call = _literal_call(expr)
+        if call is not None and call[0] in self.batch_functions:
+            name, args, kwargs = call
+            try:
+                values = self.batch_functions[name](count, *args, **kwargs)
+            except TypeError as e:
+                raise ValueError(f"{expr}: {e}") from e
+            self.vectorized += 1
+            return values
+
+        calls = expression_calls(expr)
+        if calls is None:
+            raise ValueError(f"Invalid expression: {expr}")
+
+        if calls <= self.deterministic and ROW_INDEX not in _free_names(expr):
+            [(ok, value)] = await self.evaluate([(expr, {})])
+            if not ok:
+                raise ValueError(f"{expr}: {value}")
+            self.constant += 1
+            return [value] * count
+
+        outcomes = await self.evaluate([(expr, {ROW_INDEX: i}) for i in range(count)])
+        values = []
+        for ok, value in outcomes:
+            if not ok:
+                raise ValueError(f"{expr}: {value}")
+            values.append(value)
+        self.per_row += 1
+        return values
+
+    async def generate_column(self, template: str, count: int) -> list[str]:
+        """Generate count values for a column template.
+
+        Args:
+            template: Text with {{}} placeholders (plain text is repeated)
+            count: Number of rows
+
+        Returns:
+            Column values as strings
+        """
+        parts: list[Any] = []
+        pos = 0
+        for match in _PLACEHOLDER.finditer(template):
+            if match.start() > pos:
+                parts.append(repeat(template[pos : match.start()], count))
+            values = await self.generate_values(match.group(1).strip(), count)
+            parts.append(map(str, values))
+            pos = match.end()
+        if pos < len(template):
+            parts.append(repeat(template[pos:], count))
+
+        if not parts:
+            return [""] * count
+        if len(parts) == 1:
+            return list(parts[0])
+        return ["".join(row) for row in zip(*parts, strict=True)]
+
+    async def generate(
+        self, columns: Mapping[str, str], count: int
+    ) -> tuple[list[str], list[list[str]]]:
+        """Generate dataset headers and rows.
+
+        Args:
+            columns: Header name to column template
+            count: Number of rows
+
+        Returns:
+            Tuple of (headers, rows)
+
+        Raises:
+            ValueError: If a column expression fails
+        """
+        headers = list(columns)
+        values = []
+        for header in headers:
+            try:
+                with seeded_scope(self.seed, "column", header):
+                    values.append(await self.generate_column(columns[header], count))
+            except ValueError as e:
+                raise ValueError(f"列 {header}: {e}") from e
+        return headers, [list(row) for row in zip(*values, strict=True)]
@@ -0,0 +1,80 @@
+"""Bulk position updates for drag-and-drop reordering."""
+
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from sqlalchemy import ColumnElement, case, inspect, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
+
+# Positions per UPDATE statement (two bound parameters each)
+_BATCH = 1000
+
+
+async def bulk_reorder(
+    session: AsyncSession,
+    model: Any,
+    positions: Mapping[Any, int],
+    key: str = "id",
+    column: str = "sort_order",
+    where: Sequence[ColumnElement[bool]] = (),
+    returning: Sequence[Any] = (),
+) -> list[Any]:
+    """Set the positions of many rows in one statement.
+
+    Issues ``UPDATE ... SET column = CASE key WHEN ... END WHERE key IN (...)``
+    plus the ownership conditions in ``where`` (e.g. the parent scenario or
+    plan), so rows belonging to someone else are never touched. Positions are
+    split into statements of _BATCH rows. Instances already loaded in the
+    session get the new positions too. Does not commit.
+
+    Args:
+        session: Database session
+        model: Model class of the rows
+        positions: New position by key value
+        key: Column identifying rows
+        column: Position column
+        where: Extra conditions every updated row must satisfy
+        returning: Columns to return for each updated row (default: the key)
+
+    Returns:
+        One tuple of the returning columns per updated row
+    """
+    if not positions:
+        return []
+
+    mapper = inspect(model)
+    primary_key = list(mapper.primary_key)
+    key_column = getattr(model, key)
+    columns = [*primary_key, *(returning or [key_column])]
+    supports_returning = session.get_bind().dialect.update_returning
+
+    items = list(positions.items())
+    updated: list[tuple[Any, ...]] = []
+    for start in range(0, len(items), _BATCH):
+        chunk = dict(items[start : start + _BATCH])
+        conditions = [key_column.in_(list(chunk)), *where]
+        # ORM synchronization can't evaluate CASE and would expire the
+        # column, so loaded instances are updated below instead
+        stmt = (
+            update(model)
+            .where(*conditions)
+            .values({column: case(chunk, value=key_column, else_=getattr(model, column))})
+            .execution_options(synchronize_session=False)
+        )
+        if supports_returning:
+            result = await session.execute(stmt.returning(*columns))
+            rows = result.all()
+        else:
+            # No UPDATE ... RETURNING: read the matching rows first
+            result = await session.execute(select(*columns).where(*conditions))
+            rows = result.all()
+            await session.execute(stmt)
+
+        for row in rows:
+            identity = mapper.identity_key_from_primary_key(row[: len(primary_key)])
+            instance = session.identity_map.get(identity)
+            if instance is not None:
+                set_committed_value(instance, column, chunk[getattr(instance, key)])
+            updated.append(tuple(row[len(primary_key) :]))
+    return updated
@@ -0,0 +1,56 @@
+"""Counter upserts for rollup tables."""
+
+from collections.abc import Mapping
+from typing import Any, cast
+
+from sqlalchemy import CursorResult, and_, func, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def increment_counters(
+    session: AsyncSession,
+    model: Any,
+    keys: Mapping[str, Any],
+    counters: Mapping[str, Any],
+) -> None:
+    """Add to the counters of a rollup row, creating the row if needed.
+
+    Uses INSERT ... ON CONFLICT DO UPDATE on PostgreSQL and SQLite (the keys
+    must be covered by a unique constraint), and update-then-insert on other
+    databases. Negative values decrement. Does not commit.
+
+    Args:
+        session: Database session
+        model: Rollup model class
+        keys: Unique key column values identifying the row
+        counters: Counter column deltas
+    """
+    dialect = session.get_bind().dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        stmt = insert(model).values(**keys, **counters)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(keys),
+            set_={
+                **{
+                    name: getattr(model, name) + getattr(stmt.excluded, name)
+                    for name in counters
+                },
+                "updated_at": func.now(),
+            },
+        )
+        await session.execute(stmt)
+        return
+
+    result = cast(
+        CursorResult[Any],
+        await session.execute(
+            update(model)
+            .where(and_(*(getattr(model, name) == value for name, value in keys.items())))
+            .values({name: getattr(model, name) + delta for name, delta in counters.items()})
+        ),
+    )
+    if result.rowcount == 0:
+        session.add(model(**keys, **counters))
+        await session.flush()
@@ -5,9 +5,92 @@ import random
 import re
 import string
 import time
+from collections.abc import Mapping
 from datetime import datetime
+from functools import lru_cache
+from types import CodeType
 from typing import Any
 
+from app.utils.seeded_random import current_rng
+
+# Names whose attributes may never be accessed from expressions
+_DANGEROUS_NAMES = frozenset({"os", "sys", "subprocess", "eval", "exec", "open"})
+
+# Distinct expressions kept compiled per process
+EXPRESSION_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def compile_expression(call_expr: str) -> CodeType | None:
+    """Validate an expression for safety and compile it.
+
+    Each distinct expression is parsed, checked and compiled once per process;
+    repeated placeholders such as ``current_time()`` hit the cache.
+
+    Args:
+        call_expr: Function call expression (e.g., "current_time()")
+
+    Returns:
+        Compiled code object, or None if the expression is invalid or unsafe
+    """
+    try:
+        tree = ast.parse(call_expr, mode="eval")
+    except (SyntaxError, ValueError):
+        return None
+
+    for node in ast.walk(tree):
+        # Disallow attribute access on dangerous modules
+        if (
+            isinstance(node, ast.Attribute)
+            and isinstance(node.value, ast.Name)
+            and node.value.id in _DANGEROUS_NAMES
+        ):
+            return None
+
+    return compile(tree, "<expression>", "eval")
+
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def _has_nested_scopes(call_expr: str) -> bool:
+    """Check whether a compiled expression contains nested scopes.
+
+    Lambdas and comprehensions compile to their own code objects, which look
+    up free names in globals and so cannot see a separate locals mapping.
+
+    Args:
+        call_expr: Function call expression
+
+    Returns:
+        True if the expression needs the context merged into its globals
+    """
+    code = compile_expression(call_expr)
+    return code is not None and any(isinstance(const, CodeType) for const in code.co_consts)
+
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def expression_calls(call_expr: str) -> frozenset[str] | None:
+    """Get the names of all functions an expression calls.
+
+    Args:
+        call_expr: Function call expression
+
+    Returns:
+        Called function names, or None if the expression is invalid or calls
+        something other than a plain name (e.g. ``random.randint()``)
+    """
+    try:
+        tree = ast.parse(call_expr, mode="eval")
+    except (SyntaxError, ValueError):
+        return None
+
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call):
+            if not isinstance(node.func, ast.Name):
+                return None
+            names.add(node.func.id)
+    return frozenset(names)
+
 
 class FunctionExecutor:
     """Safe executor for global parameter functions.
@@ -46,6 +129,9 @@ class FunctionExecutor:
         "string": string,
     }
 
+    # Built-ins that always return the same result for the same arguments
+    PURE_BUILTINS = frozenset(BUILTINS) - {"datetime", "time", "random", "string"}
+
     def __init__(self, functions: dict[str, Any]):
         """Initialize function executor.
 
@@ -53,6 +139,8 @@ class FunctionExecutor:
             functions: Dictionary mapping function names to callable objects
         """
         self.functions = {**self.BUILTINS, **functions}
+        # Private globals dict for eval (eval inserts __builtins__ into it)
+        self._globals = dict(self.functions)
 
     def extract_function_calls(self, text: str) -> list[str]:
         """Extract all function calls from {{}} placeholders.
@@ -70,62 +158,23 @@ class FunctionExecutor:
     def validate_function_call(self, call_expr: str) -> bool:
         """Validate function call expression for safety.
 
+        Results are memoized per process (see ``compile_expression``).
+
         Args:
             call_expr: Function call expression (e.g., "current_time()")
 
         Returns:
             True if safe, False otherwise
         """
-        try:
-            # Parse the expression
-            tree = ast.parse(call_expr, mode="eval")
-
-            # Walk the AST and check for dangerous operations
-            for node in ast.walk(tree):
-                # Disallow imports
-                if isinstance(node, (ast.Import, ast.ImportFrom)):
-                    return False
-
-                # Disallow attribute access on dangerous modules
-                if isinstance(node, ast.Attribute):
-                    if hasattr(node.value, "id") and isinstance(node.value, ast.Name):
-                        module_name = node.value.id
-                        if module_name in ["os", "sys", "subprocess", "eval", "exec", "open"]:
-                            return False
-
-                # Only allow function calls and names
-                if not isinstance(
-                    node,
-                    (
-                        ast.Expression,
-                        ast.Call,
-                        ast.Name,
-                        ast.Constant,
-                        ast.Load,
-                        ast.BinOp,
-                        ast.UnaryOp,
-                        ast.Compare,
-                        ast.BoolOp,
-                        ast.Num,
-                        ast.Str,
-                        ast.List,
-                        ast.Tuple,
-                        ast.Dict,
-                    ),
-                ):
-                    continue
-
-            return True
-
-        except (SyntaxError, ValueError):
-            return False
-
-    def execute_function(self, call_expr: str, context: dict[str, Any]) -> Any:
+        return compile_expression(call_expr) is not None
+
+    def execute_function(self, call_expr: str, context: Mapping[str, Any]) -> Any:
         """Execute a single function call.
 
         Args:
             call_expr: Function call expression (e.g., "current_time()")
-            context: Execution context variables
+            context: Execution context variables (any mapping, e.g. a
+                VariableContext; it is not copied)
 
         Returns:
             Function result
@@ -133,20 +182,23 @@ class FunctionExecutor:
         Raises:
             ValueError: If function call is invalid or unsafe
         """
-        # Validate safety
-        if not self.validate_function_call(call_expr):
+        # Validate safety (parsed and compiled once per distinct expression)
+        code = compile_expression(call_expr)
+        if code is None:
             raise ValueError(f"Unsafe or invalid function call: {call_expr}")
 
         try:
-            # Execute in restricted environment
-            exec_globals = {**self.functions, **context}
-            result = eval(call_expr, exec_globals, {})
-            return result
-
+            if _has_nested_scopes(call_expr):
+                # Nested scopes can't see the locals mapping, so merge the
+                # context into globals (context names still win)
+                return eval(code, {**self._globals, **context})
+            # Context is passed as the locals mapping (no per-call dict merge);
+            # top-level names resolve from context first, then functions.
+            return eval(code, self._globals, context)
         except Exception as e:
             raise ValueError(f"Function execution failed: {call_expr}: {str(e)}") from e
 
-    def parse_text(self, text: str, context: dict[str, Any]) -> tuple[str, list[str], bool, str]:
+    def parse_text(self, text: str, context: Mapping[str, Any]) -> tuple[str, list[str], bool, str]:
         """Parse text and replace {{function()}} with actual values.
 
         Supports nested function calls like {{outer(inner())}}.
@@ -247,18 +299,22 @@ def timestamp_to_date(ts: int) -> str:
 def random_string(length: int = 10) -> str:
     """Generate random alphanumeric string.
 
+    Draws from the current seeded scope's generator (see seeded_random).
+
     Args:
         length: String length (default: 10)
 
     Returns:
         Random string
     """
-    return "".join(random.choices(string.ascii_letters + string.digits, k=length))
+    return "".join(current_rng().choices(string.ascii_letters + string.digits, k=length))
 
 
 def random_number(min_val: int = 0, max_val: int = 100) -> int:
     """Generate random integer in range.
 
+    Draws from the current seeded scope's generator (see seeded_random).
+
     Args:
         min_val: Minimum value (inclusive, default: 0)
         max_val: Maximum value (inclusive, default: 100)
@@ -266,7 +322,7 @@ def random_number(min_val: int = 0, max_val: int = 100) -> int:
     Returns:
         Random integer
     """
-    return random.randint(min_val, max_val)
+    return current_rng().randint(min_val, max_val)
 
 
 # Built-in functions registry
@@ -308,6 +364,7 @@ BUILTIN_PARAMS_DATA = [
             {"type": "str", "description": "大写字符串"}
         ],
         "is_builtin": True,
+        "is_deterministic": True,
     },
     {
         "class_name": "StringUtils",
@@ -331,6 +388,7 @@ BUILTIN_PARAMS_DATA = [
             {"type": "str", "description": "小写字符串"}
         ],
         "is_builtin": True,
+        "is_deterministic": True,
     },
     # TimeUtils
     {
@@ -351,6 +409,7 @@ BUILTIN_PARAMS_DATA = [
             {"type": "str", "description": "当前时间字符串"}
         ],
         "is_builtin": True,
+        "is_deterministic": False,
     },
     {
         "class_name": "TimeUtils",
@@ -370,6 +429,7 @@ BUILTIN_PARAMS_DATA = [
             {"type": "int", "description": "当前时间戳"}
         ],
         "is_builtin": True,
+        "is_deterministic": False,
     },
     {
         "class_name": "TimeUtils",
@@ -394,6 +454,7 @@ BUILTIN_PARAMS_DATA = [
             {"type": "str", "description": "日期字符串"}
         ],
         "is_builtin": True,
+        "is_deterministic": True,
     },
     # RandomUtils
     {
@@ -420,6 +481,7 @@ BUILTIN_PARAMS_DATA = [
             {"type": "str", "description": "随机字符串"}
         ],
         "is_builtin": True,
+        "is_deterministic": False,
     },
     {
         "class_name": "RandomUtils",
@@ -446,5 +508,11 @@ BUILTIN_PARAMS_DATA = [
             {"type": "int", "description": "随机整数"}
         ],
         "is_builtin": True,
+        "is_deterministic": False,
     },
 ]
+
+# Built-in functions whose result depends only on their arguments
+DETERMINISTIC_BUILTIN_FUNCTIONS = frozenset(
+    param["method_name"] for param in BUILTIN_PARAMS_DATA if param["is_deterministic"]
+)
@@ -0,0 +1,544 @@
+"""Parsers turning API descriptions into interface rows.
+
+Each parser yields plain dicts with the keys ``name``, ``method``, ``path``,
+``folder`` (folder name or None), ``headers``, ``params``, ``body`` and
+``body_type``, the same shape parse_curl returns. Parsers
+of recorded traffic (Postman, HAR) also set ``url``, the full request URL.
+Parsers read their input incrementally (see JsonSource), so memory follows
+the largest single item, not the document.
+"""
+
+import json
+import re
+import shlex
+from collections.abc import Iterator, Sequence
+from typing import Any
+from urllib.parse import parse_qs, parse_qsl, urlparse
+
+from app.utils.json_stream import JsonSource
+
+# Methods an Interface can hold
+HTTP_METHODS = ("get", "post", "put", "delete", "patch")
+
+# Nesting limit when building example bodies from schemas
+_MAX_SCHEMA_DEPTH = 4
+
+# Headers a client sets by itself, not worth keeping on an interface
+_SKIPPED_HEADERS = frozenset(
+    {"host", "content-length", "connection", "accept-encoding", "keep-alive", "te"}
+)
+
+# Leading Postman variable standing for scheme and host, e.g. {{baseUrl}}
+_URL_VARIABLE = re.compile(r"^\{\{[^}]+\}\}")
+
+
+def _schema_example(schema: Any, depth: int = 0) -> Any:
+    """Build an example value from an inline JSON schema.
+
+    ``$ref`` schemas are not resolved (components are not kept in memory)
+    and become empty objects.
+    """
+    if not isinstance(schema, dict) or depth > _MAX_SCHEMA_DEPTH:
+        return None
+    if "example" in schema:
+        return schema["example"]
+    if "default" in schema:
+        return schema["default"]
+    if "$ref" in schema:
+        return {}
+    if schema.get("enum"):
+        return schema["enum"][0]
+
+    schema_type = schema.get("type")
+    if schema_type == "object" or "properties" in schema:
+        return {
+            name: _schema_example(prop, depth + 1)
+            for name, prop in (schema.get("properties") or {}).items()
+        }
+    if schema_type == "array":
+        item = _schema_example(schema.get("items"), depth + 1)
+        return [] if item is None else [item]
+    return {"string": "", "integer": 0, "number": 0, "boolean": False}.get(schema_type or "")
+
+
+def _parameter_value(param: dict[str, Any]) -> Any:
+    """Example value for a parameter (empty string if none is given)."""
+    for source in (param, param.get("schema") or {}):
+        for field in ("example", "default"):
+            if field in source:
+                return source[field]
+    return ""
+
+
+def _media_example(media: dict[str, Any]) -> Any:
+    """Example body of an OpenAPI 3 media type object."""
+    if "example" in media:
+        return media["example"]
+    examples = media.get("examples")
+    if isinstance(examples, dict) and examples:
+        first = next(iter(examples.values()))
+        if isinstance(first, dict) and "value" in first:
+            return first["value"]
+    return _schema_example(media.get("schema"))
+
+
+def _request_body(operation: dict[str, Any], parameters: list[dict[str, Any]]) -> tuple[Any, str]:
+    """Extract (body, body_type) from an operation."""
+    # Swagger 2: body / formData parameters
+    for param in parameters:
+        if param.get("in") == "body":
+            return _schema_example(param.get("schema")) or {}, "json"
+    form = {p["name"]: _parameter_value(p) for p in parameters if p.get("in") == "formData"}
+    if form:
+        return form, "form-data"
+
+    # OpenAPI 3: requestBody.content
+    content = (operation.get("requestBody") or {}).get("content") or {}
+    for media_type, media in content.items():
+        if "json" in media_type:
+            example = _media_example(media or {})
+            return ({} if example is None else example), "json"
+    for media_type, media in content.items():
+        if media_type in ("multipart/form-data", "application/x-www-form-urlencoded"):
+            example = _media_example(media or {})
+            return (example if isinstance(example, dict) else {}), "form-data"
+    if content:
+        example = _media_example(next(iter(content.values())) or {})
+        return {"raw": "" if example is None else str(example)}, "raw"
+    return {}, "json"
+
+
+def parse_openapi(source: JsonSource) -> Iterator[dict[str, Any]]:
+    """Parse an OpenAPI 3 or Swagger 2 document.
+
+    Operations become interfaces and their first tag the folder. Paths are
+    prefixed with the Swagger ``basePath`` or the path of the first OpenAPI
+    server URL.
+
+    Args:
+        source: Document source
+
+    Yields:
+        Interface dicts
+
+    Raises:
+        ValueError: If the document is not OpenAPI 3 or Swagger 2
+    """
+    header = source.values("openapi", "swagger", "servers.item.url", "basePath")
+    if header.get("openapi"):
+        server = header.get("servers.item.url") or ""
+        base_path = urlparse(server).path if "://" in server else server
+        shared = dict(source.kvitems("components.parameters"))
+        ref_prefix = "#/components/parameters/"
+    elif header.get("swagger"):
+        base_path = header.get("basePath") or ""
+        shared = dict(source.kvitems("parameters"))
+        ref_prefix = "#/parameters/"
+    else:
+        raise ValueError("Not an OpenAPI 3 or Swagger 2 document")
+    base_path = base_path.rstrip("/")
+
+    def resolve(param: Any) -> dict[str, Any] | None:
+        if isinstance(param, dict) and "$ref" in param:
+            ref = param["$ref"]
+            param = shared.get(ref[len(ref_prefix) :]) if ref.startswith(ref_prefix) else None
+        return param if isinstance(param, dict) and "name" in param else None
+
+    for path, path_item in source.kvitems("paths"):
+        if not isinstance(path_item, dict):
+            continue
+        common = path_item.get("parameters") or []
+        for method in HTTP_METHODS:
+            operation = path_item.get(method)
+            if not isinstance(operation, dict):
+                continue
+
+            # Operation parameters override path-level ones with the same name/location
+            merged: dict[tuple[str, str], dict[str, Any]] = {}
+            for raw in [*common, *(operation.get("parameters") or [])]:
+                param = resolve(raw)
+                if param is not None:
+                    merged[(param.get("in", ""), param["name"])] = param
+            parameters = list(merged.values())
+
+            body, body_type = _request_body(operation, parameters)
+            tags = operation.get("tags") or []
+            yield {
+                "name": operation.get("summary")
+                or operation.get("operationId")
+                or f"{method.upper()} {path}",
+                "method": method.upper(),
+                "path": f"{base_path}{path}" or "/",
+                "folder": tags[0] if tags else None,
+                "headers": {
+                    p["name"]: _parameter_value(p) for p in parameters if p.get("in") == "header"
+                },
+                "params": {
+                    p["name"]: _parameter_value(p) for p in parameters if p.get("in") == "query"
+                },
+                "body": body,
+                "body_type": body_type,
+            }
+
+
+def _split_url(url: str) -> tuple[str, dict[str, str]]:
+    """Split a request URL into (path, query params).
+
+    Scheme and host are dropped, as is a leading ``{{variable}}`` that stands
+    for them in Postman collections.
+    """
+    url = _URL_VARIABLE.sub("", url.strip(), count=1)
+    if "://" in url:
+        parsed = urlparse(url)
+        path, query = parsed.path, parsed.query
+    else:
+        path, _, query = url.partition("?")
+        path = path.split("#", 1)[0]
+    if not path.startswith("/"):
+        path = f"/{path}"
+    return path, dict(parse_qsl(query, keep_blank_values=True))
+
+
+def _keep_header(name: str) -> bool:
+    """Whether a recorded header belongs on the interface."""
+    return bool(name) and not name.startswith(":") and name.lower() not in _SKIPPED_HEADERS
+
+
+def _text_body(text: str, mime_type: str) -> tuple[Any, str]:
+    """Interpret a recorded request body by its content type."""
+    if "json" in mime_type or (not mime_type and text.lstrip()[:1] in ("{", "[")):
+        try:
+            return json.loads(text), "json"
+        except ValueError:
+            pass
+    if "x-www-form-urlencoded" in mime_type:
+        return dict(parse_qsl(text, keep_blank_values=True)), "form-data"
+    return {"raw": text}, "raw"
+
+
+def _postman_request(request: Any, name: str, folder: str | None) -> dict[str, Any]:
+    """Convert one Postman request object."""
+    if isinstance(request, str):
+        request = {"url": request}
+    url = request.get("url") or ""
+    query: dict[str, str] = {}
+    if isinstance(url, dict):
+        for param in url.get("query") or []:
+            if isinstance(param, dict) and param.get("key") and not param.get("disabled"):
+                query[param["key"]] = param.get("value") or ""
+        segments = url.get("path") or []
+        url = url.get("raw") or "/" + "/".join(
+            s if isinstance(s, str) else str(s.get("value", "")) for s in segments
+        )
+    path, url_query = _split_url(url)
+
+    headers = {
+        h["key"]: h.get("value") or ""
+        for h in request.get("header") or []
+        if isinstance(h, dict) and not h.get("disabled") and _keep_header(h.get("key") or "")
+    }
+    content_type = next((v for k, v in headers.items() if k.lower() == "content-type"), "")
+
+    body: Any = {}
+    body_type = "json"
+    spec = request.get("body") or {}
+    mode = spec.get("mode")
+    if mode in ("urlencoded", "formdata"):
+        body = {
+            p["key"]: p.get("value") or ""
+            for p in spec.get(mode) or []
+            if isinstance(p, dict) and p.get("key") and not p.get("disabled")
+        }
+        body_type = "form-data"
+    elif mode == "raw" and spec.get("raw"):
+        language = ((spec.get("options") or {}).get("raw") or {}).get("language", "")
+        body, body_type = _text_body(spec["raw"], content_type or language)
+    elif mode == "graphql":
+        body = dict(spec.get("graphql") or {})
+
+    return {
+        "name": name,
+        "method": str(request.get("method") or "GET").upper(),
+        "path": path,
+        "url": url,
+        "folder": folder,
+        "headers": headers,
+        "params": query or url_query,
+        "body": body,
+        "body_type": body_type,
+    }
+
+
+def _postman_items(item: dict[str, Any], folder: str | None) -> Iterator[dict[str, Any]]:
+    """Walk a Postman item (request or folder) depth-first."""
+    if "request" in item:
+        yield _postman_request(item["request"], item.get("name") or "", folder)
+    for child in item.get("item") or []:
+        if isinstance(child, dict):
+            yield from _postman_items(child, folder)
+
+
+def parse_postman(source: JsonSource) -> Iterator[dict[str, Any]]:
+    """Parse a Postman collection (v2.0 / v2.1).
+
+    Requests keep collection order. A top-level folder becomes the folder of
+    every request below it; deeper folders are flattened into it.
+
+    Args:
+        source: Document source
+
+    Yields:
+        Interface dicts
+
+    Raises:
+        ValueError: If the document is not a Postman collection
+    """
+    schema = source.value("info.schema") or ""
+    if "getpostman.com" not in schema and "postman" not in schema:
+        raise ValueError("Not a Postman collection")
+    for item in source.items("item.item"):
+        if not isinstance(item, dict):
+            continue
+        folder = None if "request" in item else (item.get("name") or None)
+        yield from _postman_items(item, folder)
+
+
+def postman_variables(source: JsonSource) -> dict[str, Any]:
+    """Collection variables of a Postman collection, by name."""
+    return {
+        var["key"]: var.get("value")
+        for var in source.items("variable.item")
+        if isinstance(var, dict) and var.get("key") and not var.get("disabled")
+    }
+
+
+def parse_har(source: JsonSource) -> Iterator[dict[str, Any]]:
+    """Parse a HAR (HTTP Archive) capture.
+
+    Entries keep capture order; each becomes an interface in a folder named
+    after its host. Responses are never read into interfaces.
+
+    Args:
+        source: Document source
+
+    Yields:
+        Interface dicts
+
+    Raises:
+        ValueError: If the document is not a HAR capture
+    """
+    # Small header fields only: reading log.entries here would load them all
+    header = source.values("log.version", "log.creator")
+    if header.get("log.version") is None and header.get("log.creator") is None:
+        raise ValueError("Not a HAR document")
+    for entry in source.items("log.entries.item"):
+        request = entry.get("request") if isinstance(entry, dict) else None
+        if not isinstance(request, dict) or not request.get("url"):
+            continue
+        url = request["url"]
+        parsed = urlparse(url)
+        path, url_query = _split_url(url)
+        query = {
+            q["name"]: q.get("value") or ""
+            for q in request.get("queryString") or []
+            if isinstance(q, dict) and q.get("name")
+        }
+
+        body: Any = {}
+        body_type = "json"
+        post_data = request.get("postData") or {}
+        mime_type = (post_data.get("mimeType") or "").split(";", 1)[0]
+        if post_data.get("params"):
+            body = {p["name"]: p.get("value") or "" for p in post_data["params"] if p.get("name")}
+            body_type = "form-data"
+        elif post_data.get("text"):
+            body, body_type = _text_body(post_data["text"], mime_type)
+
+        method = str(request.get("method") or "GET").upper()
+        yield {
+            "name": f"{method} {path}",
+            "method": method,
+            "path": path,
+            "url": url,
+            "folder": parsed.netloc or None,
+            "headers": {
+                h["name"]: h.get("value") or ""
+                for h in request.get("headers") or []
+                if isinstance(h, dict) and _keep_header(h.get("name") or "")
+            },
+            "params": query or url_query,
+            "body": body,
+            "body_type": body_type,
+        }
+
+
+# ============== cURL ==============
+
+def parse_curl(curl_command: str) -> dict[str, Any]:
+    """Parse cURL command into interface components.
+
+    Args:
+        curl_command: cURL command string
+
+    Returns:
+        Parsed components (method, path, headers, body, etc.)
+
+    Raises:
+        ValueError: If cURL command is invalid
+    """
+    result: dict[str, Any] = {
+        "method": "GET",
+        "path": "/",
+        "headers": {},
+        "params": {},
+        "body": {},
+        "body_type": "json",
+    }
+
+    # Remove 'curl' prefix and split
+    parts = shlex.split(curl_command)
+    if not parts or parts[0] != "curl":
+        raise ValueError("Invalid cURL command: must start with 'curl'")
+
+    i = 1
+    while i < len(parts):
+        part = parts[i]
+
+        if part.startswith("-X") or part.startswith("--request"):
+            # HTTP method
+            if part == "-X" or part == "--request":
+                i += 1
+                if i < len(parts):
+                    result["method"] = parts[i].upper()
+            else:
+                result["method"] = part[2:].upper()
+
+        elif part.startswith("-H") or part.startswith("--header"):
+            # Header
+            if part == "-H" or part == "--header":
+                i += 1
+                if i < len(parts):
+                    header = parts[i]
+                else:
+                    i += 1
+                    continue
+            else:
+                header = part[2:] if len(part) > 2 else parts[i + 1]
+                i += 1
+
+            if ": " in header:
+                key, value = header.split(": ", 1)
+                result["headers"][key] = value
+            elif ":" in header:
+                key, value = header.split(":", 1)
+                result["headers"][key] = value
+
+        elif part.startswith("-d") or part.startswith("--data") or part.startswith("--data-raw"):
+            # Request body
+            if part in ["-d", "--data", "--data-raw", "--data-urlencode"]:
+                i += 1
+                if i < len(parts):
+                    body_str = parts[i]
+                else:
+                    i += 1
+                    continue
+            else:
+                body_str = parts[i + 1] if len(part) <= 3 else parts[i]
+                i += 1
+
+            # Try to parse as JSON
+            try:
+                result["body"] = json.loads(body_str)
+                result["body_type"] = "json"
+            except json.JSONDecodeError:
+                # Not JSON, treat as raw
+                result["body"] = {"raw": body_str}
+                result["body_type"] = "raw"
+
+            # Set method to POST if not explicitly set
+            if result["method"] == "GET":
+                result["method"] = "POST"
+
+        elif part.startswith("--data-binary"):
+            # Binary data
+            i += 1
+            if i < len(parts):
+                result["body"] = {"binary": parts[i]}
+                result["body_type"] = "raw"
+            if result["method"] == "GET":
+                result["method"] = "POST"
+
+        elif part.startswith("-G") or part.startswith("--get"):
+            # Force GET
+            result["method"] = "GET"
+
+        elif not part.startswith("-") and "://" in part:
+            # URL
+            url = part
+            # Extract path and query params
+            parsed_url = urlparse(url)
+            result["path"] = parsed_url.path or "/"
+
+            # Parse query parameters
+            if parsed_url.query:
+                params = parse_qs(parsed_url.query, keep_blank_values=True)
+                # Convert list values to single values
+                result["params"] = {k: v[0] if len(v) == 1 else v for k, v in params.items()}
+
+        i += 1
+
+    # Generate default name from URL
+    if "name" not in result:
+        result["name"] = f"{result['method']} {result['path']}"
+
+    return result
+
+
+def split_curl_commands(text: str) -> list[tuple[int, str]]:
+    """Split a file of cURL commands into single commands.
+
+    Commands may span lines with trailing backslashes (as copied from
+    browsers). Blank lines and lines starting with ``#`` are ignored.
+
+    Args:
+        text: File content
+
+    Returns:
+        (line number of the command's first line, command) pairs
+    """
+    commands: list[tuple[int, str]] = []
+    current: list[str] = []
+    first_line = 0
+    for number, line in enumerate(text.splitlines(), start=1):
+        stripped = line.strip()
+        if not current:
+            if not stripped or stripped.startswith("#"):
+                continue
+            first_line = number
+        if stripped.endswith("\\"):
+            current.append(stripped[:-1])
+            continue
+        current.append(stripped)
+        commands.append((first_line, " ".join(current)))
+        current = []
+    if current:
+        commands.append((first_line, " ".join(current)))
+    return commands
+
+
+def parse_curl_chunk(commands: Sequence[str]) -> list[tuple[bool, Any]]:
+    """Parse many cURL commands (runs in a worker process).
+
+    Args:
+        commands: cURL command strings
+
+    Returns:
+        (ok, parsed dict) or (False, error message) per command
+    """
+    results: list[tuple[bool, Any]] = []
+    for command in commands:
+        try:
+            results.append((True, parse_curl(command)))
+        except (ValueError, IndexError) as e:
+            results.append((False, str(e) or "Invalid cURL command"))
+    return results
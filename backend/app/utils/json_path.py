@@ -0,0 +1,395 @@
+"""Compiled JSON path extraction for HTTP responses.
+
+Supported path syntax (a leading ``$`` / ``$.`` is optional)::
+
+    data.user.id            dotted keys
+    items[0].id, items[-1]  array indexes (``items.0`` also works)
+    items[*].id, data.*     wildcards over list items / dict values
+    ['key.with.dots']       quoted keys
+    items[?(@.status=="ok")].id   filters (==, !=, >, >=, <, <= or bare @.field)
+
+Paths are parsed once into step tuples and cached, as are regexes, so
+repeated extraction and assertion at high step rates only pays for the walk.
+"""
+
+import json
+import operator
+import re
+from collections.abc import Callable, Mapping
+from functools import lru_cache
+from typing import Any
+
+_MISSING = object()
+_REQUIRED = object()
+
+_TOKEN = re.compile(
+    r"""
+    \[\s*(?P<index>-?\d+)\s*\]
+    | \[\s*\*\s*\]
+    | \[\s*(?P<quote>['"])(?P<qkey>.*?)(?P=quote)\s*\]
+    | \[\?\(\s*(?P<filter>.+?)\s*\)\]
+    | \.?(?P<key>[^.\[\]]+)
+    """,
+    re.VERBOSE,
+)
+
+_FILTER = re.compile(
+    r"^@\.(?P<field>[^\s=!<>]+)\s*(?:(?P<op>==|!=|>=|<=|>|<)\s*(?P<value>.+))?$"
+)
+
+_OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+}
+
+
+def _parse_literal(text: str) -> Any:
+    """Parse a filter literal (JSON scalar or single-quoted string)."""
+    text = text.strip()
+    if len(text) >= 2 and text[0] == text[-1] == "'":
+        return text[1:-1]
+    try:
+        return json.loads(text)
+    except ValueError:
+        # Bare words compare as strings
+        return text
+
+
+def _walk_keys(node: Any, keys: tuple[str, ...]) -> Any:
+    """Follow plain keys from a node, returning _MISSING if any is absent."""
+    for key in keys:
+        if isinstance(node, dict):
+            if key not in node:
+                return _MISSING
+            node = node[key]
+        elif isinstance(node, list) and key.lstrip("-").isdigit():
+            index = int(key)
+            if not -len(node) <= index < len(node):
+                return _MISSING
+            node = node[index]
+        else:
+            return _MISSING
+    return node
+
+
+class _Filter:
+    """Compiled ``[?(@.field op value)]`` predicate."""
+
+    __slots__ = ("keys", "op", "value")
+
+    def __init__(self, expression: str):
+        match = _FILTER.match(expression)
+        if not match:
+            raise ValueError(f"Invalid JSON path filter: {expression}")
+        self.keys = tuple(match.group("field").split("."))
+        op = match.group("op")
+        self.op = _OPERATORS[op] if op else None
+        self.value = _parse_literal(match.group("value")) if op else None
+
+    def __call__(self, item: Any) -> bool:
+        actual = _walk_keys(item, self.keys)
+        if actual is _MISSING:
+            return False
+        if self.op is None:
+            return True
+        try:
+            return bool(self.op(actual, self.value))
+        except TypeError:
+            # Incomparable types (e.g. str > int) never match
+            return False
+
+
+class JsonPath:
+    """A parsed JSON path, reusable across documents."""
+
+    __slots__ = ("path", "steps", "is_definite")
+
+    def __init__(self, path: str):
+        """Parse a JSON path.
+
+        Args:
+            path: Path expression
+
+        Raises:
+            ValueError: If the path cannot be parsed
+        """
+        self.path = path
+        self.steps = self._parse(path)
+        # Definite paths select at most one node and can be walked directly
+        self.is_definite = all(kind in ("key", "index") for kind, _ in self.steps)
+
+    @staticmethod
+    def _parse(path: str) -> tuple[tuple[str, Any], ...]:
+        """Parse a path string into (kind, argument) steps."""
+        text = path.strip()
+        if text.startswith("$"):
+            text = text[1:]
+        if not text:
+            return ()
+
+        steps: list[tuple[str, Any]] = []
+        pos = 0
+        while pos < len(text):
+            match = _TOKEN.match(text, pos)
+            if not match or match.end() == pos:
+                raise ValueError(f"Invalid JSON path: {path}")
+
+            if match.group("index") is not None:
+                steps.append(("index", int(match.group("index"))))
+            elif match.group("qkey") is not None:
+                steps.append(("key", match.group("qkey")))
+            elif match.group("filter") is not None:
+                steps.append(("filter", _Filter(match.group("filter"))))
+            elif match.group("key") is not None:
+                key = match.group("key").strip()
+                steps.append(("wildcard", None) if key == "*" else ("key", key))
+            else:
+                steps.append(("wildcard", None))
+            pos = match.end()
+        return tuple(steps)
+
+    def find(self, data: Any) -> list[Any]:
+        """Find all nodes matching the path.
+
+        Args:
+            data: Parsed JSON document
+
+        Returns:
+            Matching values in document order
+        """
+        nodes = [data]
+        for kind, arg in self.steps:
+            matched: list[Any] = []
+            for node in nodes:
+                if kind == "key":
+                    value = _walk_keys(node, (arg,))
+                    if value is not _MISSING:
+                        matched.append(value)
+                elif kind == "index":
+                    if isinstance(node, list) and -len(node) <= arg < len(node):
+                        matched.append(node[arg])
+                else:
+                    children = (
+                        node.values() if isinstance(node, dict)
+                        else node if isinstance(node, list)
+                        else ()
+                    )
+                    if kind == "wildcard":
+                        matched.extend(children)
+                    else:
+                        matched.extend(child for child in children if arg(child))
+            nodes = matched
+            if not nodes:
+                break
+        return nodes
+
+    def get(self, data: Any, default: Any = _REQUIRED) -> Any:
+        """Extract the value at the path.
+
+        Definite paths return the single matching value; paths with wildcards
+        or filters return the list of matches.
+
+        Args:
+            data: Parsed JSON document
+            default: Value returned when nothing matches
+
+        Returns:
+            Extracted value
+
+        Raises:
+            KeyError: If nothing matches and no default was given
+        """
+        if self.is_definite:
+            node = data
+            for kind, arg in self.steps:
+                if kind == "key":
+                    node = _walk_keys(node, (arg,))
+                elif isinstance(node, list) and -len(node) <= arg < len(node):
+                    node = node[arg]
+                else:
+                    node = _MISSING
+                if node is _MISSING:
+                    break
+            if node is not _MISSING:
+                return node
+        else:
+            matches = self.find(data)
+            if matches:
+                return matches
+
+        if default is _REQUIRED:
+            raise KeyError(self.path)
+        return default
+
+    def exists(self, data: Any) -> bool:
+        """Check whether the path matches anything.
+
+        Args:
+            data: Parsed JSON document
+
+        Returns:
+            True if at least one node matches
+        """
+        return self.get(data, _MISSING) is not _MISSING
+
+    def __repr__(self) -> str:
+        return f"JsonPath({self.path!r})"
+
+
+@lru_cache(maxsize=1024)
+def compile_path(path: str) -> JsonPath:
+    """Parse a JSON path, caching the result.
+
+    Args:
+        path: Path expression
+
+    Returns:
+        Compiled path
+
+    Raises:
+        ValueError: If the path cannot be parsed
+    """
+    return JsonPath(path)
+
+
+@lru_cache(maxsize=256)
+def compile_regex(pattern: str, flags: int = 0) -> re.Pattern[str]:
+    """Compile a regex, caching the result.
+
+    Args:
+        pattern: Regular expression
+        flags: re flags
+
+    Returns:
+        Compiled pattern
+    """
+    return re.compile(pattern, flags)
+
+
+class _ResponseView:
+    """Lazily derived lookups shared by all extractions from one response."""
+
+    __slots__ = ("response", "_json", "_headers", "_lower_headers")
+
+    def __init__(self, response: Mapping[str, Any]):
+        self.response = response
+        self._json: Any = _MISSING
+        self._headers: Mapping[str, Any] | None = None
+        self._lower_headers: dict[str, Any] | None = None
+
+    @property
+    def json(self) -> Any:
+        if self._json is _MISSING:
+            self._json = self.response.get("json") or {}
+        return self._json
+
+    def header(self, name: str) -> Any:
+        headers = self._headers
+        if headers is None:
+            headers = self._headers = self.response.get("headers") or {}
+        if name in headers:
+            return headers[name]
+        if self._lower_headers is None:
+            self._lower_headers = {str(k).lower(): v for k, v in headers.items()}
+        return self._lower_headers.get(name.lower(), _MISSING)
+
+    @property
+    def text(self) -> str:
+        return self.response.get("text") or ""
+
+
+def _extract_one(
+    view: _ResponseView,
+    json_path: str | None = None,
+    header_name: str | None = None,
+    regex_pattern: str | None = None,
+) -> Any:
+    """Apply one extraction rule to a response view."""
+    provided = sum(
+        [json_path is not None, header_name is not None, regex_pattern is not None]
+    )
+    if provided == 0:
+        raise ValueError("必须提供 json_path, header_name, 或 regex_path 之一")
+    if provided > 1:
+        raise ValueError("只能提供一个提取方式")
+
+    if json_path is not None:
+        value = compile_path(json_path).get(view.json, _MISSING)
+        if value is _MISSING:
+            raise ValueError(f"JSON 路径不存在: {json_path}")
+        return value
+
+    if header_name is not None:
+        value = view.header(header_name)
+        if value is _MISSING:
+            raise ValueError(f"响应头不存在: {header_name}")
+        return value
+
+    match = compile_regex(regex_pattern).search(view.text)
+    if not match:
+        raise ValueError(f"正则表达式未匹配: {regex_pattern}")
+    return match.group(1) if match.groups() else match.group(0)
+
+
+def extract(
+    response: Mapping[str, Any],
+    json_path: str | None = None,
+    header_name: str | None = None,
+    regex_pattern: str | None = None,
+) -> Any:
+    """Extract one value from an HTTP response.
+
+    Args:
+        response: HTTP response dict (http_request return value)
+        json_path: JSON path into the response body
+        header_name: Response header name
+        regex_pattern: Regex applied to the response text (group 1 if present)
+
+    Returns:
+        Extracted value
+
+    Raises:
+        ValueError: If not exactly one rule is given or nothing matches
+    """
+    return _extract_one(_ResponseView(response), json_path, header_name, regex_pattern)
+
+
+def extract_many(
+    response: Mapping[str, Any], rules: Mapping[str, str | Mapping[str, Any]]
+) -> dict[str, Any]:
+    """Extract several variables from one response.
+
+    The response body, headers and text are looked up once and shared across
+    all rules.
+
+    Args:
+        response: HTTP response dict (http_request return value)
+        rules: Variable name to a JSON path string, or to a dict with one of
+            ``json_path`` / ``header_name`` / ``regex_pattern``
+
+    Returns:
+        Extracted values by variable name
+
+    Raises:
+        ValueError: If any rule is invalid or does not match
+    """
+    view = _ResponseView(response)
+    values: dict[str, Any] = {}
+    for name, rule in rules.items():
+        try:
+            if isinstance(rule, str):
+                values[name] = _extract_one(view, json_path=rule)
+            else:
+                values[name] = _extract_one(
+                    view,
+                    json_path=rule.get("json_path"),
+                    header_name=rule.get("header_name"),
+                    regex_pattern=rule.get("regex_pattern"),
+                )
+        except ValueError as e:
+            raise ValueError(f"{name}: {e}") from e
+    return values
@@ -0,0 +1,195 @@
+"""Incremental reading of large JSON (or YAML) import files.
+
+JSON values under a prefix are parsed one at a time with ijson, so only the
+current item is held in memory (ijson prefixes: ``paths`` for the keys of
+the ``paths`` object, ``log.entries.item`` for the elements of the
+``log.entries`` array). Each read re-scans the file from the start, which
+keeps memory flat at the cost of one pass per read; ``values`` reads several
+small header fields in a single pass.
+
+YAML documents are loaded once and the same prefixes are resolved in memory.
+"""
+
+from collections.abc import Iterator
+from typing import IO, Any
+
+import ijson
+
+try:
+    import yaml
+except ImportError:  # pragma: no cover - PyYAML is optional
+    yaml = None
+
+_MISSING = object()
+
+_UTF8_BOM = b"\xef\xbb\xbf"
+
+
+def _resolve(node: Any, parts: list[str]) -> Iterator[Any]:
+    """Yield the values at an ijson-style prefix of a loaded document."""
+    if not parts:
+        yield node
+        return
+    head, rest = parts[0], parts[1:]
+    # "item" is an array element, unless the node is an object (Postman
+    # collections have a key named "item")
+    if head == "item" and isinstance(node, list):
+        for element in node:
+            yield from _resolve(element, rest)
+    elif isinstance(node, dict) and head in node:
+        yield from _resolve(node[head], rest)
+
+
+class JsonSource:
+    """A JSON or YAML import document, read by prefix."""
+
+    def __init__(self, fp: IO[bytes]):
+        """Initialize JSON source.
+
+        Args:
+            fp: Seekable binary file object (rewound before each read)
+
+        Raises:
+            ValueError: If the document is YAML and PyYAML is not installed
+        """
+        self.fp = fp
+        self._document: Any = _MISSING
+        # Offset of the document after any byte order mark
+        self._start = 0
+        self.is_json = self._looks_like_json()
+        self.streaming = self.is_json
+        if not self.is_json and yaml is None:
+            raise ValueError("YAML documents require PyYAML")
+
+    def _looks_like_json(self) -> bool:
+        """Whether the document starts like JSON (rather than YAML)."""
+        self.fp.seek(0)
+        head = self.fp.read(1024)
+        if head.startswith(_UTF8_BOM):
+            self._start = len(_UTF8_BOM)
+        return head[self._start :].lstrip(b" \t\r\n")[:1] in (b"{", b"[")
+
+    def _load(self) -> Any:
+        """Load the whole document (YAML)."""
+        if self._document is _MISSING:
+            if yaml is None:  # pragma: no cover - checked in __init__
+                raise ValueError("YAML documents require PyYAML")
+            self.fp.seek(0)
+            try:
+                self._document = yaml.safe_load(self.fp)
+            except yaml.YAMLError as e:
+                raise ValueError(f"Invalid YAML document: {e}") from e
+        return self._document
+
+    def items(self, prefix: str) -> Iterator[Any]:
+        """Iterate the values at a prefix.
+
+        Args:
+            prefix: ijson prefix, e.g. ``log.entries.item``
+
+        Yields:
+            Values, one at a time
+
+        Raises:
+            ValueError: If the document is malformed
+        """
+        if not self.streaming:
+            yield from _resolve(self._load(), prefix.split(".") if prefix else [])
+            return
+        self.fp.seek(self._start)
+        try:
+            yield from ijson.items(self.fp, prefix, use_float=True)
+        except ijson.JSONError as e:
+            raise ValueError(f"Invalid JSON document: {e}") from e
+
+    def kvitems(self, prefix: str) -> Iterator[tuple[str, Any]]:
+        """Iterate the key/value pairs of the object at a prefix.
+
+        Args:
+            prefix: ijson prefix, e.g. ``paths``
+
+        Yields:
+            (key, value) pairs, one at a time
+
+        Raises:
+            ValueError: If the document is malformed
+        """
+        if not self.streaming:
+            for node in _resolve(self._load(), prefix.split(".") if prefix else []):
+                if isinstance(node, dict):
+                    yield from node.items()
+            return
+        self.fp.seek(self._start)
+        try:
+            yield from ijson.kvitems(self.fp, prefix, use_float=True)
+        except ijson.JSONError as e:
+            raise ValueError(f"Invalid JSON document: {e}") from e
+
+    def values(self, *prefixes: str) -> dict[str, Any]:
+        """Get the first value at each of several prefixes in one pass.
+
+        The scan stops as soon as every prefix has been seen, so reading a
+        few header fields costs at most one pass even if some are absent.
+
+        Args:
+            *prefixes: ijson prefixes, e.g. ``openapi``, ``swagger``
+
+        Returns:
+            Value by prefix, for the prefixes present in the document
+
+        Raises:
+            ValueError: If the document is malformed
+        """
+        found: dict[str, Any] = {}
+        if not self.streaming:
+            for prefix in prefixes:
+                value = next(_resolve(self._load(), prefix.split(".")), _MISSING)
+                if value is not _MISSING:
+                    found[prefix] = value
+            return found
+
+        wanted = set(prefixes)
+        builder: ijson.ObjectBuilder | None = None
+        target, depth = "", 0
+        self.fp.seek(self._start)
+        try:
+            for prefix, event, value in ijson.parse(self.fp, use_float=True):
+                if builder is not None:
+                    # Inside a container value: build it up to its end event
+                    if event in ("start_map", "start_array"):
+                        depth += 1
+                    elif event in ("end_map", "end_array"):
+                        depth -= 1
+                    if depth == 0:
+                        found[target] = builder.value
+                        builder = None
+                        if len(found) == len(wanted):
+                            break
+                    else:
+                        builder.event(event, value)
+                    continue
+                if prefix not in wanted or prefix in found:
+                    continue
+                if event in ("start_map", "start_array"):
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                    target, depth = prefix, 1
+                elif event not in ("end_map", "end_array", "map_key"):
+                    found[prefix] = value
+                    if len(found) == len(wanted):
+                        break
+        except ijson.JSONError as e:
+            raise ValueError(f"Invalid JSON document: {e}") from e
+        return found
+
+    def value(self, prefix: str, default: Any = None) -> Any:
+        """Get the first value at a prefix.
+
+        Args:
+            prefix: ijson prefix, e.g. ``basePath``
+            default: Value if the prefix is absent
+
+        Returns:
+            The value or default
+        """
+        return next(self.items(prefix), default)
@@ -0,0 +1,132 @@
+"""Log-linear latency histogram for load test statistics."""
+
+import math
+
+
+class LatencyHistogram:
+    """HDR-style latency histogram with bounded relative error.
+
+    Values are recorded in microseconds into log-linear buckets: every power
+    of two is split into ``2 ** (significant_bits - 1)`` linear sub-buckets,
+    so memory stays proportional to the value range (not the sample count)
+    and any reported percentile is within ``1 / 2 ** (significant_bits - 1)``
+    of the true value.
+    """
+
+    def __init__(self, significant_bits: int = 8):
+        """Initialize latency histogram.
+
+        Args:
+            significant_bits: Mantissa bits per bucket (default: 8, < 1% error)
+        """
+        if significant_bits < 2:
+            raise ValueError("significant_bits must be at least 2")
+
+        self.significant_bits = significant_bits
+        self._half = 1 << (significant_bits - 1)
+        self._exact_limit = 1 << significant_bits
+        self._counts: dict[int, int] = {}
+        self.count = 0
+        self.total_us = 0
+        self.min_us: int | None = None
+        self.max_us: int | None = None
+
+    def _bucket_index(self, value_us: int) -> int:
+        """Map a value to its bucket index."""
+        if value_us < self._exact_limit:
+            return value_us
+        shift = value_us.bit_length() - self.significant_bits
+        return (shift << (self.significant_bits - 1)) + (value_us >> shift)
+
+    def _bucket_value(self, index: int) -> int:
+        """Get the representative (midpoint) value of a bucket."""
+        if index < self._exact_limit:
+            return index
+        shift = index // self._half - 1
+        mantissa = index - shift * self._half
+        lower = mantissa << shift
+        upper = ((mantissa + 1) << shift) - 1
+        return (lower + upper) // 2
+
+    def record(self, value_ms: float) -> None:
+        """Record a latency sample.
+
+        Args:
+            value_ms: Latency in milliseconds
+        """
+        value_us = max(0, int(value_ms * 1000))
+        index = self._bucket_index(value_us)
+        self._counts[index] = self._counts.get(index, 0) + 1
+        self.count += 1
+        self.total_us += value_us
+        if self.min_us is None or value_us < self.min_us:
+            self.min_us = value_us
+        if self.max_us is None or value_us > self.max_us:
+            self.max_us = value_us
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Merge another histogram into this one.
+
+        Args:
+            other: Histogram recorded with the same significant_bits
+
+        Raises:
+            ValueError: If the histograms use different precision
+        """
+        if other.significant_bits != self.significant_bits:
+            raise ValueError("Cannot merge histograms with different precision")
+
+        for index, count in other._counts.items():
+            self._counts[index] = self._counts.get(index, 0) + count
+        self.count += other.count
+        self.total_us += other.total_us
+        if other.min_us is not None and (self.min_us is None or other.min_us < self.min_us):
+            self.min_us = other.min_us
+        if other.max_us is not None and (self.max_us is None or other.max_us > self.max_us):
+            self.max_us = other.max_us
+
+    def percentile(self, percent: float) -> float | None:
+        """Get the latency at a given percentile.
+
+        Args:
+            percent: Percentile in range [0, 100]
+
+        Returns:
+            Latency in milliseconds, or None if nothing was recorded
+        """
+        if self.count == 0:
+            return None
+
+        rank = max(1, math.ceil(percent / 100 * self.count))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= rank:
+                # Clamp to the exact extremes so p0/p100 are never approximated
+                value_us = min(max(self._bucket_value(index), self.min_us or 0), self.max_us or 0)
+                return value_us / 1000
+
+        return (self.max_us or 0) / 1000
+
+    @property
+    def mean(self) -> float | None:
+        """Mean latency in milliseconds."""
+        if self.count == 0:
+            return None
+        return self.total_us / self.count / 1000
+
+    def summary(self) -> dict[str, float | int | None]:
+        """Get summary statistics.
+
+        Returns:
+            Dict with count, min/max/mean and p50/p95/p99 in milliseconds
+        """
+        return {
+            "count": self.count,
+            "min_ms": self.min_us / 1000 if self.min_us is not None else None,
+            "max_ms": self.max_us / 1000 if self.max_us is not None else None,
+            "mean_ms": self.mean,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+        }
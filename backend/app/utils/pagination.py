@@ -0,0 +1,231 @@
+"""Keyset (cursor) pagination helpers.
+
+Offset pagination re-reads every skipped row, so deep pages get slower as a
+table grows. Keyset pagination instead remembers the sort key of the last row
+returned, e.g. ``(created_at, id)``, and the next page starts with
+``WHERE (created_at, id) < (:created_at, :id)``. Backed by an index on the
+same columns, every page costs the same.
+
+Cursors are opaque to clients: base64url-encoded JSON of the sort key. The
+trailing primary key makes every key unique, so rows with equal timestamps
+are neither skipped nor repeated.
+"""
+
+import base64
+import binascii
+import json
+from collections.abc import Hashable, Sequence
+from datetime import date, datetime
+from typing import Any
+
+from sqlalchemy import DateTime, Select, func, literal, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql.functions import FunctionElement
+
+from app.config import settings
+from app.utils.ttl_cache import TTLCache
+
+# Totals for cursor pages, keyed by list name and filters
+_total_cache = TTLCache(ttl=settings.PAGINATION_TOTAL_TTL_SECONDS)
+
+# Response header carrying the next page's cursor (absent on the last page)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# OpenAPI description of the header, for list routes supporting cursors
+CURSOR_PAGE_RESPONSES: dict[int | str, dict[str, Any]] = {
+    200: {
+        "headers": {
+            NEXT_CURSOR_HEADER: {
+                "description": "Cursor of the next page (cursor mode only, absent on the last page)",
+                "schema": {"type": "string"},
+            }
+        }
+    }
+}
+
+
+class _sort_value(FunctionElement):  # noqa: N801
+    """A sort key value as compared and ordered by keyset pagination.
+
+    Renders as the bare expression, so PostgreSQL can use the index. SQLite
+    stores datetimes as text whose format depends on how they were written
+    (``CURRENT_TIMESTAMP`` has no fraction, bound values always do), so there
+    the value is compared as ``julianday()``.
+    """
+
+    name = "sort_value"
+    inherit_cache = True
+
+
+@compiles(_sort_value)
+def _compile_sort_value(element, compiler, **kw):
+    return compiler.process(element.clauses, **kw)
+
+
+@compiles(_sort_value, "sqlite")
+def _compile_sort_value_sqlite(element, compiler, **kw):
+    return f"julianday({compiler.process(element.clauses, **kw)})"
+
+
+def _sort_key(column: InstrumentedAttribute, value: Any = None, bind: bool = False) -> Any:
+    """Sort key expression for a column, or for a cursor value of it."""
+    expr = literal(value, column.type) if bind else column
+    return _sort_value(expr) if isinstance(column.type, DateTime) else expr
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize datetimes in cursors as ISO strings."""
+    if isinstance(value, date | datetime):
+        return value.isoformat()
+    raise TypeError(f"Unsupported cursor value: {value!r}")
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode a sort key as an opaque cursor.
+
+    Args:
+        values: Sort key values of the last row on a page
+
+    Returns:
+        URL-safe cursor string
+    """
+    raw = json.dumps(list(values), default=_json_default, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: Sequence[InstrumentedAttribute]) -> list[Any]:
+    """Decode a cursor back into sort key values.
+
+    Args:
+        cursor: Cursor from encode_cursor
+        columns: Sort key columns, used to restore value types
+
+    Returns:
+        Sort key values
+
+    Raises:
+        ValueError: If the cursor is malformed or doesn't match the columns
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(values, list) or len(values) != len(columns):
+        raise ValueError("Invalid cursor")
+
+    decoded = []
+    for column, value in zip(columns, values, strict=True):
+        python_type = column.type.python_type
+        try:
+            if value is None:
+                decoded.append(None)
+            elif python_type is datetime:
+                decoded.append(datetime.fromisoformat(value))
+            elif python_type is date:
+                decoded.append(date.fromisoformat(value))
+            else:
+                decoded.append(python_type(value))
+        except (TypeError, ValueError) as e:
+            raise ValueError("Invalid cursor") from e
+    return decoded
+
+
+def keyset_order(columns: Sequence[InstrumentedAttribute], descending: bool = False) -> list[Any]:
+    """ORDER BY clauses matching keyset_page.
+
+    Args:
+        columns: Sort key columns
+        descending: Sort newest/largest first
+
+    Returns:
+        Order by expressions
+    """
+    keys = [_sort_key(column) for column in columns]
+    return [key.desc() for key in keys] if descending else keys
+
+
+def keyset_page(
+    query: Select,
+    columns: Sequence[InstrumentedAttribute],
+    cursor: str | None,
+    limit: int,
+    descending: bool = False,
+) -> Select:
+    """Restrict a query to the page after a cursor.
+
+    Fetches one extra row so next_cursor can tell whether more pages exist.
+
+    Args:
+        query: Filtered query, without ordering or limits
+        columns: Sort key columns, ending with a unique column (e.g. id)
+        cursor: Cursor of the previous page (None: first page)
+        limit: Page size
+        descending: Sort newest/largest first
+
+    Returns:
+        Ordered, limited query
+
+    Raises:
+        ValueError: If the cursor is invalid
+    """
+    if cursor:
+        key = tuple_(*(_sort_key(column) for column in columns))
+        values = tuple_(
+            *(
+                _sort_key(column, value, bind=True)
+                for column, value in zip(columns, decode_cursor(cursor, columns), strict=True)
+            )
+        )
+        query = query.where(key < values if descending else key > values)
+    return query.order_by(*keyset_order(columns, descending)).limit(limit + 1)
+
+
+def next_cursor(
+    rows: list[Any], columns: Sequence[InstrumentedAttribute], limit: int
+) -> tuple[list[Any], str | None]:
+    """Split off the extra row fetched by keyset_page.
+
+    Args:
+        rows: Rows (model instances) returned by the keyset_page query
+        columns: Sort key columns
+        limit: Page size
+
+    Returns:
+        Tuple of (page rows, cursor of the next page or None on the last page)
+    """
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor([getattr(last, column.key) for column in columns])
+
+
+async def cached_total(session: AsyncSession, query: Select, key: Hashable) -> int:
+    """Count the rows of a filtered query, cached for a short time.
+
+    Cursor pages don't need an exact total on every request, so the count
+    is shared by all pages (and clients) with the same filters for
+    PAGINATION_TOTAL_TTL_SECONDS.
+
+    Args:
+        session: Database session
+        query: Filtered query, without ordering or limits
+        key: Cache key identifying the list and its filters
+
+    Returns:
+        Row count (possibly slightly stale)
+    """
+    found, total = _total_cache.get(key)
+    if found:
+        return total
+    total = await session.scalar(select(func.count()).select_from(query.order_by(None).subquery()))
+    _total_cache.set(key, total or 0)
+    return total or 0
+
+
+def clear_total_cache() -> None:
+    """Drop all cached totals."""
+    _total_cache.clear()
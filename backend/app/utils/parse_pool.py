@@ -0,0 +1,107 @@
+"""Process pool for CPU-bound import parsing.
+
+Parsing thousands of import items (e.g. cURL commands) in the API process
+would block the event loop for the whole batch. Large batches are split into
+one chunk per worker and parsed in a shared ProcessPoolExecutor; small ones
+are parsed in a thread, where a process round trip would cost more than it
+saves. Chunk functions must be module-level so they can be pickled.
+
+Streaming parsers (e.g. OpenAPI or HAR documents read with ijson) can't be
+split up front; ``iterate_in_thread`` runs them in a thread instead and
+hands items back to the event loop in batches.
+"""
+
+import asyncio
+import itertools
+import os
+from collections.abc import AsyncIterator, Callable, Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, TypeVar
+
+from app.config import settings
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Batches smaller than this are parsed in a thread
+_MIN_POOL_ITEMS = 200
+
+_parse_pool: ProcessPoolExecutor | None = None
+
+
+def _workers() -> int:
+    """Configured worker count (CPU count when 0)."""
+    return settings.IMPORT_PARSE_WORKERS or os.cpu_count() or 1
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    """Get the process-wide parse pool, starting it if needed."""
+    global _parse_pool
+    if _parse_pool is None:
+        _parse_pool = ProcessPoolExecutor(max_workers=_workers())
+    return _parse_pool
+
+
+async def parse_in_pool(func: Callable[[Sequence[T]], list[R]], items: Sequence[T]) -> list[R]:
+    """Apply a chunk function to items, in worker processes if worthwhile.
+
+    Args:
+        func: Module-level function mapping a chunk of items to one result
+            per item
+        items: Items to parse
+
+    Returns:
+        Results in item order
+    """
+    workers = _workers()
+    if len(items) < _MIN_POOL_ITEMS or workers < 2:
+        return await asyncio.to_thread(func, items)
+
+    size = max(-(-len(items) // workers), _MIN_POOL_ITEMS // 2)
+    chunks = [items[start : start + size] for start in range(0, len(items), size)]
+    loop = asyncio.get_running_loop()
+    try:
+        parts = await asyncio.gather(
+            *(loop.run_in_executor(_get_pool(), func, chunk) for chunk in chunks)
+        )
+    except BrokenProcessPool:
+        # A worker died (e.g. killed by the OOM killer): retry once in-process
+        shutdown_parse_pool()
+        return await asyncio.to_thread(func, items)
+
+    results: list[Any] = []
+    for part in parts:
+        results.extend(part)
+    return results
+
+
+async def iterate_in_thread(items: Iterable[T], batch_size: int = 500) -> AsyncIterator[T]:
+    """Iterate a blocking iterable without blocking the event loop.
+
+    Each batch is pulled from the iterable in a worker thread, so the work
+    done by a lazy parser happens off the loop with one hand-off per batch.
+    Exceptions raised by the iterable propagate to the caller.
+
+    Args:
+        items: Iterable (typically a generator reading a file)
+        batch_size: Items pulled per thread hand-off
+
+    Yields:
+        Items in order
+    """
+    iterator = iter(items)
+    while True:
+        batch = await asyncio.to_thread(list, itertools.islice(iterator, batch_size))
+        if not batch:
+            return
+        for item in batch:
+            yield item
+
+
+def shutdown_parse_pool() -> None:
+    """Stop the parse pool if it was started."""
+    global _parse_pool
+    if _parse_pool is not None:
+        _parse_pool.shutdown(wait=False, cancel_futures=True)
+        _parse_pool = None
@@ -0,0 +1,347 @@
+"""Out-of-process sandbox pool for user function and keyword code.
+
+User code (``GlobalParam.code``, ``{{}}`` expressions) normally runs inside
+the API process, where a slow function blocks the event loop. This pool runs
+it in pre-forked worker processes instead:
+
+* each worker applies an address-space rlimit at startup and a CPU-time
+  rlimit before every batch, so the budget covers one batch rather than the
+  worker's lifetime;
+* compiled user functions are cached per worker, keyed by a hash of their
+  source, so repeated calls skip ``exec``;
+* requests are sent in batches, one round trip per batch.
+
+A worker that exceeds its limits (or a batch that times out) takes the pool
+down with it; the pool is then rebuilt and the batch fails with ValueError.
+Other batches still in flight on the old pool fail with ValueError too.
+"""
+
+import asyncio
+import hashlib
+import math
+import multiprocessing
+import os
+import pickle
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+
+from app.config import settings
+from app.utils.function_executor import BUILTIN_FUNCTIONS, FunctionExecutor
+
+# Per-worker cache of executors keyed by the hash of their function sources
+_WORKER_EXECUTORS: dict[str, FunctionExecutor] = {}
+_MAX_CACHED_EXECUTORS = 32
+
+
+def sources_key(sources: Mapping[str, str]) -> str:
+    """Hash a set of function sources.
+
+    Args:
+        sources: Function name to source code
+
+    Returns:
+        Stable hex digest
+    """
+    digest = hashlib.sha256()
+    for name in sorted(sources):
+        digest.update(name.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(sources[name].encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _init_worker(memory_mb: int) -> None:
+    """Apply the memory limit in a freshly started worker."""
+    try:
+        import resource
+    except ImportError:  # pragma: no cover - non-POSIX platforms
+        return
+
+    if memory_mb > 0:
+        limit = memory_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def _limit_batch_cpu(cpu_seconds: int) -> None:
+    """Allow the worker cpu_seconds more CPU time from now on.
+
+    RLIMIT_CPU counts the process's total CPU time, so the soft limit is
+    moved to the current usage plus the budget before each batch. The hard
+    limit is left alone so later batches can raise the soft limit again.
+    """
+    if cpu_seconds <= 0:
+        return
+    try:
+        import resource
+    except ImportError:  # pragma: no cover - non-POSIX platforms
+        return
+
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    soft = math.ceil(usage.ru_utime + usage.ru_stime) + cpu_seconds
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def _worker_executor(key: str, sources: Mapping[str, str]) -> FunctionExecutor:
+    """Get (or build and cache) the executor for a set of sources."""
+    executor = _WORKER_EXECUTORS.get(key)
+    if executor is not None:
+        return executor
+
+    functions = dict(BUILTIN_FUNCTIONS)
+    for name, code in sources.items():
+        try:
+            namespace: dict[str, Any] = {}
+            exec(code, namespace)
+            if callable(namespace.get(name)):
+                functions[name] = namespace[name]
+        except Exception:
+            # Skip invalid functions, same as GlobalParamService
+            pass
+
+    if len(_WORKER_EXECUTORS) >= _MAX_CACHED_EXECUTORS:
+        _WORKER_EXECUTORS.pop(next(iter(_WORKER_EXECUTORS)))
+    executor = FunctionExecutor(functions)
+    _WORKER_EXECUTORS[key] = executor
+    return executor
+
+
+def _picklable(value: Any) -> Any:
+    """Return value if it can be sent back to the parent, else its repr."""
+    try:
+        pickle.dumps(value)
+        return value
+    except Exception:
+        return repr(value)
+
+
+def _warm_up() -> None:
+    """Worker entry point that does nothing; submitting it starts a worker."""
+
+
+def _run_batch(
+    key: str,
+    sources: Mapping[str, str],
+    requests: Sequence[tuple[str, str, Mapping[str, Any]]],
+    cpu_seconds: int = 0,
+) -> list[tuple[bool, Any]]:
+    """Worker entry point: run a batch of eval/parse requests."""
+    _limit_batch_cpu(cpu_seconds)
+    executor = _worker_executor(key, sources)
+
+    results: list[tuple[bool, Any]] = []
+    for kind, text, context in requests:
+        try:
+            if kind == "eval":
+                results.append((True, _picklable(executor.execute_function(text, context))))
+            else:
+                results.append((True, _picklable(executor.parse_text(text, context))))
+        except Exception as e:
+            results.append((False, str(e) or type(e).__name__))
+    return results
+
+
+class _TrackingContext:
+    """Multiprocessing context that remembers the processes it creates.
+
+    Lets the pool terminate hung workers without reaching into
+    ProcessPoolExecutor internals.
+    """
+
+    def __init__(self) -> None:
+        self._context = multiprocessing.get_context()
+        self.processes: list[Any] = []
+
+    def Process(self, *args: Any, **kwargs: Any) -> Any:  # noqa: N802 - context API
+        process = self._context.Process(*args, **kwargs)
+        self.processes.append(process)
+        return process
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._context, name)
+
+
+class SandboxPool:
+    """Pool of worker processes evaluating user code under resource limits."""
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        cpu_seconds: int | None = None,
+        memory_mb: int | None = None,
+        timeout_seconds: float | None = None,
+    ):
+        """Initialize sandbox pool (workers start on first use).
+
+        Args:
+            max_workers: Worker processes (default from settings, 0: CPU count)
+            cpu_seconds: CPU-time limit per batch
+            memory_mb: Address-space limit per worker process
+            timeout_seconds: Wall-clock timeout per batch
+        """
+        workers = max_workers if max_workers is not None else settings.SANDBOX_WORKERS
+        self.max_workers = workers or os.cpu_count() or 1
+        self.cpu_seconds = (
+            cpu_seconds if cpu_seconds is not None else settings.SANDBOX_CPU_SECONDS
+        )
+        self.memory_mb = memory_mb if memory_mb is not None else settings.SANDBOX_MEMORY_MB
+        self.timeout_seconds = (
+            timeout_seconds if timeout_seconds is not None else settings.SANDBOX_TIMEOUT_SECONDS
+        )
+        self._pool: ProcessPoolExecutor | None = None
+        self._context: _TrackingContext | None = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Get the process pool, starting it if needed."""
+        if self._pool is None:
+            self._context = _TrackingContext()
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=self._context,  # type: ignore[arg-type]
+                initializer=_init_worker,
+                initargs=(self.memory_mb,),
+            )
+        return self._pool
+
+    def start(self) -> None:
+        """Start the worker processes now so the first batch does not wait for them."""
+        pool = self._get_pool()
+        # ProcessPoolExecutor spawns a worker per submitted task while none is idle
+        for _ in range(self.max_workers):
+            pool.submit(_warm_up)
+
+    def _reset(self, pool: ProcessPoolExecutor) -> None:
+        """Discard a broken or hung pool so the next call starts fresh.
+
+        Does nothing if the pool was already replaced, so a late failure from
+        an old pool never tears down its successor. Batches still queued or
+        running on the discarded pool fail with BrokenProcessPool.
+        """
+        if self._pool is not pool:
+            return
+        pool.shutdown(wait=False)
+        # Hung workers never return, so stop them instead of waiting
+        if self._context is not None:
+            for process in self._context.processes:
+                if process.is_alive():
+                    process.terminate()
+        self._pool = None
+        self._context = None
+
+    async def run_batch(
+        self,
+        sources: Mapping[str, str],
+        requests: Sequence[tuple[str, str, Mapping[str, Any]]],
+    ) -> list[tuple[bool, Any]]:
+        """Run a batch of requests in one worker round trip.
+
+        Args:
+            sources: User function name to source code
+            requests: (kind, text, context) tuples; kind is "eval" (text is
+                an expression) or "parse" (text contains {{}} placeholders)
+
+        Returns:
+            (ok, value) per request; value is the error message when not ok
+
+        Raises:
+            ValueError: If the worker crashed, hit its limits or timed out, or
+                the pool was restarted by another batch while this one ran
+        """
+        if not requests:
+            return []
+
+        key = sources_key(sources)
+        payload = [(kind, text, dict(context)) for kind, text, context in requests]
+        loop = asyncio.get_running_loop()
+        pool = self._get_pool()
+        try:
+            return await asyncio.wait_for(
+                loop.run_in_executor(pool, _run_batch, key, sources, payload, self.cpu_seconds),
+                timeout=self.timeout_seconds,
+            )
+        except BrokenProcessPool as e:
+            if pool is not self._pool:
+                raise ValueError(
+                    "Sandbox pool was restarted after another batch failed; retry the request"
+                ) from e
+            self._reset(pool)
+            raise ValueError("Sandbox worker crashed or exceeded its resource limits") from e
+        except asyncio.TimeoutError as e:
+            self._reset(pool)
+            raise ValueError(f"Sandbox execution timed out after {self.timeout_seconds}s") from e
+
+    async def execute_function(
+        self, sources: Mapping[str, str], call_expr: str, context: Mapping[str, Any]
+    ) -> Any:
+        """Evaluate one expression in the sandbox.
+
+        Args:
+            sources: User function name to source code
+            call_expr: Expression (e.g. "random_string(8)")
+            context: Execution context variables
+
+        Returns:
+            Expression result
+
+        Raises:
+            ValueError: If evaluation fails
+        """
+        [(ok, value)] = await self.run_batch(sources, [("eval", call_expr, context)])
+        if not ok:
+            raise ValueError(value)
+        return value
+
+    async def parse_text(
+        self, sources: Mapping[str, str], text: str, context: Mapping[str, Any]
+    ) -> tuple[str, list[str], bool, str]:
+        """Replace {{}} placeholders in text using the sandbox.
+
+        Args:
+            sources: User function name to source code
+            text: Text containing placeholders
+            context: Execution context variables
+
+        Returns:
+            Tuple of (parsed_text, functions_called, success, error_message)
+        """
+        [(ok, value)] = await self.run_batch(sources, [("parse", text, context)])
+        if not ok:
+            return text, [], False, value
+        return value
+
+    def shutdown(self) -> None:
+        """Stop all worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+            self._context = None
+
+
+_sandbox_pool: SandboxPool | None = None
+
+
+def get_sandbox_pool() -> SandboxPool | None:
+    """Get the process-wide sandbox pool.
+
+    Returns:
+        SandboxPool instance, or None if SANDBOX_ENABLED is off
+    """
+    global _sandbox_pool
+    if not settings.SANDBOX_ENABLED:
+        return None
+    if _sandbox_pool is None:
+        _sandbox_pool = SandboxPool()
+    return _sandbox_pool
+
+
+def shutdown_sandbox_pool() -> None:
+    """Stop the process-wide sandbox pool if it was started."""
+    global _sandbox_pool
+    if _sandbox_pool is not None:
+        _sandbox_pool.shutdown()
+        _sandbox_pool = None
@@ -0,0 +1,154 @@
+"""Set-based row copies (INSERT ... SELECT) with id remapping."""
+
+from collections.abc import Mapping, Sequence
+from typing import Any, cast
+
+from sqlalchemy import ColumnElement, CursorResult, case, func, insert, literal, null, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Remapped keys per INSERT statement (two bound parameters each)
+_BATCH = 1000
+
+# Columns left to their server defaults in copies
+_SERVER_DEFAULTS = ("created_at", "updated_at")
+
+
+def remap(column: Any, mapping: Mapping[int, int], else_: Any = None) -> ColumnElement[Any]:
+    """Expression translating old ids to new ones.
+
+    Args:
+        column: Column holding old ids
+        mapping: New id by old id
+        else_: Value for ids missing from mapping (default NULL)
+
+    Returns:
+        ``CASE column WHEN old THEN new ... ELSE else_ END``
+    """
+    if not mapping:
+        return null() if else_ is None else else_
+    return case(dict(mapping), value=column, else_=else_)
+
+
+async def allocate_ids(session: AsyncSession, model: Any, old_ids: Sequence[int]) -> dict[int, int]:
+    """Reserve new primary keys for copies of rows.
+
+    PostgreSQL draws them from the table's sequence, so concurrent inserts
+    never collide. Other databases take the ids above the current maximum;
+    SQLite serializes writers, so this is safe once the transaction has
+    written (the clone's root row is inserted first).
+
+    Args:
+        session: Database session
+        model: Model class with an integer ``id`` primary key
+        old_ids: Ids of the rows to copy
+
+    Returns:
+        New id by old id, both ascending (copies keep their relative order)
+    """
+    old_ids = sorted(old_ids)
+    if not old_ids:
+        return {}
+
+    if session.get_bind().dialect.name == "postgresql":
+        sequence = func.pg_get_serial_sequence(model.__tablename__, "id")
+        result = await session.execute(
+            select(func.nextval(sequence)).select_from(func.generate_series(1, len(old_ids)))
+        )
+        new_ids = sorted(result.scalars())
+    else:
+        result = await session.execute(select(func.coalesce(func.max(model.id), 0)))
+        start = result.scalar_one() + 1
+        new_ids = list(range(start, start + len(old_ids)))
+    return dict(zip(old_ids, new_ids, strict=True))
+
+
+def _copy_statement(
+    model: Any,
+    where: Sequence[ColumnElement[bool]],
+    values: Mapping[str, Any],
+    keep_id: bool,
+) -> Any:
+    """Build ``INSERT INTO t (...) SELECT ... FROM t WHERE ...``."""
+    table = model.__table__
+    names: list[str] = []
+    columns: list[Any] = []
+    for column in table.columns:
+        if column.name in _SERVER_DEFAULTS or (column.name == "id" and not keep_id):
+            continue
+        value = values.get(column.name, column)
+        if not isinstance(value, ColumnElement):
+            value = literal(value, type_=column.type)
+        names.append(column.name)
+        columns.append(value.label(column.name))
+    # Ordered by the source key so copies keep the originals' relative order
+    source = select(*columns).where(*where).order_by(*table.primary_key.columns)
+    return insert(table).from_select(names, source)
+
+
+async def copy_rows(
+    session: AsyncSession,
+    model: Any,
+    where: Sequence[ColumnElement[bool]],
+    values: Mapping[str, Any] | None = None,
+    key: str | None = None,
+    mapping: Mapping[int, int] | None = None,
+) -> int:
+    """Copy the rows matching ``where`` into the same table.
+
+    Every column is copied except ``id`` (assigned by the database) and the
+    timestamps (server defaults), unless overridden in ``values`` by a
+    constant or a SQL expression over the source row. With ``key`` and
+    ``mapping``, only rows whose key is in the mapping are copied and the key
+    is translated through it, in statements of _BATCH keys; ``key="id"``
+    inserts the ids from allocate_ids. Does not commit.
+
+    Args:
+        session: Database session
+        model: Model class of the rows
+        where: Conditions selecting the source rows
+        values: Replacement value or expression by column name
+        key: Column translated through mapping (e.g. "id" or a parent id)
+        mapping: New key value by old key value
+
+    Returns:
+        Number of rows copied
+    """
+    values = dict(values or {})
+    if key is None:
+        stmt = _copy_statement(model, where, values, keep_id=False)
+        result = cast(CursorResult[Any], await session.execute(stmt))
+        return result.rowcount
+
+    items = sorted((mapping or {}).items())
+    key_column = getattr(model, key)
+    copied = 0
+    for start in range(0, len(items), _BATCH):
+        chunk = dict(items[start : start + _BATCH])
+        stmt = _copy_statement(
+            model,
+            [*where, key_column.in_(list(chunk))],
+            {**values, key: remap(key_column, chunk)},
+            keep_id=key == "id",
+        )
+        result = cast(CursorResult[Any], await session.execute(stmt))
+        copied += result.rowcount
+    return copied
+
+
+async def copy_row(
+    session: AsyncSession, model: Any, row_id: int, values: Mapping[str, Any] | None = None
+) -> int:
+    """Copy one row by id.
+
+    Args:
+        session: Database session
+        model: Model class with an integer ``id`` primary key
+        row_id: Id of the row to copy
+        values: Replacement value or expression by column name
+
+    Returns:
+        Id of the copy
+    """
+    stmt = _copy_statement(model, [model.id == row_id], dict(values or {}), keep_id=False)
+    result = await session.execute(stmt.returning(model.__table__.c.id))
+    return result.scalar_one()
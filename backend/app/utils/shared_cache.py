@@ -0,0 +1,116 @@
+"""Execution-scoped shared variable cache with single-flight semantics."""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+
+class SharedVariableCache:
+    """Caches values shared by all scenarios of one execution.
+
+    The first caller for a key computes the value; concurrent callers for the
+    same key await that computation instead of repeating it (single-flight).
+    Values expire after an optional TTL. Failed computations are not cached:
+    everyone waiting on them gets the error and the next caller retries.
+    """
+
+    def __init__(self, default_ttl: float | None = None):
+        """Initialize shared variable cache.
+
+        Args:
+            default_ttl: Default time-to-live in seconds (None: never expires)
+        """
+        self.default_ttl = default_ttl
+        self._values: dict[Hashable, tuple[Any, float | None]] = {}
+        self._pending: dict[Hashable, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> tuple[bool, Any]:
+        """Look up a cached value without computing it.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Tuple of (found, value)
+        """
+        entry = self._values.get(key)
+        if entry is None:
+            return False, None
+        value, expires_at = entry
+        if expires_at is not None and time.monotonic() >= expires_at:
+            del self._values[key]
+            return False, None
+        return True, value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        """Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Time-to-live in seconds (default: cache default_ttl)
+        """
+        ttl = ttl if ttl is not None else self.default_ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        self._values[key] = (value, expires_at)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a cached value (e.g. after the token was rejected).
+
+        Args:
+            key: Cache key
+        """
+        self._values.pop(key, None)
+
+    async def get_or_compute(
+        self,
+        key: Hashable,
+        factory: Callable[[], Awaitable[Any]],
+        ttl: float | None = None,
+    ) -> Any:
+        """Get a cached value, computing it once if missing.
+
+        Args:
+            key: Cache key
+            factory: Coroutine function producing the value
+            ttl: Time-to-live in seconds (default: cache default_ttl)
+
+        Returns:
+            Cached or freshly computed value
+
+        Raises:
+            Exception: Whatever the factory raised, for the caller and all waiters
+        """
+        found, value = self.get(key)
+        if found:
+            self.hits += 1
+            return value
+
+        pending = self._pending.get(key)
+        if pending is not None:
+            self.hits += 1
+            # shield() so a cancelled waiter doesn't cancel the shared computation
+            return await asyncio.shield(pending)
+
+        self.misses += 1
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            value = await factory()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited failure doesn't log a warning
+            future.exception()
+            raise
+        else:
+            self.set(key, value, ttl)
+            future.set_result(value)
+            return value
+        finally:
+            del self._pending[key]
@@ -0,0 +1,168 @@
+"""Tag expressions such as ``smoke AND NOT (slow OR flaky)``.
+
+Grammar (operators are case-insensitive, AND binds tighter than OR)::
+
+    expr  := term ("OR" term)*
+    term  := factor ("AND" factor)*
+    factor:= "NOT" factor | "(" expr ")" | TAG
+
+Tags are words of letters, digits and ``_ - . : /`` or quoted strings, and
+are compared lowercased (see normalize_tags). Expressions compile to SQL:
+each tag becomes an indexed lookup supplied by the caller, combined with
+AND / OR / NOT in the database.
+"""
+
+import re
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy import ColumnElement, and_, not_, or_
+
+# Longest stored tag
+MAX_TAG_LENGTH = 100
+
+_TOKEN = re.compile(r'\s*(?:(\()|(\))|"([^"]*)"|\'([^\']*)\'|([\w\-.:/]+))', re.UNICODE)
+_OPERATORS = {"and", "or", "not"}
+
+
+def normalize_tags(tags: Any) -> list[str]:
+    """Tag names of a Scenario.tags value.
+
+    Scenario.tags is free-form JSON: an object whose keys are the tags (what
+    the UI shows) or a plain list of tags.
+
+    Args:
+        tags: Scenario.tags value
+
+    Returns:
+        Distinct lowercased tag names, in order
+    """
+    if isinstance(tags, dict):
+        names = tags.keys()
+    elif isinstance(tags, list | tuple):
+        names = [tag for tag in tags if isinstance(tag, str | int)]
+    else:
+        return []
+    normalized = (str(name).strip().lower()[:MAX_TAG_LENGTH] for name in names)
+    return list(dict.fromkeys(name for name in normalized if name))
+
+
+def _tokenize(text: str) -> list[tuple[str, str]]:
+    """Split an expression into (kind, value) tokens."""
+    tokens: list[tuple[str, str]] = []
+    position = 0
+    text = text.rstrip()
+    while position < len(text):
+        match = _TOKEN.match(text, position)
+        if match is None:
+            raise ValueError(f"Invalid tag expression at position {position + 1}: {text!r}")
+        position = match.end()
+        lparen, rparen, double, single, word = match.groups()
+        if lparen:
+            tokens.append(("(", lparen))
+        elif rparen:
+            tokens.append((")", rparen))
+        elif word is not None and word.lower() in _OPERATORS:
+            tokens.append((word.lower(), word))
+        else:
+            tag = word if word is not None else (double if double is not None else single)
+            tokens.append(("tag", tag.strip().lower()[:MAX_TAG_LENGTH]))
+    return tokens
+
+
+class _Parser:
+    """Recursive-descent parser producing nested tuples."""
+
+    def __init__(self, tokens: list[tuple[str, str]]):
+        self.tokens = tokens
+        self.position = 0
+
+    def peek(self) -> str | None:
+        if self.position < len(self.tokens):
+            return self.tokens[self.position][0]
+        return None
+
+    def take(self, kind: str) -> str:
+        if self.peek() != kind:
+            found = self.tokens[self.position][1] if self.peek() else "end of expression"
+            raise ValueError(f"Invalid tag expression: expected {kind}, found {found!r}")
+        self.position += 1
+        return self.tokens[self.position - 1][1]
+
+    def expr(self) -> tuple:
+        terms = [self.term()]
+        while self.peek() == "or":
+            self.position += 1
+            terms.append(self.term())
+        return terms[0] if len(terms) == 1 else ("or", *terms)
+
+    def term(self) -> tuple:
+        factors = [self.factor()]
+        while self.peek() == "and":
+            self.position += 1
+            factors.append(self.factor())
+        return factors[0] if len(factors) == 1 else ("and", *factors)
+
+    def factor(self) -> tuple:
+        kind = self.peek()
+        if kind == "not":
+            self.position += 1
+            return ("not", self.factor())
+        if kind == "(":
+            self.position += 1
+            node = self.expr()
+            self.take(")")
+            return node
+        return ("tag", self.take("tag"))
+
+
+def parse_tag_expression(text: str) -> tuple:
+    """Parse a tag expression.
+
+    Args:
+        text: Expression, e.g. ``smoke AND NOT slow``
+
+    Returns:
+        Tree of ("tag", name), ("not", node), ("and", *nodes), ("or", *nodes)
+
+    Raises:
+        ValueError: If the expression is empty or malformed
+    """
+    tokens = _tokenize(text)
+    if not tokens:
+        raise ValueError("Tag expression is empty")
+    parser = _Parser(tokens)
+    tree = parser.expr()
+    if parser.peek() is not None:
+        raise ValueError(
+            f"Invalid tag expression: unexpected {parser.tokens[parser.position][1]!r}"
+        )
+    return tree
+
+
+def compile_tag_expression(
+    text: str, has_tag: Callable[[str], ColumnElement[bool]]
+) -> ColumnElement[bool]:
+    """Compile a tag expression to a SQL condition.
+
+    Args:
+        text: Expression, e.g. ``smoke AND NOT slow``
+        has_tag: Builds the condition "row has this tag"
+
+    Returns:
+        SQL condition
+
+    Raises:
+        ValueError: If the expression is empty or malformed
+    """
+
+    def build(node: tuple) -> ColumnElement[bool]:
+        kind = node[0]
+        if kind == "tag":
+            return has_tag(node[1])
+        if kind == "not":
+            return not_(build(node[1]))
+        children = [build(child) for child in node[1:]]
+        return and_(*children) if kind == "and" else or_(*children)
+
+    return build(parse_tag_expression(text))
@@ -0,0 +1,96 @@
+"""In-process trigram index for substring search.
+
+Mirrors what PostgreSQL's pg_trgm gives the search service, for databases
+without it (SQLite in development and tests):
+
+* every lowercased document is indexed by its character trigrams, so a
+  query only verifies the documents containing all of its trigrams instead
+  of scanning everything;
+* matches are ranked with pg_trgm's word-trigram similarity.
+"""
+
+import re
+from collections.abc import Hashable
+
+_WORD = re.compile(r"\w+")
+
+
+def _grams(text: str) -> set[str]:
+    """Character trigrams of a lowercased string."""
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+def word_trigrams(text: str) -> set[str]:
+    """pg_trgm-style trigrams: each word padded with two spaces before, one after."""
+    grams: set[str] = set()
+    for word in _WORD.findall(text.lower()):
+        grams |= _grams(f"  {word} ")
+    return grams
+
+
+def similarity(a: str, b: str) -> float:
+    """pg_trgm similarity: shared trigrams over all trigrams of both strings."""
+    grams_a, grams_b = word_trigrams(a), word_trigrams(b)
+    if not grams_a or not grams_b:
+        return 0.0
+    return len(grams_a & grams_b) / len(grams_a | grams_b)
+
+
+class TrigramIndex:
+    """Substring / all-words index over documents with several text fields."""
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._fields: dict[Hashable, tuple[str, ...]] = {}
+        self._text: dict[Hashable, str] = {}
+        self._words: dict[Hashable, frozenset[str]] = {}
+        self._postings: dict[str, set[Hashable]] = {}
+
+    def __len__(self) -> int:
+        """Number of indexed documents."""
+        return len(self._fields)
+
+    def add(self, key: Hashable, *fields: str | None) -> None:
+        """Index a document.
+
+        Args:
+            key: Document key
+            fields: Searchable text fields (None is treated as empty)
+        """
+        values = tuple(field or "" for field in fields)
+        # Fields are joined with a newline, which queries never contain,
+        # so a substring match never spans two fields
+        text = "\n".join(values).lower()
+        self._fields[key] = values
+        self._text[key] = text
+        self._words[key] = frozenset(_WORD.findall(text))
+        for gram in _grams(text):
+            self._postings.setdefault(gram, set()).add(key)
+
+    def search(self, query: str, limit: int) -> list[tuple[Hashable, float]]:
+        """Find documents containing the query, or all of its words.
+
+        Args:
+            query: Search text
+            limit: Maximum results
+
+        Returns:
+            (key, similarity) pairs, best first
+        """
+        needle = " ".join(query.lower().split())
+        words = set(_WORD.findall(needle))
+        if not needle:
+            return []
+
+        # Every match contains every trigram of every query word
+        grams = set().union(*(_grams(word) for word in words)) if words else _grams(needle)
+        postings = sorted((self._postings.get(gram, set()) for gram in grams), key=len)
+        candidates = set.intersection(*postings) if postings else set(self._fields)
+
+        hits = []
+        for key in candidates:
+            if needle in self._text[key] or (words and words <= self._words[key]):
+                score = max(similarity(needle, field) for field in self._fields[key])
+                hits.append((key, score))
+        hits.sort(key=lambda hit: (-hit[1], hit[0]))
+        return hits[:limit]
@@ -0,0 +1,74 @@
+"""Small in-process cache with per-entry expiry."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+
+class TTLCache:
+    """Bounded mapping whose entries expire after a fixed time-to-live.
+
+    Used for cheap per-process caching of read-mostly results (e.g. dashboard
+    counts). Each process has its own copy, so the TTL bounds how stale a
+    value can get after a write in another process. When full, the least
+    recently stored entry is evicted.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        """Initialize TTL cache.
+
+        Args:
+            ttl: Time-to-live in seconds (0 or less disables caching)
+            maxsize: Maximum number of entries
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._values: OrderedDict[Hashable, tuple[Any, float]] = OrderedDict()
+
+    def get(self, key: Hashable) -> tuple[bool, Any]:
+        """Look up a value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Tuple of (found, value)
+        """
+        entry = self._values.get(key)
+        if entry is None:
+            return False, None
+        value, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._values[key]
+            return False, None
+        return True, value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        if self.ttl <= 0:
+            return
+        self._values.pop(key, None)
+        if len(self._values) >= self.maxsize:
+            self._values.popitem(last=False)
+        self._values[key] = (value, time.monotonic() + self.ttl)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop one entry.
+
+        Args:
+            key: Cache key
+        """
+        self._values.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._values.clear()
+
+    def __len__(self) -> int:
+        return len(self._values)
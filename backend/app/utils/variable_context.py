@@ -0,0 +1,113 @@
+"""Layered variable context for scenario execution."""
+
+from collections.abc import Iterator, Mapping, MutableMapping
+from types import MappingProxyType
+from typing import Any
+
+
+def flatten_layers(*layers: Mapping[str, Any] | None) -> Mapping[str, Any]:
+    """Merge variable layers into one read-only mapping.
+
+    Later layers override earlier ones (e.g. project globals, then
+    environment variables). Build this once per execution and share it.
+
+    Args:
+        layers: Variable mappings, lowest precedence first (None is skipped)
+
+    Returns:
+        Read-only flattened mapping
+    """
+    merged: dict[str, Any] = {}
+    for layer in layers:
+        if layer:
+            merged.update(layer)
+    return MappingProxyType(merged)
+
+
+class VariableContext(MutableMapping[str, Any]):
+    """Copy-on-write variable context over a shared read-only base.
+
+    The base (project + environment variables, see ``flatten_layers``) is
+    shared by every run and never copied or modified. Each run only allocates
+    a small local dict holding its scenario/row values and anything written
+    during the run (saved and extracted values), so lookups are at most two
+    dict probes regardless of how many variables the project defines.
+    """
+
+    __slots__ = ("_base", "_local")
+
+    def __init__(self, base: Mapping[str, Any] | None = None, *layers: Mapping[str, Any] | None):
+        """Initialize variable context.
+
+        Args:
+            base: Shared read-only base layer
+            layers: Per-run layers (scenario variables, dataset row, ...),
+                lowest precedence first
+        """
+        self._base: Mapping[str, Any] = base if base is not None else MappingProxyType({})
+        self._local: dict[str, Any] = {}
+        for layer in layers:
+            if layer:
+                self._local.update(layer)
+
+    @property
+    def base(self) -> Mapping[str, Any]:
+        """Shared read-only base layer."""
+        return self._base
+
+    @property
+    def local(self) -> Mapping[str, Any]:
+        """Values owned by this context (per-run layers and writes)."""
+        return MappingProxyType(self._local)
+
+    def child(self, *layers: Mapping[str, Any] | None) -> "VariableContext":
+        """Create a new context over the same base with extra local layers.
+
+        The child starts with a copy of this context's local values, so
+        writes to either context are not visible in the other.
+
+        Args:
+            layers: Additional layers applied on top of the current locals
+
+        Returns:
+            New VariableContext
+        """
+        return VariableContext(self._base, self._local, *layers)
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._local[key]
+        except KeyError:
+            return self._base[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._local[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key in self._local:
+            del self._local[key]
+        elif key in self._base:
+            raise KeyError(f"Cannot delete shared variable: {key}")
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._local or key in self._base
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._local
+        for key in self._base:
+            if key not in self._local:
+                yield key
+
+    def __len__(self) -> int:
+        return len(self._local) + sum(1 for key in self._base if key not in self._local)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a variable value (local values shadow the base)."""
+        if key in self._local:
+            return self._local[key]
+        return self._base.get(key, default)
+
+    def __repr__(self) -> str:
+        return f"<VariableContext(local={len(self._local)}, base={len(self._base)})>"
@@ -0,0 +1,40 @@
+"""Execution rollup backfill script.
+
+This script rebuilds the execution_daily_stats table from test_executions.
+The add_execution_daily_stats migration runs it once when the table is
+created; run it again to repair the rollup, or with --days N to repair
+recent days only.
+
+Usage:
+    python -m scripts.backfill_execution_stats [--days N]
+"""
+import argparse
+import asyncio
+from datetime import date, timedelta
+
+from app.database import async_session
+from app.services.execution_stats_service import ExecutionStatsService
+
+
+async def main(days: int | None = None) -> None:
+    """Rebuild the daily execution rollup."""
+    since = date.today() - timedelta(days=days) if days is not None else None
+
+    print("📊 Rebuilding execution daily stats...")
+    if since:
+        print(f"   Since {since.isoformat()}")
+
+    async with async_session() as session:
+        try:
+            rows = await ExecutionStatsService(session).rebuild(since)
+            print(f"✅ Backfill completed: {rows} project-day rows written")
+        except Exception as e:
+            print(f"❌ Error during backfill: {e}")
+            raise
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild execution_daily_stats")
+    parser.add_argument("--days", type=int, default=None, help="Only rebuild the last N days")
+    args = parser.parse_args()
+    asyncio.run(main(args.days))
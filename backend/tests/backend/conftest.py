@@ -11,6 +11,7 @@ from app.main import app
 from app.models.test_execution import TestExecution
 from app.models.test_report import TestReport
 from app.models.user import User
+from app.services.report_service import ReportService
 
 
 @pytest_asyncio.fixture(scope="function")
@@ -93,6 +94,10 @@ async def test_report(db_session: AsyncSession, test_execution: TestExecution) -
     )
     db_session.add(report)
     await db_session.commit()
+    # Written directly, like reports from before the rollup: backfill it as
+    # the add_report_stats migration does
+    await ReportService(db_session).rebuild_report_stats()
+    await db_session.commit()
     await db_session.refresh(report)
     return report
 
@@ -4,8 +4,11 @@ import pytest
 from datetime import datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.execution_scenario import ExecutionScenario
+from app.models.execution_step import ExecutionStep
 from app.models.test_report import TestReport
 from app.models.test_execution import TestExecution
+from app.services.payload_store import LocalBlobStore, PayloadStore
 from app.services.report_service import ReportService
 
 
@@ -171,3 +174,74 @@ async def test_get_report_statistics(db_session: AsyncSession, test_report: Test
     assert "total_skipped" in stats
     assert "pass_rate" in stats
     assert stats["total_reports"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_get_report_details_and_spilled_payload(
+    db_session: AsyncSession, test_report: TestReport, tmp_path
+):
+    """Test report details skip payloads and spilled payloads load on demand."""
+    store = PayloadStore(LocalBlobStore(tmp_path), threshold_bytes=1024)
+    scenarios = [
+        ExecutionScenario(execution_id=test_report.execution_id, scenario_id=i, status="passed")
+        for i in (1, 2)
+    ]
+    db_session.add_all(scenarios)
+    await db_session.flush()
+
+    response = {"status_code": 200, "text": "z" * 50_000}
+    step = ExecutionStep(
+        execution_scenario_id=scenarios[0].id,
+        step_id=1,
+        status="passed",
+        request_data={"url": "/big"},
+        response_data=response,
+    )
+    await store.spill_step(step)
+    db_session.add_all(
+        [step, ExecutionStep(execution_scenario_id=scenarios[1].id, step_id=2, status="failed")]
+    )
+    await db_session.commit()
+
+    service = ReportService(db_session)
+    details = await service.get_report_details(test_report.id)
+
+    assert [len(s["steps"]) for s in details["scenarios"]] == [1, 1]
+    assert details["scenarios"][0]["steps"][0]["id"] == step.id
+
+    loaded = await service.get_step_payload(test_report.id, step.id, "response", store)
+    assert loaded == response
+    request = await service.get_step_payload(test_report.id, step.id, "request", store)
+    assert request == {"url": "/big"}
+
+    with pytest.raises(ValueError):
+        await service.get_step_payload(test_report.id, step.id, "body", store)
+
+
+@pytest.mark.asyncio
+async def test_delete_report_deletes_spilled_payloads(
+    db_session: AsyncSession, test_report: TestReport, tmp_path
+):
+    """Test deleting a report removes the blobs of its spilled payloads."""
+    store = PayloadStore(LocalBlobStore(tmp_path), threshold_bytes=1024)
+    scenario = ExecutionScenario(
+        execution_id=test_report.execution_id, scenario_id=1, status="passed"
+    )
+    db_session.add(scenario)
+    await db_session.flush()
+
+    step = ExecutionStep(
+        execution_scenario_id=scenario.id,
+        step_id=1,
+        status="passed",
+        request_data={"url": "/big"},
+        response_data={"text": "z" * 50_000},
+    )
+    await store.spill_step(step)
+    db_session.add(step)
+    await db_session.commit()
+    blob = tmp_path / step.response_data["ref"]
+    assert blob.exists()
+
+    assert await ReportService(db_session).delete_report(test_report.id, store) is True
+    assert not blob.exists()
@@ -12,6 +12,10 @@ from sqlalchemy.orm import sessionmaker
 
 from app.database import Base, get_db
 from app.main import app
+from app.services.dashboard_service import invalidate_core_stats
+from app.services.interface_service import clear_interface_tree_cache
+from app.services.search_service import clear_search_index
+from app.utils.pagination import clear_total_cache
 
 # 使用测试数据库
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
@@ -61,6 +65,16 @@ db_session = db
 async_session = db
 
 
+@pytest.fixture(autouse=True)
+def clear_dashboard_cache():
+    """每个测试使用全新数据库, 清空进程内的仪表盘统计、分页总数、接口树缓存和搜索索引."""
+    invalidate_core_stats()
+    clear_total_cache()
+    clear_interface_tree_cache()
+    clear_search_index()
+    yield
+
+
 @pytest_asyncio.fixture(scope="function")
 async def client(db: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     """创建测试客户端."""
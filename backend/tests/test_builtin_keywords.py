@@ -77,6 +77,29 @@ async def test_init_builtin_keywords_is_idempotent(db):
     assert len(result.scalars().all()) == 5
 
 
+@pytest.mark.asyncio
+async def test_init_builtin_keywords_refreshes_stale_code(db):
+    """Test that existing built-in rows get the current code."""
+    db.add(
+        Keyword(
+            type="extract",
+            name="提取变量",
+            method_name="extract_variable",
+            code="def extract_variable(response, json_path=None):\n    pass",
+            is_builtin=True,
+        )
+    )
+    await db.commit()
+
+    await init_builtin_keywords(db)
+    await db.commit()
+
+    result = await db.execute(
+        select(Keyword.code).where(Keyword.method_name == "extract_variable")
+    )
+    assert "app.utils.json_path" in result.scalar_one()
+
+
 @pytest.mark.asyncio
 async def test_builtin_keyword_code_validity(db):
     """Test that built-in keywords have valid Python code."""
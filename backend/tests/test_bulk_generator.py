@@ -0,0 +1,109 @@
+"""Tests for vectorized bulk data generation."""
+
+import time
+
+import pytest
+
+from app.utils.bulk_generator import (
+    ALPHANUMERIC,
+    BulkGenerator,
+    batch_random_number,
+    batch_random_string,
+)
+from app.utils.function_executor import BUILTIN_FUNCTIONS, FunctionExecutor
+
+
+def _generator(functions=None, deterministic=frozenset({"to_uppercase"}), seed=None):
+    executor = FunctionExecutor({**BUILTIN_FUNCTIONS, **(functions or {})})
+    calls = []
+
+    async def evaluate(requests):
+        calls.append(len(requests))
+        outcomes = []
+        for expr, context in requests:
+            try:
+                outcomes.append((True, executor.execute_function(expr, context)))
+            except Exception as e:
+                outcomes.append((False, str(e)))
+        return outcomes
+
+    return BulkGenerator(evaluate, deterministic, seed=seed), calls
+
+
+def test_batch_builtins():
+    """Test batched built-ins honour their arguments."""
+    strings = batch_random_string(500, 7)
+    numbers = batch_random_number(500, 3, 5)
+
+    assert len(strings) == 500
+    assert all(len(s) == 7 and set(s) <= set(ALPHANUMERIC) for s in strings)
+    assert len(set(strings)) > 490
+    assert set(numbers) == {3, 4, 5}
+    assert batch_random_string(3, 0) == ["", "", ""]
+    with pytest.raises(ValueError):
+        batch_random_number(1, 5, 3)
+
+
+@pytest.mark.asyncio
+async def test_generation_strategies():
+    """Test batched, constant and per-row columns."""
+    generator, calls = _generator({"double": lambda x: x * 2})
+
+    headers, rows = await generator.generate(
+        {
+            "id": "{{row_index}}",
+            "name": "u_{{random_string(4)}}",
+            "role": "{{to_uppercase('dev')}}",
+            "double": "{{double(row_index)}}",
+            "static": "fixed",
+        },
+        20,
+    )
+
+    assert headers == ["id", "name", "role", "double", "static"]
+    assert rows[3] == ["3", rows[3][1], "DEV", "6", "fixed"]
+    assert all(row[1].startswith("u_") and len(row[1]) == 6 for row in rows)
+    assert (generator.vectorized, generator.constant, generator.per_row) == (2, 1, 1)
+    # One evaluation for the constant, one batch for the per-row column
+    assert calls == [1, 20]
+
+
+@pytest.mark.asyncio
+async def test_errors_name_the_column():
+    """Test a failing expression reports its column."""
+    generator, _ = _generator()
+
+    with pytest.raises(ValueError, match="列 bad"):
+        await generator.generate({"bad": "{{random_string('x', 'y', 'z')}}"}, 3)
+    with pytest.raises(ValueError, match="列 missing"):
+        await generator.generate({"missing": "{{nope()}}"}, 3)
+
+
+@pytest.mark.asyncio
+async def test_large_dataset_is_fast():
+    """Test 100k rows of built-in columns generate in well under a few seconds."""
+    generator, calls = _generator()
+
+    start = time.perf_counter()
+    _, rows = await generator.generate(
+        {"user": "user_{{random_string(8)}}", "age": "{{random_number(18, 80)}}"},
+        100_000,
+    )
+
+    assert len(rows) == 100_000
+    assert calls == []
+    assert time.perf_counter() - start < 5
+
+
+@pytest.mark.asyncio
+async def test_seed_reproduces_dataset():
+    """Test the same seed generates the same rows."""
+    columns = {"user": "{{random_string(6)}}", "age": "{{random_number(1, 99)}}"}
+
+    first, _ = _generator(seed=2024)
+    second, _ = _generator(seed=2024)
+    other, _ = _generator(seed=2025)
+
+    _, rows = await first.generate(columns, 50)
+    assert (await second.generate(columns, 50))[1] == rows
+    assert (await other.generate(columns, 50))[1] != rows
@@ -0,0 +1,125 @@
+"""Tests for single-statement bulk reordering."""
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.interface import Interface
+from app.models.interface_folder import InterfaceFolder
+from app.models.plan_scenario import PlanScenario
+from app.models.scenario_step import ScenarioStep
+from app.schemas.interface import InterfaceReorderRequest
+from app.services.interface_service import InterfaceService
+from app.services.test_plan_service import TestPlanService
+from app.utils.bulk_reorder import bulk_reorder
+
+
+class _UpdateCounter:
+    """Counts UPDATE statements sent to the database."""
+
+    def __init__(self, session: AsyncSession):
+        self.engine = session.get_bind()
+        self.count = 0
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("UPDATE"):
+            self.count += 1
+
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, "before_cursor_execute", self)
+
+
+@pytest.mark.asyncio
+async def test_bulk_reorder_one_statement_and_ownership(async_session: AsyncSession):
+    """Test all positions are set in one UPDATE scoped to the owner."""
+    steps = [
+        ScenarioStep(scenario_id=1 if i < 300 else 2, description=f"s{i}", keyword_id=1)
+        for i in range(301)
+    ]
+    async_session.add_all(steps)
+    await async_session.flush()
+
+    positions = {step.id: 1000 - step.id for step in steps}
+    with _UpdateCounter(async_session) as counter:
+        rows = await bulk_reorder(
+            async_session, ScenarioStep, positions, where=[ScenarioStep.scenario_id == 1]
+        )
+    assert counter.count == 1
+    assert len(rows) == 300
+
+    result = await async_session.execute(select(ScenarioStep.id, ScenarioStep.sort_order))
+    orders = dict(result.all())
+    assert all(orders[step.id] == 1000 - step.id for step in steps[:300])
+    # Belongs to another scenario: untouched
+    assert orders[steps[300].id] == 0
+    # Loaded instances see the new positions
+    assert steps[0].sort_order == 1000 - steps[0].id
+
+
+@pytest.mark.asyncio
+async def test_batch_reorder_interfaces_then_folders(async_session: AsyncSession):
+    """Test ids fall back to folders and project_id restricts the update."""
+    folder = InterfaceFolder(project_id=1, name="API")
+    other = InterfaceFolder(project_id=2, name="Other")
+    async_session.add_all([folder, other])
+    await async_session.flush()
+    interface = Interface(project_id=1, name="Ping", method="GET", path="/ping")
+    async_session.add(interface)
+    await async_session.flush()
+    folder_only = max(folder.id, other.id, interface.id) + 1
+    assert interface.id == folder.id
+
+    service = InterfaceService(async_session)
+    with _UpdateCounter(async_session) as counter:
+        result = await service.batch_reorder(
+            InterfaceReorderRequest(
+                updates=[
+                    {"id": interface.id, "sort_order": 7},
+                    {"id": other.id, "sort_order": 8},
+                    {"id": folder_only, "sort_order": 9},
+                ],
+                project_id=1,
+            )
+        )
+    assert result == {"updated_count": 1}
+    # Interfaces, folders and the tree version bump
+    assert counter.count == 3
+    assert interface.sort_order == 7
+    assert (folder.sort_order, other.sort_order) == (0, 0)
+
+    result = await service.batch_reorder(
+        InterfaceReorderRequest(updates=[{"id": other.id, "sort_order": 8}], project_id=2)
+    )
+    assert result == {"updated_count": 1}
+    assert other.sort_order == 8
+
+    with pytest.raises(ValidationError):
+        InterfaceReorderRequest(updates=[{"id": other.id, "sort_order": 8}])
+
+
+@pytest.mark.asyncio
+async def test_reorder_plan_scenarios(async_session: AsyncSession):
+    """Test plan scenario positions are keyed by scenario within the plan."""
+    links = [PlanScenario(plan_id=1, scenario_id=s, sort_order=s) for s in (10, 11, 12)]
+    async_session.add_all([*links, PlanScenario(plan_id=2, scenario_id=10, sort_order=5)])
+    await async_session.flush()
+
+    updated = await TestPlanService(async_session).reorder_scenarios(
+        1,
+        [
+            {"scenario_id": 12, "sort_order": 0},
+            {"scenario_id": 10, "sort_order": 2},
+            {"scenario_id": 99, "sort_order": 1},
+        ],
+    )
+    assert sorted((p.scenario_id, p.sort_order) for p in updated) == [(10, 2), (12, 0)]
+
+    result = await async_session.execute(
+        select(PlanScenario.plan_id, PlanScenario.scenario_id, PlanScenario.sort_order)
+    )
+    assert sorted(result.all()) == [(1, 10, 2), (1, 11, 11), (1, 12, 0), (2, 10, 5)]
@@ -0,0 +1,205 @@
+"""Tests for deep clones of scenarios, test plans and projects."""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.main import app
+from app.middleware.auth import get_current_user
+from app.models.database_config import DatabaseConfig
+from app.models.dataset import Dataset
+from app.models.env_variable import EnvVariable
+from app.models.environment import Environment
+from app.models.interface import Interface
+from app.models.interface_folder import InterfaceFolder
+from app.models.keyword import Keyword
+from app.models.plan_scenario import PlanScenario
+from app.models.scenario import Scenario
+from app.models.scenario_step import ScenarioStep
+from app.models.scenario_tag import ScenarioTag
+from app.models.test_plan import TestPlan
+from app.services.clone_service import CloneService
+from app.utils.set_copy import allocate_ids
+
+
+async def _scenario(session: AsyncSession, project_id: int, user_id: int, **fields) -> Scenario:
+    """Create a scenario with two steps, a dataset and tags."""
+    keyword = Keyword(type="custom", name="Step", method_name="step", code="pass")
+    scenario = Scenario(
+        project_id=project_id,
+        name="Checkout",
+        creator_id=user_id,
+        tags={"smoke": True},
+        variables={"user": "alice"},
+        **fields,
+    )
+    session.add_all([keyword, scenario])
+    await session.flush()
+    session.add_all(
+        [
+            ScenarioStep(scenario_id=scenario.id, sort_order=i, description=f"s{i}", keyword_id=keyword.id)
+            for i in range(2)
+        ]
+        + [Dataset(scenario_id=scenario.id, name="data", headers=["a"], rows=[[1]])]
+    )
+    await session.flush()
+    return scenario
+
+
+async def _column(session: AsyncSession, column, *where):
+    result = await session.execute(select(column).where(*where).order_by(column))
+    return list(result.scalars())
+
+
+@pytest.mark.asyncio
+async def test_allocate_ids_above_max(db_session: AsyncSession, test_project, test_user):
+    """Test ids are reserved above the current maximum, in source order."""
+    first = await _scenario(db_session, test_project.id, test_user.id)
+    assert await allocate_ids(db_session, Scenario, [9, 3]) == {3: first.id + 1, 9: first.id + 2}
+    assert await allocate_ids(db_session, Scenario, []) == {}
+
+
+@pytest.mark.asyncio
+async def test_clone_scenario(db_session: AsyncSession, test_project, test_user):
+    """Test steps, datasets, variables and tag rows are copied."""
+    original = await _scenario(db_session, test_project.id, test_user.id)
+
+    new_id = await CloneService(db_session).clone_scenario(original.id)
+    clone = await db_session.get(Scenario, new_id)
+    assert (clone.name, clone.variables, clone.tags) == (
+        "Checkout (copy)",
+        {"user": "alice"},
+        {"smoke": True},
+    )
+    assert await _column(
+        db_session, ScenarioStep.description, ScenarioStep.scenario_id == new_id
+    ) == ["s0", "s1"]
+    assert await _column(db_session, Dataset.name, Dataset.scenario_id == new_id) == ["data"]
+    assert await _column(db_session, ScenarioTag.tag, ScenarioTag.scenario_id == new_id) == [
+        "smoke"
+    ]
+    # The original is untouched
+    assert len(await _column(db_session, ScenarioStep.id, ScenarioStep.scenario_id == original.id)) == 2
+
+    with pytest.raises(ValueError, match="Scenario not found"):
+        await CloneService(db_session).clone_scenario(9999)
+
+
+@pytest.mark.asyncio
+async def test_clone_test_plan(db_session: AsyncSession, test_project, test_user, test_plan):
+    """Test the scenario list is copied and names stay unique per project."""
+    scenario = await _scenario(db_session, test_project.id, test_user.id)
+    db_session.add(PlanScenario(plan_id=test_plan.id, scenario_id=scenario.id, sort_order=3))
+    await db_session.flush()
+    service = CloneService(db_session)
+
+    new_id = await service.clone_test_plan(test_plan.id, test_user.id)
+    result = await db_session.execute(
+        select(PlanScenario.scenario_id, PlanScenario.sort_order).where(PlanScenario.plan_id == new_id)
+    )
+    assert result.all() == [(scenario.id, 3)]
+    assert (await db_session.get(TestPlan, new_id)).name == "Test Plan (copy)"
+
+    with pytest.raises(ValueError, match="already exists"):
+        await service.clone_test_plan(test_plan.id, test_user.id)
+    assert await service.clone_test_plan(test_plan.id, test_user.id, name="Release") > new_id
+
+
+@pytest.mark.asyncio
+async def test_clone_project_remaps_references(
+    db_session: AsyncSession, test_project, test_user, test_plan
+):
+    """Test every copied reference points to the copies, not the originals."""
+    environment = Environment(project_id=test_project.id, name="dev", base_url="http://dev")
+    root = InterfaceFolder(project_id=test_project.id, name="root")
+    db_session.add_all([environment, root])
+    await db_session.flush()
+    child = InterfaceFolder(project_id=test_project.id, parent_id=root.id, name="child")
+    db_session.add_all(
+        [
+            child,
+            EnvVariable(environment_id=environment.id, name="token", value="t"),
+            DatabaseConfig(
+                project_id=test_project.id,
+                name="main",
+                variable_name="db",
+                db_type="mysql",
+                host="localhost",
+                port=3306,
+                database="app",
+                username="root",
+                password="secret",
+                is_connected=True,
+            ),
+        ]
+    )
+    await db_session.flush()
+    db_session.add_all(
+        [
+            Interface(project_id=test_project.id, folder_id=child.id, name="a", method="GET", path="/a"),
+            Interface(project_id=test_project.id, name="b", method="GET", path="/b"),
+        ]
+    )
+    scenario = await _scenario(
+        db_session, test_project.id, test_user.id, environment_id=environment.id
+    )
+    db_session.add(PlanScenario(plan_id=test_plan.id, scenario_id=scenario.id, sort_order=0))
+    await db_session.flush()
+
+    new_id = await CloneService(db_session).clone_project(test_project.id, test_user.id)
+
+    [new_env] = await _column(db_session, Environment.id, Environment.project_id == new_id)
+    assert await _column(db_session, EnvVariable.name, EnvVariable.environment_id == new_env) == ["token"]
+
+    result = await db_session.execute(
+        select(InterfaceFolder.name, InterfaceFolder.id, InterfaceFolder.parent_id).where(
+            InterfaceFolder.project_id == new_id
+        )
+    )
+    folders = {name: (folder_id, parent_id) for name, folder_id, parent_id in result.all()}
+    assert folders["root"][1] is None
+    assert folders["child"][1] == folders["root"][0]
+
+    result = await db_session.execute(
+        select(Interface.name, Interface.folder_id).where(Interface.project_id == new_id)
+    )
+    assert sorted(result.all()) == [("a", folders["child"][0]), ("b", None)]
+
+    [new_scenario] = await _column(db_session, Scenario.id, Scenario.project_id == new_id)
+    assert (await db_session.get(Scenario, new_scenario)).environment_id == new_env
+    assert len(await _column(db_session, ScenarioStep.id, ScenarioStep.scenario_id == new_scenario)) == 2
+
+    [new_plan] = await _column(db_session, TestPlan.id, TestPlan.project_id == new_id)
+    assert await _column(
+        db_session, PlanScenario.scenario_id, PlanScenario.plan_id == new_plan
+    ) == [new_scenario]
+
+    [connected] = await _column(
+        db_session, DatabaseConfig.is_connected, DatabaseConfig.project_id == new_id
+    )
+    assert connected is False
+
+
+@pytest.mark.asyncio
+async def test_clone_endpoints(client: AsyncClient, db_session: AsyncSession, test_project, test_user, test_plan):
+    """Test the clone endpoints."""
+    app.dependency_overrides[get_current_user] = lambda: test_user
+    scenario = await _scenario(db_session, test_project.id, test_user.id)
+
+    response = await client.post(f"/api/v1/scenarios/{scenario.id}/clone", params={"name": "Fork"})
+    assert response.status_code == 201
+    assert (response.json()["name"], len(response.json()["steps"])) == ("Fork", 2)
+
+    response = await client.post(f"/api/v1/test-plans/{test_plan.id}/clone")
+    assert response.status_code == 201
+    assert response.json()["name"] == "Test Plan (copy)"
+
+    response = await client.post(f"/api/v1/projects/{test_project.id}/clone", params={"name": "v2"})
+    assert response.status_code == 201
+    assert response.json()["name"] == "v2"
+    response = await client.post(f"/api/v1/projects/{test_project.id}/clone", params={"name": "v2"})
+    assert response.status_code == 400
+
+    response = await client.post("/api/v1/scenarios/9999/clone")
+    assert response.status_code == 404
@@ -110,3 +110,25 @@ async def test_coverage_percentage_calculation(
     if total > 0:
         expected_percentage = (coverage.tested_projects / total) * 100
         assert abs(coverage.coverage_percentage - expected_percentage) < 0.01
+
+
+@pytest.mark.asyncio
+async def test_core_stats_cached_and_invalidated(async_session: AsyncSession, test_user):
+    """Test core stats are cached per user and invalidated by service writes."""
+    from app.models.project import Project
+    from app.schemas.project import ProjectCreate
+    from app.services.project_service import ProjectService
+
+    service = DashboardService()
+    assert (await service.get_core_stats(async_session, test_user.id)).total_projects == 0
+
+    # Written behind the services' back: the cached value is still served
+    async_session.add(Project(name="Direct", creator_id=test_user.id))
+    await async_session.commit()
+    assert (await service.get_core_stats(async_session, test_user.id)).total_projects == 0
+
+    # Creating through the service invalidates the user's entry
+    await ProjectService(async_session).create_project(
+        ProjectCreate(name="Via service"), creator_id=test_user.id
+    )
+    assert (await service.get_core_stats(async_session, test_user.id)).total_projects == 2
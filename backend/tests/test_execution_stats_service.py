@@ -0,0 +1,129 @@
+"""Tests for the daily execution rollup."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.execution_daily_stat import ExecutionDailyStat
+from app.models.test_execution import TestExecution
+from app.services.dashboard_service import DashboardService
+from app.services.execution_stats_service import ExecutionStatsService
+from app.services.report_service import ReportService
+
+
+async def _add_execution(
+    session: AsyncSession, plan, days_ago: int = 0, status: str = "completed", passed: int = 2
+) -> TestExecution:
+    created = datetime.now() - timedelta(days=days_ago)
+    execution = TestExecution(
+        plan_id=plan.id,
+        environment_id=1,
+        executor_id=plan.creator_id,
+        status=status,
+        total_scenarios=passed + 1,
+        passed_scenarios=passed,
+        failed_scenarios=1,
+        skipped_scenarios=0,
+        started_at=created,
+        finished_at=created + timedelta(seconds=30),
+        created_at=created,
+    )
+    session.add(execution)
+    await session.commit()
+    return execution
+
+
+async def _rollup(session: AsyncSession) -> list[tuple]:
+    result = await session.execute(
+        select(
+            ExecutionDailyStat.project_id,
+            ExecutionDailyStat.day,
+            ExecutionDailyStat.executions,
+            ExecutionDailyStat.passed_scenarios,
+            ExecutionDailyStat.failed_scenarios,
+            ExecutionDailyStat.duration_seconds,
+        ).order_by(ExecutionDailyStat.day)
+    )
+    return [tuple(row) for row in result.all()]
+
+
+@pytest.mark.asyncio
+async def test_finished_executions_update_rollup(async_session: AsyncSession, test_plan):
+    """Test report creation adds the execution to its project-day row."""
+    reports = ReportService(async_session)
+    for days_ago, passed in [(0, 2), (0, 3), (2, 1)]:
+        execution = await _add_execution(async_session, test_plan, days_ago, passed=passed)
+        await reports.create_report(
+            execution_id=execution.id,
+            plan_id=test_plan.id,
+            executor_id=execution.executor_id,
+            environment_name="dev",
+            started_at=execution.started_at,
+        )
+
+    rows = await _rollup(async_session)
+    today = datetime.now().date()
+    assert rows == [
+        (test_plan.project_id, today - timedelta(days=2), 1, 1, 1, 30.0),
+        (test_plan.project_id, today, 2, 5, 2, 60.0),
+    ]
+
+    dashboard = DashboardService()
+    trend = await dashboard.get_execution_trend(async_session, test_plan.creator_id, days=7)
+    assert [(point.date, point.count) for point in trend.trend] == [
+        (str(today - timedelta(days=2)), 1),
+        (str(today), 2),
+    ]
+    coverage = await dashboard.get_project_coverage(async_session, test_plan.creator_id)
+    assert coverage.tested_projects == 1
+
+
+@pytest.mark.asyncio
+async def test_unfinished_execution_not_counted(async_session: AsyncSession, test_plan):
+    """Test running executions are left out of the rollup."""
+    execution = await _add_execution(async_session, test_plan, status="running")
+
+    await ExecutionStatsService(async_session).record_execution(execution)
+    await async_session.commit()
+
+    assert await _rollup(async_session) == []
+
+
+@pytest.mark.asyncio
+async def test_rebuild_matches_incremental(async_session: AsyncSession, test_plan):
+    """Test the backfill produces the same rows as incremental updates."""
+    service = ExecutionStatsService(async_session)
+    for days_ago in (0, 0, 1, 5):
+        execution = await _add_execution(async_session, test_plan, days_ago)
+        await service.record_execution(execution)
+    await _add_execution(async_session, test_plan, status="pending")
+    await async_session.commit()
+    incremental = await _rollup(async_session)
+
+    assert await service.rebuild() == 3
+    assert await _rollup(async_session) == incremental
+
+    # Partial rebuild only touches the requested days
+    assert await service.rebuild(since=datetime.now().date() - timedelta(days=1)) == 2
+    assert await _rollup(async_session) == incremental
+
+
+@pytest.mark.asyncio
+async def test_dashboard_reads_do_not_write_rollup(async_session: AsyncSession, test_plan):
+    """Test dashboard reads leave an empty rollup alone until it is backfilled."""
+    for days_ago in (0, 1):
+        await _add_execution(async_session, test_plan, days_ago)
+
+    dashboard = DashboardService()
+    trend = await dashboard.get_execution_trend(async_session, test_plan.creator_id, days=7)
+    assert trend.trend == []
+    assert await _rollup(async_session) == []
+
+    # The backfill counts history once; later executions are added on top
+    await ExecutionStatsService(async_session).rebuild()
+    execution = await _add_execution(async_session, test_plan)
+    await ExecutionStatsService(async_session).record_execution(execution)
+    await async_session.commit()
+    assert [row[2] for row in await _rollup(async_session)] == [1, 2]
@@ -0,0 +1,58 @@
+"""Tests for function executor expression caching."""
+
+import pytest
+
+from app.utils.function_executor import BUILTIN_FUNCTIONS, FunctionExecutor, compile_expression
+
+
+@pytest.fixture
+def executor():
+    """Function executor with built-in functions."""
+    return FunctionExecutor(BUILTIN_FUNCTIONS)
+
+
+def test_expressions_compiled_once():
+    """Test repeated expressions reuse the cached code object."""
+    compile_expression.cache_clear()
+
+    first = compile_expression("random_string(8)")
+    second = compile_expression("random_string(8)")
+
+    assert first is second
+    info = compile_expression.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_validation_results(executor):
+    """Test unsafe and invalid expressions are rejected (and cached as such)."""
+    assert executor.validate_function_call("current_time()")
+    assert not executor.validate_function_call("os.system('ls')")
+    assert not executor.validate_function_call("random_string(")
+    assert compile_expression("os.system('ls')") is None
+
+
+def test_execute_uses_cached_code(executor):
+    """Test execution results with cached code objects."""
+    for value in range(3):
+        assert executor.execute_function("to_uppercase(s) + str(n)", {"s": "a", "n": value}) == (
+            f"A{value}"
+        )
+    assert len(executor.execute_function("random_string(8)", {})) == 8
+
+    with pytest.raises(ValueError, match="Unsafe or invalid"):
+        executor.execute_function("sys.exit(1)", {})
+
+
+def test_nested_scopes_evaluated_once():
+    """Test expressions with nested scopes see the context and run only once."""
+    calls = []
+
+    def tick():
+        calls.append(1)
+        return len(calls)
+
+    executor = FunctionExecutor({**BUILTIN_FUNCTIONS, "tick": tick})
+
+    assert executor.execute_function("sum(tick() + n for _ in range(2))", {"n": 10}) == 23
+    assert len(calls) == 2
+    assert executor.execute_function("(lambda: prefix + s)()", {"prefix": "a", "s": "b"}) == "ab"
@@ -0,0 +1,116 @@
+"""Tests for batched global-param placeholder parsing."""
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.global_param import GlobalParam
+from app.services.global_param_service import GlobalParamService
+
+
+@pytest.mark.asyncio
+async def test_pure_expressions_evaluated_once(async_session: AsyncSession):
+    """Test deterministic expressions are shared across the batch."""
+    service = GlobalParamService(async_session)
+
+    results, evaluated, deduplicated = await service.parse_batch(
+        ["{{to_uppercase('a')}}-{{random_string(12)}}"] * 3,
+        {},
+    )
+
+    assert [item["parsed"][:1] for item in results] == ["A", "A", "A"]
+    # One to_uppercase plus three random_string evaluations
+    assert evaluated == 4
+    assert deduplicated == 2
+    suffixes = {item["parsed"].split("-", 1)[1] for item in results}
+    assert len(suffixes) == 3
+    assert all(item["success"] for item in results)
+
+
+@pytest.mark.asyncio
+async def test_structures_and_context(async_session: AsyncSession):
+    """Test dicts/lists are parsed recursively with the shared context."""
+    service = GlobalParamService(async_session)
+
+    results, _, _ = await service.parse_batch(
+        [{"name": "{{to_lowercase(user)}}", "tags": ["{{user}}", 3]}, "plain"],
+        {"user": "Alice"},
+    )
+
+    assert results[0]["parsed"] == {"name": "alice", "tags": ["Alice", 3]}
+    assert results[0]["functions_called"] == ["to_lowercase(user)", "user"]
+    assert results[1] == {
+        "parsed": "plain",
+        "functions_called": [],
+        "success": True,
+        "error": None,
+    }
+
+
+@pytest.mark.asyncio
+async def test_user_function_marked_deterministic(async_session: AsyncSession):
+    """Test is_deterministic user functions are deduplicated."""
+    async_session.add_all(
+        [
+            GlobalParam(
+                class_name="Custom",
+                method_name="triple",
+                description="Triple",
+                code="def triple(x):\n    return x * 3\n",
+                is_deterministic=True,
+            ),
+            GlobalParam(
+                class_name="Custom",
+                method_name="half",
+                description="Half",
+                code="def half(x):\n    return x / 2\n",
+            ),
+        ]
+    )
+    await async_session.commit()
+    service = GlobalParamService(async_session)
+
+    results, evaluated, deduplicated = await service.parse_batch(
+        ["{{triple(2)}}", "{{triple(2)}}", "{{half(4)}}", "{{half(4)}}"], {}
+    )
+
+    assert [item["parsed"] for item in results] == ["6", "6", "2.0", "2.0"]
+    assert evaluated == 3
+    assert deduplicated == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_placeholder_kept(async_session: AsyncSession):
+    """Test a failing placeholder is left in place and reported."""
+    service = GlobalParamService(async_session)
+
+    results, _, _ = await service.parse_batch(["ok={{to_uppercase('x')}} bad={{missing()}}"], {})
+
+    assert results[0]["parsed"] == "ok=X bad={{missing()}}"
+    assert results[0]["success"] is False
+    assert results[0]["error"]
+
+
+@pytest.mark.asyncio
+async def test_shadowed_builtin_not_deduplicated(async_session: AsyncSession):
+    """Test a user function shadowing a pure built-in is evaluated every time."""
+    async_session.add(
+        GlobalParam(
+            class_name="Custom",
+            method_name="to_uppercase",
+            description="Random suffix",
+            code=(
+                "def to_uppercase(s):\n"
+                "    import random\n"
+                "    return s.upper() + str(random.random())\n"
+            ),
+        )
+    )
+    await async_session.commit()
+    service = GlobalParamService(async_session)
+
+    assert "to_uppercase" not in await service.get_deterministic_functions()
+    results, evaluated, deduplicated = await service.parse_batch(["{{to_uppercase('a')}}"] * 2, {})
+
+    assert evaluated == 2
+    assert deduplicated == 0
+    assert results[0]["parsed"] != results[1]["parsed"]
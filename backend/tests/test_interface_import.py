@@ -0,0 +1,508 @@
+"""Tests for bulk interface import."""
+
+import io
+import json
+import threading
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.main import app
+from app.middleware.auth import get_current_user
+from app.models.interface import Interface
+from app.models.interface_folder import InterfaceFolder
+from app.models.keyword import Keyword
+from app.models.scenario import Scenario
+from app.models.scenario_step import ScenarioStep
+from app.services.interface_import_service import InterfaceImportService
+from app.services.interface_service import InterfaceService
+from app.utils import parse_pool
+from app.utils.import_parsers import (
+    parse_curl_chunk,
+    parse_har,
+    parse_openapi,
+    parse_postman,
+    split_curl_commands,
+)
+from app.utils.json_stream import JsonSource
+
+OPENAPI = {
+    "openapi": "3.0.0",
+    "servers": [{"url": "https://api.example.com/v1"}],
+    "components": {
+        "parameters": {"Token": {"name": "X-Token", "in": "header", "example": "abc"}}
+    },
+    "paths": {
+        "/users": {
+            "parameters": [{"$ref": "#/components/parameters/Token"}],
+            "get": {
+                "summary": "List users",
+                "tags": ["Users"],
+                "parameters": [{"name": "page", "in": "query", "schema": {"default": 1}}],
+            },
+            "post": {
+                "operationId": "createUser",
+                "tags": ["Users"],
+                "requestBody": {
+                    "content": {
+                        "application/json": {
+                            "schema": {
+                                "type": "object",
+                                "properties": {
+                                    "name": {"type": "string", "example": "bob"},
+                                    "age": {"type": "integer"},
+                                },
+                            }
+                        }
+                    }
+                },
+            },
+        },
+        "/tags": {
+            "put": {
+                "requestBody": {
+                    "content": {"application/json": {"example": ["a", "b"]}}
+                }
+            },
+            "options": {"summary": "Ignored"},
+        },
+    },
+}
+
+SWAGGER_YAML = b"""
+swagger: "2.0"
+basePath: /api/
+paths:
+  /login:
+    post:
+      summary: Login
+      tags: [Auth]
+      parameters:
+        - {name: user, in: formData, default: admin}
+        - {name: password, in: formData}
+"""
+
+POSTMAN = {
+    "info": {
+        "name": "Shop",
+        "schema": "https://schema.getpostman.com/json/collection/v2.1.0/collection.json",
+    },
+    "variable": [{"key": "baseUrl", "value": "https://shop.example.com"}],
+    "item": [
+        {"name": "Health", "request": {"method": "GET", "url": "{{baseUrl}}/health"}},
+        {
+            "name": "Orders",
+            "item": [
+                {
+                    "name": "Create order",
+                    "request": {
+                        "method": "POST",
+                        "header": [
+                            {"key": "Content-Type", "value": "application/json"},
+                            {"key": "X-Debug", "value": "1", "disabled": True},
+                        ],
+                        "url": {
+                            "raw": "{{baseUrl}}/orders?dry=1",
+                            "query": [{"key": "dry", "value": "1"}],
+                        },
+                        "body": {"mode": "raw", "raw": '{"sku": "A1"}'},
+                    },
+                },
+                {
+                    "name": "Nested",
+                    "item": [
+                        {
+                            "name": "Login",
+                            "request": {
+                                "method": "POST",
+                                "url": "{{baseUrl}}/login",
+                                "body": {
+                                    "mode": "urlencoded",
+                                    "urlencoded": [{"key": "user", "value": "bob"}],
+                                },
+                            },
+                        }
+                    ],
+                },
+            ],
+        },
+    ],
+}
+
+
+def _har_entry(method: str, url: str, text: str | None = None) -> dict:
+    request = {
+        "method": method,
+        "url": url,
+        "headers": [{"name": ":authority", "value": "x"}, {"name": "Accept", "value": "*/*"}],
+        "queryString": [],
+    }
+    if text is not None:
+        request["postData"] = {"mimeType": "application/json; charset=utf-8", "text": text}
+    return {"request": request, "response": {"status": 200, "content": {"text": "x" * 100}}}
+
+
+HAR = {
+    "log": {
+        "version": "1.2",
+        "entries": [
+            _har_entry("GET", "https://api.example.com/items?page=2"),
+            _har_entry("POST", "https://api.example.com/items", '{"name": "a"}'),
+            _har_entry("GET", "https://api.example.com/items?page=2"),
+            _har_entry("POST", "https://api.example.com/items", '{"name": "b"}'),
+        ],
+    }
+}
+
+
+def _source(document) -> JsonSource:
+    data = document if isinstance(document, bytes) else json.dumps(document).encode()
+    return JsonSource(io.BytesIO(data))
+
+
+def test_parse_openapi3():
+    """Test OpenAPI 3 operations, parameters and bodies are extracted."""
+    items = {(i["method"], i["path"]): i for i in parse_openapi(_source(OPENAPI))}
+    assert set(items) == {("GET", "/v1/users"), ("POST", "/v1/users"), ("PUT", "/v1/tags")}
+
+    listing = items[("GET", "/v1/users")]
+    assert listing["name"] == "List users"
+    assert listing["folder"] == "Users"
+    assert listing["headers"] == {"X-Token": "abc"}
+    assert listing["params"] == {"page": 1}
+
+    create = items[("POST", "/v1/users")]
+    assert create["name"] == "createUser"
+    assert create["body"] == {"name": "bob", "age": 0}
+    assert items[("PUT", "/v1/tags")]["folder"] is None
+
+
+def test_parse_swagger2_yaml():
+    """Test Swagger 2 YAML with basePath and form parameters."""
+    [item] = parse_openapi(_source(SWAGGER_YAML))
+    assert item["path"] == "/api/login"
+    assert item["body"] == {"user": "admin", "password": ""}
+    assert item["body_type"] == "form-data"
+
+
+def test_parse_rejects_other_documents():
+    """Test documents that aren't OpenAPI raise ValueError."""
+    with pytest.raises(ValueError, match="Not an OpenAPI"):
+        list(parse_openapi(_source({"info": {}})))
+    with pytest.raises(ValueError, match="Invalid JSON"):
+        list(parse_openapi(_source(b"{not json")))
+
+
+def test_json_source_streams_documents_with_bom():
+    """Test JSON is streamed with ijson, after any byte order mark."""
+    source = JsonSource(io.BytesIO(b"\xef\xbb\xbf" + json.dumps(OPENAPI).encode()))
+    assert source.streaming
+    assert source.value("openapi") == "3.0.0"
+    assert [key for key, _ in source.kvitems("paths")] == list(OPENAPI["paths"])
+
+
+def test_json_source_reads_header_fields_in_one_pass():
+    """Test values() stops once every prefix is found and skips absent ones."""
+    # The rest of the document is never reached, so its syntax error is not seen
+    source = _source(b'{"openapi": "3.0.0", "servers": [{"url": "/v1"}], "paths": {oops')
+    assert source.values("openapi", "servers.item.url") == {
+        "openapi": "3.0.0",
+        "servers.item.url": "/v1",
+    }
+    assert _source(OPENAPI).values("swagger", "components.parameters", "openapi") == {
+        "components.parameters": OPENAPI["components"]["parameters"],
+        "openapi": "3.0.0",
+    }
+    assert _source(SWAGGER_YAML).values("swagger", "basePath") == {
+        "swagger": "2.0",
+        "basePath": "/api/",
+    }
+
+
+@pytest.mark.asyncio
+async def test_import_parses_off_the_event_loop(db_session: AsyncSession, test_project):
+    """Test parsed items are pulled in a worker thread, not on the event loop."""
+    threads = set()
+
+    def items():
+        for i in range(3):
+            threads.add(threading.get_ident())
+            yield {"method": "GET", "path": f"/item/{i}"}
+
+    summary = await InterfaceImportService(db_session).import_interfaces(
+        test_project.id, items()
+    )
+
+    assert summary["created"] == 3
+    assert threads and threading.get_ident() not in threads
+
+
+@pytest.mark.asyncio
+async def test_import_openapi_creates_folders_and_interfaces(
+    db_session: AsyncSession, test_project
+):
+    """Test an import creates tag folders and bumps the tree version."""
+    service = InterfaceImportService(db_session)
+    version = await InterfaceService(db_session).get_tree_version(test_project.id)
+
+    summary = await service.import_openapi(
+        test_project.id, io.BytesIO(json.dumps(OPENAPI).encode())
+    )
+    assert summary == {
+        "created": 3,
+        "updated": 0,
+        "skipped": 0,
+        "folders_created": 1,
+        "errors": [],
+    }
+    assert await InterfaceService(db_session).get_tree_version(test_project.id) == version + 1
+
+    folder_id = await db_session.scalar(
+        select(InterfaceFolder.id).where(InterfaceFolder.name == "Users")
+    )
+    result = await db_session.execute(
+        select(Interface.path, Interface.folder_id, Interface.body, Interface.body_type)
+        .where(Interface.project_id == test_project.id)
+        .order_by(Interface.id)
+    )
+    rows = result.all()
+    assert [(r.path, r.folder_id) for r in rows] == [
+        ("/v1/users", folder_id),
+        ("/v1/users", folder_id),
+        ("/v1/tags", None),
+    ]
+    # Array bodies are stored as raw text
+    assert (rows[2].body, rows[2].body_type) == ({"raw": '["a", "b"]'}, "raw")
+
+    # Re-import: existing interfaces and folders are reused
+    summary = await service.import_openapi(
+        test_project.id, io.BytesIO(json.dumps(OPENAPI).encode())
+    )
+    assert (summary["created"], summary["skipped"], summary["folders_created"]) == (0, 3, 0)
+
+
+@pytest.mark.asyncio
+async def test_import_modes(db_session: AsyncSession, test_project):
+    """Test skip, upsert and append handling of existing (method, path)."""
+    db_session.add(
+        Interface(project_id=test_project.id, name="Old", method="GET", path="/ping")
+    )
+    await db_session.flush()
+    service = InterfaceImportService(db_session)
+    items = [
+        {"name": "Ping", "method": "get", "path": "/ping"},
+        {"name": "Pong", "method": "GET", "path": "/pong"},
+        {"name": "Pong 2", "method": "GET", "path": "/pong"},
+        {"name": "Bad", "method": "TRACE", "path": "/x"},
+    ]
+
+    summary = await service.import_interfaces(test_project.id, items, mode="skip")
+    assert (summary["created"], summary["updated"], summary["skipped"]) == (1, 0, 3)
+    assert summary["errors"] == ["#4 Bad: unsupported method TRACE"]
+
+    summary = await service.import_interfaces(test_project.id, items, mode="upsert")
+    assert (summary["created"], summary["updated"]) == (0, 2)
+    result = await db_session.execute(
+        select(Interface.path, Interface.name).where(Interface.project_id == test_project.id)
+    )
+    assert dict(result.all()) == {"/ping": "Ping", "/pong": "Pong 2"}
+
+    summary = await service.import_interfaces(test_project.id, items[:2], mode="append")
+    assert summary["created"] == 2
+
+    with pytest.raises(ValueError, match="Invalid import mode"):
+        await service.import_interfaces(test_project.id, items, mode="replace")
+    with pytest.raises(ValueError, match="Folder 999 not found"):
+        await service.import_interfaces(test_project.id, items, folder_id=999)
+
+
+@pytest.mark.asyncio
+async def test_import_openapi_endpoint(client: AsyncClient, test_project):
+    """Test the multipart upload endpoint."""
+    response = await client.post(
+        "/api/v1/interfaces/import/openapi",
+        data={"project_id": str(test_project.id), "mode": "upsert"},
+        files={"file": ("spec.yaml", SWAGGER_YAML, "application/yaml")},
+    )
+    assert response.status_code == 201
+    assert response.json()["created"] == 1
+
+    response = await client.post(
+        "/api/v1/interfaces/import/openapi",
+        data={"project_id": str(test_project.id)},
+        files={"file": ("spec.json", b'{"info": {}}', "application/json")},
+    )
+    assert response.status_code == 400
+
+
+def test_parse_postman():
+    """Test requests keep order, folders and variable-prefixed paths."""
+    items = list(parse_postman(_source(POSTMAN)))
+    assert [(i["method"], i["path"], i["folder"]) for i in items] == [
+        ("GET", "/health", None),
+        ("POST", "/orders", "Orders"),
+        ("POST", "/login", "Orders"),
+    ]
+    create = items[1]
+    assert create["headers"] == {"Content-Type": "application/json"}
+    assert create["params"] == {"dry": "1"}
+    assert (create["body"], create["body_type"]) == ({"sku": "A1"}, "json")
+    assert (items[2]["body"], items[2]["body_type"]) == ({"user": "bob"}, "form-data")
+
+    with pytest.raises(ValueError, match="Not a Postman collection"):
+        list(parse_postman(_source(OPENAPI)))
+
+
+def test_parse_har():
+    """Test HAR entries become interfaces grouped by host."""
+    items = list(parse_har(_source(HAR)))
+    assert len(items) == 4
+    first = items[0]
+    assert (first["path"], first["params"], first["folder"]) == (
+        "/items",
+        {"page": "2"},
+        "api.example.com",
+    )
+    # Pseudo headers are dropped
+    assert first["headers"] == {"Accept": "*/*"}
+    assert items[1]["body"] == {"name": "a"}
+
+    with pytest.raises(ValueError, match="Not a HAR document"):
+        list(parse_har(_source(POSTMAN)))
+
+
+@pytest.mark.asyncio
+async def test_import_har_dedupes_and_creates_scenario(
+    db_session: AsyncSession, test_project, test_user
+):
+    """Test identical requests collapse and the scenario replays the rest."""
+    db_session.add(
+        Keyword(type="http_request", name="HTTP", method_name="http_request", code="pass")
+    )
+    await db_session.flush()
+
+    service = InterfaceImportService(db_session)
+    # The scenario creator is never defaulted
+    with pytest.raises(TypeError, match="creator_id"):
+        await service.import_har(test_project.id, io.BytesIO(b"{}"))  # type: ignore[call-arg]
+
+    summary = await service.import_har(
+        test_project.id,
+        io.BytesIO(json.dumps(HAR).encode()),
+        scenario_name="Captured",
+        creator_id=test_user.id,
+    )
+    # Repeated GET is an identical request; second POST shares (method, path)
+    assert (summary["created"], summary["skipped"]) == (2, 2)
+
+    scenario = await db_session.get(Scenario, summary["scenario_id"])
+    assert scenario.name == "Captured"
+    result = await db_session.execute(
+        select(ScenarioStep.sort_order, ScenarioStep.params)
+        .where(ScenarioStep.scenario_id == scenario.id)
+        .order_by(ScenarioStep.sort_order)
+    )
+    steps = result.all()
+    assert [s.sort_order for s in steps] == [0, 1, 2]
+    assert steps[0].params == {
+        "url": "https://api.example.com/items?page=2",
+        "method": "GET",
+        "headers": {"Accept": "*/*"},
+    }
+    assert steps[2].params["json"] == {"name": "b"}
+
+
+@pytest.mark.asyncio
+async def test_import_postman_endpoint(
+    client: AsyncClient, db_session, test_project, test_user
+):
+    """Test the Postman upload endpoint and scenario variables."""
+    app.dependency_overrides[get_current_user] = lambda: test_user
+    db_session.add(
+        Keyword(type="http_request", name="HTTP", method_name="http_request", code="pass")
+    )
+    await db_session.flush()
+
+    response = await client.post(
+        "/api/v1/interfaces/import/postman",
+        data={"project_id": str(test_project.id), "scenario_name": "Shop"},
+        files={"file": ("shop.json", json.dumps(POSTMAN).encode(), "application/json")},
+    )
+    assert response.status_code == 201
+    data = response.json()
+    assert (data["created"], data["folders_created"]) == (3, 1)
+
+    scenario = await db_session.get(Scenario, data["scenario_id"])
+    assert scenario.creator_id == test_user.id
+    assert scenario.variables == {"baseUrl": "https://shop.example.com"}
+
+
+CURL_FILE = """# saved snippets
+curl https://api.example.com/users?page=1
+
+curl -X POST https://api.example.com/users \\
+  -H 'Content-Type: application/json' \\
+  -d '{"name": "bob"}'
+wget https://api.example.com/
+curl 'https://api.example.com/unterminated
+"""
+
+
+def test_split_and_parse_curl_commands():
+    """Test continuation lines, comments and per-command errors."""
+    commands = split_curl_commands(CURL_FILE)
+    assert [line for line, _ in commands] == [2, 4, 7, 8]
+    results = parse_curl_chunk([command for _, command in commands])
+
+    assert results[0] == (
+        True,
+        {
+            "method": "GET",
+            "path": "/users",
+            "headers": {},
+            "params": {"page": "1"},
+            "body": {},
+            "body_type": "json",
+            "name": "GET /users",
+        },
+    )
+    ok, created = results[1]
+    assert ok and created["method"] == "POST" and created["body"] == {"name": "bob"}
+    assert results[2] == (False, "Invalid cURL command: must start with 'curl'")
+    assert results[3][0] is False
+
+
+@pytest.mark.asyncio
+async def test_parse_in_pool_uses_worker_processes(monkeypatch):
+    """Test large batches are split across workers and keep their order."""
+    monkeypatch.setattr(parse_pool.settings, "IMPORT_PARSE_WORKERS", 2)
+    monkeypatch.setattr(parse_pool, "_MIN_POOL_ITEMS", 4)
+    commands = [f"curl https://example.com/items/{i}" for i in range(10)]
+    try:
+        results = await parse_pool.parse_in_pool(parse_curl_chunk, commands)
+        assert parse_pool._parse_pool is not None
+    finally:
+        parse_pool.shutdown_parse_pool()
+    assert [value["path"] for _, value in results] == [f"/items/{i}" for i in range(10)]
+
+
+@pytest.mark.asyncio
+async def test_import_curl_batch_endpoint(client: AsyncClient, db_session, test_project):
+    """Test a cURL file imports successes and reports failing lines."""
+    response = await client.post(
+        "/api/v1/interfaces/import/curl/batch",
+        data={"project_id": str(test_project.id)},
+        files={"file": ("snippets.txt", CURL_FILE.encode(), "text/plain")},
+    )
+    assert response.status_code == 201
+    data = response.json()
+    assert (data["created"], data["skipped"]) == (2, 2)
+    assert data["errors"][0] == "line 7: Invalid cURL command: must start with 'curl'"
+    assert data["errors"][1].startswith("line 8: ")
+
+    result = await db_session.execute(
+        select(Interface.method, Interface.path).where(Interface.project_id == test_project.id)
+    )
+    assert sorted(result.all()) == [("GET", "/users"), ("POST", "/users")]
@@ -1,6 +1,9 @@
 """Tests for interface service."""
 
+import json
+
 import pytest
+from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.interface import Interface
@@ -248,7 +251,8 @@ async def test_batch_reorder(db_session: AsyncSession, test_project):
         updates=[
             {"id": interface1.id, "sort_order": 10},
             {"id": interface2.id, "sort_order": 20},
-        ]
+        ],
+        project_id=test_project.id,
     )
 
     result = await service.batch_reorder(reorder_request)
@@ -261,3 +265,167 @@ async def test_batch_reorder(db_session: AsyncSession, test_project):
 
     assert interface1.sort_order == 10
     assert interface2.sort_order == 20
+
+
+@pytest.mark.asyncio
+async def test_tree_version_tracks_mutations(db_session: AsyncSession, test_project):
+    """Test every folder and interface change bumps the tree version."""
+    service = InterfaceService(db_session)
+    assert await service.get_tree_version(test_project.id) == 0
+
+    folder = await service.create_folder(
+        InterfaceFolderCreate(project_id=test_project.id, name="API")
+    )
+    interface = await service.create_interface(
+        InterfaceCreate(project_id=test_project.id, name="Ping", method="GET", path="/ping")
+    )
+    await service.update_interface(interface.id, InterfaceUpdate(folder_id=folder.id))
+    await service.batch_reorder(
+        InterfaceReorderRequest(
+            updates=[{"id": interface.id, "sort_order": 5}], project_id=test_project.id
+        )
+    )
+    await service.delete_interface(interface.id)
+
+    assert await service.get_tree_version(test_project.id) == 5
+    assert await service.get_tree_version(test_project.id + 1) is None
+
+
+@pytest.mark.asyncio
+async def test_tree_json_is_cached_per_version(db_session: AsyncSession, test_project):
+    """Test the serialized tree is reused until the tree changes."""
+    service = InterfaceService(db_session)
+    await service.create_interface(
+        InterfaceCreate(project_id=test_project.id, name="Ping", method="GET", path="/ping")
+    )
+
+    version = await service.get_tree_version(test_project.id)
+    body = await service.get_interface_tree_json(test_project.id, version)
+    nodes = json.loads(body)
+    assert [node["name"] for node in nodes] == ["Ping"]
+    assert nodes == [
+        node.model_dump(exclude={"child_count"})
+        for node in await service.get_interface_tree(test_project.id)
+    ]
+
+    # Rows written behind the service's back are not seen until a bump
+    db_session.add(
+        Interface(project_id=test_project.id, name="Hidden", method="GET", path="/hidden")
+    )
+    await db_session.flush()
+    assert await service.get_interface_tree_json(test_project.id, version) == body
+
+    await service.create_interface(
+        InterfaceCreate(project_id=test_project.id, name="Pong", method="GET", path="/pong")
+    )
+    new_version = await service.get_tree_version(test_project.id)
+    assert new_version != version
+    assert len(json.loads(await service.get_interface_tree_json(test_project.id, new_version))) == 3
+
+
+@pytest.mark.asyncio
+async def test_tree_endpoint_not_modified(client: AsyncClient, test_project):
+    """Test the tree endpoint answers 304 for a matching ETag."""
+    url = f"/api/v1/interfaces/tree?project_id={test_project.id}"
+    first = await client.get(url)
+    assert first.status_code == 200
+    assert first.json() == []
+
+    cached = await client.get(url, headers={"If-None-Match": first.headers["ETag"]})
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == first.headers["ETag"]
+
+    await client.post(
+        "/api/v1/interfaces",
+        json={"project_id": test_project.id, "name": "Ping", "method": "GET", "path": "/ping"},
+    )
+    changed = await client.get(url, headers={"If-None-Match": first.headers["ETag"]})
+    assert changed.status_code == 200
+    assert [node["name"] for node in changed.json()] == ["Ping"]
+
+    missing = await client.get(f"/api/v1/interfaces/tree?project_id={test_project.id + 1}")
+    assert missing.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_interface_subtree(db_session: AsyncSession, test_project):
+    """Test lazy subtree loading returns one level with child counts."""
+    service = InterfaceService(db_session)
+    api = InterfaceFolder(project_id=test_project.id, name="API")
+    db_session.add(api)
+    await db_session.flush()
+    auth = InterfaceFolder(project_id=test_project.id, name="Auth", parent_id=api.id)
+    empty = InterfaceFolder(project_id=test_project.id, name="Empty", parent_id=api.id)
+    db_session.add_all([auth, empty])
+    await db_session.flush()
+    db_session.add_all(
+        [
+            Interface(project_id=test_project.id, name="Health", method="GET", path="/health"),
+            Interface(
+                project_id=test_project.id, folder_id=api.id, name="User", method="GET", path="/u"
+            ),
+            Interface(
+                project_id=test_project.id,
+                folder_id=auth.id,
+                name="Login",
+                method="POST",
+                path="/login",
+            ),
+        ]
+    )
+    await db_session.flush()
+
+    root = await service.get_interface_subtree(test_project.id)
+    assert [(node["name"], node["child_count"]) for node in root] == [("Health", 0), ("API", 3)]
+    assert root[1]["children"] == []
+
+    level = await service.get_interface_subtree(test_project.id, parent_id=api.id)
+    assert [(node["name"], node["child_count"]) for node in level] == [
+        ("User", 0),
+        ("Auth", 1),
+        ("Empty", 0),
+    ]
+
+    deep = await service.get_interface_subtree(test_project.id, depth=3)
+    assert deep[1]["child_count"] == 3
+    assert [node["name"] for node in deep[1]["children"][1]["children"]] == ["Login"]
+
+    with pytest.raises(ValueError, match="not found"):
+        await service.get_interface_subtree(test_project.id + 1, parent_id=api.id)
+
+
+@pytest.mark.asyncio
+async def test_tree_endpoint_lazy_mode(client: AsyncClient, test_project):
+    """Test the tree endpoint serves one level per request in lazy mode."""
+    folder = await client.post(
+        "/api/v1/interfaces/folders", json={"project_id": test_project.id, "name": "API"}
+    )
+    folder_id = folder.json()["id"]
+    await client.post(
+        "/api/v1/interfaces",
+        json={
+            "project_id": test_project.id,
+            "folder_id": folder_id,
+            "name": "Ping",
+            "method": "GET",
+            "path": "/ping",
+        },
+    )
+
+    url = f"/api/v1/interfaces/tree?project_id={test_project.id}"
+    root = await client.get(f"{url}&depth=1")
+    assert root.status_code == 200
+    assert [(n["name"], n["child_count"], n["children"]) for n in root.json()] == [
+        ("API", 1, [])
+    ]
+    assert root.headers["ETag"] != (await client.get(url)).headers["ETag"]
+
+    children = await client.get(f"{url}&parent_id={folder_id}")
+    assert [n["name"] for n in children.json()] == ["Ping"]
+    cached = await client.get(
+        f"{url}&parent_id={folder_id}", headers={"If-None-Match": children.headers["ETag"]}
+    )
+    assert cached.status_code == 304
+
+    missing = await client.get(f"{url}&parent_id={folder_id + 100}")
+    assert missing.status_code == 404
@@ -0,0 +1,109 @@
+"""Tests for compiled JSON path extraction."""
+
+import pytest
+
+from app.builtin_keywords import BUILTIN_KEYWORDS
+from app.utils.json_path import compile_path, compile_regex, extract, extract_many
+
+DOCUMENT = {
+    "data": {"user": {"id": 42, "name": "alice"}, "a.b": "dotted"},
+    "items": [
+        {"id": 1, "status": "ok", "price": 10},
+        {"id": 2, "status": "error", "price": 25},
+        {"id": 3, "status": "ok", "price": 40, "tags": ["x"]},
+    ],
+}
+
+RESPONSE = {
+    "status_code": 200,
+    "headers": {"content-type": "application/json", "x-request-id": "req-1"},
+    "text": 'token="abc123"',
+    "json": DOCUMENT,
+}
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        ("data.user.id", 42),
+        ("$.data.user.name", "alice"),
+        ("items[0].id", 1),
+        ("items[-1].id", 3),
+        ("items.1.status", "error"),
+        ("data['a.b']", "dotted"),
+        ("items[*].id", [1, 2, 3]),
+        ('items[?(@.status=="ok")].id', [1, 3]),
+        ("items[?(@.price>=25)].id", [2, 3]),
+        ("items[?(@.tags)].id", [3]),
+        ("data.*.id", [42]),
+    ],
+)
+def test_path_extraction(path, expected):
+    """Test supported path syntax."""
+    assert compile_path(path).get(DOCUMENT) == expected
+
+
+def test_missing_paths():
+    """Test missing paths raise or fall back to the default."""
+    assert compile_path("data.user.email").get(DOCUMENT, None) is None
+    assert not compile_path("items[5]").exists(DOCUMENT)
+    assert not compile_path('items[?(@.status=="gone")]').exists(DOCUMENT)
+    with pytest.raises(KeyError):
+        compile_path("data.user.id.value").get(DOCUMENT)
+
+
+def test_invalid_path():
+    """Test malformed paths are rejected at compile time."""
+    with pytest.raises(ValueError):
+        compile_path("items[?(status)]")
+
+
+def test_compiled_paths_and_regexes_are_cached():
+    """Test repeated compilation returns the cached program."""
+    assert compile_path("items[0].id") is compile_path("items[0].id")
+    assert compile_regex(r"token=\"(\w+)\"") is compile_regex(r"token=\"(\w+)\"")
+
+
+def test_extract_rules():
+    """Test single extraction by JSON path, header and regex."""
+    assert extract(RESPONSE, json_path="items[1].id") == 2
+    assert extract(RESPONSE, header_name="X-Request-Id") == "req-1"
+    assert extract(RESPONSE, regex_pattern=r'token="(\w+)"') == "abc123"
+
+    with pytest.raises(ValueError, match="只能提供一个提取方式"):
+        extract(RESPONSE, json_path="data", header_name="x-request-id")
+    with pytest.raises(ValueError, match="JSON 路径不存在"):
+        extract(RESPONSE, json_path="data.missing")
+
+
+def test_extract_many():
+    """Test batch extraction of several variables from one response."""
+    values = extract_many(
+        RESPONSE,
+        {
+            "user_id": "data.user.id",
+            "ok_ids": 'items[?(@.status=="ok")].id',
+            "request_id": {"header_name": "x-request-id"},
+            "token": {"regex_pattern": r'token="(\w+)"'},
+        },
+    )
+
+    assert values == {"user_id": 42, "ok_ids": [1, 3], "request_id": "req-1", "token": "abc123"}
+
+    with pytest.raises(ValueError, match="^missing: "):
+        extract_many(RESPONSE, {"missing": "data.nope"})
+
+
+def test_builtin_keywords_use_compiled_paths():
+    """Test built-in extract/assert keywords accept indexed paths."""
+    functions = {}
+    for keyword in BUILTIN_KEYWORDS:
+        if keyword["method_name"] in ("extract_variable", "assert_response"):
+            namespace: dict = {}
+            exec(keyword["code"], namespace)
+            functions[keyword["method_name"]] = namespace[keyword["method_name"]]
+
+    assert functions["extract_variable"](RESPONSE, json_path="items[2].tags[0]") == "x"
+    assert functions["assert_response"](RESPONSE, json_path_exists="items[0].id") is True
+    with pytest.raises(AssertionError, match="JSON 路径不存在"):
+        functions["assert_response"](RESPONSE, json_path_exists="items[9]")
@@ -0,0 +1,50 @@
+"""Tests for latency histogram utility."""
+
+import pytest
+
+from app.utils.latency_histogram import LatencyHistogram
+
+
+def test_empty_histogram():
+    """Test summary of an empty histogram."""
+    histogram = LatencyHistogram()
+
+    summary = histogram.summary()
+
+    assert summary["count"] == 0
+    assert summary["p50_ms"] is None
+    assert summary["mean_ms"] is None
+
+
+def test_percentiles_within_relative_error():
+    """Test percentiles stay within the configured relative error."""
+    histogram = LatencyHistogram(significant_bits=8)
+    for value in range(1, 10001):
+        histogram.record(value / 10)  # 0.1ms .. 1000ms
+
+    assert histogram.count == 10000
+    assert histogram.percentile(50) == pytest.approx(500, rel=0.01)
+    assert histogram.percentile(95) == pytest.approx(950, rel=0.01)
+    assert histogram.percentile(99) == pytest.approx(990, rel=0.01)
+    assert histogram.percentile(100) == pytest.approx(1000)
+    assert histogram.mean == pytest.approx(500.05, rel=0.001)
+
+
+def test_merge_histograms():
+    """Test merging two histograms."""
+    first = LatencyHistogram()
+    second = LatencyHistogram()
+    first.record(1)
+    second.record(100)
+
+    first.merge(second)
+
+    assert first.count == 2
+    assert first.summary()["min_ms"] == 1
+    assert first.summary()["max_ms"] == 100
+
+
+def test_merge_different_precision_rejected():
+    """Test merging histograms with different precision fails."""
+    with pytest.raises(ValueError):
+        LatencyHistogram(significant_bits=8).merge(LatencyHistogram(significant_bits=6))
@@ -0,0 +1,329 @@
+"""Tests for scenario load test service."""
+
+import asyncio
+
+import httpx
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.environment import Environment
+from app.models.keyword import Keyword
+from app.models.scenario import Scenario
+from app.models.scenario_step import ScenarioStep
+from app.schemas.load_test import LoadTestRequest
+from app.config import settings
+from app.services.load_test_service import LoadTestService, cancel_load_test_jobs
+from app.utils.function_executor import random_string
+from app.utils.seeded_random import seeded_scope
+
+
+async def _create_scenario(
+    session: AsyncSession, project_id: int, creator_id: int, keywords: list[Keyword], params: list
+) -> Scenario:
+    """Create a scenario with one step per keyword."""
+    session.add_all(keywords)
+    await session.flush()
+
+    scenario = Scenario(name="Load", project_id=project_id, creator_id=creator_id)
+    session.add(scenario)
+    await session.flush()
+
+    for index, (keyword, step_params) in enumerate(zip(keywords, params, strict=True)):
+        session.add(
+            ScenarioStep(
+                scenario_id=scenario.id,
+                description=keyword.name,
+                keyword_id=keyword.id,
+                params=step_params,
+                sort_order=index,
+            )
+        )
+    await session.commit()
+    return scenario
+
+
+def _http_keyword() -> Keyword:
+    return Keyword(
+        type="http_request",
+        name="HTTP 请求",
+        method_name="http_request",
+        code="def http_request(url, method='GET', **kwargs): ...",
+        is_builtin=True,
+    )
+
+
+@pytest.mark.asyncio
+async def test_virtual_users_mode(db_session: AsyncSession, test_project):
+    """Test closed-loop virtual users record per-step latencies."""
+    check = Keyword(
+        type="assertion",
+        name="检查状态码",
+        method_name="check_status",
+        code=(
+            "def check_status(response, expected=200):\n"
+            "    assert response['status_code'] == expected, 'bad status'\n"
+            "    return True\n"
+        ),
+    )
+    scenario = await _create_scenario(
+        db_session,
+        test_project.id,
+        test_project.creator_id,
+        [_http_keyword(), check],
+        [{"url": "/ping", "method": "GET"}, {}],
+    )
+
+    environment = Environment(
+        project_id=test_project.id, name="staging", base_url="http://staging.local"
+    )
+    db_session.add(environment)
+    await db_session.commit()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert str(request.url) == "http://staging.local/ping"
+        return httpx.Response(200, json={"ok": True})
+
+    service = LoadTestService(db_session, transport=httpx.MockTransport(handler))
+
+    result = await service.run_load_test(
+        scenario.id,
+        LoadTestRequest(environment_id=environment.id, virtual_users=3, duration_seconds=0.2),
+    )
+
+    assert result is not None
+    assert result.mode == "virtual_users"
+    assert result.iterations > 0
+    assert result.failed_iterations == 0
+    assert result.error_rate == 0
+    assert len(result.steps) == 2
+    assert result.steps[0].count == result.iterations
+    assert result.latency.p99_ms is not None
+
+
+@pytest.mark.asyncio
+async def test_arrival_rate_mode_counts_errors(db_session: AsyncSession, test_project):
+    """Test arrival-rate mode reports failing iterations."""
+    scenario = await _create_scenario(
+        db_session,
+        test_project.id,
+        test_project.creator_id,
+        [_http_keyword()],
+        [{"url": "http://service.local/fail", "method": "POST", "json": {"id": "{{user_id}}"}}],
+    )
+    scenario.variables = {"user_id": 7}
+    await db_session.commit()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.content == b'{"id":7}'
+        raise httpx.ConnectError("connection refused", request=request)
+
+    service = LoadTestService(db_session, transport=httpx.MockTransport(handler))
+
+    result = await service.run_load_test(
+        scenario.id,
+        LoadTestRequest(virtual_users=5, target_rps=50, duration_seconds=0.2),
+    )
+
+    assert result is not None
+    assert result.mode == "arrival_rate"
+    assert result.iterations > 0
+    assert result.failed_iterations == result.iterations
+    assert result.error_rate == 100
+    assert result.steps[0].errors == result.iterations
+    assert "connection refused" in result.errors
+
+
+@pytest.mark.asyncio
+async def test_scenario_not_found(db_session: AsyncSession):
+    """Test load test on a missing scenario."""
+    service = LoadTestService(db_session)
+
+    result = await service.run_load_test(99999, LoadTestRequest(duration_seconds=0.1))
+
+    assert result is None
+
+
+@pytest.mark.asyncio
+async def test_disabled_keyword_rejected(db_session: AsyncSession, test_project):
+    """Test scenarios using disabled keywords are rejected up front."""
+    keyword = _http_keyword()
+    keyword.is_enabled = False
+    scenario = await _create_scenario(
+        db_session, test_project.id, test_project.creator_id, [keyword], [{"url": "/"}]
+    )
+
+    service = LoadTestService(db_session)
+
+    with pytest.raises(ValueError, match="disabled"):
+        await service.run_load_test(scenario.id, LoadTestRequest(duration_seconds=0.1))
+
+
+@pytest.mark.asyncio
+async def test_shared_login_step_runs_once(db_session: AsyncSession, test_project):
+    """Test a shared login step is sent once and reused by every virtual user."""
+    get_token = Keyword(
+        type="extract",
+        name="提取 Token",
+        method_name="get_token",
+        code="def get_token(response):\n    return response['json']['token']\n",
+    )
+    http = _http_keyword()
+    scenario = await _create_scenario(
+        db_session,
+        test_project.id,
+        test_project.creator_id,
+        [http, get_token, http],
+        [
+            {"url": "http://auth.local/login", "method": "POST", "shared": True},
+            {"save_as": "token"},
+            {"url": "http://api.local/orders", "headers": {"Authorization": "Bearer {{token}}"}},
+        ],
+    )
+
+    calls = {"login": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/login":
+            calls["login"] += 1
+            return httpx.Response(200, json={"token": "abc"})
+        assert request.headers["Authorization"] == "Bearer abc"
+        return httpx.Response(200, json=[])
+
+    service = LoadTestService(db_session, transport=httpx.MockTransport(handler))
+
+    result = await service.run_load_test(
+        scenario.id, LoadTestRequest(virtual_users=4, duration_seconds=0.2)
+    )
+
+    assert result is not None
+    assert result.failed_iterations == 0
+    assert result.iterations > 1
+    assert calls["login"] == 1
+    assert result.shared_cache_misses == 1
+    assert result.shared_cache_hits == result.iterations - 1
+
+
+@pytest.mark.asyncio
+async def test_step_extract_param(db_session: AsyncSession, test_project):
+    """Test the extract step param stores several variables from one response."""
+    http = _http_keyword()
+    scenario = await _create_scenario(
+        db_session,
+        test_project.id,
+        test_project.creator_id,
+        [http, http],
+        [
+            {
+                "url": "http://api.local/orders",
+                "extract": {"first_id": "items[0].id", "open_ids": "items[?(@.open)].id"},
+            },
+            {"url": "http://api.local/orders/{{first_id}}", "params": {"ids": "{{open_ids}}"}},
+        ],
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/orders":
+            return httpx.Response(200, json={"items": [{"id": 5, "open": True}, {"id": 6}]})
+        assert request.url.path == "/orders/5"
+        assert request.url.params.get_list("ids") == ["5"]
+        return httpx.Response(200, json={})
+
+    service = LoadTestService(db_session, transport=httpx.MockTransport(handler))
+
+    result = await service.run_load_test(scenario.id, LoadTestRequest(duration_seconds=0.05))
+
+    assert result is not None
+    assert result.iterations > 0
+    assert result.failed_iterations == 0, result.errors
+
+
+@pytest.mark.asyncio
+async def test_seeded_iterations_are_reproducible(db_session: AsyncSession, test_project):
+    """Test each virtual user iteration draws from its own seeded generator."""
+    scenario = await _create_scenario(
+        db_session,
+        test_project.id,
+        test_project.creator_id,
+        [_http_keyword()],
+        [{"url": "http://api.local/users/{{random_string(8)}}"}],
+    )
+
+    paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        return httpx.Response(200, json={})
+
+    service = LoadTestService(db_session, transport=httpx.MockTransport(handler))
+
+    result = await service.run_load_test(
+        scenario.id, LoadTestRequest(virtual_users=2, duration_seconds=0.05, seed=42)
+    )
+
+    assert result is not None
+    assert result.seed == 42
+    for user in range(2):
+        with seeded_scope(42, "user", user, 0):
+            assert f"/users/{random_string(8)}" in paths
+
+    unseeded = await service.run_load_test(scenario.id, LoadTestRequest(duration_seconds=0.01))
+    assert unseeded is not None
+    assert unseeded.seed != 42
+
+
+@pytest.mark.asyncio
+async def test_load_test_endpoint_runs_in_background(
+    client: AsyncClient, db_session: AsyncSession, test_project
+):
+    """Test the load test is started as a job and polled for its result."""
+    noop = Keyword(
+        type="custom", name="Sleep", method_name="nap", code="import time\ndef nap():\n    time.sleep(0.001)\n"
+    )
+    scenario = await _create_scenario(
+        db_session, test_project.id, test_project.creator_id, [noop], [{}]
+    )
+
+    response = await client.post(
+        f"/api/v1/scenarios/{scenario.id}/load-test", json={"duration_seconds": 0.05}
+    )
+    assert response.status_code == 202
+    job = response.json()
+    assert job["status"] == "running" and job["result"] is None
+
+    url = f"/api/v1/scenarios/{scenario.id}/load-test/{job['job_id']}"
+    for _ in range(100):
+        job = (await client.get(url)).json()
+        if job["status"] != "running":
+            break
+        await asyncio.sleep(0.02)
+    assert job["status"] == "completed"
+    assert job["result"]["iterations"] > 0
+    assert job["result"]["failed_iterations"] == 0
+
+    assert (await client.get(f"/api/v1/scenarios/{scenario.id + 1}/load-test/{job['job_id']}")).status_code == 404
+    response = await client.post("/api/v1/scenarios/99999/load-test", json={})
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_load_test_jobs_are_limited_and_cancellable(
+    client: AsyncClient, db_session: AsyncSession, test_project, monkeypatch
+):
+    """Test starts beyond the job limit are refused and cancelled jobs say so."""
+    monkeypatch.setattr(settings, "LOAD_TEST_MAX_CONCURRENT_JOBS", 1)
+    noop = Keyword(
+        type="custom", name="Sleep", method_name="nap", code="import time\ndef nap():\n    time.sleep(0.001)\n"
+    )
+    scenario = await _create_scenario(
+        db_session, test_project.id, test_project.creator_id, [noop], [{}]
+    )
+    url = f"/api/v1/scenarios/{scenario.id}/load-test"
+
+    first = await client.post(url, json={"duration_seconds": 30})
+    assert first.status_code == 202
+    assert (await client.post(url, json={"duration_seconds": 30})).status_code == 429
+
+    await cancel_load_test_jobs()
+    job = (await client.get(f"{url}/{first.json()['job_id']}")).json()
+    assert job["status"] == "cancelled"
@@ -0,0 +1,188 @@
+"""Tests for keyset (cursor) pagination."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.main import app
+from app.middleware.auth import get_current_user
+from app.models.interface import Interface
+from app.models.scenario import Scenario
+from app.models.scenario_step import ScenarioStep
+from app.models.test_plan import TestPlan
+from app.models.test_report import TestReport
+from app.services.interface_service import InterfaceService
+from app.services.report_service import ReportService
+from app.services.scenario_service import ScenarioService
+from app.services.test_plan_service import TestPlanService
+from app.utils.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
+
+
+async def _walk(fetch, limit: int) -> list[list[int]]:
+    """Follow cursors to the end, returning the ids of each page."""
+    pages, cursor = [], None
+    while True:
+        items, cursor = await fetch(cursor, limit)
+        pages.append([item["id"] if isinstance(item, dict) else item.id for item in items])
+        if cursor is None:
+            return pages
+
+
+def test_cursor_round_trip():
+    """Test cursors restore typed sort key values."""
+    created = datetime(2026, 1, 2, 3, 4, 5, 678)
+    cursor = encode_cursor([created, 42])
+    assert decode_cursor(cursor, (TestReport.created_at, TestReport.id)) == [created, 42]
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", encode_cursor([1]), encode_cursor(["x", "y"])])
+def test_invalid_cursor(cursor: str):
+    """Test malformed cursors raise ValueError."""
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(cursor, (TestReport.created_at, TestReport.id))
+
+
+@pytest.mark.asyncio
+async def test_report_pages_break_ties_by_id(async_session: AsyncSession):
+    """Test reports with equal timestamps are neither skipped nor repeated."""
+    now = datetime.now()
+    for i in range(7):
+        async_session.add(
+            TestReport(
+                execution_id=f"exec-{i}",
+                plan_id=1 if i < 5 else 2,
+                status="completed",
+                executor_id=1,
+                environment_name="dev",
+                started_at=now,
+                created_at=now if i % 2 else now - timedelta(hours=i),
+            )
+        )
+    await async_session.commit()
+    service = ReportService(async_session)
+
+    async def fetch(cursor, limit):
+        reports, next_page, total = await service.get_reports_page(
+            plan_id=1, cursor=cursor, limit=limit
+        )
+        assert total == 5
+        return reports, next_page
+
+    # Newest first; reports 1, 2 and 4 share a timestamp, larger id first
+    assert await _walk(fetch, limit=2) == [[4, 2], [1, 3], [5]]
+
+
+@pytest.mark.asyncio
+async def test_scenario_pages_keep_step_counts(async_session: AsyncSession):
+    """Test scenario cursor pages include per-scenario step counts."""
+    now = datetime.now()
+    for i in range(5):
+        scenario = Scenario(
+            name=f"场景{i}",
+            project_id=1,
+            creator_id=1,
+            created_at=now - timedelta(minutes=i),
+        )
+        async_session.add(scenario)
+        await async_session.flush()
+        for order in range(i):
+            async_session.add(
+                ScenarioStep(
+                    scenario_id=scenario.id,
+                    description=f"步骤{order}",
+                    keyword_id=1,
+                    sort_order=order,
+                )
+            )
+    await async_session.commit()
+    service = ScenarioService(async_session)
+
+    async def fetch(cursor, limit):
+        scenarios, next_page = await service.list_scenarios_page(1, cursor, limit)
+        for scenario in scenarios:
+            assert scenario["step_count"] == int(scenario["name"][-1])
+        return scenarios, next_page
+
+    pages = await _walk(fetch, limit=3)
+    assert pages == [[1, 2, 3], [4, 5]]
+
+
+@pytest.mark.asyncio
+async def test_interface_pages_follow_sort_order(async_session: AsyncSession):
+    """Test interface cursor pages use (sort_order, id) order."""
+    for i, sort_order in enumerate([2, 0, 1, 0, 2]):
+        async_session.add(
+            Interface(
+                project_id=1, name=f"api{i}", method="GET", path=f"/{i}", sort_order=sort_order
+            )
+        )
+    await async_session.commit()
+    service = InterfaceService(async_session)
+
+    pages = await _walk(
+        lambda cursor, limit: service.list_interfaces_page(1, cursor, limit), limit=2
+    )
+    assert pages == [[2, 4], [3, 1], [5]]
+
+    offset_page, _ = await service.list_interfaces(1, 0, 5)
+    assert [interface.id for interface in offset_page] == [2, 4, 3, 1, 5]
+
+
+@pytest.mark.asyncio
+async def test_test_plan_page_total_is_optional(async_session: AsyncSession):
+    """Test test plan pages skip the count unless asked."""
+    # Server-default timestamps, equal within the same second
+    for i in range(3):
+        async_session.add(TestPlan(name=f"计划{i}", project_id=1, creator_id=1))
+    await async_session.commit()
+    service = TestPlanService(async_session)
+
+    plans, next_page, total = await service.list_test_plans_page(limit=2, with_total=False)
+    assert (len(plans), total) == (2, None)
+    rest, last, total = await service.list_test_plans_page(cursor=next_page, limit=2)
+    assert (len(rest), last, total) == (1, None, 3)
+    assert [plan.id for plan in plans + rest] == [3, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_list_endpoints_share_cursor_header(
+    client: AsyncClient, async_session: AsyncSession, test_user, test_plan
+):
+    """Test every cursor-paginated list returns the next cursor in X-Next-Cursor."""
+    project_id = test_plan.project_id
+    for i in range(2):
+        async_session.add_all(
+            [
+                TestPlan(name=f"计划{i}", project_id=project_id, creator_id=test_user.id),
+                Scenario(name=f"Scenario {i}", project_id=project_id, creator_id=test_user.id),
+                Interface(project_id=project_id, name=f"api{i}", method="GET", path=f"/{i}"),
+                TestReport(
+                    execution_id=f"exec-{i}",
+                    plan_id=test_plan.id,
+                    status="completed",
+                    executor_id=test_user.id,
+                    environment_name="dev",
+                    started_at=datetime.now(),
+                ),
+            ]
+        )
+    await async_session.commit()
+    app.dependency_overrides[get_current_user] = lambda: test_user
+
+    for url, params in [
+        ("/api/v1/interfaces", {"project_id": project_id, "limit": 1}),
+        ("/api/v1/scenarios", {"project_id": project_id, "limit": 1}),
+        ("/api/v1/reports", {"plan_id": test_plan.id, "limit": 1}),
+        ("/api/v1/test-plans", {"project_id": project_id, "pageSize": 2}),
+    ]:
+        first = await client.get(url, params={**params, "cursor": ""})
+        assert first.status_code == 200, url
+        assert "next_cursor" not in first.text, url
+
+        second = await client.get(
+            url, params={**params, "cursor": first.headers[NEXT_CURSOR_HEADER]}
+        )
+        assert second.status_code == 200, url
+        assert NEXT_CURSOR_HEADER not in second.headers, url
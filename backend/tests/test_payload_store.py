@@ -0,0 +1,68 @@
+"""Tests for payload store."""
+
+import pytest
+
+from app.models.execution_step import ExecutionStep
+from app.services.payload_store import LocalBlobStore, PayloadStore
+
+
+@pytest.fixture
+def payload_store(tmp_path):
+    """Payload store writing to a temporary directory."""
+    return PayloadStore(LocalBlobStore(tmp_path), threshold_bytes=1024, preview_chars=64)
+
+
+@pytest.mark.asyncio
+async def test_small_payload_stays_inline(payload_store):
+    """Payloads under the threshold are returned unchanged."""
+    payload = {"status_code": 200, "text": "ok"}
+
+    assert await payload_store.spill(payload) is payload
+    assert await payload_store.spill(None) is None
+
+
+@pytest.mark.asyncio
+async def test_large_payload_round_trip(payload_store, tmp_path):
+    """Large payloads are compressed to the blob store and loaded back."""
+    payload = {"status_code": 200, "text": "x" * 100_000, "json": {"items": list(range(100))}}
+
+    stub = await payload_store.spill(payload)
+
+    assert PayloadStore.is_spilled(stub)
+    assert stub["encoding"] == "gzip"
+    assert stub["stored_size"] < stub["size"]
+    assert len(stub["preview"]) == 64
+    assert (tmp_path / stub["ref"]).exists()
+    assert await payload_store.load(stub) == payload
+
+    # Spilling a stub again is a no-op
+    assert await payload_store.spill(stub) is stub
+
+    await payload_store.delete(stub)
+    assert not (tmp_path / stub["ref"]).exists()
+
+
+@pytest.mark.asyncio
+async def test_spill_step(payload_store):
+    """spill_step only replaces the oversized column."""
+    step = ExecutionStep(
+        execution_scenario_id=7,
+        step_id=1,
+        request_data={"url": "/items"},
+        response_data={"text": "y" * 5000},
+    )
+
+    await payload_store.spill_step(step)
+
+    assert step.request_data == {"url": "/items"}
+    assert PayloadStore.is_spilled(step.response_data)
+    assert step.response_data["ref"].startswith("payloads/7/")
+
+
+@pytest.mark.asyncio
+async def test_local_store_rejects_escaping_refs(payload_store):
+    """References cannot point outside the store directory."""
+    stub = {"_spilled": True, "ref": "../../etc/passwd", "encoding": "gzip"}
+
+    with pytest.raises(ValueError):
+        await payload_store.load(stub)
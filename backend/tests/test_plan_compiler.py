@@ -0,0 +1,197 @@
+"""Tests for the plan compiler."""
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.database_config import DatabaseConfig
+from app.models.dataset import Dataset
+from app.models.env_variable import EnvVariable
+from app.models.environment import Environment
+from app.models.keyword import Keyword
+from app.models.plan_scenario import PlanScenario
+from app.models.scenario import Scenario
+from app.models.scenario_step import ScenarioStep
+from app.services.plan_compiler import PlanCompiler
+
+
+async def _add_scenario(session: AsyncSession, plan, steps: list[tuple[Keyword, dict]], **kwargs):
+    """Create a scenario in the plan with the given (keyword, params) steps."""
+    scenario = Scenario(
+        name=kwargs.pop("name", "Scenario"),
+        project_id=plan.project_id,
+        creator_id=plan.creator_id,
+        **kwargs,
+    )
+    session.add(scenario)
+    await session.flush()
+    for index, (keyword, params) in enumerate(steps):
+        session.add(
+            ScenarioStep(
+                scenario_id=scenario.id,
+                description=f"step {index}",
+                keyword_id=keyword.id,
+                params=params,
+                sort_order=index,
+            )
+        )
+    session.add(PlanScenario(plan_id=plan.id, scenario_id=scenario.id, sort_order=0))
+    await session.commit()
+    return scenario
+
+
+@pytest_asyncio.fixture
+async def keywords(async_session: AsyncSession) -> dict[str, Keyword]:
+    """Create an HTTP keyword, a DB keyword and a disabled keyword."""
+    items = {
+        "http": Keyword(
+            type="http_request",
+            name="HTTP 请求",
+            method_name="http_request",
+            code="def http_request(url, method='GET', **kwargs): ...",
+        ),
+        "db": Keyword(
+            type="database",
+            name="数据库查询",
+            method_name="db_query",
+            code="def db_query(db_connection, sql):\n    return []\n",
+        ),
+        "disabled": Keyword(
+            type="custom",
+            name="Disabled",
+            method_name="old_keyword",
+            code="def old_keyword():\n    return 1\n",
+            is_enabled=False,
+        ),
+    }
+    async_session.add_all(items.values())
+    await async_session.commit()
+    return items
+
+
+@pytest.mark.asyncio
+async def test_compile_valid_plan(async_session: AsyncSession, test_plan, keywords):
+    """Test a valid plan compiles into an immutable plan with resolved data."""
+    environment = Environment(
+        project_id=test_plan.project_id, name="dev", base_url="http://dev.local"
+    )
+    async_session.add(environment)
+    await async_session.flush()
+    async_session.add(EnvVariable(environment_id=environment.id, name="host", value="dev"))
+    async_session.add(
+        DatabaseConfig(
+            project_id=test_plan.project_id,
+            name="Main",
+            variable_name="main_db",
+            db_type="mysql",
+            host="localhost",
+            port=3306,
+            database="app",
+            username="root",
+            password="secret",
+        )
+    )
+    scenario = await _add_scenario(
+        async_session,
+        test_plan,
+        [
+            (keywords["http"], {"url": "/users/{{user_id}}?h={{host}}", "save_as": "user"}),
+            (keywords["db"], {"db_connection": "main_db", "sql": "SELECT '{{user}}'"}),
+        ],
+        environment_id=environment.id,
+    )
+    async_session.add(
+        Dataset(scenario_id=scenario.id, name="d.csv", headers=["user_id"], rows=[["1"], ["2"]])
+    )
+    await async_session.commit()
+
+    compiled, report = await PlanCompiler(async_session).compile(test_plan.id)
+
+    assert report.is_valid, report.errors
+    assert compiled is not None
+    assert compiled.base_url == "http://dev.local"
+    assert compiled.step_count == 2
+    assert compiled.database_configs == {"main_db": compiled.database_configs["main_db"]}
+    assert "user_id" in compiled.templates
+    assert [ctx["user_id"] for ctx in compiled.contexts_for(compiled.scenarios[0])] == ["1", "2"]
+
+    with pytest.raises(TypeError):
+        compiled.scenarios[0].steps[0].params["url"] = "/changed"
+
+
+@pytest.mark.asyncio
+async def test_compile_reports_all_problems(async_session: AsyncSession, test_plan, keywords):
+    """Test missing/disabled keywords, DB configs, variables and unsafe templates."""
+    async_session.add(
+        DatabaseConfig(
+            project_id=test_plan.project_id,
+            name="Old",
+            variable_name="old_db",
+            db_type="mysql",
+            host="localhost",
+            port=3306,
+            database="app",
+            username="root",
+            password="secret",
+            is_enabled=False,
+        )
+    )
+    await _add_scenario(
+        async_session,
+        test_plan,
+        [
+            (keywords["http"], {"url": "/items/{{item_id}}"}),
+            (keywords["http"], {"url": "/{{ ().__class__.__bases__ }}"}),
+            (keywords["http"], {"url": "/{{ broken( }}"}),
+            (keywords["db"], {"db_connection": "{{old_db}}", "sql": "SELECT 1"}),
+            (keywords["disabled"], {}),
+        ],
+    )
+
+    compiled, report = await PlanCompiler(async_session).compile(test_plan.id)
+
+    assert compiled is None
+    assert not report.is_valid
+    assert {issue.code for issue in report.errors} == {
+        "undefined_variable",
+        "unsafe_placeholder",
+        "invalid_placeholder",
+        "disabled_database",
+        "disabled_keyword",
+    }
+    undefined = next(i for i in report.errors if i.code == "undefined_variable")
+    assert "item_id" in undefined.message
+
+
+@pytest.mark.asyncio
+async def test_compile_skips_reserved_step_params(async_session: AsyncSession, test_plan, keywords):
+    """Test extract rules are not template-checked and define variables for later steps."""
+    await _add_scenario(
+        async_session,
+        test_plan,
+        [
+            (
+                keywords["http"],
+                {
+                    "url": "/login",
+                    "extract": {"token": {"regex_pattern": r"token={{(\w+)}}"}},
+                },
+            ),
+            (keywords["http"], {"url": "/me?token={{token}}"}),
+        ],
+    )
+
+    compiled, report = await PlanCompiler(async_session).compile(test_plan.id)
+
+    assert report.is_valid, report.errors
+    assert compiled is not None
+
+
+@pytest.mark.asyncio
+async def test_compile_empty_and_missing_plan(async_session: AsyncSession, test_plan):
+    """Test empty plans are invalid and unknown plans return None."""
+    compiled, report = await PlanCompiler(async_session).compile(test_plan.id)
+
+    assert compiled is None
+    assert [issue.code for issue in report.errors] == ["empty_plan"]
+    assert await PlanCompiler(async_session).compile(99999) is None
@@ -0,0 +1,243 @@
+"""Tests for project bundle export and import."""
+
+import gzip
+import io
+import json
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.main import app
+from app.middleware.auth import get_current_user
+from app.models.database_config import DatabaseConfig
+from app.models.dataset import Dataset
+from app.models.env_variable import EnvVariable
+from app.models.environment import Environment
+from app.models.interface import Interface
+from app.models.interface_folder import InterfaceFolder
+from app.models.keyword import Keyword
+from app.models.plan_scenario import PlanScenario
+from app.models.scenario import Scenario
+from app.models.scenario_step import ScenarioStep
+from app.models.scenario_tag import ScenarioTag
+from app.services.project_bundle_service import ProjectBundleService
+
+
+async def _populate(session: AsyncSession, project_id: int, user_id: int, plan_id: int) -> None:
+    """Fill a project with one row of every bundled kind."""
+    keyword = Keyword(type="custom", name="Request", method_name="send_request", code="pass")
+    environment = Environment(project_id=project_id, name="dev", base_url="http://dev")
+    # The child is created first, so id order isn't level order
+    child = InterfaceFolder(project_id=project_id, name="child")
+    session.add_all([keyword, environment, child])
+    await session.flush()
+    root = InterfaceFolder(project_id=project_id, name="root")
+    session.add(root)
+    await session.flush()
+    child.parent_id = root.id
+    scenario = Scenario(
+        project_id=project_id,
+        name="Checkout",
+        creator_id=user_id,
+        environment_id=environment.id,
+        tags={"smoke": True},
+    )
+    session.add_all(
+        [
+            scenario,
+            EnvVariable(environment_id=environment.id, name="token", value="t"),
+            DatabaseConfig(
+                project_id=project_id,
+                name="main",
+                variable_name="db",
+                db_type="mysql",
+                host="localhost",
+                port=3306,
+                database="app",
+                username="root",
+                password="s3cret",
+                is_connected=True,
+            ),
+        ]
+    )
+    await session.flush()
+    session.add_all(
+        [
+            Interface(project_id=project_id, folder_id=child.id, name="a", method="GET", path="/a"),
+            ScenarioStep(scenario_id=scenario.id, description="send", keyword_id=keyword.id),
+            Dataset(scenario_id=scenario.id, name="data", headers=["a"], rows=[[1]]),
+            PlanScenario(plan_id=plan_id, scenario_id=scenario.id, sort_order=2),
+        ]
+    )
+    await session.flush()
+
+
+async def _export(session: AsyncSession, project_id: int) -> bytes:
+    return b"".join([chunk async for chunk in ProjectBundleService(session).export_project(project_id)])
+
+
+def _records(bundle: bytes) -> list[dict]:
+    return [json.loads(line) for line in gzip.decompress(bundle).splitlines()]
+
+
+@pytest.mark.asyncio
+async def test_export_order_and_redaction(
+    db_session: AsyncSession, test_project, test_user, test_plan
+):
+    """Test rows come parents first and secrets are left out."""
+    await _populate(db_session, test_project.id, test_user.id, test_plan.id)
+    records = _records(await _export(db_session, test_project.id))
+
+    assert records[0]["format"] == "sisyphus-x-project"
+    assert records[-1] == {"type": "end", "rows": len(records) - 2}
+    kinds = [record["type"] for record in records[1:-1]]
+    assert kinds == [
+        "database_config",
+        "environment",
+        "env_variable",
+        "folder",
+        "folder",
+        "interface",
+        "scenario",
+        "scenario_step",
+        "dataset",
+        "test_plan",
+        "plan_scenario",
+    ]
+    config = records[1]
+    assert "password" not in config and "is_connected" not in config
+    assert [r["name"] for r in records if r["type"] == "folder"] == ["root", "child"]
+    step = next(r for r in records if r["type"] == "scenario_step")
+    assert step["keyword"] == "send_request" and "keyword_id" not in step
+
+    with pytest.raises(ValueError, match="Project not found"):
+        await _export(db_session, 9999)
+
+
+@pytest.mark.asyncio
+async def test_import_round_trip(db_session: AsyncSession, test_project, test_user, test_plan):
+    """Test an exported project imports with every reference remapped."""
+    await _populate(db_session, test_project.id, test_user.id, test_plan.id)
+    bundle = await _export(db_session, test_project.id)
+
+    summary = await ProjectBundleService(db_session).import_project(
+        io.BytesIO(bundle), test_user.id, name="Imported"
+    )
+    new_id = summary["project_id"]
+    assert summary["errors"] == []
+    assert summary["counts"]["folder"] == 2
+    assert summary["counts"]["plan_scenario"] == 1
+
+    folders = dict(
+        (await db_session.execute(
+            select(InterfaceFolder.name, InterfaceFolder.id).where(InterfaceFolder.project_id == new_id)
+        )).all()
+    )
+    child = await db_session.get(InterfaceFolder, folders["child"])
+    assert child.parent_id == folders["root"]
+    interface = (
+        await db_session.execute(select(Interface).where(Interface.project_id == new_id))
+    ).scalar_one()
+    assert interface.folder_id == folders["child"]
+
+    environment = (
+        await db_session.execute(select(Environment).where(Environment.project_id == new_id))
+    ).scalar_one()
+    scenario = (
+        await db_session.execute(select(Scenario).where(Scenario.project_id == new_id))
+    ).scalar_one()
+    assert scenario.environment_id == environment.id
+    assert (
+        await db_session.execute(
+            select(EnvVariable.name).where(EnvVariable.environment_id == environment.id)
+        )
+    ).scalars().all() == ["token"]
+    assert (
+        await db_session.execute(select(ScenarioTag.tag).where(ScenarioTag.scenario_id == scenario.id))
+    ).scalars().all() == ["smoke"]
+    assert (
+        await db_session.execute(select(Dataset.rows).where(Dataset.scenario_id == scenario.id))
+    ).scalars().all() == [[[1]]]
+
+    config = (
+        await db_session.execute(select(DatabaseConfig).where(DatabaseConfig.project_id == new_id))
+    ).scalar_one()
+    assert (config.password, config.is_enabled, config.is_connected) == ("", False, False)
+
+    result = await db_session.execute(
+        select(PlanScenario.scenario_id, PlanScenario.sort_order).where(
+            PlanScenario.plan_id != test_plan.id
+        )
+    )
+    assert result.all() == [(scenario.id, 2)]
+
+    with pytest.raises(ValueError, match="already exists"):
+        await ProjectBundleService(db_session).import_project(
+            io.BytesIO(bundle), test_user.id, name="Imported"
+        )
+
+
+@pytest.mark.asyncio
+async def test_import_errors(db_session: AsyncSession, test_user):
+    """Test invalid bundles are rejected and unresolved rows reported."""
+    service = ProjectBundleService(db_session)
+    header = {"type": "header", "format": "sisyphus-x-project", "version": 1, "project": {"name": "P"}}
+
+    def bundle(*records) -> io.BytesIO:
+        return io.BytesIO("".join(json.dumps(r) + "\n" for r in records).encode())
+
+    with pytest.raises(ValueError, match="Not a project bundle"):
+        await service.import_project(bundle({"type": "header"}), test_user.id)
+    with pytest.raises(ValueError, match="truncated"):
+        await service.import_project(bundle(header), test_user.id)
+    with pytest.raises(ValueError, match="Invalid bundle"):
+        truncated = gzip.compress(bundle(header).getvalue())[:-4]
+        await service.import_project(io.BytesIO(truncated), test_user.id, name="Broken")
+
+    summary = await service.import_project(
+        bundle(
+            header,
+            {"type": "scenario", "id": 1, "name": "S"},
+            {"type": "scenario_step", "id": 1, "scenario_id": 1, "description": "d", "keyword": "nope"},
+            {"type": "dataset", "id": 1, "scenario_id": 2, "name": "orphan"},
+            {"type": "report", "id": 1},
+            {"type": "end"},
+        ),
+        test_user.id,
+        name="Partial",
+    )
+    assert summary["counts"]["scenario"] == 1
+    assert summary["errors"] == [
+        "line 3: keyword 'nope' not found",
+        "line 4: scenario_id 2 not found in bundle",
+        "line 5: unknown type 'report'",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_export_import_endpoints(
+    client: AsyncClient, db_session: AsyncSession, test_project, test_user, test_plan
+):
+    """Test the export download and import upload."""
+    app.dependency_overrides[get_current_user] = lambda: test_user
+    await _populate(db_session, test_project.id, test_user.id, test_plan.id)
+
+    response = await client.get(f"/api/v1/projects/{test_project.id}/export")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/gzip"
+
+    response = await client.post(
+        "/api/v1/projects/import",
+        params={"name": "Staging copy"},
+        files={"file": ("project.ndjson.gz", response.content, "application/gzip")},
+    )
+    assert response.status_code == 201
+    assert response.json()["counts"]["interface"] == 1
+
+    response = await client.post(
+        "/api/v1/projects/import", files={"file": ("x.ndjson", b"{}\n", "application/x-ndjson")}
+    )
+    assert response.status_code == 400
+    assert (await client.get("/api/v1/projects/9999/export")).status_code == 404
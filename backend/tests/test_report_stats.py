@@ -0,0 +1,113 @@
+"""Tests for the report statistics rollup."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.report_stat import ReportStat
+from app.models.test_execution import TestExecution
+from app.models.test_report import TestReport
+from app.services.report_service import ReportService
+
+
+async def _report(
+    service: ReportService, plan_id: int, status: str, passed: int, duration: int | None = 10
+) -> TestReport:
+    started = datetime.now() - timedelta(seconds=duration or 0)
+    execution = TestExecution(
+        plan_id=plan_id,
+        environment_id=1,
+        executor_id=1,
+        status=status,
+        total_scenarios=passed + 1,
+        passed_scenarios=passed,
+        failed_scenarios=1,
+        skipped_scenarios=0,
+        started_at=started if duration is not None else None,
+        finished_at=datetime.now() if duration is not None else None,
+    )
+    service.session.add(execution)
+    await service.session.commit()
+    return await service.create_report(
+        execution_id=execution.id,
+        plan_id=plan_id,
+        executor_id=1,
+        environment_name="dev",
+        started_at=started,
+    )
+
+
+@pytest.mark.asyncio
+async def test_statistics_follow_create_and_delete(async_session: AsyncSession):
+    """Test running totals and filters track report writes."""
+    service = ReportService(async_session)
+    first = await _report(service, 1, "completed", passed=3)
+    await _report(service, 1, "failed", passed=0, duration=None)
+    await _report(service, 2, "completed", passed=5)
+
+    stats = await service.get_report_statistics()
+    assert stats["total_reports"] == 3
+    assert stats["total_scenarios"] == 11
+    assert stats["total_passed"] == 8
+    assert stats["average_duration"] == pytest.approx(10, abs=1)
+
+    by_plan = await service.get_report_statistics(plan_id=1)
+    assert (by_plan["total_reports"], by_plan["total_passed"]) == (2, 3)
+    by_status = await service.get_report_statistics(status="completed")
+    assert (by_status["total_reports"], by_status["total_passed"]) == (2, 8)
+    both = await service.get_report_statistics(plan_id=1, status="failed")
+    assert (both["total_reports"], both["average_duration"]) == (1, None)
+
+    assert await service.delete_report(first.id)
+    stats = await service.get_report_statistics()
+    assert (stats["total_reports"], stats["total_passed"]) == (2, 5)
+
+
+@pytest.mark.asyncio
+async def test_cleanup_updates_rollup(async_session: AsyncSession):
+    """Test cleanup subtracts the removed reports."""
+    service = ReportService(async_session)
+    old = await _report(service, 1, "completed", passed=4)
+    await _report(service, 1, "completed", passed=2)
+    old.created_at = datetime.now() - timedelta(days=40)
+    await async_session.commit()
+
+    assert await service.cleanup_old_reports(days=30) == 1
+
+    stats = await service.get_report_statistics()
+    assert (stats["total_reports"], stats["total_passed"]) == (1, 2)
+
+
+@pytest.mark.asyncio
+async def test_rollup_rebuilt_from_existing_reports(async_session: AsyncSession):
+    """Test reports written before the rollup existed are counted by a rebuild."""
+    for index, passed in enumerate((1, 2)):
+        async_session.add(
+            TestReport(
+                execution_id=f"legacy-{index}",
+                plan_id=7,
+                status="completed",
+                total_scenarios=passed,
+                passed=passed,
+                executor_id=1,
+                environment_name="dev",
+                started_at=datetime.now(),
+            )
+        )
+    await async_session.commit()
+    service = ReportService(async_session)
+
+    # Reads never build the rollup themselves
+    stats = await service.get_report_statistics(plan_id=7)
+    assert stats["total_reports"] == 0
+
+    await service.rebuild_report_stats()
+    await async_session.commit()
+    await _report(service, 7, "completed", passed=5)
+
+    stats = await service.get_report_statistics(plan_id=7)
+    assert (stats["total_reports"], stats["total_passed"]) == (3, 8)
+    rows = (await async_session.execute(select(ReportStat))).scalars().all()
+    assert len(rows) == 1
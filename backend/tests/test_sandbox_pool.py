@@ -0,0 +1,106 @@
+"""Tests for the out-of-process sandbox pool."""
+
+import asyncio
+
+import pytest
+
+from app.utils.sandbox_pool import SandboxPool
+
+SOURCES = {
+    "double": "def double(x):\n    return x * 2\n",
+    "spin": "def spin():\n    while True:\n        pass\n",
+    "burn": (
+        "def burn(seconds):\n"
+        "    import time\n"
+        "    end = time.process_time() + seconds\n"
+        "    while time.process_time() < end:\n"
+        "        pass\n"
+        "    return seconds\n"
+    ),
+    "nap": "def nap(seconds):\n    import time\n    time.sleep(seconds)\n    return seconds\n",
+}
+
+
+@pytest.fixture
+def pool():
+    """Single-worker sandbox pool."""
+    sandbox = SandboxPool(max_workers=1, cpu_seconds=1, memory_mb=0, timeout_seconds=10)
+    yield sandbox
+    sandbox.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_batch_evaluation(pool):
+    """Test one batch runs evals and parses with user functions."""
+    results = await pool.run_batch(
+        SOURCES,
+        [
+            ("eval", "double(n)", {"n": 21}),
+            ("eval", "to_uppercase('abc')", {}),
+            ("parse", "id={{double(3)}}", {}),
+            ("eval", "missing()", {}),
+        ],
+    )
+
+    assert results[0] == (True, 42)
+    assert results[1] == (True, "ABC")
+    assert results[2][0] is True
+    assert results[2][1][0] == "id=6"
+    assert results[3][0] is False
+
+
+@pytest.mark.asyncio
+async def test_single_call_helpers(pool):
+    """Test execute_function and parse_text wrappers."""
+    assert await pool.execute_function(SOURCES, "double(5)", {}) == 10
+    parsed, _, success, _ = await pool.parse_text(SOURCES, "{{double(x)}}", {"x": 4})
+    assert (parsed, success) == ("8", True)
+
+    with pytest.raises(ValueError):
+        await pool.execute_function(SOURCES, "double()", {})
+
+
+@pytest.mark.asyncio
+async def test_cpu_limit_kills_worker_and_pool_recovers(pool):
+    """Test runaway code hits the CPU limit without affecting later calls."""
+    with pytest.raises(ValueError, match="resource limits|timed out"):
+        await pool.execute_function(SOURCES, "spin()", {})
+
+    assert await pool.execute_function(SOURCES, "double(1)", {}) == 2
+
+
+@pytest.mark.asyncio
+async def test_cpu_limit_is_per_batch(pool):
+    """Test a warm worker is not killed once its total CPU passes the budget."""
+    for _ in range(3):
+        assert await pool.execute_function(SOURCES, "burn(0.6)", {}) == 0.6
+
+
+def test_start_launches_workers():
+    """Test start() brings up every worker before the first batch."""
+    sandbox = SandboxPool(max_workers=2, cpu_seconds=1, memory_mb=0, timeout_seconds=10)
+    try:
+        sandbox.start()
+        assert sandbox._context is not None
+        assert len(sandbox._context.processes) == 2
+    finally:
+        sandbox.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_timeout_fails_other_batches_explicitly():
+    """Test a hung batch restarts the pool and other in-flight batches get a clear error."""
+    sandbox = SandboxPool(max_workers=2, cpu_seconds=0, memory_mb=0, timeout_seconds=1)
+    try:
+        hung = asyncio.create_task(sandbox.execute_function(SOURCES, "spin()", {}))
+        await asyncio.sleep(0.5)
+        other = asyncio.create_task(sandbox.execute_function(SOURCES, "nap(5)", {}))
+
+        with pytest.raises(ValueError, match="timed out"):
+            await hung
+        with pytest.raises(ValueError, match="restarted"):
+            await other
+
+        assert await sandbox.execute_function(SOURCES, "double(2)", {}) == 4
+    finally:
+        sandbox.shutdown()
@@ -0,0 +1,137 @@
+"""Tests for the scenario tag index and tag expressions."""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.plan_scenario import PlanScenario
+from app.models.scenario_tag import ScenarioTag
+from app.services.scenario_service import ScenarioService
+from app.services.test_plan_service import TestPlanService
+from app.utils.tag_expression import normalize_tags, parse_tag_expression
+
+
+def test_parse_tag_expression_precedence():
+    """Test NOT > AND > OR, parentheses and case-insensitive operators."""
+    assert parse_tag_expression("smoke and not Slow or 'nightly run'") == (
+        "or",
+        ("and", ("tag", "smoke"), ("not", ("tag", "slow"))),
+        ("tag", "nightly run"),
+    )
+    assert parse_tag_expression("NOT (a OR b) AND c") == (
+        "and",
+        ("not", ("or", ("tag", "a"), ("tag", "b"))),
+        ("tag", "c"),
+    )
+
+
+@pytest.mark.parametrize("text", ["", "smoke AND", "(smoke", "smoke slow", "smoke ) ", "a & b"])
+def test_parse_tag_expression_errors(text):
+    """Test malformed expressions raise ValueError."""
+    with pytest.raises(ValueError):
+        parse_tag_expression(text)
+
+
+def test_normalize_tags():
+    """Test dict keys and list items become distinct lowercased tags."""
+    assert normalize_tags({"Smoke": True, " slow ": "", "": 1}) == ["smoke", "slow"]
+    assert normalize_tags(["api", "API", 3, None]) == ["api", "3"]
+    assert normalize_tags(None) == []
+
+
+async def _tags(session: AsyncSession, scenario_id: int) -> list[str]:
+    result = await session.execute(
+        select(ScenarioTag.tag).where(ScenarioTag.scenario_id == scenario_id).order_by(ScenarioTag.tag)
+    )
+    return list(result.scalars())
+
+
+async def _create(service: ScenarioService, project_id: int, name: str, tags: dict):
+    return await service.create_scenario(
+        name=name, project_id=project_id, creator_id=1, tags=tags
+    )
+
+
+@pytest.mark.asyncio
+async def test_tag_rows_follow_scenario_writes(db_session: AsyncSession, test_project):
+    """Test tag rows are written on create, replaced on update, removed on delete."""
+    service = ScenarioService(db_session)
+    scenario = await _create(service, test_project.id, "Login", {"Smoke": 1, "auth": "login"})
+    assert await _tags(db_session, scenario.id) == ["auth", "smoke"]
+
+    await service.update_scenario(scenario.id, tags={"slow": True})
+    assert await _tags(db_session, scenario.id) == ["slow"]
+
+    await service.update_scenario(scenario.id, name="Renamed")
+    assert await _tags(db_session, scenario.id) == ["slow"]
+
+    await service.delete_scenario(scenario.id)
+    assert await _tags(db_session, scenario.id) == []
+
+
+@pytest.mark.asyncio
+async def test_list_scenarios_by_tag_expression(db_session: AsyncSession, test_project):
+    """Test offset and cursor lists filter by tag expressions in SQL."""
+    service = ScenarioService(db_session)
+    await _create(service, test_project.id, "fast smoke", {"smoke": 1})
+    await _create(service, test_project.id, "slow smoke", {"smoke": 1, "slow": 1})
+    await _create(service, test_project.id, "nightly", {"nightly": 1})
+    await _create(service, test_project.id + 1, "other smoke", {"smoke": 1})
+
+    scenarios, total = await service.list_scenarios(
+        project_id=test_project.id, tag_expression="smoke AND NOT slow"
+    )
+    assert (total, [s["name"] for s in scenarios]) == (1, ["fast smoke"])
+
+    scenarios, _ = await service.list_scenarios_page(
+        project_id=test_project.id, tag_expression="slow OR nightly"
+    )
+    assert sorted(s["name"] for s in scenarios) == ["nightly", "slow smoke"]
+
+    with pytest.raises(ValueError, match="Invalid tag expression"):
+        await service.list_scenarios(tag_expression="smoke AND")
+
+
+@pytest.mark.asyncio
+async def test_add_scenarios_by_tags(db_session: AsyncSession, test_project, test_plan):
+    """Test a plan is extended with matching scenarios in one statement."""
+    service = ScenarioService(db_session)
+    first = await _create(service, test_project.id, "a", {"smoke": 1})
+    second = await _create(service, test_project.id, "b", {"smoke": 1})
+    await _create(service, test_project.id, "c", {"slow": 1})
+    await _create(service, test_project.id + 1, "d", {"smoke": 1})
+
+    plans = TestPlanService(db_session)
+    await plans.add_scenario_to_plan(test_plan.id, first.id, 5)
+    assert await plans.add_scenarios_by_tags(test_plan.id, "smoke") == 1
+    # Already-added scenarios are not duplicated
+    assert await plans.add_scenarios_by_tags(test_plan.id, "smoke") == 0
+
+    result = await db_session.execute(
+        select(PlanScenario.scenario_id, PlanScenario.sort_order)
+        .where(PlanScenario.plan_id == test_plan.id)
+        .order_by(PlanScenario.sort_order)
+    )
+    assert result.all() == [(first.id, 5), (second.id, 6)]
+
+    with pytest.raises(ValueError, match="Test plan not found"):
+        await plans.add_scenarios_by_tags(9999, "smoke")
+
+
+@pytest.mark.asyncio
+async def test_list_scenarios_endpoint_tags(client: AsyncClient, db_session, test_project):
+    """Test the tags query parameter."""
+    service = ScenarioService(db_session)
+    await _create(service, test_project.id, "tagged", {"smoke": 1})
+    await _create(service, test_project.id, "untagged", {})
+
+    response = await client.get("/api/v1/scenarios", params={"tags": "smoke"})
+    assert response.status_code == 200
+    assert [s["name"] for s in response.json()] == ["tagged"]
+
+    response = await client.get("/api/v1/scenarios", params={"tags": "NOT smoke", "cursor": ""})
+    assert [s["name"] for s in response.json()] == ["untagged"]
+
+    response = await client.get("/api/v1/scenarios", params={"tags": "(smoke"})
+    assert response.status_code == 400
@@ -8,6 +8,7 @@ from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.main import app
+from app.models.global_param import GlobalParam
 from app.models.keyword import Keyword
 
 
@@ -172,6 +173,31 @@ class TestScenarioList:
         data = response.json()
         assert len(data) == 3
 
+    @pytest.mark.asyncio
+    async def test_list_scenarios_by_cursor(self, client: AsyncClient, test_project, test_user):
+        """Test cursor pagination returns the next cursor in a header."""
+        for i in range(3):
+            await client.post(
+                "/api/v1/scenarios",
+                json={
+                    "name": f"Scenario {i}",
+                    "project_id": test_project.id,
+                    "creator_id": test_user.id,
+                },
+            )
+
+        url = f"/api/v1/scenarios?project_id={test_project.id}&limit=2"
+        first = await client.get(f"{url}&cursor=")
+        assert first.status_code == 200
+        assert [s["name"] for s in first.json()] == ["Scenario 2", "Scenario 1"]
+
+        second = await client.get(f"{url}&cursor={first.headers['X-Next-Cursor']}")
+        assert [s["name"] for s in second.json()] == ["Scenario 0"]
+        assert "X-Next-Cursor" not in second.headers
+
+        invalid = await client.get(f"{url}&cursor=bogus")
+        assert invalid.status_code == 400
+
     @pytest.mark.asyncio
     async def test_list_scenarios_empty(self, client: AsyncClient, test_project):
         """Test listing scenarios when none exist."""
@@ -430,3 +456,107 @@ class TestDatasetUpload:
         data = response.json()
         assert "dataset" in data
         assert data["rows_count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_generate_dataset(self, client: AsyncClient, test_project, test_user):
+        """Test generating a dataset from function templates."""
+        create_response = await client.post(
+            "/api/v1/scenarios",
+            json={
+                "name": "Generated Data Test",
+                "project_id": test_project.id,
+                "creator_id": test_user.id,
+            },
+        )
+        scenario_id = create_response.json()["id"]
+
+        response = await client.post(
+            f"/api/v1/scenarios/{scenario_id}/dataset/generate",
+            json={
+                "rows": 1000,
+                "columns": {
+                    "username": "user_{{row_index}}_{{random_string(6)}}",
+                    "age": "{{random_number(18, 60)}}",
+                    "role": "{{to_uppercase('admin')}}",
+                },
+            },
+        )
+        assert response.status_code == 201
+        data = response.json()
+        assert data["headers"] == ["username", "age", "role"]
+        assert data["rows_count"] == 1000
+        assert data["per_row"] == 0
+        assert data["preview"][1][0].startswith("user_1_")
+        assert data["preview"][1][2] == "ADMIN"
+
+        dataset = (await client.get(f"/api/v1/scenarios/{scenario_id}/dataset")).json()
+        assert len(dataset["rows"]) == 1000
+        assert all(18 <= int(row[1]) <= 60 for row in dataset["rows"])
+
+    @pytest.mark.asyncio
+    async def test_generate_dataset_deterministic_user_function(
+        self, client: AsyncClient, async_session: AsyncSession, test_project, test_user
+    ):
+        """Test a user function marked is_deterministic is evaluated once."""
+        async_session.add_all(
+            [
+                GlobalParam(
+                    class_name="Text",
+                    method_name="slugify",
+                    description="Slug",
+                    code="def slugify(text):\n    return text.lower().replace(' ', '-')\n",
+                    is_deterministic=True,
+                ),
+                GlobalParam(
+                    class_name="Text",
+                    method_name="shout",
+                    description="Upper case",
+                    code="def shout(text):\n    return text.upper()\n",
+                ),
+            ]
+        )
+        await async_session.commit()
+        create_response = await client.post(
+            "/api/v1/scenarios",
+            json={
+                "name": "Deterministic Data Test",
+                "project_id": test_project.id,
+                "creator_id": test_user.id,
+            },
+        )
+        scenario_id = create_response.json()["id"]
+
+        response = await client.post(
+            f"/api/v1/scenarios/{scenario_id}/dataset/generate",
+            json={
+                "rows": 20,
+                "columns": {"slug": "{{slugify('Hello World')}}", "loud": "{{shout('hi')}}"},
+            },
+        )
+        assert response.status_code == 201
+        data = response.json()
+        assert data["preview"][0] == ["hello-world", "HI"]
+        # Only the unmarked function runs per row
+        assert (data["vectorized"], data["per_row"]) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_generate_dataset_invalid_expression(
+        self, client: AsyncClient, test_project, test_user
+    ):
+        """Test a failing column expression is rejected."""
+        create_response = await client.post(
+            "/api/v1/scenarios",
+            json={
+                "name": "Generated Data Error",
+                "project_id": test_project.id,
+                "creator_id": test_user.id,
+            },
+        )
+        scenario_id = create_response.json()["id"]
+
+        response = await client.post(
+            f"/api/v1/scenarios/{scenario_id}/dataset/generate",
+            json={"rows": 5, "columns": {"bad": "{{missing_function()}}"}},
+        )
+        assert response.status_code == 400
+        assert "bad" in response.json()["detail"]
@@ -0,0 +1,107 @@
+"""Tests for search across interfaces, scenarios and keywords."""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.interface import Interface
+from app.models.keyword import Keyword
+from app.models.scenario import Scenario
+from app.schemas.interface import InterfaceUpdate
+from app.services.interface_service import InterfaceService
+from app.services.search_service import SearchService
+from app.utils.trigram_index import TrigramIndex, similarity
+
+
+def test_trigram_index_substring_and_words():
+    """Test substring and all-words matches, ranked by similarity."""
+    index = TrigramIndex()
+    index.add(1, "Create new order", "/api/orders")
+    index.add(2, "List users", "/api/users/{id}")
+    index.add(3, "Order history", None)
+
+    assert [key for key, _ in index.search("users/{", 10)] == [2]
+    assert [key for key, _ in index.search("ORDER", 10)] == [3, 1]
+    # All words, in any order
+    assert [key for key, _ in index.search("order create", 10)] == [1]
+    # Short queries have no trigrams and verify every document
+    assert [key for key, _ in index.search("li", 10)] == [2]
+    assert index.search("payments", 10) == []
+    assert index.search("   ", 10) == []
+
+
+def test_similarity_matches_pg_trgm():
+    """Test word-trigram similarity (pg_trgm: similarity('word', 'two words') = 0.36)."""
+    assert similarity("word", "two words") == pytest.approx(4 / 11)
+    assert similarity("abc", "abc") == 1.0
+    assert similarity("", "abc") == 0.0
+
+
+@pytest.mark.asyncio
+async def test_search_types_and_project_scope(
+    db_session: AsyncSession, test_project, test_user
+):
+    """Test hits per type, project filtering and global keywords."""
+    db_session.add_all(
+        [
+            Interface(project_id=test_project.id, name="Get user", method="GET", path="/users/{id}"),
+            Interface(project_id=test_project.id + 1, name="Other", method="GET", path="/users"),
+            Scenario(
+                project_id=test_project.id,
+                name="Checkout",
+                description="Buys as a new user",
+                creator_id=test_user.id,
+            ),
+            Keyword(type="custom", name="Create user", method_name="create_user", code="pass"),
+        ]
+    )
+    await db_session.flush()
+    service = SearchService(db_session)
+
+    hits = await service.search("user", project_id=test_project.id)
+    assert sorted((hit["type"], hit["name"]) for hit in hits) == [
+        ("interface", "Get user"),
+        ("keyword", "Create user"),
+        ("scenario", "Checkout"),
+    ]
+    interface = next(hit for hit in hits if hit["type"] == "interface")
+    assert interface["detail"] == "GET /users/{id}"
+    assert interface["project_id"] == test_project.id
+
+    hits = await service.search("/users", types=["interface"])
+    assert len(hits) == 2
+    with pytest.raises(ValueError, match="Unknown search type"):
+        await service.search("user", types=["report"])
+
+
+@pytest.mark.asyncio
+async def test_search_index_follows_writes(db_session: AsyncSession, test_project):
+    """Test the in-process index is rebuilt after updates."""
+    service = SearchService(db_session)
+    interfaces = InterfaceService(db_session)
+    db_session.add(Interface(project_id=test_project.id, name="Ping", method="GET", path="/ping"))
+    await db_session.flush()
+    [hit] = await service.search("ping", project_id=test_project.id)
+
+    await interfaces.update_interface(hit["id"], InterfaceUpdate(path="/health"))
+    assert await service.search("ping", project_id=test_project.id) == [
+        {**hit, "detail": "GET /health", "score": 1.0}
+    ]
+    assert len(await service.search("/health", project_id=test_project.id)) == 1
+
+
+@pytest.mark.asyncio
+async def test_search_endpoint(client: AsyncClient, db_session: AsyncSession, test_project):
+    """Test the search endpoint."""
+    db_session.add(
+        Interface(project_id=test_project.id, name="Login", method="POST", path="/auth/login")
+    )
+    await db_session.flush()
+
+    response = await client.get("/api/v1/search", params={"q": "auth/log", "types": "interface"})
+    assert response.status_code == 200
+    [item] = response.json()["items"]
+    assert (item["type"], item["name"]) == ("interface", "Login")
+
+    response = await client.get("/api/v1/search", params={"q": "x", "types": "report"})
+    assert response.status_code == 422
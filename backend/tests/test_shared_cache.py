@@ -0,0 +1,72 @@
+"""Tests for shared variable cache."""
+
+import asyncio
+
+import pytest
+
+from app.utils.shared_cache import SharedVariableCache
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_computation():
+    """Concurrent callers for the same key wait for a single factory call."""
+    cache = SharedVariableCache()
+    calls = 0
+
+    async def login():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "token"
+
+    results = await asyncio.gather(*(cache.get_or_compute("auth", login) for _ in range(10)))
+
+    assert results == ["token"] * 10
+    assert calls == 1
+    assert cache.misses == 1
+    assert cache.hits == 9
+
+
+@pytest.mark.asyncio
+async def test_ttl_expiry(monkeypatch):
+    """Values are recomputed after their TTL expires."""
+    now = [100.0]
+    monkeypatch.setattr("app.utils.shared_cache.time.monotonic", lambda: now[0])
+    cache = SharedVariableCache()
+    cache.set("auth", "old", ttl=5)
+
+    assert cache.get("auth") == (True, "old")
+
+    now[0] += 5
+
+    assert cache.get("auth") == (False, None)
+
+    async def refresh():
+        return "new"
+
+    assert await cache.get_or_compute("auth", refresh) == "new"
+
+
+@pytest.mark.asyncio
+async def test_failures_are_not_cached():
+    """A failed computation propagates to waiters and is retried next time."""
+    cache = SharedVariableCache()
+    attempts = 0
+
+    async def flaky():
+        nonlocal attempts
+        attempts += 1
+        await asyncio.sleep(0.01)
+        if attempts == 1:
+            raise ConnectionError("auth service down")
+        return "token"
+
+    results = await asyncio.gather(
+        cache.get_or_compute("auth", flaky),
+        cache.get_or_compute("auth", flaky),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(r, ConnectionError) for r in results)
+    assert await cache.get_or_compute("auth", flaky) == "token"
+    assert attempts == 2
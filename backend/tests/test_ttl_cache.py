@@ -0,0 +1,40 @@
+"""Tests for the TTL cache."""
+
+import time
+
+from app.utils.ttl_cache import TTLCache
+
+
+def test_entries_expire():
+    """Test values are served until their TTL passes."""
+    cache = TTLCache(ttl=0.05)
+    cache.set("a", 1)
+
+    assert cache.get("a") == (True, 1)
+    time.sleep(0.06)
+    assert cache.get("a") == (False, None)
+    assert len(cache) == 0
+
+
+def test_bounded_and_invalidation():
+    """Test oldest entries are evicted and entries can be dropped."""
+    cache = TTLCache(ttl=60, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+
+    assert cache.get("a") == (False, None)
+    assert cache.get("c") == (True, 3)
+
+    cache.invalidate("c")
+    assert cache.get("c") == (False, None)
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_zero_ttl_disables_caching():
+    """Test a non-positive TTL never stores values."""
+    cache = TTLCache(ttl=0)
+    cache.set("a", 1)
+
+    assert cache.get("a") == (False, None)
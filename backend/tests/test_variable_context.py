@@ -0,0 +1,63 @@
+"""Tests for layered variable context."""
+
+import pytest
+
+from app.utils.function_executor import BUILTIN_FUNCTIONS, FunctionExecutor
+from app.utils.variable_context import VariableContext, flatten_layers
+
+
+def test_layer_precedence():
+    """Later layers override earlier ones; locals override the base."""
+    base = flatten_layers({"host": "global", "token": "g"}, {"host": "env"}, None)
+    context = VariableContext(base, {"user": "scenario", "token": "s"}, {"user": "row"})
+
+    assert context["host"] == "env"
+    assert context["token"] == "s"
+    assert context["user"] == "row"
+    assert context.get("missing", "default") == "default"
+    assert dict(context) == {"host": "env", "token": "s", "user": "row"}
+    assert len(context) == 3
+
+
+def test_copy_on_write():
+    """Writes stay local to one run and never touch the shared base."""
+    base = flatten_layers({"host": "env"})
+    first = VariableContext(base)
+    second = VariableContext(base)
+
+    first["host"] = "override"
+    first["token"] = "abc"
+    child = first.child({"step": 1})
+    child["token"] = "child"
+
+    assert first["host"] == "override"
+    assert first["token"] == "abc"
+    assert "step" not in first
+    assert second["host"] == "env"
+    assert "token" not in second
+    assert base == {"host": "env"}
+
+    with pytest.raises(TypeError):
+        base["host"] = "changed"  # type: ignore[index]
+
+
+def test_delete_only_local_values():
+    """Shared base values cannot be deleted through a run context."""
+    context = VariableContext(flatten_layers({"host": "env"}), {"user": "a"})
+
+    del context["user"]
+    assert "user" not in context
+    with pytest.raises(KeyError):
+        del context["host"]
+
+
+def test_executor_evaluates_against_context_without_copying():
+    """Expressions read variables from the context mapping directly."""
+    executor = FunctionExecutor(BUILTIN_FUNCTIONS)
+    context = VariableContext(flatten_layers({"name": "bob", "ids": [1, 2]}), {"offset": 10})
+
+    assert executor.execute_function("to_uppercase(name)", context) == "BOB"
+    # Comprehensions fall back to merged globals for nested-scope lookups
+    assert executor.execute_function("[i + offset for i in ids]", context) == [11, 12]
+    with pytest.raises(ValueError):
+        executor.execute_function("unknown_var + 1", context)